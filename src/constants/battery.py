@@ -5,3 +5,6 @@ BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS = 0.8522
 
 # % of capacity that is lost to the electronics & wiring within the battery
 BATTERY_LOSSES = 0.05
+
+# The most a battery can charge or discharge in an hour, as a fraction of its capacity
+BATTERY_MAX_C_RATE = 0.5
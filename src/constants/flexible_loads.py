@@ -0,0 +1,15 @@
+# Loads that can be moved to other hours of the day, e.g. onto solar or off-peak
+
+# kW, a typical home EV charger
+EV_CHARGER_POWER = 7.4
+
+# Hours of a weekday a car is at home to charge, i.e. it's out from 8am to 5pm. At
+# weekends it's home all day.
+EV_AT_HOME_WEEKDAY_HOURS = list(range(0, 8)) + list(range(17, 24))
+
+# kW, a typical hot water cylinder's element (or heat pump)
+HOT_WATER_HEATER_POWER = 3
+
+# kWh of electricity a day's hot water heating a cylinder can do ahead of use. The
+# rest is heated as hot water is used.
+HOT_WATER_CYLINDER_FLEXIBLE_KWH = 6
@@ -0,0 +1,29 @@
+from constants.fuel_stats import (
+    COST_PER_FUEL_KWH_AVG_15_YEARS,
+    COST_PER_FUEL_KWH_TODAY,
+    EMISSIONS_FACTORS,
+    FuelTypeEnum,
+)
+from utils.fuel_vector import FuelVector
+
+# The fuel stats tables as FuelVectors, so that they can be dotted with energy vectors
+
+# Unit: kgCO2e/kWh
+EMISSIONS_FACTORS_VECTOR = FuelVector.from_mapping(EMISSIONS_FACTORS)
+
+# Unit: $/kWh
+# Electricity is excluded because its price depends on when it's bought (see get_effective_grid_price)
+OTHER_FUEL_COST_PER_KWH_TODAY_VECTOR = FuelVector.from_mapping(
+    {
+        fuel_type: cost
+        for fuel_type, cost in COST_PER_FUEL_KWH_TODAY.items()
+        if fuel_type != FuelTypeEnum.ELECTRICITY
+    }
+)
+OTHER_FUEL_COST_PER_KWH_AVG_15_YEARS_VECTOR = FuelVector.from_mapping(
+    {
+        fuel_type: cost
+        for fuel_type, cost in COST_PER_FUEL_KWH_AVG_15_YEARS.items()
+        if fuel_type != FuelTypeEnum.ELECTRICITY
+    }
+)
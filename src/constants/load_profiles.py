@@ -0,0 +1,81 @@
+# Shapes used to spread each category's daily kWh over the hours of a year.
+# Illustrative shapes for NZ households, e.g. from typical smart meter load curves.
+# They're relative: the synthesiser normalises them, so that the profile over a year
+# uses the same kWh as the daily figure every day.
+
+# The categories profiled, in the order of the rows of the synthesiser's arrays.
+# Appliances are split into the machines whose timing differs.
+PROFILE_CATEGORIES = [
+    "space_heating",
+    "water_heating",
+    "cooktop",
+    "vehicles",
+    "other_appliances",
+]
+
+# How much energy each category uses in each month, January first, relative to the
+# average month. NZ winters are June to August.
+# fmt: off
+SEASONAL_SHAPES = {
+    "space_heating": [0.05, 0.05, 0.2, 0.7, 1.5, 2.2, 2.5, 2.2, 1.5, 0.7, 0.3, 0.1],
+    "water_heating": [0.85, 0.85, 0.9, 1.0, 1.1, 1.15, 1.2, 1.15, 1.1, 1.0, 0.9, 0.85],
+    "cooktop": [0.9, 0.9, 0.95, 1.0, 1.05, 1.1, 1.1, 1.1, 1.0, 1.0, 0.95, 0.95],
+    "vehicles": [1.0] * 12,
+    "other_appliances": [0.9, 0.9, 0.95, 1.0, 1.05, 1.1, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9],
+}
+
+# How much energy each category uses in each hour of the day, from midnight, relative
+# to each other. Electric vehicles charge at home, mostly in the evening.
+DIURNAL_SHAPES = {
+    "space_heating": {
+        "weekday": [
+            0.3, 0.3, 0.3, 0.3, 0.4, 0.8, 1.8, 2.2, 1.6, 0.8, 0.5, 0.4,
+            0.4, 0.4, 0.4, 0.6, 1.1, 2.0, 2.6, 2.6, 2.3, 1.8, 1.0, 0.5,
+        ],
+        "weekend": [
+            0.3, 0.3, 0.3, 0.3, 0.3, 0.5, 1.0, 1.6, 1.9, 1.6, 1.1, 0.9,
+            0.8, 0.8, 0.8, 0.9, 1.2, 1.9, 2.4, 2.5, 2.2, 1.7, 1.0, 0.5,
+        ],
+    },
+    "water_heating": {
+        "weekday": [
+            0.4, 0.3, 0.3, 0.3, 0.4, 0.8, 2.0, 2.4, 1.8, 1.0, 0.7, 0.6,
+            0.6, 0.5, 0.5, 0.6, 0.8, 1.2, 1.6, 1.6, 1.4, 1.2, 0.9, 0.6,
+        ],
+        "weekend": [
+            0.4, 0.3, 0.3, 0.3, 0.3, 0.4, 0.9, 1.6, 2.0, 1.8, 1.4, 1.0,
+            0.9, 0.8, 0.7, 0.7, 0.8, 1.1, 1.4, 1.5, 1.3, 1.1, 0.8, 0.6,
+        ],
+    },
+    "cooktop": {
+        "weekday": [
+            0.05, 0.05, 0.05, 0.05, 0.05, 0.1, 0.5, 1.0, 0.6, 0.2, 0.2, 0.5,
+            0.9, 0.4, 0.2, 0.2, 0.6, 2.2, 3.2, 2.0, 0.6, 0.2, 0.1, 0.05,
+        ],
+        "weekend": [
+            0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.6, 1.1, 1.0, 0.6, 0.8,
+            1.2, 0.7, 0.3, 0.3, 0.6, 2.0, 3.0, 2.0, 0.7, 0.2, 0.1, 0.05,
+        ],
+    },
+    "vehicles": {
+        "weekday": [
+            0.8, 0.6, 0.4, 0.3, 0.2, 0.2, 0.2, 0.2, 0.1, 0.1, 0.1, 0.1,
+            0.1, 0.1, 0.1, 0.2, 0.5, 1.4, 2.0, 2.2, 2.0, 1.7, 1.4, 1.1,
+        ],
+        "weekend": [
+            0.8, 0.6, 0.4, 0.3, 0.2, 0.2, 0.2, 0.2, 0.3, 0.4, 0.5, 0.5,
+            0.5, 0.5, 0.5, 0.6, 0.8, 1.2, 1.6, 1.8, 1.7, 1.5, 1.2, 1.0,
+        ],
+    },
+    "other_appliances": {
+        "weekday": [
+            0.6, 0.5, 0.5, 0.5, 0.5, 0.6, 0.9, 1.2, 1.1, 0.9, 0.8, 0.8,
+            0.8, 0.8, 0.8, 0.9, 1.1, 1.5, 1.8, 1.8, 1.7, 1.5, 1.1, 0.8,
+        ],
+        "weekend": [
+            0.6, 0.5, 0.5, 0.5, 0.5, 0.5, 0.7, 0.9, 1.1, 1.2, 1.2, 1.2,
+            1.2, 1.1, 1.1, 1.1, 1.2, 1.5, 1.7, 1.7, 1.6, 1.4, 1.1, 0.8,
+        ],
+    },
+}
+# fmt: on
@@ -0,0 +1,12 @@
+# Machines are replaced with electric ones as they wear out, rather than all at once
+
+# Years a machine typically lasts, by load profile category. A household's machines are
+# part-way through their lives, so on average 1 / lifespan of them wear out each year,
+# i.e. by the end of year t of the lifetime (counting from 0) min(1, (t + 1) / lifespan)
+# of them have been replaced.
+MACHINE_LIFESPAN_YEARS = {
+    "space_heating": 15,
+    "water_heating": 12,
+    "cooktop": 15,
+    "vehicles": 14,
+}
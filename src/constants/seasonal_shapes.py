@@ -0,0 +1,97 @@
+from openapi_client.models.location_enum import LocationEnum
+from openapi_client.models.season_enum import SeasonEnum
+
+# How much of each region's space heating & solar generation falls in each month,
+# January first, relative to the average month. Illustrative shapes for three
+# climates: the further south, the longer the heating season and the bigger the gap
+# between summer & winter sun. They're relative: monthly values are normalised so
+# that the months add up to the year.
+
+_NORTHERN_HEATING = [0.0, 0.0, 0.1, 0.6, 1.5, 2.4, 2.7, 2.3, 1.4, 0.6, 0.25, 0.05]
+_CENTRAL_HEATING = [0.05, 0.05, 0.25, 0.8, 1.5, 2.1, 2.4, 2.1, 1.5, 0.8, 0.4, 0.1]
+_SOUTHERN_HEATING = [0.2, 0.2, 0.45, 0.9, 1.45, 1.85, 2.0, 1.8, 1.35, 0.95, 0.6, 0.3]
+
+_NORTHERN_SOLAR = [1.35, 1.2, 1.05, 0.8, 0.6, 0.5, 0.55, 0.75, 0.95, 1.15, 1.3, 1.4]
+_CENTRAL_SOLAR = [
+    1.42,
+    1.28,
+    1.08,
+    0.78,
+    0.52,
+    0.42,
+    0.47,
+    0.68,
+    0.92,
+    1.18,
+    1.38,
+    1.48,
+]
+_SOUTHERN_SOLAR = [1.5, 1.35, 1.1, 0.75, 0.45, 0.35, 0.4, 0.6, 0.9, 1.2, 1.45, 1.55]
+
+# The national shapes, for locations outside NZ's regions
+_NZ_HEATING = _CENTRAL_HEATING
+_NZ_SOLAR = _CENTRAL_SOLAR
+
+SPACE_HEATING_MONTHLY_SHAPE = {
+    LocationEnum.NORTHLAND: _NORTHERN_HEATING,
+    LocationEnum.AUCKLAND_NORTH: _NORTHERN_HEATING,
+    LocationEnum.AUCKLAND_CENTRAL: _NORTHERN_HEATING,
+    LocationEnum.AUCKLAND_EAST: _NORTHERN_HEATING,
+    LocationEnum.AUCKLAND_WEST: _NORTHERN_HEATING,
+    LocationEnum.AUCKLAND_SOUTH: _NORTHERN_HEATING,
+    LocationEnum.WAIKATO: _CENTRAL_HEATING,
+    LocationEnum.BAY_OF_PLENTY: _NORTHERN_HEATING,
+    LocationEnum.GISBORNE: _CENTRAL_HEATING,
+    LocationEnum.HAWKES_BAY: _CENTRAL_HEATING,
+    LocationEnum.TARANAKI: _CENTRAL_HEATING,
+    LocationEnum.MANAWATU_WANGANUI: _CENTRAL_HEATING,
+    LocationEnum.WELLINGTON: _CENTRAL_HEATING,
+    LocationEnum.TASMAN: _CENTRAL_HEATING,
+    LocationEnum.NELSON: _CENTRAL_HEATING,
+    LocationEnum.MARLBOROUGH: _CENTRAL_HEATING,
+    LocationEnum.WEST_COAST: _SOUTHERN_HEATING,
+    LocationEnum.CANTERBURY: _SOUTHERN_HEATING,
+    LocationEnum.OTAGO: _SOUTHERN_HEATING,
+    LocationEnum.SOUTHLAND: _SOUTHERN_HEATING,
+    LocationEnum.STEWART_ISLAND: _SOUTHERN_HEATING,
+    LocationEnum.CHATHAM_ISLANDS: _SOUTHERN_HEATING,
+    LocationEnum.GREAT_BARRIER_ISLAND: _NORTHERN_HEATING,
+    LocationEnum.OVERSEAS: _NZ_HEATING,
+    LocationEnum.OTHER: _NZ_HEATING,
+}
+
+SOLAR_MONTHLY_SHAPE = {
+    LocationEnum.NORTHLAND: _NORTHERN_SOLAR,
+    LocationEnum.AUCKLAND_NORTH: _NORTHERN_SOLAR,
+    LocationEnum.AUCKLAND_CENTRAL: _NORTHERN_SOLAR,
+    LocationEnum.AUCKLAND_EAST: _NORTHERN_SOLAR,
+    LocationEnum.AUCKLAND_WEST: _NORTHERN_SOLAR,
+    LocationEnum.AUCKLAND_SOUTH: _NORTHERN_SOLAR,
+    LocationEnum.WAIKATO: _NORTHERN_SOLAR,
+    LocationEnum.BAY_OF_PLENTY: _NORTHERN_SOLAR,
+    LocationEnum.GISBORNE: _CENTRAL_SOLAR,
+    LocationEnum.HAWKES_BAY: _CENTRAL_SOLAR,
+    LocationEnum.TARANAKI: _CENTRAL_SOLAR,
+    LocationEnum.MANAWATU_WANGANUI: _CENTRAL_SOLAR,
+    LocationEnum.WELLINGTON: _CENTRAL_SOLAR,
+    LocationEnum.TASMAN: _CENTRAL_SOLAR,
+    LocationEnum.NELSON: _CENTRAL_SOLAR,
+    LocationEnum.MARLBOROUGH: _CENTRAL_SOLAR,
+    LocationEnum.WEST_COAST: _CENTRAL_SOLAR,
+    LocationEnum.CANTERBURY: _SOUTHERN_SOLAR,
+    LocationEnum.OTAGO: _SOUTHERN_SOLAR,
+    LocationEnum.SOUTHLAND: _SOUTHERN_SOLAR,
+    LocationEnum.STEWART_ISLAND: _SOUTHERN_SOLAR,
+    LocationEnum.CHATHAM_ISLANDS: _SOUTHERN_SOLAR,
+    LocationEnum.GREAT_BARRIER_ISLAND: _NORTHERN_SOLAR,
+    LocationEnum.OVERSEAS: _NZ_SOLAR,
+    LocationEnum.OTHER: _NZ_SOLAR,
+}
+
+# The months in each season, in the southern hemisphere. Summer straddles the new year.
+SEASON_MONTHS = {
+    SeasonEnum.SUMMER: [12, 1, 2],
+    SeasonEnum.AUTUMN: [3, 4, 5],
+    SeasonEnum.WINTER: [6, 7, 8],
+    SeasonEnum.SPRING: [9, 10, 11],
+}
@@ -14,6 +14,9 @@ SOLAR_FEEDIN_TARIFF_AVG_15_YEARS = 0.14632  # real pricing
 # % of max capacity that it generates on average over 30 years, taking into account degradation
 SOLAR_AVG_DEGRADED_PERFORMANCE_30_YRS = 0.9308
 
+# NZ's latitude in degrees, roughly, for the sun's path over the day & the year
+SOLAR_LATITUDE = -41
+
 # Solar capacity factor
 SOLAR_CAPACITY_FACTOR = {
     LocationEnum.NORTHLAND: 0.155,
@@ -0,0 +1,47 @@
+from utils.tou_tariff import TouPeriodEnum, TouTariff, TouWindow
+
+# A typical residential time-of-use plan. The shoulder & night rates match the
+# volume & off-peak rates in COST_PER_FUEL_KWH_TODAY.
+
+# Weekdays: peak in the morning & evening, off-peak in the middle of the day
+TOU_WEEKDAY_WINDOWS = (
+    TouWindow(7, 11, TouPeriodEnum.PEAK),
+    TouWindow(11, 17, TouPeriodEnum.OFF_PEAK),
+    TouWindow(17, 21, TouPeriodEnum.PEAK),
+    TouWindow(21, 23, TouPeriodEnum.SHOULDER),
+    TouWindow(23, 7, TouPeriodEnum.NIGHT),
+)
+
+# Weekends: no peak
+TOU_WEEKEND_WINDOWS = (
+    TouWindow(7, 23, TouPeriodEnum.SHOULDER),
+    TouWindow(23, 7, TouPeriodEnum.NIGHT),
+)
+
+# Unit: $/kWh
+TOU_TARIFF_2024 = TouTariff(
+    name="Time of use (2024)",
+    rates={
+        TouPeriodEnum.PEAK: 0.32900,
+        TouPeriodEnum.SHOULDER: 0.26175,
+        TouPeriodEnum.OFF_PEAK: 0.21000,
+        TouPeriodEnum.NIGHT: 0.17300,
+    },
+    weekday=TOU_WEEKDAY_WINDOWS,
+    weekend=TOU_WEEKEND_WINDOWS,
+)
+
+# Average over next 15 years (real, 2024-2038 inclusive), i.e. the 2024 rates scaled
+# like the volume rate in COST_PER_FUEL_KWH_AVG_15_YEARS
+# Unit: $/kWh
+TOU_TARIFF_AVG_15_YEARS = TouTariff(
+    name="Time of use (average over 15 years)",
+    rates={
+        TouPeriodEnum.PEAK: 0.35653,
+        TouPeriodEnum.SHOULDER: 0.28365,
+        TouPeriodEnum.OFF_PEAK: 0.22757,
+        TouPeriodEnum.NIGHT: 0.18747,
+    },
+    weekday=TOU_WEEKDAY_WINDOWS,
+    weekend=TOU_WEEKEND_WINDOWS,
+)
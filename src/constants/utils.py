@@ -2,11 +2,20 @@ from aenum import Enum
 
 DAYS_PER_YEAR = 365.25  # N.B. Josh's model uses 365 in some cases, like when calculating energy generated from solar, Home!C33
 WEEKS_PER_YEAR = 52
+MONTHS_PER_YEAR = 12
+SEASONS_PER_YEAR = 4
 HOURS_PER_YEAR = 24 * DAYS_PER_YEAR  # 8766
 
 
 class PeriodEnum(str, Enum):
     DAILY = "DAILY"
     WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"  # the average month
+    SEASONAL = "SEASONAL"  # the average season
     YEARLY = "YEARLY"
     OPERATIONAL_LIFETIME = "OPERATIONAL_LIFETIME"
+
+
+# Hourly & half-hourly profiles are laid out over this year: it isn't a leap year, so
+# they have 8760 hours, and it starts on a Sunday
+PROFILE_YEAR = 2023
@@ -0,0 +1,41 @@
+from openapi_client.models.location_enum import LocationEnum
+
+# The weather station whose temperatures represent each location. Locations without
+# one (e.g. OVERSEAS) use the reference climate, i.e. aren't scaled.
+LOCATION_WEATHER_STATION = {
+    LocationEnum.NORTHLAND: "KAITAIA",
+    LocationEnum.AUCKLAND_NORTH: "AUCKLAND",
+    LocationEnum.AUCKLAND_CENTRAL: "AUCKLAND",
+    LocationEnum.AUCKLAND_EAST: "AUCKLAND",
+    LocationEnum.AUCKLAND_WEST: "AUCKLAND",
+    LocationEnum.AUCKLAND_SOUTH: "AUCKLAND",
+    LocationEnum.WAIKATO: "HAMILTON",
+    LocationEnum.BAY_OF_PLENTY: "TAURANGA",
+    LocationEnum.GISBORNE: "GISBORNE",
+    LocationEnum.HAWKES_BAY: "NAPIER",
+    LocationEnum.TARANAKI: "NEW_PLYMOUTH",
+    LocationEnum.MANAWATU_WANGANUI: "PALMERSTON_NORTH",
+    LocationEnum.WELLINGTON: "WELLINGTON",
+    LocationEnum.TASMAN: "NELSON",
+    LocationEnum.NELSON: "NELSON",
+    LocationEnum.MARLBOROUGH: "BLENHEIM",
+    LocationEnum.WEST_COAST: "HOKITIKA",
+    LocationEnum.CANTERBURY: "CHRISTCHURCH",
+    LocationEnum.OTAGO: "DUNEDIN",
+    LocationEnum.SOUTHLAND: "INVERCARGILL",
+    LocationEnum.STEWART_ISLAND: "INVERCARGILL",
+    LocationEnum.CHATHAM_ISLANDS: "CHATHAM_ISLANDS",
+    LocationEnum.GREAT_BARRIER_ISLAND: "AUCKLAND",
+}
+
+# °C. Homes need heating when it's colder than this outside (internal gains from
+# people & appliances make up the rest).
+HEATING_BASE_TEMPERATURE = 16
+
+# An air-source heat pump's coefficient of performance (kWh of heat per kWh of
+# electricity) falls as it gets colder outside: linearly from its rating at 7°C,
+# within limits
+HEAT_PUMP_COP_AT_7C = 3.5
+HEAT_PUMP_COP_PER_DEGREE = 0.08
+HEAT_PUMP_MIN_COP = 1.5
+HEAT_PUMP_MAX_COP = 5.5
@@ -1,15 +1,58 @@
-from fastapi import FastAPI
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set
+
+from fastapi import Body, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from models.electrify_household import electrify_household
 from openapi_client.models import (
     Household,
+    MeterCalibration,
+    MeterCalibrationRequest,
+    MeterDataFormatEnum,
+    PlanTypeEnum,
+    RetailPlanComparison,
     Savings,
+    SavingsCurve,
+    SavingsCurveRequest,
+    SystemSize,
+    SystemSizeRequest,
+)
+from savings.closed_form.calculate_savings_curve import calculate_savings_curve
+from savings.closed_form.optimise_system_size import optimise_system_size
+from savings.closed_form.evaluate_household_model import (
+    calculate_monthly_savings_closed_form,
+    get_emissions_from_totals,
+    get_household_totals,
+    get_opex_from_totals,
+)
+from savings.energy.calibrate_energy_needs import calibrate_energy_needs
+from savings.emissions.calculate_emissions_trajectory import (
+    calculate_emissions_trajectory,
 )
-from savings.emissions.calculate_emissions import calculate_emissions
-from savings.opex.calculate_opex import calculate_opex
+from savings.opex.compare_retail_plans import compare_retail_plans
 from savings.upfront_cost.calculate_upfront_cost import calculate_upfront_cost
+from models.aggregate_savings import aggregate_savings
 from models.recommend_next_action import recommend_next_action
+from models.savings_cube import load_savings_cube
+from models.savings_ranking import SavingsRankingIndex, rank_household_savings
+from models.similar_households import (
+    find_similar_households,
+    load_similar_households_index,
+)
+from utils.arrow_batch import (
+    ARROW_STREAM_MEDIA_TYPE,
+    SAVINGS_ARROW_FIELDS,
+    read_household_rows,
+    write_savings_aggregate,
+    write_savings_batch,
+    write_savings_cube_rows,
+)
 from utils.clean_household import clean_household
+from utils.parse_savings_fields import OPTIONAL_SAVINGS_FIELDS, parse_savings_fields
+from utils.savings_aggregates import parse_group_by
+from utils.stage_graph import StageGraph, StageGraphResult, StageNode
 from utils.validate_household import validate_household
 
 app = FastAPI()
@@ -38,22 +81,296 @@ def health_check():
     return {"status": "healthy"}
 
 
-@app.post("/savings")
-def calculate_household_savings(current_household: Household) -> Savings:
+# The /savings pipeline. Nodes named after Savings fields are the outputs.
+# Stages are looked up when they run, so that they can be swapped out (e.g. patched in tests).
+SAVINGS_GRAPH = StageGraph(
+    [
+        StageNode(
+            "household",
+            lambda household: clean_household(household),
+            ("current_household",),
+        ),
+        StageNode(
+            "electrified_household",
+            lambda household: electrify_household(household),
+            ("household",),
+        ),
+        # Each household's energy needs & solar generation, priced, which both opex &
+        # emissions (and so percentiles) are read from
+        StageNode(
+            "household_totals",
+            lambda household: get_household_totals(household),
+            ("household",),
+        ),
+        StageNode(
+            "electrified_household_totals",
+            lambda household: get_household_totals(household),
+            ("electrified_household",),
+        ),
+        StageNode(
+            "emissions",
+            lambda before, after: get_emissions_from_totals(before, after),
+            ("household_totals", "electrified_household_totals"),
+        ),
+        StageNode(
+            "opex",
+            lambda before, after: get_opex_from_totals(before, after),
+            ("household_totals", "electrified_household_totals"),
+        ),
+        StageNode(
+            "monthly",
+            lambda current, electrified: calculate_monthly_savings_closed_form(
+                current, electrified
+            ),
+            ("household", "electrified_household"),
+        ),
+        StageNode(
+            "emissionsTrajectory",
+            lambda current, electrified: calculate_emissions_trajectory(
+                current, electrified
+            ),
+            ("household", "electrified_household"),
+        ),
+        StageNode(
+            "upfrontCost",
+            lambda current, electrified: calculate_upfront_cost(current, electrified),
+            ("household", "electrified_household"),
+        ),
+        StageNode(
+            "recommendation",
+            lambda household: recommend_next_action(household),
+            ("household",),
+        ),
+        StageNode(
+            "percentiles",
+            lambda household, opex, emissions: rank_household_savings(
+                savings_ranking_index.get(), household, opex, emissions
+            ),
+            ("household", "opex", "emissions"),
+        ),
+        StageNode(
+            "similarHouseholds",
+            lambda household: find_similar_households(
+                similar_households_index, household
+            ),
+            ("household",),
+        ),
+    ],
+    inputs=["current_household"],
+)
+
+stage_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="savings-stage")
+
+# Ranks /savings against the savings cube's households, built in the background
+savings_ranking_index = SavingsRankingIndex()
+
+# Memory-mapped once, or None if it hasn't been built (see build_similar_households_index)
+similar_households_index = load_similar_households_index()
+
+
+@app.post("/savings", response_model_exclude_unset=True)
+def calculate_household_savings(
+    current_household: Household,
+    fields: Optional[str] = None,
+    response: Response = None,
+) -> Savings:
+
+    try:
+        requested_fields = parse_savings_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     validate_household(current_household)
-    current_household = clean_household(current_household)
-    electrified_household = electrify_household(current_household)
-
-    emissions = calculate_emissions(current_household, electrified_household)
-    opex = calculate_opex(current_household, electrified_household)
-    upfront_cost = calculate_upfront_cost(current_household, electrified_household)
-    recommendation = recommend_next_action(current_household)
-
-    savings = Savings(
-        emissions=emissions,
-        opex=opex,
-        upfrontCost=upfront_cost,
-        recommendation=recommendation,
+
+    result = run_savings_graph(current_household, requested_fields, stage_executor)
+    if response is not None:
+        response.headers["Server-Timing"] = result.server_timing()
+
+    return Savings(**{field: result.values[field] for field in requested_fields})
+
+
+@app.post("/savings/batch", response_class=Response)
+def calculate_household_savings_batch(
+    body: bytes = Body(..., media_type=ARROW_STREAM_MEDIA_TYPE),
+    fields: Optional[str] = None,
+) -> Response:
+    """Calculates savings for a batch of households, as Arrow IPC streams in & out
+
+    Each input row is a household and each output row is its flattened savings. Rows
+    that can't be calculated (e.g. invalid households) have null savings and an error.
+    """
+    try:
+        # Only optional sections with Arrow columns (e.g. not monthly) are offered
+        requested_fields = parse_savings_fields(
+            fields,
+            optional_fields=[
+                field
+                for field in OPTIONAL_SAVINGS_FIELDS
+                if field in SAVINGS_ARROW_FIELDS
+            ],
+        )
+        rows = read_household_rows(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    savings: List[Optional[Savings]] = []
+    errors: List[Optional[str]] = []
+    for row in rows:
+        try:
+            household = Household.from_dict(row)
+            validate_household(household)
+            # Rows are run one after another; running each row's stages concurrently
+            # costs more in scheduling than it saves
+            result = run_savings_graph(household, requested_fields)
+        except ValueError as e:
+            savings.append(None)
+            errors.append(str(e))
+            continue
+        savings.append(
+            Savings(**{field: result.values[field] for field in requested_fields})
+        )
+        errors.append(None)
+
+    return Response(
+        content=write_savings_batch(savings, errors, requested_fields),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+    )
+
+
+@app.post("/savings/batch/aggregate", response_class=Response)
+def aggregate_household_savings_batch(
+    body: bytes = Body(..., media_type=ARROW_STREAM_MEDIA_TYPE),
+    group_by: Optional[str] = Query(default=None, alias="groupBy"),
+) -> Response:
+    """Aggregates the emissions & opex savings of a batch of households by group
+
+    The households are read as for /savings/batch, but each one's savings are folded
+    into streaming statistics for its group rather than returned, so the response has
+    one row per group however many households there are.
+    """
+    try:
+        group_by_fields = parse_group_by(group_by)
+        rows = read_household_rows(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return Response(
+        content=write_savings_aggregate(aggregate_savings(rows, group_by_fields)),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+    )
+
+
+@app.get("/savings/cube", response_class=Response)
+def query_savings_cube(
+    location: Optional[str] = None,
+    space_heating: Optional[str] = Query(default=None, alias="spaceHeating"),
+    water_heating: Optional[str] = Query(default=None, alias="waterHeating"),
+    cooktop: Optional[str] = None,
+    occupancy: Optional[str] = None,
+    vehicles: Optional[str] = None,
+    group_by: Optional[str] = Query(default=None, alias="groupBy"),
+) -> Response:
+    """Slices & rolls up the precomputed savings of every kind of household
+
+    Each filter is a comma-separated list of the labels to keep in that dimension, e.g.
+    spaceHeating=GAS,WOOD. The response has a row per group, as an Arrow IPC stream.
+    """
+    filters = {
+        dimension: [label.strip() for label in labels.split(",") if label.strip()]
+        for dimension, labels in {
+            "location": location,
+            "spaceHeating": space_heating,
+            "waterHeating": water_heating,
+            "cooktop": cooktop,
+            "occupancy": occupancy,
+            "vehicles": vehicles,
+        }.items()
+        if labels is not None
+    }
+    group_by_dimensions = list(
+        dict.fromkeys(
+            dimension.strip()
+            for dimension in (group_by or "").split(",")
+            if dimension.strip()
+        )
+    )
+    try:
+        rows = load_savings_cube().query(filters, group_by_dimensions)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return Response(
+        content=write_savings_cube_rows(rows, group_by_dimensions),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+    )
+
+
+@app.post("/savings/curve", response_model=SavingsCurve)
+def calculate_household_savings_curve(request: SavingsCurveRequest) -> JSONResponse:
+    """Calculates savings across a range of one or two of the household's inputs
+
+    e.g. for every solar size from 0 to 15 kW in 0.25 kW steps, so that a UI can draw
+    the whole curve without a request per point.
+    """
+    try:
+        curve = calculate_savings_curve(request.household, request.sweeps)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Returned as is, as validating the response again costs more than calculating it
+    return JSONResponse(content=curve.dict(by_alias=True, exclude_none=True))
+
+
+@app.post("/savings/system-size")
+def calculate_household_system_size(request: SystemSizeRequest) -> SystemSize:
+    """Finds the solar size & battery capacity that are best for the household"""
+    try:
+        return optimise_system_size(
+            request.household,
+            request.objective,
+            request.max_solar_size,
+            request.max_battery_capacity,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/savings/retail-plans", response_model_exclude_none=True)
+def compare_household_retail_plans(
+    household: Household,
+    plan_type: Optional[PlanTypeEnum] = Query(default=None, alias="planType"),
+) -> RetailPlanComparison:
+    """Finds the cheapest retail electricity plan before & after electrification"""
+    try:
+        return compare_retail_plans(household, plan_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/savings/meter-calibration", response_model_exclude_none=True)
+def calibrate_household_energy(request: MeterCalibrationRequest) -> MeterCalibration:
+    """Calibrates the household's energy needs against a year of its smart meter data
+
+    The result is set as the household's meterCalibration in later requests.
+    """
+    try:
+        return calibrate_energy_needs(
+            request.household,
+            base64.b64decode(request.meter_data, validate=True),
+            request.meter_data_format or MeterDataFormatEnum.CSV,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def run_savings_graph(
+    household: Household,
+    requested_fields: Set[str],
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> StageGraphResult:
+    # Only run the stages that were asked for; unrequested sections are left unset
+    # so that they're omitted from the response
+    return SAVINGS_GRAPH.run(
+        {"current_household": household},
+        targets=requested_fields,
+        executor=executor,
     )
-    return savings
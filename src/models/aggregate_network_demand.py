@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.utils import PROFILE_YEAR, PeriodEnum
+from models.electrify_household import electrify_household
+from openapi_client.models import Household
+from savings.energy.get_electricity_consumption import get_e_generated_from_solar
+from savings.energy.synthesise_load_profiles import (
+    get_daily_kwh_by_category,
+    get_profile_shapes,
+    get_solar_generation_shape,
+)
+
+# The loads at the network, in the order of NetworkLoad.peak_by_category. Solar
+# generation is a negative load.
+NETWORK_LOAD_CATEGORIES = PROFILE_CATEGORIES + ["solar"]
+
+# Households' hourly profiles are synthesised this many at a time, which bounds the
+# memory used to chunk size x hours in the year x 8 bytes (~70 MB)
+NETWORK_DEMAND_CHUNK_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class NetworkLoad:
+    """The hourly load that a group of households puts on the network they share, net
+    of their solar generation"""
+
+    load: np.ndarray  # kWh in each hour, i.e. the average kW, shape (n_hours,)
+    # kW of each NETWORK_LOAD_CATEGORIES at the coincident peak
+    peak_by_category: np.ndarray
+    # The sum of each household's own peak kW, whenever it is
+    sum_of_peaks: float
+
+    @property
+    def coincident_peak(self) -> float:
+        """The highest kW of the households together"""
+        return float(self.load[self.peak_hour])
+
+    @property
+    def peak_hour(self) -> int:
+        """The hour of the year of the coincident peak, from 0"""
+        return int(np.argmax(self.load))
+
+    @property
+    def diversity_factor(self) -> float:
+        """The sum of the households' own peaks over their coincident peak, i.e. how
+        much less than their own peaks they need of the network together (>= 1)
+
+        The profiles are each household's expected load, from shapes averaged over
+        many households, so they already include most of the diversity of real
+        households' loads. This is the diversity left between households' expected
+        loads, e.g. from heating more in winter or charging EVs at night, and is lower
+        than metered households' diversity."""
+        return self.sum_of_peaks / self.coincident_peak
+
+    def get_load_duration_curve(self) -> np.ndarray:
+        """The hourly load sorted from highest to lowest, i.e. the kW that the load is
+        at or above for each number of hours of the year"""
+        return np.sort(self.load)[::-1]
+
+
+@dataclass(frozen=True)
+class NetworkDemand:
+    """The load on the network of a group of households before & after they're
+    electrified"""
+
+    before: NetworkLoad
+    after: NetworkLoad
+    households: float  # weighted
+
+    @property
+    def peak_increase(self) -> float:
+        """How much the coincident peak goes up by in kW"""
+        return self.after.coincident_peak - self.before.coincident_peak
+
+
+@lru_cache(maxsize=8)
+def get_network_load_shapes(year: int = PROFILE_YEAR) -> np.ndarray:
+    """The hourly shape of each NETWORK_LOAD_CATEGORIES over a year, with solar
+    negative (see get_profile_shapes & get_solar_generation_shape)
+
+    Returns:
+        np.ndarray: shape (n_network_load_categories, n_hours). Read-only, as it's shared between callers.
+    """
+    shapes = np.vstack([get_profile_shapes(year), -get_solar_generation_shape(year)])
+    shapes.flags.writeable = False
+    return shapes
+
+
+def get_daily_kwh_by_network_load(households: Sequence[Household]) -> np.ndarray:
+    """Each household's average electricity kWh/day by NETWORK_LOAD_CATEGORIES, i.e.
+    get_daily_kwh_by_category and the kWh/day generated by its solar
+
+    Args:
+        households (Sequence[Household]): the households, cleaned (see clean_household)
+
+    Returns:
+        np.ndarray: kWh/day, shape (n_households, n_network_load_categories)
+    """
+    solar = [
+        get_e_generated_from_solar(h.solar, h.location, PeriodEnum.DAILY)
+        for h in households
+    ]
+    return np.column_stack([get_daily_kwh_by_category(households), solar])
+
+
+def aggregate_network_demand(
+    households: Sequence[Household],
+    weights: Optional[np.ndarray] = None,
+    year: int = PROFILE_YEAR,
+    chunk_size: int = NETWORK_DEMAND_CHUNK_SIZE,
+) -> NetworkDemand:
+    """Sums the hourly electricity load of a group of households on a shared part of
+    the network (e.g. a street's transformer), before & after electrify_household
+
+    Each household's profile is its kWh/day by category spread over the year by the
+    category's shape (see synthesise_load_profiles), less its solar generation. EVs
+    charge & heat pumps run when the shapes say, i.e. without smart charging or
+    batteries. As the profiles are linear in the kWh/day, the group's load is its
+    total kWh/day spread over the year; each household's own profile is only needed
+    for its peak, so they're synthesised a chunk at a time into one buffer.
+
+    Args:
+        households (Sequence[Household]): the households, cleaned (see clean_household)
+        weights (np.ndarray, optional): how many households each one represents, shape (n_households,). Defaults to None, i.e. 1 each.
+        year (int, optional): the year to lay the profiles out over. Defaults to PROFILE_YEAR.
+        chunk_size (int, optional): households synthesised at a time. Defaults to NETWORK_DEMAND_CHUNK_SIZE.
+
+    Raises:
+        ValueError: if there are no households, or the weights don't match them
+
+    Returns:
+        NetworkDemand: the group's load before & after electrification
+    """
+    if not households:
+        raise ValueError("No households to aggregate")
+    weights = (
+        np.ones(len(households)) if weights is None else np.asarray(weights, float)
+    )
+    if weights.shape != (len(households),):
+        raise ValueError(f"Weights need to have shape ({len(households)},)")
+    if np.any(weights < 0):
+        raise ValueError("Weights can't be negative")
+
+    shapes = get_network_load_shapes(year)
+    buffer = np.empty((min(chunk_size, len(households)), shapes.shape[1]))
+    loads = {}
+    for name, electrify in [("before", False), ("after", True)]:
+        total_daily_kwh = np.zeros(len(NETWORK_LOAD_CATEGORIES))
+        sum_of_peaks = 0.0
+        for start in range(0, len(households), chunk_size):
+            chunk = households[start : start + chunk_size]
+            if electrify:
+                chunk = [electrify_household(h) for h in chunk]
+            daily_kwh = get_daily_kwh_by_network_load(chunk)
+            chunk_weights = weights[start : start + chunk_size]
+            total_daily_kwh += chunk_weights @ daily_kwh
+            profiles = np.matmul(daily_kwh, shapes, out=buffer[: len(chunk)])
+            sum_of_peaks += float(chunk_weights @ profiles.max(axis=1))
+        load = total_daily_kwh @ shapes
+        loads[name] = NetworkLoad(
+            load=load,
+            peak_by_category=total_daily_kwh * shapes[:, np.argmax(load)],
+            sum_of_peaks=sum_of_peaks,
+        )
+    return NetworkDemand(**loads, households=float(weights.sum()))
@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from models.electrify_household import electrify_household
+from openapi_client.models import Household, Savings
+from savings.closed_form.evaluate_household_model import (
+    calculate_emissions_closed_form,
+    calculate_opex_closed_form,
+)
+from utils.clean_household import clean_household
+from utils.savings_aggregates import SavingsAggregate
+from utils.validate_household import validate_household
+
+
+def aggregate_savings(
+    rows: Iterable[Dict[str, Any]], group_by: Sequence[str] = ("location",)
+) -> SavingsAggregate:
+    """Calculates each household's emissions & opex savings and folds them into an
+    aggregate by group, one household at a time
+
+    Households that can't be calculated (e.g. invalid ones) are counted as errors.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): households as JSON API dicts (e.g. from read_household_rows), read as they're needed
+        group_by (Sequence[str], optional): the AGGREGATE_GROUP_KEYS to group by. Defaults to location.
+
+    Returns:
+        SavingsAggregate: the households' savings by group
+    """
+    aggregate = SavingsAggregate(group_by)
+    for row in rows:
+        household: Optional[Household] = None
+        try:
+            household = Household.from_dict(row)
+            validate_household(household)
+            current = clean_household(household)
+            electrified = electrify_household(current)
+            savings = Savings(
+                emissions=calculate_emissions_closed_form(current, electrified),
+                opex=calculate_opex_closed_form(current, electrified),
+            )
+        except ValueError:
+            aggregate.add_error(household)
+            continue
+        aggregate.add(household, savings)
+    return aggregate
+
+
+def aggregate_savings_in_processes(
+    batches: Iterable[Sequence[Dict[str, Any]]],
+    group_by: Sequence[str] = ("location",),
+    max_workers: Optional[int] = None,
+) -> SavingsAggregate:
+    """Aggregates batches of households in worker processes (see aggregate_savings),
+    and merges the workers' aggregates as they finish
+
+    At most two batches per worker are read ahead, so only a few batches are ever in
+    memory however many there are.
+
+    Args:
+        batches (Iterable[Sequence[Dict[str, Any]]]): batches of households as JSON API dicts
+        group_by (Sequence[str], optional): the AGGREGATE_GROUP_KEYS to group by. Defaults to location.
+        max_workers (int, optional): the number of processes. Defaults to None, i.e. one per CPU.
+
+    Returns:
+        SavingsAggregate: the savings of every batch's households by group
+    """
+    aggregate = SavingsAggregate(group_by)
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        max_pending = 2 * max_workers
+        pending = set()
+        for batch in batches:
+            pending.add(executor.submit(aggregate_savings, list(batch), group_by))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    aggregate.merge(future.result())
+        for future in wait(pending).done:
+            aggregate.merge(future.result())
+    return aggregate
@@ -22,6 +22,8 @@ def electrify_household(current_household: Household) -> Household:
             "vehicles": [electrify_vehicle(v) for v in current_household.vehicles],
             "solar": install_solar(current_household.solar),
             "battery": install_battery(current_household.battery),
+            # The household's use of its machines doesn't change with their fuel
+            "meter_calibration": current_household.meter_calibration,
         }
     )
     return electrified_household
@@ -0,0 +1,425 @@
+import heapq
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.savings_cube import calculate_cell_values
+from openapi_client.models import Household, MeterCalibration
+from utils.clean_household import clean_household
+from utils.household_projections import (
+    project_appliances,
+    project_meter_calibration,
+    project_occupancy,
+)
+from utils.validate_household import validate_household
+
+# The most rounds of k-means in each configuration, which usually settles well before
+KMEANS_ITERATIONS = 25
+
+# Households to find the distances to the centres of at once, to bound memory
+_DISTANCE_CHUNK_SIZE = 1 << 16
+
+
+@dataclass(frozen=True, eq=False)
+class HouseholdArchetypes:
+    """A population compressed into weighted archetypes
+
+    Each archetype shares its members' discrete inputs (location, occupancy,
+    appliances, vehicles' fuel types & whether they switch to EV, and whether they
+    have or will install solar & a battery), and has their (weighted) mean kms_per_week,
+    solar size, battery capacity & meter calibration factors.
+    """
+
+    archetypes: List[Household]  # cleaned (see clean_household)
+    # The households each archetype stands for, shape (n_archetypes,)
+    weights: np.ndarray
+    assignments: np.ndarray  # each household's archetype, shape (n_households,)
+    household_weights: np.ndarray  # each household's weight, shape (n_households,)
+
+
+@dataclass(frozen=True)
+class CompressionError:
+    """How far the archetypes' totals are from a full run's, per measure
+
+    The full run's totals are within total + error ± margin, with the confidence they
+    were estimated with. The margin is 0 when every household was run.
+    """
+
+    total: np.ndarray  # the archetypes' totals
+    error: np.ndarray  # the full run's totals minus the archetypes'
+    margin: np.ndarray
+    sampled: int  # the number of households run
+
+    @property
+    def bound(self) -> np.ndarray:
+        """The most the archetypes' totals are off by"""
+        return np.abs(self.error) + self.margin
+
+    @property
+    def relative_bound(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.bound / np.abs(self.total)
+
+
+def get_archetype_key(household: Household) -> Hashable:
+    """The household's discrete inputs, before & after it's electrified. Only
+    households with the same key are clustered together."""
+    return (
+        household.location,
+        project_occupancy(household.occupancy),
+        project_appliances(household),
+        tuple((v.fuel_type, v.switch_to_ev) for v in household.vehicles or []),
+        (
+            household.solar.has_solar,
+            household.solar.install_solar,
+            household.solar.size is None,
+        ),
+        (
+            household.battery.has_battery,
+            household.battery.install_battery,
+            household.battery.capacity is None,
+        ),
+    )
+
+
+def get_archetype_features(household: Household) -> np.ndarray:
+    """The household's continuous inputs: each vehicle's kms_per_week, then the solar
+    size, battery capacity and meter calibration factors (0 when they're None)"""
+    return np.array(
+        [v.kms_per_week for v in household.vehicles or []]
+        + [household.solar.size or 0, household.battery.capacity or 0]
+        + list(project_meter_calibration(household.meter_calibration)),
+        dtype=float,
+    )
+
+
+def compress_households(
+    households: Sequence[Household],
+    n_archetypes: Optional[int] = None,
+    weights: Optional[Sequence[float]] = None,
+    seed: int = 0,
+) -> HouseholdArchetypes:
+    """Clusters the households into weighted archetypes
+
+    Households are grouped by their discrete inputs (see get_archetype_key), and each
+    group gets at least one archetype. The rest go to the groups whose continuous
+    inputs are most spread out, which are split by weighted k-means. Inputs are
+    compared in units of their standard deviation over the whole population.
+
+    Args:
+        households (Sequence[Household]): the population
+        n_archetypes (int, optional): the number of archetypes. Defaults to None, i.e. one per group of discrete inputs.
+        weights (Sequence[float], optional): the number of households each one stands for, e.g. survey weights. Defaults to None, i.e. 1 each.
+        seed (int, optional): seeds k-means. Defaults to 0.
+
+    Raises:
+        ValueError: if there are fewer archetypes than groups of discrete inputs, or the weights don't match the households
+
+    Returns:
+        HouseholdArchetypes: the archetypes
+    """
+    for household in households:
+        validate_household(household)
+    # Copying every household to clean it takes longer than clustering them, so only
+    # those with vehicles missing their kms_per_week are cleaned
+    households = [
+        (
+            clean_household(household.copy())
+            if any(vehicle.kms_per_week is None for vehicle in household.vehicles)
+            else household
+        )
+        for household in households
+    ]
+    household_weights = (
+        np.ones(len(households))
+        if weights is None
+        else np.asarray(weights, dtype=float)
+    )
+    if household_weights.shape != (len(households),) or np.any(household_weights < 0):
+        raise ValueError("Need a non-negative weight for each household")
+
+    groups: Dict[Hashable, List[int]] = {}
+    for i, household in enumerate(households):
+        groups.setdefault(get_archetype_key(household), []).append(i)
+    if n_archetypes is None:
+        n_archetypes = len(groups)
+    if n_archetypes < len(groups):
+        raise ValueError(
+            f"Need at least {len(groups)} archetypes, one per group of discrete inputs"
+        )
+
+    members = [np.array(indices) for indices in groups.values()]
+    features = [
+        np.array([get_archetype_features(households[i]) for i in indices])
+        for indices in members
+    ]
+    points = [f / s for f, s in zip(features, _get_feature_scales(features))]
+    sizes = _allocate_archetypes(
+        points, [household_weights[indices] for indices in members], n_archetypes
+    )
+
+    rng = np.random.default_rng(seed)
+    archetypes = []
+    archetype_weights = []
+    assignments = np.empty(len(households), dtype=np.int64)
+    for indices, group_features, group_points, size in zip(
+        members, features, points, sizes
+    ):
+        group_weights = household_weights[indices]
+        labels = _cluster(group_points, group_weights, size, rng)
+        for label in range(labels.max() + 1):
+            in_cluster = labels == label
+            cluster_weights = group_weights[in_cluster]
+            assignments[indices[in_cluster]] = len(archetypes)
+            archetypes.append(
+                _get_archetype(
+                    households[indices[in_cluster][0]],
+                    np.average(
+                        group_features[in_cluster],
+                        axis=0,
+                        weights=(
+                            cluster_weights if cluster_weights.sum() > 0 else None
+                        ),
+                    ),
+                )
+            )
+            archetype_weights.append(cluster_weights.sum())
+    return HouseholdArchetypes(
+        archetypes=archetypes,
+        weights=np.array(archetype_weights),
+        assignments=assignments,
+        household_weights=household_weights,
+    )
+
+
+def calculate_archetype_values(
+    archetypes: HouseholdArchetypes,
+    evaluate: Callable[[Household], np.ndarray] = calculate_cell_values,
+) -> np.ndarray:
+    """Each archetype's values per household, shape (n_archetypes, n_measures)
+
+    Args:
+        archetypes (HouseholdArchetypes): the archetypes
+        evaluate (Callable[[Household], np.ndarray], optional): calculates a household's measures. Defaults to calculate_cell_values, i.e. the CUBE_MEASURES.
+    """
+    return np.array(
+        [evaluate(archetype.copy(deep=True)) for archetype in archetypes.archetypes]
+    )
+
+
+def estimate_compression_error(
+    households: Sequence[Household],
+    archetypes: HouseholdArchetypes,
+    archetype_values: np.ndarray,
+    evaluate: Callable[[Household], np.ndarray] = calculate_cell_values,
+    sample_size: Optional[int] = 1000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> CompressionError:
+    """Compares the archetypes' totals with a full run over the households
+
+    Each sampled household's error is its own values minus its archetype's. Households
+    are sampled in proportion to their weight, so the full run's error is the total
+    weight times their mean error, give or take its standard error.
+
+    Args:
+        households (Sequence[Household]): the population the archetypes were compressed from
+        archetypes (HouseholdArchetypes): the archetypes
+        archetype_values (np.ndarray): the archetypes' values (see calculate_archetype_values)
+        evaluate (Callable[[Household], np.ndarray], optional): calculates a household's measures, as for the archetypes. Defaults to calculate_cell_values.
+        sample_size (int, optional): the number of households to run. Defaults to 1000. None runs every household, for the exact error.
+        confidence (float, optional): the confidence of the margin. Defaults to 0.95.
+        seed (int, optional): seeds the sample. Defaults to 0.
+
+    Returns:
+        CompressionError: the archetypes' totals & error per measure
+    """
+    household_weights = archetypes.household_weights
+    total = archetypes.weights @ archetype_values
+    if sample_size is None or sample_size >= len(households):
+        errors = _get_household_errors(
+            households, archetypes, archetype_values, evaluate, range(len(households))
+        )
+        return CompressionError(
+            total=total,
+            error=household_weights @ errors,
+            margin=np.zeros_like(total),
+            sampled=len(households),
+        )
+
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(
+        len(households),
+        size=sample_size,
+        p=household_weights / household_weights.sum(),
+    )
+    errors = _get_household_errors(
+        households, archetypes, archetype_values, evaluate, sample
+    )
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return CompressionError(
+        total=total,
+        error=household_weights.sum() * errors.mean(axis=0),
+        margin=z
+        * household_weights.sum()
+        * errors.std(axis=0, ddof=1)
+        / np.sqrt(sample_size),
+        sampled=sample_size,
+    )
+
+
+def _get_household_errors(
+    households: Sequence[Household],
+    archetypes: HouseholdArchetypes,
+    archetype_values: np.ndarray,
+    evaluate: Callable[[Household], np.ndarray],
+    indices: Sequence[int],
+) -> np.ndarray:
+    return np.array(
+        [
+            evaluate(households[i].copy(deep=True))
+            - archetype_values[archetypes.assignments[i]]
+            for i in indices
+        ]
+    )
+
+
+def _get_feature_scales(points: List[np.ndarray]) -> List[np.ndarray]:
+    # Every vehicle's kms share a scale, as do the two calibration factors
+    kms = np.concatenate([p[:, :-4].reshape(-1) for p in points])
+    other = np.concatenate([p[:, -4:] for p in points])
+    stds = [
+        kms.std() if kms.size else 0,
+        other[:, 0].std(),
+        other[:, 1].std(),
+        other[:, 2:].std(),
+    ]
+    kms_scale, solar_scale, battery_scale, calibration_scale = [
+        std if std > 0 else 1.0 for std in stds
+    ]
+    return [
+        np.array(
+            [kms_scale] * (p.shape[1] - 4)
+            + [solar_scale, battery_scale, calibration_scale, calibration_scale]
+        )
+        for p in points
+    ]
+
+
+def _allocate_archetypes(
+    points: List[np.ndarray], weights: List[np.ndarray], n_archetypes: int
+) -> List[int]:
+    """One archetype per group, then one at a time to the group whose squared
+    error (as the sum of squared distances to its centre) would fall the most,
+    assuming it falls with the square of the number of archetypes"""
+    sizes = [1] * len(points)
+    limits = [len(np.unique(p, axis=0)) for p in points]
+    spreads = []
+    for p, w in zip(points, weights):
+        centre = np.average(p, axis=0, weights=w if w.sum() > 0 else None)
+        spreads.append(float(w @ ((p - centre) ** 2).sum(axis=1)))
+
+    def gain(i: int) -> Tuple[float, int]:
+        k = sizes[i]
+        return (-spreads[i] * (1 / k**2 - 1 / (k + 1) ** 2), i)
+
+    queue = [gain(i) for i in range(len(points)) if limits[i] > 1 and spreads[i] > 0]
+    heapq.heapify(queue)
+    for _ in range(n_archetypes - len(points)):
+        if not queue:
+            break
+        _, i = heapq.heappop(queue)
+        sizes[i] += 1
+        if sizes[i] < limits[i]:
+            heapq.heappush(queue, gain(i))
+    return sizes
+
+
+def _cluster(
+    points: np.ndarray, weights: np.ndarray, k: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Each point's cluster by weighted k-means, numbered from 0 in the order of their
+    first point"""
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    if k >= len(unique):
+        return _number_in_order(inverse)
+    unique_weights = np.bincount(inverse, weights=weights, minlength=len(unique))
+    # Points without weight can still be picked as centres, just rarely
+    unique_weights = unique_weights + 1e-9
+
+    # k-means++: each new centre is picked in proportion to its squared distance
+    # to the nearest centre so far
+    centres = [unique[rng.choice(len(unique), p=unique_weights / unique_weights.sum())]]
+    distances = ((unique - centres[0]) ** 2).sum(axis=1)
+    for _ in range(k - 1):
+        p = unique_weights * distances
+        centres.append(unique[rng.choice(len(unique), p=p / p.sum())])
+        distances = np.minimum(distances, ((unique - centres[-1]) ** 2).sum(axis=1))
+    centres = np.array(centres)
+
+    labels = None
+    for _ in range(KMEANS_ITERATIONS):
+        new_labels = _get_nearest_centres(unique, centres)
+        if labels is not None and np.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+        cluster_weights = np.bincount(labels, weights=unique_weights, minlength=k)
+        for axis in range(unique.shape[1]):
+            sums = np.bincount(
+                labels, weights=unique_weights * unique[:, axis], minlength=k
+            )
+            # Clusters that lose all their points keep their centre
+            centres[:, axis] = np.where(
+                cluster_weights > 0,
+                sums / np.maximum(cluster_weights, 1e-300),
+                centres[:, axis],
+            )
+    return _number_in_order(labels[inverse])
+
+
+def _number_in_order(labels: np.ndarray) -> np.ndarray:
+    clusters, first, labels = np.unique(labels, return_index=True, return_inverse=True)
+    order = np.empty(len(clusters), dtype=np.int64)
+    order[np.argsort(first)] = np.arange(len(clusters))
+    return order[labels.reshape(-1)]
+
+
+def _get_nearest_centres(points: np.ndarray, centres: np.ndarray) -> np.ndarray:
+    return np.concatenate(
+        [
+            ((points[start : start + _DISTANCE_CHUNK_SIZE, np.newaxis] - centres) ** 2)
+            .sum(axis=2)
+            .argmin(axis=1)
+            for start in range(0, len(points), _DISTANCE_CHUNK_SIZE)
+        ]
+    )
+
+
+def _get_archetype(member: Household, features: np.ndarray) -> Household:
+    """A copy of one of the cluster's households at the cluster's mean features"""
+    *kms, solar_size, battery_capacity, baseload_factor, space_heating_factor = (
+        features.tolist()
+    )
+    update = {
+        # kms_per_week is an integer
+        "vehicles": [
+            vehicle.copy(update={"kms_per_week": round(vehicle_kms)})
+            for vehicle, vehicle_kms in zip(member.vehicles or [], kms)
+        ],
+        "meter_calibration": (
+            None
+            if (baseload_factor, space_heating_factor) == (1.0, 1.0)
+            else MeterCalibration(
+                baseload_factor=baseload_factor,
+                space_heating_factor=space_heating_factor,
+            )
+        ),
+    }
+    if member.solar.size is not None:
+        update["solar"] = member.solar.copy(update={"size": solar_size})
+    if member.battery.capacity is not None:
+        update["battery"] = member.battery.copy(update={"capacity": battery_capacity})
+    return member.copy(update=update)
@@ -0,0 +1,385 @@
+import itertools
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants.fuel_stats import FuelTypeEnum
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.machines.machine_info import MachineEnum
+from constants.machines.replacement import MACHINE_LIFESPAN_YEARS
+from constants.utils import DAYS_PER_YEAR, PeriodEnum
+from openapi_client.models import Household, LocationEnum
+from savings.closed_form.compile_household_model import (
+    CLOSED_FORM_PERIODS,
+    LinearHouseholdModel,
+    compile_household_model,
+    project_discrete_inputs,
+)
+from savings.closed_form.evaluate_household_model import (
+    evaluate_household_at_points,
+    get_continuous_inputs,
+)
+from savings.emissions.calculate_emissions_trajectory import (
+    EMISSIONS_FUEL_TYPES,
+    get_yearly_emissions_by_category,
+)
+from savings.emissions.get_machine_emissions import MACHINE_PROFILE_CATEGORY
+from savings.energy.synthesise_load_profiles import get_daily_kwh_by_category
+from utils.grid_emissions import get_lifetime_years
+
+# The kinds of machine that wear out & are replaced, in MACHINE_LIFESPAN_YEARS order
+STOCK_CATEGORIES = list(MACHINE_LIFESPAN_YEARS)
+
+REGIONS = list(LocationEnum)
+
+# Households are projected this many at a time, which bounds the memory used
+STOCK_TURNOVER_CHUNK_SIZE = 20_000
+
+
+@dataclass(frozen=True)
+class UptakeRule:
+    """What a category's machines are replaced with when they wear out
+
+    e.g. UptakeRule("water_heating", WaterHeatingEnum.ELECTRIC_HEAT_PUMP,
+    frozenset({WaterHeatingEnum.GAS})) replaces every gas water heater with a heat pump
+    at the end of its life. Vehicles are replaced with the replacement's fuel type.
+    """
+
+    category: str  # one of STOCK_CATEGORIES
+    replacement: MachineEnum
+    # The machines that are replaced, or None for every machine but the replacement
+    replaces: Optional[FrozenSet[MachineEnum]] = None
+    # The share of worn out machines replaced by the replacement. The rest are
+    # replaced like for like, and can be replaced by it when they wear out in turn.
+    uptake: float = 1.0
+    # The year the rule starts, or None for the first year of the projection
+    first_year: Optional[int] = None
+
+    def __post_init__(self):
+        if self.category not in STOCK_CATEGORIES:
+            raise ValueError(
+                f"Unknown machine category {self.category}. "
+                f"Choose from: {', '.join(STOCK_CATEGORIES)}"
+            )
+        if MACHINE_PROFILE_CATEGORY[type(self.replacement)] != self.category:
+            raise ValueError(
+                f"{self.replacement.value} can't replace a machine in {self.category}"
+            )
+        if not 0 <= self.uptake <= 1:
+            raise ValueError("Uptake must be between 0 and 1")
+
+    def applies_to(self, machine: MachineEnum) -> bool:
+        return machine != self.replacement and (
+            self.replaces is None or machine in self.replaces
+        )
+
+
+@dataclass(frozen=True)
+class StockTurnoverProjection:
+    """A population's yearly totals by region, as its machines are replaced"""
+
+    years: Tuple[int, ...]
+    regions: Tuple[LocationEnum, ...]
+    fuel_types: Tuple[FuelTypeEnum, ...]
+    energy: np.ndarray  # kWh, shape (n_regions, n_fuel_types, n_years)
+    opex: np.ndarray  # $, shape (n_regions, n_years)
+    emissions: np.ndarray  # kgCO2e, shape (n_regions, n_years)
+    # Machines replaced by their rule's replacement (in households, weighted), shape
+    # (n_regions, n_stock_categories, n_years) in STOCK_CATEGORIES order
+    replaced: np.ndarray
+
+
+def get_replacement_household(
+    household: Household, rules: Sequence[UptakeRule]
+) -> Household:
+    """The household with every machine that a rule applies to replaced"""
+    update = {}
+    for rule in rules:
+        if rule.category == "vehicles":
+            update["vehicles"] = [
+                (
+                    vehicle.copy(update={"fuel_type": rule.replacement})
+                    if rule.applies_to(vehicle.fuel_type)
+                    else vehicle
+                )
+                for vehicle in household.vehicles or []
+            ]
+        elif rule.applies_to(getattr(household, rule.category)):
+            update[rule.category] = rule.replacement
+    return household.copy(update=update)
+
+
+def get_replaced_shares(
+    ages: np.ndarray,
+    applies: np.ndarray,
+    uptake: np.ndarray,
+    first_year_index: np.ndarray,
+    n_years: int,
+) -> np.ndarray:
+    """How much of each household's machines have been replaced by their rule's
+    replacement in each year
+
+    A machine wears out at the start of the year it reaches its lifespan (see
+    MACHINE_LIFESPAN_YEARS), when the uptake share of it is replaced by the replacement
+    and the rest like for like. Either way, it's then new. The shares are expected
+    values, so a household can be part way between the two.
+
+    Args:
+        ages (np.ndarray): each machine's age in years at the start of the first year, shape (n_households, n_stock_categories)
+        applies (np.ndarray): whether a rule applies to each machine, shape (n_households, n_stock_categories)
+        uptake (np.ndarray): each category's rule's uptake, shape (n_stock_categories,)
+        first_year_index (np.ndarray): the year each category's rule starts, from 0, shape (n_stock_categories,)
+        n_years (int): the number of years
+
+    Returns:
+        np.ndarray: shape (n_households, n_stock_categories, n_years)
+    """
+    lifespans = np.array([MACHINE_LIFESPAN_YEARS[c] for c in STOCK_CATEGORIES])
+    age = np.asarray(ages, dtype=float)
+    share = np.zeros(age.shape)
+    shares = np.empty(age.shape + (n_years,))
+    for year in range(n_years):
+        worn_out = age >= lifespans
+        adopting = worn_out & applies & (year >= first_year_index)
+        share = np.where(adopting, share + (1 - share) * uptake, share)
+        age = np.where(worn_out, 0, age) + 1
+        shares[:, :, year] = share
+    return shares
+
+
+def get_yearly_opex(
+    households: Sequence[Household],
+    shares: np.ndarray,
+    applies: np.ndarray,
+    rules_by_category: Dict[str, UptakeRule],
+    models: Optional[Dict[Hashable, LinearHouseholdModel]] = None,
+) -> np.ndarray:
+    """Each household's expected yearly opex as its machines are replaced
+
+    A household's opex is its yearly opex in /savings (see get_household_totals), i.e.
+    with fixed costs, RUCs & solar. As opex isn't linear in the machines (e.g. the gas
+    fixed costs go when the last gas machine does), it's the opex of each combination
+    of the household's machines being replaced or not, weighted by how likely the
+    combination is, with each category replaced independently.
+
+    The combinations are grouped by their discrete inputs (see
+    project_discrete_inputs), so each group's linear model is compiled once and
+    evaluated at every member's continuous inputs together. The models are compiled
+    without the stage caches, which a whole population would only churn.
+
+    Args:
+        households (Sequence[Household]): the households, cleaned (see clean_household)
+        shares (np.ndarray): how much of each machine has been replaced, shape (n_households, n_stock_categories, n_years) (see get_replaced_shares)
+        applies (np.ndarray): whether a rule applies to each machine, shape (n_households, n_stock_categories)
+        rules_by_category (Dict[str, UptakeRule]): the rules, by category
+        models (Dict[Hashable, LinearHouseholdModel], optional): models already compiled, by discrete inputs, which new ones are added to. Defaults to None.
+
+    Returns:
+        np.ndarray: $, shape (n_households, n_years)
+    """
+    yearly = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+    models = {} if models is None else models
+    inputs = [get_continuous_inputs(household) for household in households]
+
+    # Households with the same machines & rules have the same combinations
+    by_machines: Dict[Hashable, List[int]] = {}
+    for i, household in enumerate(households):
+        key = (project_discrete_inputs(household), tuple(applies[i]))
+        by_machines.setdefault(key, []).append(i)
+
+    # Each combination's households & weights, by its discrete inputs
+    groups: Dict[Hashable, Tuple[Household, List[np.ndarray], List[np.ndarray]]] = {}
+    for members in by_machines.values():
+        members = np.array(members)
+        categories = np.flatnonzero(applies[members[0]])
+        for replaced in itertools.product([False, True], repeat=len(categories)):
+            weight = np.ones((len(members), shares.shape[2]))
+            for c, is_replaced in zip(categories, replaced):
+                weight *= shares[members, c] if is_replaced else 1 - shares[members, c]
+            # Combinations that never happen aren't evaluated
+            happens = np.any(weight, axis=1)
+            if not np.any(happens):
+                continue
+            combination = get_replacement_household(
+                households[members[0]],
+                [
+                    rules_by_category[STOCK_CATEGORIES[c]]
+                    for c, is_replaced in zip(categories, replaced)
+                    if is_replaced
+                ],
+            )
+            _, group_members, group_weights = groups.setdefault(
+                project_discrete_inputs(combination), (combination, [], [])
+            )
+            group_members.append(members[happens])
+            group_weights.append(weight[happens])
+
+    opex = np.zeros((len(households), shares.shape[2]))
+    for key, (combination, group_members, group_weights) in groups.items():
+        if key not in models:
+            # Without memoise_stage's cache
+            models[key] = compile_household_model.__wrapped__(combination)
+        members = np.concatenate(group_members)
+        kms, solar_size, battery_capacity = (
+            np.concatenate([inputs[i][j] for i in members]) for j in range(3)
+        )
+        totals = evaluate_household_at_points(
+            models[key], combination, kms, solar_size, battery_capacity
+        )
+        np.add.at(
+            opex,
+            members,
+            np.concatenate(group_weights) * totals["opex"][:, yearly, np.newaxis],
+        )
+    return opex
+
+
+def project_stock_turnover(
+    households: Sequence[Household],
+    ages: np.ndarray,
+    rules: Sequence[UptakeRule],
+    weights: Optional[np.ndarray] = None,
+    years: Optional[Sequence[int]] = None,
+    chunk_size: int = STOCK_TURNOVER_CHUNK_SIZE,
+) -> StockTurnoverProjection:
+    """Projects a population's energy, opex & emissions as its machines wear out and
+    are replaced according to the uptake rules
+
+    Each household's current & fully replaced (see get_replacement_household) kWh &
+    emissions by category are looked up for a chunk of households at once (see
+    get_daily_kwh_by_category & get_yearly_emissions_by_category), then mixed year by
+    year by how much of each machine has been replaced (see get_replaced_shares).
+
+    Opex is the households' yearly opex as in /savings, so it includes fixed costs,
+    RUCs & solar (see get_yearly_opex).
+
+    Args:
+        households (Sequence[Household]): the population, cleaned (see clean_household)
+        ages (np.ndarray): each household's machines' ages in years at the start of the first year, shape (n_households, n_stock_categories). A household's vehicles are replaced together.
+        rules (Sequence[UptakeRule]): at most one per category. Categories without a rule are replaced like for like.
+        weights (np.ndarray, optional): how many households each one represents, shape (n_households,). Defaults to None, i.e. 1 each.
+        years (Sequence[int], optional): consecutive years to project. Defaults to None, i.e. get_lifetime_years().
+        chunk_size (int, optional): households projected at a time. Defaults to STOCK_TURNOVER_CHUNK_SIZE.
+
+    Raises:
+        ValueError: if a category has more than one rule, or the ages or weights don't match the households
+
+    Returns:
+        StockTurnoverProjection: the population's totals by region in each year
+    """
+    years = list(get_lifetime_years() if years is None else years)
+    ages = np.asarray(ages, dtype=float)
+    weights = (
+        np.ones(len(households)) if weights is None else np.asarray(weights, float)
+    )
+    if ages.shape != (len(households), len(STOCK_CATEGORIES)):
+        raise ValueError(
+            f"Ages need to have shape ({len(households)}, {len(STOCK_CATEGORIES)})"
+        )
+    if weights.shape != (len(households),):
+        raise ValueError(f"Weights need to have shape ({len(households)},)")
+    if np.any(ages < 0) or np.any(weights < 0):
+        raise ValueError("Ages & weights can't be negative")
+    rules_by_category = {rule.category: rule for rule in rules}
+    if len(rules_by_category) != len(rules):
+        raise ValueError("Each machine category can only have one uptake rule")
+
+    uptake = np.array(
+        [
+            rules_by_category[c].uptake if c in rules_by_category else 0
+            for c in STOCK_CATEGORIES
+        ]
+    )
+    first_year_index = np.array(
+        [
+            (
+                max(0, (rules_by_category[c].first_year or years[0]) - years[0])
+                if c in rules_by_category
+                else 0
+            )
+            for c in STOCK_CATEGORIES
+        ]
+    )
+    profile_index = [PROFILE_CATEGORIES.index(c) for c in STOCK_CATEGORIES]
+
+    energy = np.zeros((len(REGIONS), len(EMISSIONS_FUEL_TYPES), len(years)))
+    opex = np.zeros((len(REGIONS), len(years)))
+    emissions = np.zeros((len(REGIONS), len(years)))
+    replaced = np.zeros((len(REGIONS), len(STOCK_CATEGORIES), len(years)))
+    models = {}
+    for start in range(0, len(households), chunk_size):
+        chunk = households[start : start + chunk_size]
+        replacements = [get_replacement_household(h, rules) for h in chunk]
+        applies = _get_rules_apply(chunk, rules_by_category)
+        shares = get_replaced_shares(
+            ages[start : start + chunk_size],
+            applies,
+            uptake,
+            first_year_index,
+            len(years),
+        )
+        # Shares by load profile category, where other appliances aren't replaced
+        profile_shares = np.zeros((len(chunk), len(PROFILE_CATEGORIES), len(years)))
+        profile_shares[:, profile_index] = shares
+
+        current_kwh, replacement_kwh = (
+            np.stack(
+                [get_daily_kwh_by_category(batch, f) for f in EMISSIONS_FUEL_TYPES]
+            )
+            * DAYS_PER_YEAR
+            for batch in (chunk, replacements)
+        )
+        chunk_energy = current_kwh.sum(axis=2)[:, :, np.newaxis] + np.einsum(
+            "fhc,hcy->fhy", replacement_kwh - current_kwh, profile_shares
+        )
+        current_emissions, replacement_emissions = (
+            get_yearly_emissions_by_category(batch, years)
+            for batch in (chunk, replacements)
+        )
+        chunk_emissions = current_emissions.sum(axis=1) + np.einsum(
+            "hcy,hcy->hy", replacement_emissions - current_emissions, profile_shares
+        )
+
+        # Each region's weighted sum of its households
+        by_region = np.zeros((len(REGIONS), len(chunk)))
+        by_region[[REGIONS.index(h.location) for h in chunk], np.arange(len(chunk))] = (
+            weights[start : start + chunk_size]
+        )
+        energy += np.einsum("rh,fhy->rfy", by_region, chunk_energy)
+        opex += by_region @ get_yearly_opex(
+            chunk, shares, applies, rules_by_category, models
+        )
+        emissions += by_region @ chunk_emissions
+        replaced += np.einsum("rh,hcy->rcy", by_region, shares)
+
+    return StockTurnoverProjection(
+        years=tuple(years),
+        regions=tuple(REGIONS),
+        fuel_types=tuple(EMISSIONS_FUEL_TYPES),
+        energy=energy,
+        opex=opex,
+        emissions=emissions,
+        replaced=replaced,
+    )
+
+
+def _get_rules_apply(
+    households: Sequence[Household], rules_by_category: dict
+) -> np.ndarray:
+    # Whether each household has a machine in each category that its rule replaces
+    applies: List[List[bool]] = []
+    for household in households:
+        row = []
+        for category in STOCK_CATEGORIES:
+            rule = rules_by_category.get(category)
+            if rule is None:
+                row.append(False)
+            elif category == "vehicles":
+                row.append(
+                    any(rule.applies_to(v.fuel_type) for v in household.vehicles or [])
+                )
+            else:
+                row.append(rule.applies_to(getattr(household, category)))
+        applies.append(row)
+    return np.array(applies, dtype=bool).reshape(len(households), -1)
@@ -0,0 +1,506 @@
+import argparse
+import contextlib
+import itertools
+import json
+import math
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.electrify_household import electrify_household
+from openapi_client.models import (
+    Battery,
+    CooktopEnum,
+    Household,
+    LocationEnum,
+    Solar,
+    SpaceHeatingEnum,
+    Vehicle,
+    VehicleFuelTypeEnum,
+    WaterHeatingEnum,
+)
+from params import (
+    OPERATIONAL_LIFETIME,
+    OPTIMISE_BATTERY_DISPATCH,
+    SCHEDULE_FLEXIBLE_LOADS,
+    TIME_VARYING_GRID_EMISSIONS,
+    WEATHER_AWARE_SPACE_HEATING,
+)
+from savings.closed_form.evaluate_household_model import (
+    calculate_emissions_closed_form,
+    calculate_opex_closed_form,
+)
+from savings.upfront_cost.calculate_upfront_cost import calculate_upfront_cost
+from utils.clean_household import clean_household
+from utils.household_projections import MAX_OCCUPANCY_BUCKET
+from utils.validate_household import validate_household
+
+# Illustrative numbers of households in each location, and the shares of households
+# with each kind of space heating, water heating, cooktop, occupancy & mix of vehicles.
+# The file is JSON with an object per CUBE_DIMENSIONS, from label to number or share.
+# Vehicle mixes are fuel types joined by "+", e.g. "PETROL+ELECTRIC", or "NONE".
+DEFAULT_HOUSEHOLD_SHARES_PATH = (
+    Path(__file__).parent.parent / "data" / "household_shares.json"
+)
+
+# Bump to rebuild cached cubes after changing the assumptions they're calculated with
+# (e.g. prices or emissions factors in constants/)
+SAVINGS_CUBE_VERSION = 2
+
+# The household fields the cube is indexed by, by their API name, in axis order
+CUBE_DIMENSIONS = [
+    "location",
+    "spaceHeating",
+    "waterHeating",
+    "cooktop",
+    "occupancy",
+    "vehicles",
+]
+
+# The values in each cell, per household, by their batch column name
+CUBE_MEASURES = [
+    "emissions.perYear.before",
+    "emissions.perYear.after",
+    "emissions.perYear.difference",
+    "opex.perYear.before",
+    "opex.perYear.after",
+    "opex.perYear.difference",
+    "upfrontCost.total",
+]
+
+NO_VEHICLES = "NONE"
+
+# Builds are serialised, so that a request & the ranking's refresh (see
+# SavingsRankingIndex) that both miss the cache share one build
+_BUILD_LOCK = threading.Lock()
+
+_DIMENSION_LABELS = {
+    "location": [location.value for location in LocationEnum],
+    "spaceHeating": [machine.value for machine in SpaceHeatingEnum],
+    "waterHeating": [machine.value for machine in WaterHeatingEnum],
+    "cooktop": [machine.value for machine in CooktopEnum],
+    "occupancy": list(range(1, MAX_OCCUPANCY_BUCKET + 1)),
+}
+_VEHICLE_FUEL_TYPES = [fuel_type.value for fuel_type in VehicleFuelTypeEnum]
+
+
+@dataclass(frozen=True, eq=False)
+class SavingsCube:
+    """Savings of every combination of the CUBE_DIMENSIONS, with how many households
+    have each one
+
+    Cells are indexed by the position of their label in each dimension, so a slice
+    or roll-up is an index & a weighted sum over the cells' arrays.
+    """
+
+    labels: Tuple[Tuple[Any, ...], ...]  # per dimension, in CUBE_DIMENSIONS order
+    households: np.ndarray  # shape (n_labels per dimension...)
+    # float32 per household, shape (n_measures, n_labels per dimension...)
+    values: np.ndarray
+    # The values times the households, i.e. each cell's totals
+    totals: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "totals", self.values * self.households)
+
+    def query(
+        self,
+        filters: Optional[Mapping[str, Sequence[Any]]] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """Rolls the cube up to the groups, over the cells that match the filters
+
+        Args:
+            filters (Mapping[str, Sequence[Any]], optional): the labels to keep by dimension, e.g. {"location": ["OTAGO"]}. Labels are matched as strings. Defaults to None, i.e. every cell.
+            group_by (Sequence[str], optional): the dimensions to group by. Defaults to (), i.e. one row for all the matching cells.
+
+        Raises:
+            ValueError: if a dimension or label isn't in the cube
+
+        Returns:
+            List[Dict[str, Any]]: one row per group, with its label in each grouped
+                dimension, its number of "households", and the mean (per household) &
+                total of each measure, e.g. "opex.perYear.difference.mean"
+        """
+        filters = filters or {}
+        unknown = (set(filters) | set(group_by)) - set(CUBE_DIMENSIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown savings cube dimensions: {', '.join(sorted(unknown))}. "
+                f"Choose from: {', '.join(CUBE_DIMENSIONS)}"
+            )
+
+        indices = []
+        for dimension, labels in zip(CUBE_DIMENSIONS, self.labels):
+            if dimension not in filters:
+                indices.append(range(len(labels)))
+                continue
+            positions = {str(label): i for i, label in enumerate(labels)}
+            missing = [str(v) for v in filters[dimension] if str(v) not in positions]
+            if missing:
+                raise ValueError(
+                    f"Unknown {dimension} in the savings cube: {', '.join(missing)}"
+                )
+            indices.append(
+                np.array([positions[str(v)] for v in dict.fromkeys(filters[dimension])])
+            )
+
+        households, totals = self.households, self.totals
+        for axis, (dimension, index) in enumerate(zip(CUBE_DIMENSIONS, indices)):
+            if dimension in filters:
+                households = households.take(index, axis=axis)
+                totals = totals.take(index, axis=axis + 1)
+        # Sum over every dimension that isn't grouped by, then order the groups' axes
+        # as in group_by
+        group_by = list(dict.fromkeys(group_by))
+        group_axes = [CUBE_DIMENSIONS.index(dimension) for dimension in group_by]
+        other_axes = tuple(
+            axis for axis in range(len(CUBE_DIMENSIONS)) if axis not in group_axes
+        )
+        order = [sorted(group_axes).index(axis) for axis in group_axes]
+        households = households.sum(axis=other_axes).transpose(order)
+        totals = totals.sum(axis=tuple(axis + 1 for axis in other_axes)).transpose(
+            [0] + [axis + 1 for axis in order]
+        )
+
+        # Columns first, then rows, as building each row from the arrays is slow
+        # when there are many groups
+        households = households.reshape(-1)
+        totals = totals.reshape(len(CUBE_MEASURES), -1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(households > 0, totals / households, np.nan)
+        columns: Dict[str, List[Any]] = {
+            dimension: list(column)
+            for dimension, column in zip(
+                group_by,
+                zip(
+                    *itertools.product(
+                        *(
+                            [self.labels[axis][i] for i in indices[axis]]
+                            for axis in group_axes
+                        )
+                    )
+                ),
+            )
+        }
+        columns["households"] = households.tolist()
+        for measure, mean, total in zip(CUBE_MEASURES, means, totals):
+            columns[f"{measure}.mean"] = [
+                None if math.isnan(value) else value for value in mean.tolist()
+            ]
+            columns[f"{measure}.total"] = total.tolist()
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        return rows
+
+
+def load_household_shares(
+    path: Path = DEFAULT_HOUSEHOLD_SHARES_PATH,
+) -> Dict[str, Dict[str, float]]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def get_dimension_weights(
+    shares: Mapping[str, Mapping[str, float]]
+) -> Tuple[Tuple[Tuple[Any, ...], ...], np.ndarray]:
+    """Each dimension's labels, and the number of households in each cell
+
+    Households are spread over the cells as if each dimension were independent of the
+    others, i.e. a location's households times the share of each label in every other
+    dimension.
+
+    Args:
+        shares (Mapping[str, Mapping[str, float]]): per dimension, from label to number of households (for location) or share (see DEFAULT_HOUSEHOLD_SHARES_PATH)
+
+    Raises:
+        ValueError: if a dimension is missing or has an invalid label or share
+
+    Returns:
+        Tuple[Tuple[Tuple[Any, ...], ...], np.ndarray]: the labels per dimension, in
+            CUBE_DIMENSIONS order, and the households with shape (n_labels per dimension...)
+    """
+    labels = []
+    households = np.ones(())
+    for dimension in CUBE_DIMENSIONS:
+        if not shares.get(dimension):
+            raise ValueError(f"Household shares need {dimension}")
+        dimension_labels = tuple(
+            _parse_label(dimension, label) for label in shares[dimension]
+        )
+        weights = np.array(list(shares[dimension].values()), dtype=float)
+        if np.any(weights < 0) or weights.sum() == 0:
+            raise ValueError(f"Household shares of {dimension} must be non-negative")
+        if dimension != "location":
+            weights = weights / weights.sum()
+        labels.append(dimension_labels)
+        households = np.multiply.outer(households, weights)
+    return tuple(labels), households
+
+
+def get_cell_household(
+    location: str,
+    space_heating: str,
+    water_heating: str,
+    cooktop: str,
+    occupancy: int,
+    vehicles: str,
+) -> Household:
+    """The household in a cube cell: one without solar or a battery, whose vehicles
+    are switched to EVs when it's electrified"""
+    return Household(
+        location=location,
+        occupancy=occupancy,
+        space_heating=space_heating,
+        water_heating=water_heating,
+        cooktop=cooktop,
+        vehicles=[
+            Vehicle(fuel_type=fuel_type, switch_to_ev=True)
+            for fuel_type in ([] if vehicles == NO_VEHICLES else vehicles.split("+"))
+        ],
+        solar=Solar(has_solar=False, install_solar=False),
+        battery=Battery(has_battery=False, install_battery=False),
+    )
+
+
+def calculate_cell_values(household: Household) -> np.ndarray:
+    """The household's CUBE_MEASURES, as /savings calculates them"""
+    validate_household(household)
+    current = clean_household(household)
+    electrified = electrify_household(current)
+    emissions = calculate_emissions_closed_form(current, electrified).per_year
+    opex = calculate_opex_closed_form(current, electrified).per_year
+    upfront_cost = calculate_upfront_cost(current, electrified)
+    return np.array(
+        [
+            emissions.before,
+            emissions.after,
+            emissions.difference,
+            opex.before,
+            opex.after,
+            opex.difference,
+            sum(cost or 0 for cost in upfront_cost.dict().values()),
+        ]
+    )
+
+
+def build_savings_cube(
+    shares: Mapping[str, Mapping[str, float]], max_workers: Optional[int] = None
+) -> SavingsCube:
+    """Calculates the savings of every cell of the cube
+
+    Each location's cells are calculated in a worker process.
+
+    Args:
+        shares (Mapping[str, Mapping[str, float]]): the households in each dimension (see get_dimension_weights)
+        max_workers (int, optional): the number of processes. Defaults to None, i.e. one per CPU.
+
+    Returns:
+        SavingsCube: the cube
+    """
+    labels, households = get_dimension_weights(shares)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        values = list(
+            executor.map(
+                _calculate_location_values,
+                labels[0],
+                itertools.repeat(labels[1:]),
+            )
+        )
+    return SavingsCube(
+        labels=labels,
+        households=households,
+        values=np.stack(values, axis=1).astype(np.float32),
+    )
+
+
+@lru_cache(maxsize=2)
+def load_savings_cube(
+    path: Path = DEFAULT_HOUSEHOLD_SHARES_PATH,
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+) -> SavingsCube:
+    """Loads the savings cube for a household shares file, once per file (see
+    read_savings_cube)"""
+    return read_savings_cube(path, cache_path, max_workers)
+
+
+def get_savings_cube_source(path: Path = DEFAULT_HOUSEHOLD_SHARES_PATH) -> np.ndarray:
+    """What the cube for a household shares file is calculated from: the shares file,
+    the deploy switches in params.py and SAVINGS_CUBE_VERSION. The cube needs
+    rebuilding when this changes."""
+    stat = os.stat(path)
+    return np.array(
+        [
+            SAVINGS_CUBE_VERSION,
+            stat.st_size,
+            stat.st_mtime_ns,
+            OPERATIONAL_LIFETIME,
+            WEATHER_AWARE_SPACE_HEATING,
+            SCHEDULE_FLEXIBLE_LOADS,
+            OPTIMISE_BATTERY_DISPATCH,
+            TIME_VARYING_GRID_EMISSIONS,
+        ],
+        dtype=np.int64,
+    )
+
+
+def read_savings_cube(
+    path: Path = DEFAULT_HOUSEHOLD_SHARES_PATH,
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+) -> SavingsCube:
+    """Reads the savings cube for a household shares file from its cache, or builds it
+
+    Building the cube takes a few minutes, so it's built offline (see main) into an
+    .npz file next to the shares, and rebuilt when its source changes (see
+    get_savings_cube_source). A thread that finds the cache missing or out of date
+    waits for any build in progress, and only builds the cube if that didn't cache it.
+    If the cache can't be written, the cube is just built each time it's read.
+
+    Args:
+        path (Path, optional): the shares file. Defaults to DEFAULT_HOUSEHOLD_SHARES_PATH.
+        cache_path (Path, optional): the cache file. Defaults to savings_cube.npz next to the shares.
+        max_workers (int, optional): the number of processes to build it with. Defaults to None, i.e. one per CPU.
+
+    Returns:
+        SavingsCube: the cube
+    """
+    path = Path(path)
+    cache_path = _get_cache_path(path, cache_path)
+    source = get_savings_cube_source(path)
+    cube = _read_cached_savings_cube(cache_path, source)
+    if cube is not None:
+        return cube
+
+    with _BUILD_LOCK:
+        # Another thread may have built it while this one waited
+        cube = _read_cached_savings_cube(cache_path, source)
+        if cube is None:
+            cube = build_savings_cube(load_household_shares(path), max_workers)
+            try:
+                write_savings_cube(cube, source, cache_path)
+            except OSError:
+                pass
+    return cube
+
+
+def write_savings_cube(cube: SavingsCube, source: np.ndarray, cache_path: Path):
+    """Caches a savings cube built from the given source (see get_savings_cube_source)
+
+    The cache is written to a temporary file next to it, then moved over it, so that
+    readers never see a partly written cache.
+
+    Raises:
+        OSError: if the cache can't be written
+    """
+    cache_path = Path(cache_path)
+    fd, temp_path = tempfile.mkstemp(
+        dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(
+                f,
+                source=source,
+                households=cube.households,
+                values=cube.values,
+                **{
+                    f"labels.{dimension}": np.array(labels)
+                    for dimension, labels in zip(CUBE_DIMENSIONS, cube.labels)
+                },
+            )
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
+def _get_cache_path(path: Path, cache_path: Optional[Path]) -> Path:
+    return Path(cache_path) if cache_path else path.with_name("savings_cube.npz")
+
+
+def _read_cached_savings_cube(
+    cache_path: Path, source: np.ndarray
+) -> Optional[SavingsCube]:
+    # The cached cube, or None if it's missing, unreadable or out of date
+    try:
+        with np.load(cache_path) as cached:
+            if np.array_equal(cached["source"], source):
+                return SavingsCube(
+                    labels=tuple(
+                        tuple(cached[f"labels.{dimension}"].tolist())
+                        for dimension in CUBE_DIMENSIONS
+                    ),
+                    households=cached["households"],
+                    values=cached["values"],
+                )
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+        pass
+    return None
+
+
+def _parse_label(dimension: str, label: str) -> Any:
+    if dimension == "occupancy":
+        label = int(label)
+    if dimension == "vehicles":
+        fuel_types = [] if label == NO_VEHICLES else label.split("+")
+        if not all(f in _VEHICLE_FUEL_TYPES for f in fuel_types):
+            raise ValueError(f"Invalid vehicles in household shares: {label}")
+    elif label not in _DIMENSION_LABELS[dimension]:
+        raise ValueError(f"Invalid {dimension} in household shares: {label}")
+    return label
+
+
+def _calculate_location_values(
+    location: str, labels: Tuple[Tuple[Any, ...], ...]
+) -> np.ndarray:
+    # The location's cells, with shape (n_measures, n_labels per other dimension...)
+    values = np.array(
+        [
+            calculate_cell_values(get_cell_household(location, *cell))
+            for cell in itertools.product(*labels)
+        ]
+    )
+    return values.T.reshape((len(CUBE_MEASURES),) + tuple(map(len, labels)))
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Builds the savings cube for a household shares file & caches it, so that the
+    server doesn't build it in a request (see read_savings_cube)"""
+    parser = argparse.ArgumentParser(
+        prog="python -m models.savings_cube",
+        description="Builds & caches the savings cube for a household shares file.",
+    )
+    parser.add_argument(
+        "--shares",
+        type=Path,
+        default=DEFAULT_HOUSEHOLD_SHARES_PATH,
+        help="the household shares file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="the cache file (default: savings_cube.npz next to the shares)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="the number of processes to build it with (default: one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    source = get_savings_cube_source(args.shares)
+    cube = build_savings_cube(load_household_shares(args.shares), args.workers)
+    write_savings_cube(cube, source, _get_cache_path(args.shares, args.cache))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from logger import logger
+from models.savings_cube import (
+    CUBE_DIMENSIONS,
+    CUBE_MEASURES,
+    DEFAULT_HOUSEHOLD_SHARES_PATH,
+    SavingsCube,
+    get_savings_cube_source,
+    read_savings_cube,
+)
+from openapi_client.models import Emissions, Household, Opex, SavingsPercentiles
+from utils.household_projections import project_occupancy
+
+# Seconds between checks of whether the reference population's assumptions changed
+RANKING_CHECK_INTERVAL = 60
+
+
+@dataclass(frozen=True)
+class SavingsDistribution:
+    """The yearly savings of a group of households, sorted, with the number of
+    households that save up to each"""
+
+    savings: np.ndarray  # float32, ascending
+    households: np.ndarray  # cumulative
+
+    def get_percentile(self, savings: float) -> float:
+        """The share (%) of the households that save less, counting half of those that
+        save the same. Found by binary search, so O(log n)."""
+        # The cube's savings are float32, so ties are compared at that precision
+        savings = np.float32(savings)
+        below = np.searchsorted(self.savings, savings, side="left")
+        up_to = np.searchsorted(self.savings, savings, side="right")
+        households_below = self.households[below - 1] if below else 0.0
+        households_up_to = self.households[up_to - 1] if up_to else 0.0
+        return float(
+            100 * (households_below + households_up_to) / 2 / self.households[-1]
+        )
+
+
+# A location & occupancy, or None for every occupancy in the location
+RankingKey = Tuple[str, Optional[int]]
+
+
+@dataclass(frozen=True)
+class SavingsRanking:
+    """Distributions of yearly opex & emissions savings (before minus after) for each
+    location & occupancy of a reference population"""
+
+    opex: Dict[RankingKey, SavingsDistribution]
+    emissions: Dict[RankingKey, SavingsDistribution]
+
+    def rank(
+        self, household: Household, opex: Opex, emissions: Emissions
+    ) -> Optional[SavingsPercentiles]:
+        """Where the household's yearly savings fall among households in its location
+        with its occupancy, or None if there are none"""
+        key = (
+            household.location and household.location.value,
+            project_occupancy(household.occupancy),
+        )
+        if key not in self.opex:
+            return None
+        return SavingsPercentiles(
+            opex=round(self.opex[key].get_percentile(-opex.per_year.difference), 1),
+            emissions=round(
+                self.emissions[key].get_percentile(-emissions.per_year.difference), 1
+            ),
+            households=round(float(self.opex[key].households[-1]), 1),
+        )
+
+
+def build_savings_ranking(cube: SavingsCube) -> SavingsRanking:
+    """Sorts the savings of the cube's cells for each location & occupancy, weighted
+    by the households in each cell (see get_dimension_weights)
+
+    Args:
+        cube (SavingsCube): the reference population
+
+    Returns:
+        SavingsRanking: the ranking
+    """
+    occupancy_axis = CUBE_DIMENSIONS.index("occupancy")
+    # Each location's cells, with the occupancy first
+    households = np.moveaxis(cube.households, occupancy_axis, 1)
+    measures = {}
+    for name in ["opex", "emissions"]:
+        values = cube.values[CUBE_MEASURES.index(f"{name}.perYear.difference")]
+        measures[name] = -np.moveaxis(values, occupancy_axis, 1)
+
+    distributions = {"opex": {}, "emissions": {}}
+    for i, location in enumerate(cube.labels[0]):
+        groups = [(None, slice(None))] + [
+            (occupancy, j) for j, occupancy in enumerate(cube.labels[occupancy_axis])
+        ]
+        for occupancy, j in groups:
+            weights = households[i, j].reshape(-1)
+            if not np.any(weights > 0):
+                continue
+            for name, savings in measures.items():
+                distributions[name][(location, occupancy)] = _get_distribution(
+                    savings[i, j].reshape(-1), weights
+                )
+    return SavingsRanking(**distributions)
+
+
+def rank_household_savings(
+    ranking: Optional[SavingsRanking],
+    household: Household,
+    opex: Opex,
+    emissions: Emissions,
+) -> Optional[SavingsPercentiles]:
+    """The household's savings percentiles, or None while the ranking isn't ready"""
+    if ranking is None:
+        return None
+    return ranking.rank(household, opex, emissions)
+
+
+class SavingsRankingIndex:
+    """Keeps a SavingsRanking of the savings cube up to date without blocking readers
+
+    Building the cube can take minutes, so the ranking is (re)built in a background
+    thread (sharing a build of the cube in progress, see read_savings_cube) when it's
+    first read, and whenever the cube's source (see
+    get_savings_cube_source) has changed, checked at most every check_interval
+    seconds. Readers get the last ranking that was built in the meantime, which is
+    None until the first one is.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_HOUSEHOLD_SHARES_PATH,
+        cache_path: Optional[Path] = None,
+        check_interval: float = RANKING_CHECK_INTERVAL,
+    ):
+        self.path = Path(path)
+        self.cache_path = cache_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._ranking: Optional[SavingsRanking] = None
+        self._source: Optional[np.ndarray] = None
+        self._checked_at = -np.inf
+        self._refresh: Optional[threading.Thread] = None
+
+    def get(self) -> Optional[SavingsRanking]:
+        """The latest ranking, starting a refresh if it's due"""
+        with self._lock:
+            now = time.monotonic()
+            if self._refresh is None and now - self._checked_at >= self.check_interval:
+                self._checked_at = now
+                try:
+                    source = get_savings_cube_source(self.path)
+                except OSError:
+                    logger.exception("Can't read the household shares for rankings")
+                    return self._ranking
+                if self._source is None or not np.array_equal(source, self._source):
+                    self._refresh = threading.Thread(
+                        target=self._build,
+                        args=(source,),
+                        name="savings-ranking",
+                        daemon=True,
+                    )
+                    self._refresh.start()
+            return self._ranking
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[SavingsRanking]:
+        """Waits for a refresh in progress, e.g. to build the ranking before serving"""
+        refresh = self._refresh
+        if refresh is not None:
+            refresh.join(timeout)
+        return self._ranking
+
+    def _build(self, source: np.ndarray):
+        ranking = None
+        try:
+            ranking = build_savings_ranking(
+                read_savings_cube(self.path, self.cache_path)
+            )
+        except Exception:
+            # Keep serving the last ranking, and try again at the next check
+            logger.exception("Failed to build the savings ranking")
+        with self._lock:
+            if ranking is not None:
+                self._ranking = ranking
+                self._source = source
+            self._refresh = None
+
+
+def _get_distribution(
+    savings: np.ndarray, households: np.ndarray
+) -> SavingsDistribution:
+    has_households = households > 0
+    savings, households = savings[has_households], households[has_households]
+    order = np.argsort(savings, kind="stable")
+    return SavingsDistribution(
+        savings=savings[order].astype(np.float32), households=households[order].cumsum()
+    )
@@ -0,0 +1,408 @@
+import argparse
+import heapq
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from logger import logger
+from models.savings_cube import CUBE_MEASURES, calculate_cell_values
+from openapi_client.models import (
+    CooktopEnum,
+    EmissionsValues,
+    Household,
+    OpexValues,
+    SimilarHousehold,
+    SpaceHeatingEnum,
+    WaterHeatingEnum,
+)
+from savings.energy.scale_energy_by_occupancy import OCCUPANCY_MULTIPLIER
+from utils.arrow_batch import read_household_rows
+from utils.clean_household import clean_vehicle
+from utils.household_projections import project_occupancy
+
+# Where the index of the reference population is built to & loaded from. It's a
+# directory of .npy files that are memory-mapped when loaded, so it's not read into
+# memory until it's queried.
+DEFAULT_SIMILAR_HOUSEHOLDS_INDEX_PATH = (
+    Path(__file__).parent.parent / "data" / "similar_households"
+)
+
+# Bump when the features or file layout change, so that old indexes aren't loaded
+SIMILAR_HOUSEHOLDS_INDEX_VERSION = 1
+
+# The number of similar households returned with /savings
+SIMILAR_HOUSEHOLDS = 5
+
+# The most households in a leaf of the k-d tree, which are compared one by one
+LEAF_SIZE = 64
+
+# The numeric features, which are divided by their standard deviation over the
+# reference population
+NUMERIC_FEATURES = ["occupancy", "kmsPerWeek", "solarSize"]
+
+# Each appliance is one-hot encoded, scaled so that a different appliance is as far
+# as a standard deviation of a numeric feature
+_APPLIANCE_FEATURES = {
+    "spaceHeating": [machine.value for machine in SpaceHeatingEnum],
+    "waterHeating": [machine.value for machine in WaterHeatingEnum],
+    "cooktop": [machine.value for machine in CooktopEnum],
+}
+_ONE_HOT = 1 / math.sqrt(2)
+
+# Reference populations with these suffixes are Arrow IPC streams of households like
+# /savings/batch's; anything else is JSON lines, with a household per line
+ARROW_POPULATION_SUFFIXES = {".arrow", ".arrows"}
+
+
+@dataclass(frozen=True)
+class SimilarHouseholdsIndex:
+    """A k-d tree over the features of a reference population, one per location
+
+    Every array is in tree order, i.e. each node's households are the rows start to
+    end, so they can be memory-mapped from disk as they are.
+    """
+
+    features: np.ndarray  # float32, shape (n_households, n_features)
+    savings: np.ndarray  # float32 CUBE_MEASURES, shape (n_households, n_measures)
+    households: np.ndarray  # uint8, the households' JSON, one after the other
+    offsets: np.ndarray  # int64, where each household's JSON starts & ends
+    # Per node: its first & last household + 1, and its children (-1 for leaves)
+    nodes: np.ndarray  # int64, shape (n_nodes, 4)
+    lower: np.ndarray  # float32, the node's bounding box, shape (n_nodes, n_features)
+    upper: np.ndarray
+    roots: Dict[str, int]  # the root node of each location's tree
+    scales: np.ndarray  # the standard deviation of each NUMERIC_FEATURES
+
+    def query(
+        self, household: Household, k: int = SIMILAR_HOUSEHOLDS
+    ) -> List[Tuple[int, float]]:
+        """The k households in the household's location nearest to it, by best-first
+        search of the location's tree
+
+        Returns:
+            List[Tuple[int, float]]: the households' rows & distances, nearest first
+        """
+        location = household.location and household.location.value
+        if location not in self.roots:
+            return []
+        point = get_similarity_features(household, self.scales)
+
+        # Nodes to visit, nearest box first, and the nearest households so far as a
+        # max-heap of (-squared distance, row)
+        queue = [(0.0, self.roots[location])]
+        nearest: List[tuple] = []
+        while queue:
+            box_distance, node = heapq.heappop(queue)
+            if len(nearest) == k and box_distance >= -nearest[0][0]:
+                break
+            start, end, left, right = self.nodes[node].tolist()
+            if left < 0:
+                distances = ((self.features[start:end] - point) ** 2).sum(axis=1)
+                for row in np.argsort(distances, kind="stable")[:k].tolist():
+                    item = (-float(distances[row]), -(start + row))
+                    if len(nearest) < k:
+                        heapq.heappush(nearest, item)
+                    elif item > nearest[0]:
+                        heapq.heapreplace(nearest, item)
+                    else:
+                        break
+                continue
+            children = [left, right]
+            gaps = np.maximum(self.lower[children] - point, 0) + np.maximum(
+                point - self.upper[children], 0
+            )
+            for child, distance in zip(children, (gaps**2).sum(axis=1).tolist()):
+                if len(nearest) < k or distance < -nearest[0][0]:
+                    heapq.heappush(queue, (distance, child))
+        return [
+            (-row, math.sqrt(-distance))
+            for distance, row in sorted(nearest, reverse=True)
+        ]
+
+    def get_household(self, row: int) -> Household:
+        start, end = self.offsets[row : row + 2].tolist()
+        return Household.from_json(self.households[start:end].tobytes().decode())
+
+
+def get_numeric_features(household: Household) -> List[float]:
+    """The household's NUMERIC_FEATURES: its occupancy as the energy it scales by (1
+    when unknown), its vehicles' total kms_per_week and its solar size once
+    electrified"""
+    occupancy = project_occupancy(household.occupancy)
+    solar = household.solar
+    return [
+        OCCUPANCY_MULTIPLIER.get(occupancy, 1.0),
+        sum(
+            clean_vehicle(vehicle).kms_per_week for vehicle in household.vehicles or []
+        ),
+        (solar.size or 0) if solar.has_solar or solar.install_solar else 0,
+    ]
+
+
+def get_similarity_features(household: Household, scales: np.ndarray) -> np.ndarray:
+    """The household's numeric features divided by their scales, then its one-hot
+    appliances"""
+    appliances = {
+        "spaceHeating": household.space_heating,
+        "waterHeating": household.water_heating,
+        "cooktop": household.cooktop,
+    }
+    one_hot = [
+        _ONE_HOT if machine is not None and machine.value == label else 0.0
+        for name, labels in _APPLIANCE_FEATURES.items()
+        for machine in [appliances[name]]
+        for label in labels
+    ]
+    return np.array(
+        list(np.array(get_numeric_features(household)) / scales) + one_hot,
+        dtype=np.float32,
+    )
+
+
+def build_similar_households_index(
+    households: Iterable[Household],
+    path: Path = DEFAULT_SIMILAR_HOUSEHOLDS_INDEX_PATH,
+    max_workers: Optional[int] = None,
+):
+    """Scores a reference population and writes its index, to load with
+    load_similar_households_index
+
+    Households without a location, or whose savings can't be calculated, are left out.
+
+    Args:
+        households (Iterable[Household]): the reference population
+        path (Path, optional): the directory to write the index to. Defaults to DEFAULT_SIMILAR_HOUSEHOLDS_INDEX_PATH.
+        max_workers (int, optional): the number of processes to score the households with. Defaults to None, i.e. one per CPU.
+
+    Raises:
+        ValueError: if none of the households can be indexed
+    """
+    households = [h for h in households if h.location is not None]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        scores = list(executor.map(_score, households, chunksize=256))
+    households = [h for h, score in zip(households, scores) if score is not None]
+    if not households:
+        raise ValueError("No households to index")
+    savings = np.array([s for s in scores if s is not None], dtype=np.float32)
+
+    scales = np.array([get_numeric_features(h) for h in households]).std(axis=0)
+    scales[scales == 0] = 1
+    features = np.array([get_similarity_features(h, scales) for h in households])
+
+    # Each location's households are contiguous, and ordered by its tree
+    order = np.argsort([h.location.value for h in households], kind="stable")
+    locations = [households[i].location.value for i in order]
+    nodes: List[List[int]] = []
+    roots = {}
+    start = 0
+    while start < len(order):
+        end = start
+        while end < len(order) and locations[end] == locations[start]:
+            end += 1
+        roots[locations[start]] = _build_tree(features, order, start, end, nodes)
+        start = end
+
+    features = features[order]
+    lines = [households[i].to_json().encode() for i in order]
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    node_array = np.array(nodes, dtype=np.int64).reshape(-1, 4)
+    np.save(path / "features.npy", features)
+    np.save(path / "savings.npy", savings[order])
+    np.save(path / "households.npy", np.frombuffer(b"".join(lines), dtype=np.uint8))
+    np.save(path / "offsets.npy", np.cumsum([0] + [len(line) for line in lines]))
+    np.save(path / "nodes.npy", node_array)
+    np.save(
+        path / "lower.npy",
+        np.array([features[s:e].min(axis=0) for s, e, _, _ in nodes], np.float32),
+    )
+    np.save(
+        path / "upper.npy",
+        np.array([features[s:e].max(axis=0) for s, e, _, _ in nodes], np.float32),
+    )
+    with open(path / "index.json", "w") as f:
+        json.dump(
+            {
+                "version": SIMILAR_HOUSEHOLDS_INDEX_VERSION,
+                "measures": CUBE_MEASURES,
+                "roots": roots,
+                "scales": scales.tolist(),
+            },
+            f,
+        )
+
+
+def read_reference_population(path: Path) -> List[Household]:
+    """Reads a reference population to index (see build_similar_households_index)
+
+    Args:
+        path (Path): an Arrow IPC stream of households (see ARROW_POPULATION_SUFFIXES & read_household_rows), or JSON lines with a household per line
+
+    Raises:
+        ValueError: if a household can't be read
+
+    Returns:
+        List[Household]: the households
+    """
+    path = Path(path)
+    if path.suffix in ARROW_POPULATION_SUFFIXES:
+        return [
+            Household.from_dict(row) for row in read_household_rows(path.read_bytes())
+        ]
+    with open(path) as f:
+        return [Household.from_json(line) for line in f if line.strip()]
+
+
+@lru_cache(maxsize=2)
+def load_similar_households_index(
+    path: Path = DEFAULT_SIMILAR_HOUSEHOLDS_INDEX_PATH,
+) -> Optional[SimilarHouseholdsIndex]:
+    """Memory-maps the index in a directory, or None if it hasn't been built (see
+    build_similar_households_index) or was built by an incompatible version"""
+    path = Path(path)
+    try:
+        with open(path / "index.json") as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    if (
+        meta.get("version") != SIMILAR_HOUSEHOLDS_INDEX_VERSION
+        or meta.get("measures") != CUBE_MEASURES
+    ):
+        logger.warning(f"Rebuild the similar households index in {path}")
+        return None
+    return SimilarHouseholdsIndex(
+        **{
+            # As plain arrays, as indexing a memmap is slower
+            name: np.asarray(np.load(path / f"{name}.npy", mmap_mode="r"))
+            for name in [
+                "features",
+                "savings",
+                "households",
+                "offsets",
+                "nodes",
+                "lower",
+                "upper",
+            ]
+        },
+        roots=meta["roots"],
+        scales=np.array(meta["scales"]),
+    )
+
+
+def find_similar_households(
+    index: Optional[SimilarHouseholdsIndex],
+    household: Household,
+    k: int = SIMILAR_HOUSEHOLDS,
+) -> Optional[List[SimilarHousehold]]:
+    """The k households in the index most like the household, with their yearly
+    savings, or None if there's no index"""
+    if index is None:
+        return None
+    similar = []
+    for row, distance in index.query(household, k):
+        values = dict(zip(CUBE_MEASURES, index.savings[row].tolist()))
+        similar.append(
+            SimilarHousehold(
+                household=index.get_household(row),
+                distance=round(distance, 3),
+                emissions=EmissionsValues(
+                    **{
+                        value: round(values[f"emissions.perYear.{value}"], 2)
+                        for value in ["before", "after", "difference"]
+                    }
+                ),
+                opex=OpexValues(
+                    **{
+                        value: round(values[f"opex.perYear.{value}"], 2)
+                        for value in ["before", "after", "difference"]
+                    }
+                ),
+            )
+        )
+    return similar
+
+
+def _score(household: Household) -> Optional[np.ndarray]:
+    try:
+        return calculate_cell_values(household.copy(deep=True))
+    except ValueError:
+        return None
+
+
+def _build_tree(
+    features: np.ndarray,
+    order: np.ndarray,
+    start: int,
+    end: int,
+    nodes: List[List[int]],
+) -> int:
+    """Splits order[start:end] in place halfway across its most spread out feature,
+    until every leaf has at most LEAF_SIZE households. Returns the root node.
+
+    Splitting halfway across the range rather than at the median keeps households
+    with different appliances apart, as their one-hot features are mostly 0."""
+    root = len(nodes)
+    nodes.append([start, end, -1, -1])
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        start, end, _, _ = nodes[node]
+        if end - start <= LEAF_SIZE:
+            continue
+        segment = features[order[start:end]]
+        lowest, highest = segment.min(axis=0), segment.max(axis=0)
+        dimension = int(np.argmax(highest - lowest))
+        if highest[dimension] > lowest[dimension]:
+            below = segment[:, dimension] < (lowest[dimension] + highest[dimension]) / 2
+            order[start:end] = np.concatenate(
+                [order[start:end][below], order[start:end][~below]]
+            )
+            middle = int(below.sum())
+        else:
+            # The households are all the same, so just split them in two
+            middle = (end - start) // 2
+        nodes[node][2:] = [len(nodes), len(nodes) + 1]
+        nodes.append([start, start + middle, -1, -1])
+        nodes.append([start + middle, end, -1, -1])
+        stack.extend(nodes[node][2:])
+    return root
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Builds the similar households index from a reference population file, to serve
+    with /savings (see read_reference_population & build_similar_households_index)"""
+    parser = argparse.ArgumentParser(
+        prog="python -m models.similar_households",
+        description="Builds the similar households index from a reference population.",
+    )
+    parser.add_argument(
+        "population",
+        type=Path,
+        help="the households, as JSON lines or an Arrow IPC stream (.arrow)",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=DEFAULT_SIMILAR_HOUSEHOLDS_INDEX_PATH,
+        help="the directory to write the index to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="the number of processes to score the households with (default: one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    build_similar_households_index(
+        read_reference_population(args.population), args.index, args.workers
+    )
+
+
+if __name__ == "__main__":
+    main()
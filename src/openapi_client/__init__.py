@@ -37,14 +37,36 @@ from openapi_client.models.emissions import Emissions
 from openapi_client.models.emissions_values import EmissionsValues
 from openapi_client.models.household import Household
 from openapi_client.models.location_enum import LocationEnum
+from openapi_client.models.meter_calibration import MeterCalibration
+from openapi_client.models.meter_calibration_request import MeterCalibrationRequest
+from openapi_client.models.meter_data_format_enum import MeterDataFormatEnum
+from openapi_client.models.month_savings import MonthSavings
+from openapi_client.models.monthly_savings import MonthlySavings
 from openapi_client.models.opex import Opex
 from openapi_client.models.opex_values import OpexValues
+from openapi_client.models.plan_type_enum import PlanTypeEnum
 from openapi_client.models.recommendation import Recommendation
 from openapi_client.models.recommendation_action_enum import RecommendationActionEnum
+from openapi_client.models.retail_plan_comparison import RetailPlanComparison
+from openapi_client.models.retail_plan_cost import RetailPlanCost
 from openapi_client.models.savings import Savings
+from openapi_client.models.savings_curve import SavingsCurve
+from openapi_client.models.savings_curve_periods import SavingsCurvePeriods
+from openapi_client.models.savings_curve_request import SavingsCurveRequest
+from openapi_client.models.savings_curve_values import SavingsCurveValues
+from openapi_client.models.savings_percentiles import SavingsPercentiles
+from openapi_client.models.season_enum import SeasonEnum
+from openapi_client.models.season_savings import SeasonSavings
+from openapi_client.models.similar_household import SimilarHousehold
 from openapi_client.models.solar import Solar
 from openapi_client.models.space_heating_enum import SpaceHeatingEnum
+from openapi_client.models.sweep import Sweep
+from openapi_client.models.sweep_axis import SweepAxis
+from openapi_client.models.system_size import SystemSize
+from openapi_client.models.system_size_objective_enum import SystemSizeObjectiveEnum
+from openapi_client.models.system_size_request import SystemSizeRequest
 from openapi_client.models.upfront_cost import UpfrontCost
 from openapi_client.models.vehicle import Vehicle
 from openapi_client.models.vehicle_fuel_type_enum import VehicleFuelTypeEnum
 from openapi_client.models.water_heating_enum import WaterHeatingEnum
+from openapi_client.models.year_emissions import YearEmissions
@@ -19,10 +19,20 @@ import warnings
 from pydantic import validate_arguments, ValidationError
 
 from typing_extensions import Annotated
-from pydantic import Field
+from pydantic import Field, StrictBytes, StrictStr
+
+from typing import Optional, Union
 
 from openapi_client.models.household import Household
+from openapi_client.models.meter_calibration import MeterCalibration
+from openapi_client.models.meter_calibration_request import MeterCalibrationRequest
+from openapi_client.models.plan_type_enum import PlanTypeEnum
+from openapi_client.models.retail_plan_comparison import RetailPlanComparison
 from openapi_client.models.savings import Savings
+from openapi_client.models.savings_curve import SavingsCurve
+from openapi_client.models.savings_curve_request import SavingsCurveRequest
+from openapi_client.models.system_size import SystemSize
+from openapi_client.models.system_size_request import SystemSizeRequest
 
 from openapi_client.api_client import ApiClient
 from openapi_client.api_response import ApiResponse
@@ -45,18 +55,20 @@ class SavingsApi:
         self.api_client = api_client
 
     @validate_arguments
-    def calculate_savings(self, household : Annotated[Household, Field(..., description="Input a household's energy behaviour")], **kwargs) -> Savings:  # noqa: E501
+    def calculate_savings(self, household : Annotated[Household, Field(..., description="Input a household's energy behaviour")], fields : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Unrequested sections are not calculated and are omitted from the response. Defaults to all sections.")] = None, **kwargs) -> Savings:  # noqa: E501
         """Calculate savings & get upfront cost  # noqa: E501
 
         Calculate the emissions savings, opex savings, and the upfront cost from electrifying a given household.  # noqa: E501
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
 
-        >>> thread = api.calculate_savings(household, async_req=True)
+        >>> thread = api.calculate_savings(household, fields, async_req=True)
         >>> result = thread.get()
 
         :param household: Input a household's energy behaviour (required)
         :type household: Household
+        :param fields: Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Unrequested sections are not calculated and are omitted from the response. Defaults to all sections.
+        :type fields: str
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
         :param _request_timeout: timeout setting for this request.
@@ -72,21 +84,23 @@ class SavingsApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the calculate_savings_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.calculate_savings_with_http_info(household, **kwargs)  # noqa: E501
+        return self.calculate_savings_with_http_info(household, fields, **kwargs)  # noqa: E501
 
     @validate_arguments
-    def calculate_savings_with_http_info(self, household : Annotated[Household, Field(..., description="Input a household's energy behaviour")], **kwargs) -> ApiResponse:  # noqa: E501
+    def calculate_savings_with_http_info(self, household : Annotated[Household, Field(..., description="Input a household's energy behaviour")], fields : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Unrequested sections are not calculated and are omitted from the response. Defaults to all sections.")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Calculate savings & get upfront cost  # noqa: E501
 
         Calculate the emissions savings, opex savings, and the upfront cost from electrifying a given household.  # noqa: E501
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
 
-        >>> thread = api.calculate_savings_with_http_info(household, async_req=True)
+        >>> thread = api.calculate_savings_with_http_info(household, fields, async_req=True)
         >>> result = thread.get()
 
         :param household: Input a household's energy behaviour (required)
         :type household: Household
+        :param fields: Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Unrequested sections are not calculated and are omitted from the response. Defaults to all sections.
+        :type fields: str
         :param async_req: Whether to execute the request asynchronously.
         :type async_req: bool, optional
         :param _preload_content: if False, the ApiResponse.data will
@@ -115,7 +129,8 @@ class SavingsApi:
         _params = locals()
 
         _all_params = [
-            'household'
+            'household',
+            'fields'
         ]
         _all_params.extend(
             [
@@ -146,6 +161,9 @@ class SavingsApi:
 
         # process the query parameters
         _query_params = []
+        if _params.get('fields') is not None:  # noqa: E501
+            _query_params.append(('fields', _params['fields']))
+
         # process the header parameters
         _header_params = dict(_params.get('_headers', {}))
         # process the form parameters
@@ -192,3 +210,1119 @@ class SavingsApi:
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
             _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def calculate_savings_batch(self, body : Annotated[Union[StrictBytes, StrictStr], Field(..., description="An Arrow IPC stream of households")], fields : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Only the columns of the requested sections are returned. Defaults to all sections.")] = None, **kwargs) -> bytearray:  # noqa: E501
+        """Calculate savings for a batch of households  # noqa: E501
+
+        Calculate savings for many households at once, exchanged as Apache Arrow IPC streams. Each input row is a household, with one column per field named by its path (e.g. `solar.hasSolar`) and `vehicles` as a list of structs. Each output row is the flattened savings of the matching household (e.g. `opex.perWeek.before`), plus an `error` column that is set, with null savings, for rows that couldn't be calculated.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calculate_savings_batch(body, fields, async_req=True)
+        >>> result = thread.get()
+
+        :param body: An Arrow IPC stream of households (required)
+        :type body: bytearray
+        :param fields: Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Only the columns of the requested sections are returned. Defaults to all sections.
+        :type fields: str
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: bytearray
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the calculate_savings_batch_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.calculate_savings_batch_with_http_info(body, fields, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def calculate_savings_batch_with_http_info(self, body : Annotated[Union[StrictBytes, StrictStr], Field(..., description="An Arrow IPC stream of households")], fields : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Only the columns of the requested sections are returned. Defaults to all sections.")] = None, **kwargs) -> ApiResponse:  # noqa: E501
+        """Calculate savings for a batch of households  # noqa: E501
+
+        Calculate savings for many households at once, exchanged as Apache Arrow IPC streams. Each input row is a household, with one column per field named by its path (e.g. `solar.hasSolar`) and `vehicles` as a list of structs. Each output row is the flattened savings of the matching household (e.g. `opex.perWeek.before`), plus an `error` column that is set, with null savings, for rows that couldn't be calculated.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calculate_savings_batch_with_http_info(body, fields, async_req=True)
+        >>> result = thread.get()
+
+        :param body: An Arrow IPC stream of households (required)
+        :type body: bytearray
+        :param fields: Comma-separated list of the Savings sections to calculate, e.g. `emissions,upfrontCost`. Only the columns of the requested sections are returned. Defaults to all sections.
+        :type fields: str
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'body',
+            'fields'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method calculate_savings_batch" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        if _params.get('fields') is not None:  # noqa: E501
+            _query_params.append(('fields', _params['fields']))
+
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+        if _params['body'] is not None:
+            _body_params = _params['body']
+            # convert to byte array if the input is a file name (str)
+            if isinstance(_body_params, str):
+               with io.open(_body_params, "rb") as _fp:
+                  _body_params_from_file = _fp.read()
+               _body_params = _body_params_from_file
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/vnd.apache.arrow.stream'])  # noqa: E501
+
+        # set the HTTP header `Content-Type`
+        _content_types_list = _params.get('_content_type',
+            self.api_client.select_header_content_type(
+                ['application/vnd.apache.arrow.stream']))
+        if _content_types_list:
+                _header_params['Content-Type'] = _content_types_list
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "bytearray",
+            '400': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/batch', 'POST',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def calculate_savings_curve(self, savings_curve_request : Annotated[SavingsCurveRequest, Field(..., description="Input a household's energy behaviour, and the inputs to sweep")], **kwargs) -> SavingsCurve:  # noqa: E501
+        """Calculate savings across a range of inputs  # noqa: E501
+
+        Calculate how a household's emissions, opex and upfront cost change as one or two of its continuous inputs (solar size, battery capacity or a vehicle's kms per week) are swept across a range. Every point of the curve, or of the grid for two sweeps, is calculated in one go.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calculate_savings_curve(savings_curve_request, async_req=True)
+        >>> result = thread.get()
+
+        :param savings_curve_request: Input a household's energy behaviour, and the inputs to sweep (required)
+        :type savings_curve_request: SavingsCurveRequest
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: SavingsCurve
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the calculate_savings_curve_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.calculate_savings_curve_with_http_info(savings_curve_request, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def calculate_savings_curve_with_http_info(self, savings_curve_request : Annotated[SavingsCurveRequest, Field(..., description="Input a household's energy behaviour, and the inputs to sweep")], **kwargs) -> ApiResponse:  # noqa: E501
+        """Calculate savings across a range of inputs  # noqa: E501
+
+        Calculate how a household's emissions, opex and upfront cost change as one or two of its continuous inputs (solar size, battery capacity or a vehicle's kms per week) are swept across a range. Every point of the curve, or of the grid for two sweeps, is calculated in one go.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calculate_savings_curve_with_http_info(savings_curve_request, async_req=True)
+        >>> result = thread.get()
+
+        :param savings_curve_request: Input a household's energy behaviour, and the inputs to sweep (required)
+        :type savings_curve_request: SavingsCurveRequest
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(SavingsCurve, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'savings_curve_request'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method calculate_savings_curve" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+        if _params['savings_curve_request'] is not None:
+            _body_params = _params['savings_curve_request']
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/json'])  # noqa: E501
+
+        # set the HTTP header `Content-Type`
+        _content_types_list = _params.get('_content_type',
+            self.api_client.select_header_content_type(
+                ['application/json']))
+        if _content_types_list:
+                _header_params['Content-Type'] = _content_types_list
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "SavingsCurve",
+            '400': None,
+            '422': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/curve', 'POST',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def calculate_system_size(self, system_size_request : Annotated[SystemSizeRequest, Field(..., description="Input a household's energy behaviour, and what to optimise for")], **kwargs) -> SystemSize:  # noqa: E501
+        """Find the best solar & battery size  # noqa: E501
+
+        Search solar sizes and battery capacities for the system that maximises the household's lifetime net savings (opex savings minus upfront cost), or minimises its payback period. Only systems the household doesn't have yet are sized; an existing solar or battery system keeps its size.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calculate_system_size(system_size_request, async_req=True)
+        >>> result = thread.get()
+
+        :param system_size_request: Input a household's energy behaviour, and what to optimise for (required)
+        :type system_size_request: SystemSizeRequest
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: SystemSize
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the calculate_system_size_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.calculate_system_size_with_http_info(system_size_request, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def calculate_system_size_with_http_info(self, system_size_request : Annotated[SystemSizeRequest, Field(..., description="Input a household's energy behaviour, and what to optimise for")], **kwargs) -> ApiResponse:  # noqa: E501
+        """Find the best solar & battery size  # noqa: E501
+
+        Search solar sizes and battery capacities for the system that maximises the household's lifetime net savings (opex savings minus upfront cost), or minimises its payback period. Only systems the household doesn't have yet are sized; an existing solar or battery system keeps its size.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calculate_system_size_with_http_info(system_size_request, async_req=True)
+        >>> result = thread.get()
+
+        :param system_size_request: Input a household's energy behaviour, and what to optimise for (required)
+        :type system_size_request: SystemSizeRequest
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(SystemSize, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'system_size_request'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method calculate_system_size" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+        if _params['system_size_request'] is not None:
+            _body_params = _params['system_size_request']
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/json'])  # noqa: E501
+
+        # set the HTTP header `Content-Type`
+        _content_types_list = _params.get('_content_type',
+            self.api_client.select_header_content_type(
+                ['application/json']))
+        if _content_types_list:
+                _header_params['Content-Type'] = _content_types_list
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "SystemSize",
+            '400': None,
+            '422': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/system-size', 'POST',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def compare_retail_plans(self, household : Annotated[Household, Field(..., description="Input a household's energy behaviour")], plan_type : Annotated[Optional[PlanTypeEnum], Field(description="Only consider plans of this type. Defaults to all types.")] = None, **kwargs) -> RetailPlanComparison:  # noqa: E501
+        """Find the cheapest retail electricity plans  # noqa: E501
+
+        Price the household's electricity use before & after electrification against every applicable plan in the retail plan catalogue, and return the cheapest plan for each.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.compare_retail_plans(household, plan_type, async_req=True)
+        >>> result = thread.get()
+
+        :param household: Input a household's energy behaviour (required)
+        :type household: Household
+        :param plan_type: Only consider plans of this type. Defaults to all types.
+        :type plan_type: PlanTypeEnum
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: RetailPlanComparison
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the compare_retail_plans_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.compare_retail_plans_with_http_info(household, plan_type, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def compare_retail_plans_with_http_info(self, household : Annotated[Household, Field(..., description="Input a household's energy behaviour")], plan_type : Annotated[Optional[PlanTypeEnum], Field(description="Only consider plans of this type. Defaults to all types.")] = None, **kwargs) -> ApiResponse:  # noqa: E501
+        """Find the cheapest retail electricity plans  # noqa: E501
+
+        Price the household's electricity use before & after electrification against every applicable plan in the retail plan catalogue, and return the cheapest plan for each.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.compare_retail_plans_with_http_info(household, plan_type, async_req=True)
+        >>> result = thread.get()
+
+        :param household: Input a household's energy behaviour (required)
+        :type household: Household
+        :param plan_type: Only consider plans of this type. Defaults to all types.
+        :type plan_type: PlanTypeEnum
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(RetailPlanComparison, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'household',
+            'plan_type'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method compare_retail_plans" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        if _params.get('plan_type') is not None:  # noqa: E501
+            _query_params.append(('planType', _params['plan_type'].value))
+
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+        if _params['household'] is not None:
+            _body_params = _params['household']
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/json'])  # noqa: E501
+
+        # set the HTTP header `Content-Type`
+        _content_types_list = _params.get('_content_type',
+            self.api_client.select_header_content_type(
+                ['application/json']))
+        if _content_types_list:
+                _header_params['Content-Type'] = _content_types_list
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "RetailPlanComparison",
+            '400': None,
+            '422': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/retail-plans', 'POST',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def calibrate_household_energy(self, meter_calibration_request : Annotated[MeterCalibrationRequest, Field(..., description="The household & its meter data")], **kwargs) -> MeterCalibration:  # noqa: E501
+        """Calibrate a household's energy use against its smart meter data  # noqa: E501
+
+        Split a year of the household's smart meter interval data into baseload & space heating, and compare them to the average household with the same machines. Set the result as the household's `meterCalibration` to calibrate its savings.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calibrate_household_energy(meter_calibration_request, async_req=True)
+        >>> result = thread.get()
+
+        :param meter_calibration_request: The household & its meter data (required)
+        :type meter_calibration_request: MeterCalibrationRequest
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: MeterCalibration
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the calibrate_household_energy_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.calibrate_household_energy_with_http_info(meter_calibration_request, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def calibrate_household_energy_with_http_info(self, meter_calibration_request : Annotated[MeterCalibrationRequest, Field(..., description="The household & its meter data")], **kwargs) -> ApiResponse:  # noqa: E501
+        """Calibrate a household's energy use against its smart meter data  # noqa: E501
+
+        Split a year of the household's smart meter interval data into baseload & space heating, and compare them to the average household with the same machines. Set the result as the household's `meterCalibration` to calibrate its savings.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.calibrate_household_energy_with_http_info(meter_calibration_request, async_req=True)
+        >>> result = thread.get()
+
+        :param meter_calibration_request: The household & its meter data (required)
+        :type meter_calibration_request: MeterCalibrationRequest
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(MeterCalibration, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'meter_calibration_request'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method calibrate_household_energy" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+        if _params['meter_calibration_request'] is not None:
+            _body_params = _params['meter_calibration_request']
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/json'])  # noqa: E501
+
+        # set the HTTP header `Content-Type`
+        _content_types_list = _params.get('_content_type',
+            self.api_client.select_header_content_type(
+                ['application/json']))
+        if _content_types_list:
+                _header_params['Content-Type'] = _content_types_list
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "MeterCalibration",
+            '400': None,
+            '422': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/meter-calibration', 'POST',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def aggregate_savings_batch(self, body : Annotated[Union[StrictBytes, StrictStr], Field(..., description="An Arrow IPC stream of households")], group_by : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the household fields to group by, from `location`, `occupancy`, `spaceHeating`, `waterHeating` and `cooktop`. Occupancy above 5 is grouped with 5. Defaults to `location`.")] = None, **kwargs) -> bytearray:  # noqa: E501
+        """Aggregate savings for a batch of households by group  # noqa: E501
+
+        Calculate the emissions and opex savings of many households, read as for `/savings/batch`, and aggregate them by group (e.g. by location) rather than returning them one by one. Each output row is a group, with a column per grouped field, the number of `households` and `errors`, and the `total`, `mean` and approximate `p10`, `p50` and `p90` of `emissions.perYear.difference` and `opex.perYear.difference`.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.aggregate_savings_batch(body, group_by, async_req=True)
+        >>> result = thread.get()
+
+        :param body: An Arrow IPC stream of households (required)
+        :type body: bytearray
+        :param group_by: Comma-separated list of the household fields to group by, from `location`, `occupancy`, `spaceHeating`, `waterHeating` and `cooktop`. Occupancy above 5 is grouped with 5. Defaults to `location`.
+        :type group_by: str
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: bytearray
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the aggregate_savings_batch_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.aggregate_savings_batch_with_http_info(body, group_by, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def aggregate_savings_batch_with_http_info(self, body : Annotated[Union[StrictBytes, StrictStr], Field(..., description="An Arrow IPC stream of households")], group_by : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the household fields to group by, from `location`, `occupancy`, `spaceHeating`, `waterHeating` and `cooktop`. Occupancy above 5 is grouped with 5. Defaults to `location`.")] = None, **kwargs) -> ApiResponse:  # noqa: E501
+        """Aggregate savings for a batch of households by group  # noqa: E501
+
+        Calculate the emissions and opex savings of many households, read as for `/savings/batch`, and aggregate them by group (e.g. by location) rather than returning them one by one. Each output row is a group, with a column per grouped field, the number of `households` and `errors`, and the `total`, `mean` and approximate `p10`, `p50` and `p90` of `emissions.perYear.difference` and `opex.perYear.difference`.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.aggregate_savings_batch_with_http_info(body, group_by, async_req=True)
+        >>> result = thread.get()
+
+        :param body: An Arrow IPC stream of households (required)
+        :type body: bytearray
+        :param group_by: Comma-separated list of the household fields to group by, from `location`, `occupancy`, `spaceHeating`, `waterHeating` and `cooktop`. Occupancy above 5 is grouped with 5. Defaults to `location`.
+        :type group_by: str
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'body',
+            'group_by'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method aggregate_savings_batch" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        if _params.get('group_by') is not None:  # noqa: E501
+            _query_params.append(('groupBy', _params['group_by']))
+
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+        if _params['body'] is not None:
+            _body_params = _params['body']
+            # convert to byte array if the input is a file name (str)
+            if isinstance(_body_params, str):
+               with io.open(_body_params, "rb") as _fp:
+                  _body_params_from_file = _fp.read()
+               _body_params = _body_params_from_file
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/vnd.apache.arrow.stream'])  # noqa: E501
+
+        # set the HTTP header `Content-Type`
+        _content_types_list = _params.get('_content_type',
+            self.api_client.select_header_content_type(
+                ['application/vnd.apache.arrow.stream']))
+        if _content_types_list:
+                _header_params['Content-Type'] = _content_types_list
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "bytearray",
+            '400': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/batch/aggregate', 'POST',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
+
+    @validate_arguments
+    def query_savings_cube(self, location : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the locations to include. Defaults to all of them.")] = None, space_heating : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the space heating types to include. Defaults to all of them.")] = None, water_heating : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the water heating types to include. Defaults to all of them.")] = None, cooktop : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the cooktop types to include. Defaults to all of them.")] = None, occupancy : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the occupancies to include, from 1 to 5 (5 or more). Defaults to all of them.")] = None, vehicles : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the vehicle mixes to include, each its vehicles' fuel types joined by `+` (e.g. `PETROL+ELECTRIC`) or `NONE`. Defaults to all of them.")] = None, group_by : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the dimensions to group by, from `location`, `spaceHeating`, `waterHeating`, `cooktop`, `occupancy` and `vehicles`. Defaults to none, i.e. one row for all the included households.")] = None, **kwargs) -> bytearray:  # noqa: E501
+        """Slice precomputed savings by household type  # noqa: E501
+
+        Query a cube of the precomputed emissions, opex and upfront cost savings of every combination of location, space heating, water heating, cooktop, occupancy and vehicle mix, weighted by how many households have each. Each filter keeps only the listed labels of its dimension, and each output row is a group of `groupBy`, with its number of `households` and the `mean` (per household) and `total` of `emissions.perYear.before`, `.after` and `.difference`, the same for `opex`, and `upfrontCost.total`. Households in the cube have no solar or battery, and switch their vehicles to EVs.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.query_savings_cube(location, space_heating, water_heating, cooktop, occupancy, vehicles, group_by, async_req=True)
+        >>> result = thread.get()
+
+        :param location: Comma-separated list of the locations to include. Defaults to all of them.
+        :type location: str
+        :param space_heating: Comma-separated list of the space heating types to include. Defaults to all of them.
+        :type space_heating: str
+        :param water_heating: Comma-separated list of the water heating types to include. Defaults to all of them.
+        :type water_heating: str
+        :param cooktop: Comma-separated list of the cooktop types to include. Defaults to all of them.
+        :type cooktop: str
+        :param occupancy: Comma-separated list of the occupancies to include, from 1 to 5 (5 or more). Defaults to all of them.
+        :type occupancy: str
+        :param vehicles: Comma-separated list of the vehicle mixes to include, each its vehicles' fuel types joined by `+` (e.g. `PETROL+ELECTRIC`) or `NONE`. Defaults to all of them.
+        :type vehicles: str
+        :param group_by: Comma-separated list of the dimensions to group by, from `location`, `spaceHeating`, `waterHeating`, `cooktop`, `occupancy` and `vehicles`. Defaults to none, i.e. one row for all the included households.
+        :type group_by: str
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _request_timeout: timeout setting for this request.
+               If one number provided, it will be total request
+               timeout. It can also be a pair (tuple) of
+               (connection, read) timeouts.
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: bytearray
+        """
+        kwargs['_return_http_data_only'] = True
+        if '_preload_content' in kwargs:
+            message = "Error! Please call the query_savings_cube_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
+            raise ValueError(message)
+        return self.query_savings_cube_with_http_info(location, space_heating, water_heating, cooktop, occupancy, vehicles, group_by, **kwargs)  # noqa: E501
+
+    @validate_arguments
+    def query_savings_cube_with_http_info(self, location : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the locations to include. Defaults to all of them.")] = None, space_heating : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the space heating types to include. Defaults to all of them.")] = None, water_heating : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the water heating types to include. Defaults to all of them.")] = None, cooktop : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the cooktop types to include. Defaults to all of them.")] = None, occupancy : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the occupancies to include, from 1 to 5 (5 or more). Defaults to all of them.")] = None, vehicles : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the vehicle mixes to include, each its vehicles' fuel types joined by `+` (e.g. `PETROL+ELECTRIC`) or `NONE`. Defaults to all of them.")] = None, group_by : Annotated[Optional[StrictStr], Field(description="Comma-separated list of the dimensions to group by, from `location`, `spaceHeating`, `waterHeating`, `cooktop`, `occupancy` and `vehicles`. Defaults to none, i.e. one row for all the included households.")] = None, **kwargs) -> ApiResponse:  # noqa: E501
+        """Slice precomputed savings by household type  # noqa: E501
+
+        Query a cube of the precomputed emissions, opex and upfront cost savings of every combination of location, space heating, water heating, cooktop, occupancy and vehicle mix, weighted by how many households have each. Each filter keeps only the listed labels of its dimension, and each output row is a group of `groupBy`, with its number of `households` and the `mean` (per household) and `total` of `emissions.perYear.before`, `.after` and `.difference`, the same for `opex`, and `upfrontCost.total`. Households in the cube have no solar or battery, and switch their vehicles to EVs.  # noqa: E501
+        This method makes a synchronous HTTP request by default. To make an
+        asynchronous HTTP request, please pass async_req=True
+
+        >>> thread = api.query_savings_cube_with_http_info(location, space_heating, water_heating, cooktop, occupancy, vehicles, group_by, async_req=True)
+        >>> result = thread.get()
+
+        :param location: Comma-separated list of the locations to include. Defaults to all of them.
+        :type location: str
+        :param space_heating: Comma-separated list of the space heating types to include. Defaults to all of them.
+        :type space_heating: str
+        :param water_heating: Comma-separated list of the water heating types to include. Defaults to all of them.
+        :type water_heating: str
+        :param cooktop: Comma-separated list of the cooktop types to include. Defaults to all of them.
+        :type cooktop: str
+        :param occupancy: Comma-separated list of the occupancies to include, from 1 to 5 (5 or more). Defaults to all of them.
+        :type occupancy: str
+        :param vehicles: Comma-separated list of the vehicle mixes to include, each its vehicles' fuel types joined by `+` (e.g. `PETROL+ELECTRIC`) or `NONE`. Defaults to all of them.
+        :type vehicles: str
+        :param group_by: Comma-separated list of the dimensions to group by, from `location`, `spaceHeating`, `waterHeating`, `cooktop`, `occupancy` and `vehicles`. Defaults to none, i.e. one row for all the included households.
+        :type group_by: str
+        :param async_req: Whether to execute the request asynchronously.
+        :type async_req: bool, optional
+        :param _preload_content: if False, the ApiResponse.data will
+                                 be set to none and raw_data will store the
+                                 HTTP response body without reading/decoding.
+                                 Default is True.
+        :type _preload_content: bool, optional
+        :param _return_http_data_only: response data instead of ApiResponse
+                                       object with status code, headers, etc
+        :type _return_http_data_only: bool, optional
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the authentication
+                              in the spec for a single request.
+        :type _request_auth: dict, optional
+        :type _content_type: string, optional: force content-type for the request
+        :return: Returns the result object.
+                 If the method is called asynchronously,
+                 returns the request thread.
+        :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
+        """
+
+        _params = locals()
+
+        _all_params = [
+            'location',
+            'space_heating',
+            'water_heating',
+            'cooktop',
+            'occupancy',
+            'vehicles',
+            'group_by'
+        ]
+        _all_params.extend(
+            [
+                'async_req',
+                '_return_http_data_only',
+                '_preload_content',
+                '_request_timeout',
+                '_request_auth',
+                '_content_type',
+                '_headers'
+            ]
+        )
+
+        # validate the arguments
+        for _key, _val in _params['kwargs'].items():
+            if _key not in _all_params:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method query_savings_cube" % _key
+                )
+            _params[_key] = _val
+        del _params['kwargs']
+
+        _collection_formats = {}
+
+        # process the path parameters
+        _path_params = {}
+
+        # process the query parameters
+        _query_params = []
+        if _params.get('location') is not None:  # noqa: E501
+            _query_params.append(('location', _params['location']))
+
+        if _params.get('space_heating') is not None:  # noqa: E501
+            _query_params.append(('spaceHeating', _params['space_heating']))
+
+        if _params.get('water_heating') is not None:  # noqa: E501
+            _query_params.append(('waterHeating', _params['water_heating']))
+
+        if _params.get('cooktop') is not None:  # noqa: E501
+            _query_params.append(('cooktop', _params['cooktop']))
+
+        if _params.get('occupancy') is not None:  # noqa: E501
+            _query_params.append(('occupancy', _params['occupancy']))
+
+        if _params.get('vehicles') is not None:  # noqa: E501
+            _query_params.append(('vehicles', _params['vehicles']))
+
+        if _params.get('group_by') is not None:  # noqa: E501
+            _query_params.append(('groupBy', _params['group_by']))
+
+        # process the header parameters
+        _header_params = dict(_params.get('_headers', {}))
+        # process the form parameters
+        _form_params = []
+        _files = {}
+        # process the body parameter
+        _body_params = None
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            ['application/vnd.apache.arrow.stream'])  # noqa: E501
+
+        # authentication setting
+        _auth_settings = []  # noqa: E501
+
+        _response_types_map = {
+            '200': "bytearray",
+            '400': None,
+        }
+
+        return self.api_client.call_api(
+            '/savings/cube', 'GET',
+            _path_params,
+            _query_params,
+            _header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            response_types_map=_response_types_map,
+            auth_settings=_auth_settings,
+            async_req=_params.get('async_req'),
+            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
+            _preload_content=_params.get('_preload_content', True),
+            _request_timeout=_params.get('_request_timeout'),
+            collection_formats=_collection_formats,
+            _request_auth=_params.get('_request_auth'))
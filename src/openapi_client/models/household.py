@@ -23,6 +23,7 @@ from pydantic import BaseModel, Field, conint, conlist
 from openapi_client.models.battery import Battery
 from openapi_client.models.cooktop_enum import CooktopEnum
 from openapi_client.models.location_enum import LocationEnum
+from openapi_client.models.meter_calibration import MeterCalibration
 from openapi_client.models.solar import Solar
 from openapi_client.models.space_heating_enum import SpaceHeatingEnum
 from openapi_client.models.vehicle import Vehicle
@@ -40,7 +41,8 @@ class Household(BaseModel):
     vehicles: Optional[conlist(Vehicle)] = None
     solar: Optional[Solar] = None
     battery: Optional[Battery] = None
-    __properties = ["location", "occupancy", "spaceHeating", "waterHeating", "cooktop", "vehicles", "solar", "battery"]
+    meter_calibration: Optional[MeterCalibration] = Field(default=None, alias="meterCalibration")
+    __properties = ["location", "occupancy", "spaceHeating", "waterHeating", "cooktop", "vehicles", "solar", "battery", "meterCalibration"]
 
     class Config:
         """Pydantic configuration"""
@@ -79,6 +81,9 @@ class Household(BaseModel):
         # override the default output from pydantic by calling `to_dict()` of battery
         if self.battery:
             _dict['battery'] = self.battery.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of meter_calibration
+        if self.meter_calibration:
+            _dict['meterCalibration'] = self.meter_calibration.to_dict()
         return _dict
 
     @classmethod
@@ -98,7 +103,8 @@ class Household(BaseModel):
             "cooktop": obj.get("cooktop"),
             "vehicles": [Vehicle.from_dict(_item) for _item in obj.get("vehicles")] if obj.get("vehicles") is not None else None,
             "solar": Solar.from_dict(obj.get("solar")) if obj.get("solar") is not None else None,
-            "battery": Battery.from_dict(obj.get("battery")) if obj.get("battery") is not None else None
+            "battery": Battery.from_dict(obj.get("battery")) if obj.get("battery") is not None else None,
+            "meter_calibration": MeterCalibration.from_dict(obj.get("meterCalibration")) if obj.get("meterCalibration") is not None else None
         })
         return _obj
 
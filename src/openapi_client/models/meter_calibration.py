@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional, Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, confloat, conint
+
+class MeterCalibration(BaseModel):
+    """
+    How much energy a household uses compared to the average household with the same machines, from a year of its smart meter data  # noqa: E501
+    """
+    baseload_factor: Optional[Union[confloat(ge=0, strict=True), conint(ge=0, strict=True)]] = Field(default=None, alias="baseloadFactor", description="The household's other appliances, and its water heating & cooking if they're electric, use this times the average. It's measured by the household's electricity meter, so it only applies to electric machines, including ones that are electrified.")
+    space_heating_factor: Optional[Union[confloat(ge=0, strict=True), conint(ge=0, strict=True)]] = Field(default=None, alias="spaceHeatingFactor", description="The household's space heating uses this times the average, whatever its fuel. 1 if the household's space heating isn't electric, so can't be measured.")
+    baseload_kwh_per_day: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="baseloadKwhPerDay", description="The measured electricity a day that doesn't follow the weather (including EV charging), averaged over the year")
+    space_heating_kwh_per_day: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="spaceHeatingKwhPerDay", description="The measured electricity a day that follows the weather, averaged over the year")
+    __properties = ["baseloadFactor", "spaceHeatingFactor", "baseloadKwhPerDay", "spaceHeatingKwhPerDay"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> MeterCalibration:
+        """Create an instance of MeterCalibration from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> MeterCalibration:
+        """Create an instance of MeterCalibration from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return MeterCalibration.parse_obj(obj)
+
+        _obj = MeterCalibration.parse_obj({
+            "baseload_factor": obj.get("baseloadFactor"),
+            "space_heating_factor": obj.get("spaceHeatingFactor"),
+            "baseload_kwh_per_day": obj.get("baseloadKwhPerDay"),
+            "space_heating_kwh_per_day": obj.get("spaceHeatingKwhPerDay")
+        })
+        return _obj
+
+
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional, Union
+from pydantic import BaseModel, Field, StrictBytes, StrictStr
+from openapi_client.models.household import Household
+from openapi_client.models.meter_data_format_enum import MeterDataFormatEnum
+
+class MeterCalibrationRequest(BaseModel):
+    """
+    MeterCalibrationRequest
+    """
+    household: Household = Field(...)
+    meter_data: Union[StrictBytes, StrictStr] = Field(default=..., alias="meterData", description="A year of the household's interval data, base64 encoded. It has a `kwh` column with one row per hour or half hour of the year in order, i.e. 8760 or 17520 rows. Other columns are ignored.")
+    meter_data_format: Optional[MeterDataFormatEnum] = Field(default=None, alias="meterDataFormat")
+    __properties = ["household", "meterData", "meterDataFormat"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> MeterCalibrationRequest:
+        """Create an instance of MeterCalibrationRequest from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of household
+        if self.household:
+            _dict['household'] = self.household.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> MeterCalibrationRequest:
+        """Create an instance of MeterCalibrationRequest from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return MeterCalibrationRequest.parse_obj(obj)
+
+        _obj = MeterCalibrationRequest.parse_obj({
+            "household": Household.from_dict(obj.get("household")) if obj.get("household") is not None else None,
+            "meter_data": obj.get("meterData"),
+            "meter_data_format": obj.get("meterDataFormat")
+        })
+        return _obj
+
+
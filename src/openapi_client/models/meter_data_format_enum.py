@@ -0,0 +1,40 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import json
+import pprint
+import re  # noqa: F401
+from aenum import Enum, no_arg
+
+
+
+
+
+class MeterDataFormatEnum(str, Enum):
+    """
+    The format of smart meter interval data
+    """
+
+    """
+    allowed enum values
+    """
+    CSV = 'CSV'
+    ARROW = 'ARROW'
+
+    @classmethod
+    def from_json(cls, json_str: str) -> MeterDataFormatEnum:
+        """Create an instance of MeterDataFormatEnum from a JSON string"""
+        return MeterDataFormatEnum(json.loads(json_str))
+
+
@@ -0,0 +1,89 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import List, Optional
+from pydantic import BaseModel, Field, conlist
+from openapi_client.models.month_savings import MonthSavings
+from openapi_client.models.season_savings import SeasonSavings
+
+class MonthlySavings(BaseModel):
+    """
+    Opex & emissions in each month & season of a typical year, with space heating & solar generation following the seasons in the household's region  # noqa: E501
+    """
+    per_month: Optional[conlist(MonthSavings, min_items=12, max_items=12)] = Field(default=None, alias="perMonth", description="January first")
+    per_season: Optional[conlist(SeasonSavings, min_items=4, max_items=4)] = Field(default=None, alias="perSeason", description="Summer first")
+    __properties = ["perMonth", "perSeason"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> MonthlySavings:
+        """Create an instance of MonthlySavings from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in per_month (list)
+        _items = []
+        if self.per_month:
+            for _item in self.per_month:
+                if _item:
+                    _items.append(_item.to_dict())
+            _dict['perMonth'] = _items
+        # override the default output from pydantic by calling `to_dict()` of each item in per_season (list)
+        _items = []
+        if self.per_season:
+            for _item in self.per_season:
+                if _item:
+                    _items.append(_item.to_dict())
+            _dict['perSeason'] = _items
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> MonthlySavings:
+        """Create an instance of MonthlySavings from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return MonthlySavings.parse_obj(obj)
+
+        _obj = MonthlySavings.parse_obj({
+            "per_month": [MonthSavings.from_dict(_item) for _item in obj.get("perMonth")] if obj.get("perMonth") is not None else None,
+            "per_season": [SeasonSavings.from_dict(_item) for _item in obj.get("perSeason")] if obj.get("perSeason") is not None else None
+        })
+        return _obj
+
+
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional
+from pydantic import BaseModel, Field
+from openapi_client.models.retail_plan_cost import RetailPlanCost
+
+class RetailPlanComparison(BaseModel):
+    """
+    RetailPlanComparison
+    """
+    before: Optional[RetailPlanCost] = None
+    after: Optional[RetailPlanCost] = None
+    __properties = ["before", "after"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> RetailPlanComparison:
+        """Create an instance of RetailPlanComparison from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of before
+        if self.before:
+            _dict['before'] = self.before.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of after
+        if self.after:
+            _dict['after'] = self.after.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> RetailPlanComparison:
+        """Create an instance of RetailPlanComparison from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return RetailPlanComparison.parse_obj(obj)
+
+        _obj = RetailPlanComparison.parse_obj({
+            "before": RetailPlanCost.from_dict(obj.get("before")) if obj.get("before") is not None else None,
+            "after": RetailPlanCost.from_dict(obj.get("after")) if obj.get("after") is not None else None
+        })
+        return _obj
+
+
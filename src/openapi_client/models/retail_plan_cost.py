@@ -0,0 +1,78 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional, Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, StrictStr
+from openapi_client.models.plan_type_enum import PlanTypeEnum
+
+class RetailPlanCost(BaseModel):
+    """
+    What the household's electricity would cost on a retail plan  # noqa: E501
+    """
+    id: Optional[StrictStr] = Field(default=None, description="The plan's ID in the catalogue")
+    name: Optional[StrictStr] = None
+    plan_type: Optional[PlanTypeEnum] = Field(default=None, alias="planType")
+    cost_per_year: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="costPerYear", description="The yearly cost of the household's electricity on this plan, including daily charges & less solar buy-back, in NZD to 2 dp.")
+    __properties = ["id", "name", "planType", "costPerYear"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> RetailPlanCost:
+        """Create an instance of RetailPlanCost from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> RetailPlanCost:
+        """Create an instance of RetailPlanCost from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return RetailPlanCost.parse_obj(obj)
+
+        _obj = RetailPlanCost.parse_obj({
+            "id": obj.get("id"),
+            "name": obj.get("name"),
+            "plan_type": obj.get("planType"),
+            "cost_per_year": obj.get("costPerYear")
+        })
+        return _obj
+
+
@@ -18,12 +18,16 @@ import re  # noqa: F401
 import json
 
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, conlist
 from openapi_client.models.emissions import Emissions
+from openapi_client.models.monthly_savings import MonthlySavings
 from openapi_client.models.opex import Opex
 from openapi_client.models.recommendation import Recommendation
+from openapi_client.models.savings_percentiles import SavingsPercentiles
+from openapi_client.models.similar_household import SimilarHousehold
 from openapi_client.models.upfront_cost import UpfrontCost
+from openapi_client.models.year_emissions import YearEmissions
 
 class Savings(BaseModel):
     """
@@ -33,7 +37,11 @@ class Savings(BaseModel):
     opex: Optional[Opex] = None
     upfront_cost: Optional[UpfrontCost] = Field(default=None, alias="upfrontCost")
     recommendation: Optional[Recommendation] = None
-    __properties = ["emissions", "opex", "upfrontCost", "recommendation"]
+    monthly: Optional[MonthlySavings] = None
+    emissions_trajectory: Optional[conlist(YearEmissions)] = Field(default=None, alias="emissionsTrajectory", description="The household's emissions in each year of the operational lifetime, first year first, with the grid decarbonising (when time-varying grid emissions are on) and its machines replaced by electric ones as they wear out")
+    percentiles: Optional[SavingsPercentiles] = None
+    similar_households: Optional[conlist(SimilarHousehold)] = Field(default=None, alias="similarHouseholds", description="The households in the reference population that are most like this one, in the same location, most similar first. Null if there's no reference population.")
+    __properties = ["emissions", "opex", "upfrontCost", "recommendation", "monthly", "emissionsTrajectory", "percentiles", "similarHouseholds"]
 
     class Config:
         """Pydantic configuration"""
@@ -71,6 +79,26 @@ class Savings(BaseModel):
         # override the default output from pydantic by calling `to_dict()` of recommendation
         if self.recommendation:
             _dict['recommendation'] = self.recommendation.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of monthly
+        if self.monthly:
+            _dict['monthly'] = self.monthly.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of each item in emissions_trajectory (list)
+        _items = []
+        if self.emissions_trajectory:
+            for _item in self.emissions_trajectory:
+                if _item:
+                    _items.append(_item.to_dict())
+            _dict['emissionsTrajectory'] = _items
+        # override the default output from pydantic by calling `to_dict()` of percentiles
+        if self.percentiles:
+            _dict['percentiles'] = self.percentiles.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of each item in similar_households (list)
+        _items = []
+        if self.similar_households:
+            for _item in self.similar_households:
+                if _item:
+                    _items.append(_item.to_dict())
+            _dict['similarHouseholds'] = _items
         return _dict
 
     @classmethod
@@ -86,7 +114,11 @@ class Savings(BaseModel):
             "emissions": Emissions.from_dict(obj.get("emissions")) if obj.get("emissions") is not None else None,
             "opex": Opex.from_dict(obj.get("opex")) if obj.get("opex") is not None else None,
             "upfront_cost": UpfrontCost.from_dict(obj.get("upfrontCost")) if obj.get("upfrontCost") is not None else None,
-            "recommendation": Recommendation.from_dict(obj.get("recommendation")) if obj.get("recommendation") is not None else None
+            "recommendation": Recommendation.from_dict(obj.get("recommendation")) if obj.get("recommendation") is not None else None,
+            "monthly": MonthlySavings.from_dict(obj.get("monthly")) if obj.get("monthly") is not None else None,
+            "emissions_trajectory": [YearEmissions.from_dict(_item) for _item in obj.get("emissionsTrajectory")] if obj.get("emissionsTrajectory") is not None else None,
+            "percentiles": SavingsPercentiles.from_dict(obj.get("percentiles")) if obj.get("percentiles") is not None else None,
+            "similar_households": [SimilarHousehold.from_dict(_item) for _item in obj.get("similarHouseholds")] if obj.get("similarHouseholds") is not None else None
         })
         return _obj
 
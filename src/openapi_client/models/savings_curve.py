@@ -0,0 +1,92 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import List, Optional, Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, conlist
+from openapi_client.models.savings_curve_periods import SavingsCurvePeriods
+from openapi_client.models.sweep_axis import SweepAxis
+
+class SavingsCurve(BaseModel):
+    """
+    Savings at every point of the swept inputs. Points are ordered by the first axis, then the second, i.e. the value at (i, j) is at index i * (number of values on the second axis) + j.  # noqa: E501
+    """
+    axes: Optional[conlist(SweepAxis)] = None
+    emissions: Optional[SavingsCurvePeriods] = None
+    opex: Optional[SavingsCurvePeriods] = None
+    upfront_cost: Optional[conlist(Union[StrictFloat, StrictInt])] = Field(default=None, alias="upfrontCost", description="The estimated total NZD cost of electrifying the household at each point")
+    __properties = ["axes", "emissions", "opex", "upfrontCost"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SavingsCurve:
+        """Create an instance of SavingsCurve from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of each item in axes (list)
+        _items = []
+        if self.axes:
+            for _item in self.axes:
+                if _item:
+                    _items.append(_item.to_dict())
+            _dict['axes'] = _items
+        # override the default output from pydantic by calling `to_dict()` of emissions
+        if self.emissions:
+            _dict['emissions'] = self.emissions.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of opex
+        if self.opex:
+            _dict['opex'] = self.opex.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SavingsCurve:
+        """Create an instance of SavingsCurve from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SavingsCurve.parse_obj(obj)
+
+        _obj = SavingsCurve.parse_obj({
+            "axes": [SweepAxis.from_dict(_item) for _item in obj.get("axes")] if obj.get("axes") is not None else None,
+            "emissions": SavingsCurvePeriods.from_dict(obj.get("emissions")) if obj.get("emissions") is not None else None,
+            "opex": SavingsCurvePeriods.from_dict(obj.get("opex")) if obj.get("opex") is not None else None,
+            "upfront_cost": obj.get("upfrontCost")
+        })
+        return _obj
+
+
@@ -0,0 +1,85 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import List
+from pydantic import BaseModel, Field, conlist
+from openapi_client.models.household import Household
+from openapi_client.models.sweep import Sweep
+
+class SavingsCurveRequest(BaseModel):
+    """
+    SavingsCurveRequest
+    """
+    household: Household = Field(...)
+    sweeps: conlist(Sweep, min_items=1, max_items=2) = Field(default=..., description="One or two inputs to sweep. With two, every combination of their values is calculated.")
+    __properties = ["household", "sweeps"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SavingsCurveRequest:
+        """Create an instance of SavingsCurveRequest from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of household
+        if self.household:
+            _dict['household'] = self.household.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of each item in sweeps (list)
+        _items = []
+        if self.sweeps:
+            for _item in self.sweeps:
+                if _item:
+                    _items.append(_item.to_dict())
+            _dict['sweeps'] = _items
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SavingsCurveRequest:
+        """Create an instance of SavingsCurveRequest from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SavingsCurveRequest.parse_obj(obj)
+
+        _obj = SavingsCurveRequest.parse_obj({
+            "household": Household.from_dict(obj.get("household")) if obj.get("household") is not None else None,
+            "sweeps": [Sweep.from_dict(_item) for _item in obj.get("sweeps")] if obj.get("sweeps") is not None else None
+        })
+        return _obj
+
+
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional, Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, confloat, conint
+
+class SavingsPercentiles(BaseModel):
+    """
+    Where the household's yearly savings fall among similar households (in the same location, with the same occupancy) in the reference population. Null while the reference population is being calculated.  # noqa: E501
+    """
+    opex: Optional[Union[confloat(le=100, ge=0, strict=True), conint(le=100, ge=0, strict=True)]] = Field(default=None, description="The share (%) of similar households that save less on opex per year, counting half of those that save the same")
+    emissions: Optional[Union[confloat(le=100, ge=0, strict=True), conint(le=100, ge=0, strict=True)]] = Field(default=None, description="The share (%) of similar households that save less emissions per year, counting half of those that save the same")
+    households: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, description="The number of similar households in the reference population")
+    __properties = ["opex", "emissions", "households"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SavingsPercentiles:
+        """Create an instance of SavingsPercentiles from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SavingsPercentiles:
+        """Create an instance of SavingsPercentiles from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SavingsPercentiles.parse_obj(obj)
+
+        _obj = SavingsPercentiles.parse_obj({
+            "opex": obj.get("opex"),
+            "emissions": obj.get("emissions"),
+            "households": obj.get("households")
+        })
+        return _obj
+
+
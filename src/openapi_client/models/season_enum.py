@@ -0,0 +1,42 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import json
+import pprint
+import re  # noqa: F401
+from aenum import Enum, no_arg
+
+
+
+
+
+class SeasonEnum(str, Enum):
+    """
+    A season of the year in NZ, e.g. WINTER is June to August
+    """
+
+    """
+    allowed enum values
+    """
+    SUMMER = 'SUMMER'
+    AUTUMN = 'AUTUMN'
+    WINTER = 'WINTER'
+    SPRING = 'SPRING'
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SeasonEnum:
+        """Create an instance of SeasonEnum from a JSON string"""
+        return SeasonEnum(json.loads(json_str))
+
+
@@ -0,0 +1,84 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional
+from pydantic import BaseModel, Field
+from openapi_client.models.emissions_values import EmissionsValues
+from openapi_client.models.opex_values import OpexValues
+from openapi_client.models.season_enum import SeasonEnum
+
+class SeasonSavings(BaseModel):
+    """
+    SeasonSavings
+    """
+    season: Optional[SeasonEnum] = None
+    opex: Optional[OpexValues] = None
+    emissions: Optional[EmissionsValues] = None
+    __properties = ["season", "opex", "emissions"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SeasonSavings:
+        """Create an instance of SeasonSavings from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of opex
+        if self.opex:
+            _dict['opex'] = self.opex.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of emissions
+        if self.emissions:
+            _dict['emissions'] = self.emissions.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SeasonSavings:
+        """Create an instance of SeasonSavings from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SeasonSavings.parse_obj(obj)
+
+        _obj = SeasonSavings.parse_obj({
+            "season": obj.get("season"),
+            "opex": OpexValues.from_dict(obj.get("opex")) if obj.get("opex") is not None else None,
+            "emissions": EmissionsValues.from_dict(obj.get("emissions")) if obj.get("emissions") is not None else None
+        })
+        return _obj
+
+
@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, StrictStr
+
+class Sweep(BaseModel):
+    """
+    A range of values for one of the household's continuous inputs  # noqa: E501
+    """
+    field: StrictStr = Field(default=..., description="The path of the swept input, one of `solar.size`, `battery.capacity` or `vehicles.<index>.kmsPerWeek`")
+    start: Union[StrictFloat, StrictInt] = Field(default=..., description="The first value")
+    stop: Union[StrictFloat, StrictInt] = Field(default=..., description="The last value, included if it's a whole number of steps from start")
+    step: Union[StrictFloat, StrictInt] = Field(default=..., description="The distance between consecutive values")
+    __properties = ["field", "start", "stop", "step"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Sweep:
+        """Create an instance of Sweep from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> Sweep:
+        """Create an instance of Sweep from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return Sweep.parse_obj(obj)
+
+        _obj = Sweep.parse_obj({
+            "field": obj.get("field"),
+            "start": obj.get("start"),
+            "stop": obj.get("stop"),
+            "step": obj.get("step")
+        })
+        return _obj
+
+
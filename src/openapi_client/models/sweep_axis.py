@@ -0,0 +1,73 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import List, Optional, Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, StrictStr, conlist
+
+class SweepAxis(BaseModel):
+    """
+    SweepAxis
+    """
+    field: Optional[StrictStr] = Field(default=None, description="The path of the swept input")
+    values: Optional[conlist(Union[StrictFloat, StrictInt])] = Field(default=None, description="The values of the swept input")
+    __properties = ["field", "values"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SweepAxis:
+        """Create an instance of SweepAxis from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SweepAxis:
+        """Create an instance of SweepAxis from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SweepAxis.parse_obj(obj)
+
+        _obj = SweepAxis.parse_obj({
+            "field": obj.get("field"),
+            "values": obj.get("values")
+        })
+        return _obj
+
+
@@ -0,0 +1,81 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional, Union
+from pydantic import BaseModel, Field, StrictFloat, StrictInt
+
+class SystemSize(BaseModel):
+    """
+    The best solar & battery system for a household, compared to its electrified household with only its existing systems  # noqa: E501
+    """
+    solar_size: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="solarSize", description="The size of the solar panel system in kW")
+    battery_capacity: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="batteryCapacity", description="The capacity of the battery system in kWh")
+    upfront_cost: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="upfrontCost", description="The estimated cost of installing the new solar & battery in NZD")
+    opex_savings_per_year: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="opexSavingsPerYear", description="The opex saved per year by the new solar & battery in NZD to 2 dp.")
+    net_savings_over_lifetime: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="netSavingsOverLifetime", description="The opex saved over the operational lifetime by the new solar & battery, minus their upfront cost, in NZD to 2 dp.")
+    payback_years: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="paybackYears", description="The years it takes for the opex savings to cover the upfront cost, to 2 dp. Null if they never do.")
+    __properties = ["solarSize", "batteryCapacity", "upfrontCost", "opexSavingsPerYear", "netSavingsOverLifetime", "paybackYears"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SystemSize:
+        """Create an instance of SystemSize from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SystemSize:
+        """Create an instance of SystemSize from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SystemSize.parse_obj(obj)
+
+        _obj = SystemSize.parse_obj({
+            "solar_size": obj.get("solarSize"),
+            "battery_capacity": obj.get("batteryCapacity"),
+            "upfront_cost": obj.get("upfrontCost"),
+            "opex_savings_per_year": obj.get("opexSavingsPerYear"),
+            "net_savings_over_lifetime": obj.get("netSavingsOverLifetime"),
+            "payback_years": obj.get("paybackYears")
+        })
+        return _obj
+
+
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+from typing import Optional, Union
+from pydantic import BaseModel, Field, confloat, conint
+from openapi_client.models.household import Household
+from openapi_client.models.system_size_objective_enum import SystemSizeObjectiveEnum
+
+class SystemSizeRequest(BaseModel):
+    """
+    SystemSizeRequest
+    """
+    household: Household = Field(...)
+    objective: Optional[SystemSizeObjectiveEnum] = None
+    max_solar_size: Optional[Union[confloat(ge=0, strict=True), conint(ge=0, strict=True)]] = Field(default=None, alias="maxSolarSize", description="The largest solar size to consider in kW. Defaults to 15.")
+    max_battery_capacity: Optional[Union[confloat(ge=0, strict=True), conint(ge=0, strict=True)]] = Field(default=None, alias="maxBatteryCapacity", description="The largest battery capacity to consider in kWh. Defaults to 20.")
+    __properties = ["household", "objective", "maxSolarSize", "maxBatteryCapacity"]
+
+    class Config:
+        """Pydantic configuration"""
+        allow_population_by_field_name = True
+        validate_assignment = True
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.dict(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> SystemSizeRequest:
+        """Create an instance of SystemSizeRequest from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self):
+        """Returns the dictionary representation of the model using alias"""
+        _dict = self.dict(by_alias=True,
+                          exclude={
+                          },
+                          exclude_none=True)
+        # override the default output from pydantic by calling `to_dict()` of household
+        if self.household:
+            _dict['household'] = self.household.to_dict()
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> SystemSizeRequest:
+        """Create an instance of SystemSizeRequest from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return SystemSizeRequest.parse_obj(obj)
+
+        _obj = SystemSizeRequest.parse_obj({
+            "household": Household.from_dict(obj.get("household")) if obj.get("household") is not None else None,
+            "objective": obj.get("objective"),
+            "max_solar_size": obj.get("maxSolarSize"),
+            "max_battery_capacity": obj.get("maxBatteryCapacity")
+        })
+        return _obj
+
+
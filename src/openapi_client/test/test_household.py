@@ -56,7 +56,12 @@ class TestHousehold(unittest.TestCase):
                     capacity = 13.5, 
                     power_output = 5, 
                     peak_power_output = 7, 
-                    install_battery = True, )
+                    install_battery = True, ),
+                meter_calibration = openapi_client.models.meter_calibration.MeterCalibration(
+                    baseload_factor = 1.2, 
+                    space_heating_factor = 0.8, 
+                    baseload_kwh_per_day = 14.2, 
+                    space_heating_kwh_per_day = 3.1, )
             )
         else:
             return Household(
@@ -0,0 +1,61 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import unittest
+import datetime
+
+from openapi_client.models.month_savings import MonthSavings  # noqa: E501
+
+class TestMonthSavings(unittest.TestCase):
+    """MonthSavings unit test stubs"""
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def make_instance(self, include_optional) -> MonthSavings:
+        """Test MonthSavings
+            include_option is a boolean, when False only required
+            params are included, when True both required and
+            optional params are included """
+        # uncomment below to create an instance of `MonthSavings`
+        """
+        model = MonthSavings()  # noqa: E501
+        if include_optional:
+            return MonthSavings(
+                month = 7,
+                season = 'SUMMER',
+                opex = openapi_client.models.opex_values.OpexValues(
+                        before = 500.5, 
+                        after = 100.1, 
+                        difference = 400.4, ),
+                emissions = openapi_client.models.emissions_values.EmissionsValues(
+                        before = 500.5, 
+                        after = 100.1, 
+                        difference = 400.4, )
+            )
+        else:
+            return MonthSavings(
+        )
+        """
+
+    def testMonthSavings(self):
+        """Test MonthSavings"""
+        # inst_req_only = self.make_instance(include_optional=False)
+        # inst_req_and_optional = self.make_instance(include_optional=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,7 +66,39 @@ class TestSavings(unittest.TestCase):
                     space_heating = 1.337, ),
                 recommendation = openapi_client.models.recommendation.Recommendation(
                     action = 'SPACE_HEATING', 
-                    url = 'https://www.rewiring.nz/electrification-guides/space-heating-and-cooling', )
+                    url = 'https://www.rewiring.nz/electrification-guides/space-heating-and-cooling', ),
+                monthly = openapi_client.models.monthly_savings.MonthlySavings(
+                    per_month = [
+                        openapi_client.models.month_savings.MonthSavings()
+                        ], 
+                    per_season = [
+                        openapi_client.models.season_savings.SeasonSavings()
+                        ], ),
+                emissions_trajectory = [
+                    openapi_client.models.year_emissions.YearEmissions(
+                        year = 2030, 
+                        emissions = openapi_client.models.emissions_values.EmissionsValues(
+                            before = 500.50, 
+                            after = 100.10, 
+                            difference = -400.40, ), )
+                    ],
+                percentiles = openapi_client.models.savings_percentiles.SavingsPercentiles(
+                    opex = 72.5, 
+                    emissions = 64.1, 
+                    households = 25410, ),
+                similar_households = [
+                    openapi_client.models.similar_household.SimilarHousehold(
+                        household = openapi_client.models.household.Household(), 
+                        distance = 0.42, 
+                        emissions = openapi_client.models.emissions_values.EmissionsValues(
+                            before = 500.50, 
+                            after = 100.10, 
+                            difference = -400.40, ), 
+                        opex = openapi_client.models.opex_values.OpexValues(
+                            before = 500.50, 
+                            after = 100.10, 
+                            difference = -400.40, ), )
+                    ]
             )
         else:
             return Savings(
@@ -0,0 +1,57 @@
+# coding: utf-8
+
+"""
+    Household savings
+
+    This is the API for a household savings model. You can provide details about a household's energy use, and receive information about the household's potential emissions & cost savings from electrifying their fossil fuel machines, as well as the upfront costs of switching.
+
+    The version of the OpenAPI document: 0.0.8
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import unittest
+import datetime
+
+from openapi_client.models.system_size import SystemSize  # noqa: E501
+
+class TestSystemSize(unittest.TestCase):
+    """SystemSize unit test stubs"""
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def make_instance(self, include_optional) -> SystemSize:
+        """Test SystemSize
+            include_option is a boolean, when False only required
+            params are included, when True both required and
+            optional params are included """
+        # uncomment below to create an instance of `SystemSize`
+        """
+        model = SystemSize()  # noqa: E501
+        if include_optional:
+            return SystemSize(
+                solar_size = 6.5,
+                battery_capacity = 10,
+                upfront_cost = 24805.56,
+                opex_savings_per_year = 2100.5,
+                net_savings_over_lifetime = 5000.25,
+                payback_years = 11.81
+            )
+        else:
+            return SystemSize(
+        )
+        """
+
+    def testSystemSize(self):
+        """Test SystemSize"""
+        # inst_req_only = self.make_instance(include_optional=False)
+        # inst_req_and_optional = self.make_instance(include_optional=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,19 @@
 OPERATIONAL_LIFETIME = 15
+
+# Scale space heating by each location's hourly temperatures (heating degree-hours &
+# heat pump COP) instead of the static SPACE_HEATING_ENERGY_LOCATION_MULTIPLIER
+WEATHER_AWARE_SPACE_HEATING = False
+
+# Schedule water heating & EV charging onto surplus solar & off-peak hours, hour by
+# hour, when calculating opex instead of a flat self-consumption rate
+SCHEDULE_FLEXIBLE_LOADS = False
+
+# Charge & discharge batteries against hourly TOU prices (see optimise_battery_dispatch)
+# when calculating opex, including from the grid, instead of only storing surplus
+# solar. This also allows a battery without solar.
+OPTIMISE_BATTERY_DISPATCH = False
+
+# Weight electricity's emissions by the grid's hourly carbon intensity & its
+# decarbonisation over the lifetime (see utils/grid_emissions.py) instead of a flat
+# emissions factor
+TIME_VARYING_GRID_EMISSIONS = False
@@ -0,0 +1,227 @@
+import re
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from models.electrify_household import electrify_household
+from openapi_client.models import (
+    Household,
+    SavingsCurve,
+    SavingsCurvePeriods,
+    SavingsCurveValues,
+    Sweep,
+    SweepAxis,
+)
+from params import OPERATIONAL_LIFETIME
+from savings.closed_form.compile_household_model import compile_household_model
+from savings.closed_form.evaluate_household_model import evaluate_household_at_points
+from savings.upfront_cost.calculate_upfront_cost import calculate_upfront_cost
+from savings.upfront_cost.get_machine_upfront_cost import (
+    get_battery_upfront_cost,
+    get_solar_upfront_cost,
+)
+from utils.clean_household import clean_household
+from utils.validate_household import validate_household
+
+SOLAR_SIZE_FIELD = "solar.size"
+BATTERY_CAPACITY_FIELD = "battery.capacity"
+VEHICLE_KMS_FIELD = re.compile(r"^vehicles\.(\d+)\.kmsPerWeek$")
+
+# Bounds the size of a response, e.g. a 100 x 100 grid
+MAX_SAVINGS_CURVE_POINTS = 10_000
+
+
+def get_sweep_values(sweep: Sweep) -> np.ndarray:
+    """The values of a sweep, from start up to and including stop
+
+    Args:
+        sweep (Sweep): the sweep
+
+    Raises:
+        ValueError: if the range is empty or negative, or the step isn't positive
+
+    Returns:
+        np.ndarray: the values
+    """
+    if sweep.step <= 0:
+        raise ValueError(f"The step of {sweep.field} must be positive")
+    if sweep.start < 0:
+        raise ValueError(f"The start of {sweep.field} can't be negative")
+    if sweep.stop < sweep.start:
+        raise ValueError(f"The stop of {sweep.field} can't be before its start")
+
+    # Allow for floating point error, so that e.g. 0 to 15 in 0.25 steps includes 15
+    n_steps = int(np.floor((sweep.stop - sweep.start) / sweep.step + 1e-9))
+    if n_steps + 1 > MAX_SAVINGS_CURVE_POINTS:
+        raise ValueError(
+            f"Too many points, a curve can have at most {MAX_SAVINGS_CURVE_POINTS}"
+        )
+    return np.round(sweep.start + sweep.step * np.arange(n_steps + 1), 9)
+
+
+def calculate_savings_curve(household: Household, sweeps: List[Sweep]) -> SavingsCurve:
+    """Calculates a household's savings at every point of one or two swept inputs
+
+    The household's linear models (see compile_household_model) only depend on its
+    discrete inputs, so they're compiled once and evaluated at all the points together.
+
+    Args:
+        household (Household): the household
+        sweeps (List[Sweep]): one or two of the household's continuous inputs, and their ranges
+
+    Raises:
+        ValueError: if the sweeps or the household are invalid
+
+    Returns:
+        SavingsCurve: the savings at each point, ordered by the first axis then the second
+    """
+    if not 1 <= len(sweeps) <= 2:
+        raise ValueError("Sweep one or two fields")
+    fields = [sweep.field for sweep in sweeps]
+    if len(set(fields)) != len(fields):
+        raise ValueError("Each field can only be swept once")
+
+    axes = [get_sweep_values(sweep) for sweep in sweeps]
+    for field, values in zip(fields, axes):
+        if VEHICLE_KMS_FIELD.match(field) and np.any(values != np.round(values)):
+            raise ValueError(f"{field} can only be swept in whole kms")
+    n_points = int(np.prod([len(values) for values in axes]))
+    if n_points > MAX_SAVINGS_CURVE_POINTS:
+        raise ValueError(
+            f"Too many points, a curve can have at most {MAX_SAVINGS_CURVE_POINTS}"
+        )
+    points = {
+        field: grid.ravel()
+        for field, grid in zip(fields, np.meshgrid(*axes, indexing="ij"))
+    }
+
+    # The swept values only change continuous inputs, so a household with the first
+    # value of each has the same discrete inputs as every other point
+    for field, values in zip(fields, axes):
+        household = _set_field(household, field, values[0])
+    validate_household(household)
+    current = clean_household(household)
+    electrified = electrify_household(current)
+
+    # Electrifying keeps the vehicles in order, along with their kms, the solar size
+    # & the battery capacity, so both households share the same inputs at each point
+    kms = np.tile(
+        np.array([v.kms_per_week for v in current.vehicles], dtype=float),
+        (n_points, 1),
+    )
+    solar_size = np.full(n_points, current.solar.size or 0, dtype=float)
+    battery_capacity = np.full(n_points, current.battery.capacity or 0, dtype=float)
+    for field, values in points.items():
+        if field == SOLAR_SIZE_FIELD:
+            solar_size = values
+        elif field == BATTERY_CAPACITY_FIELD:
+            battery_capacity = values
+        else:
+            kms[:, _get_vehicle_index(field)] = values
+
+    before = evaluate_household_at_points(
+        compile_household_model(current), current, kms, solar_size, battery_capacity
+    )
+    after = evaluate_household_at_points(
+        compile_household_model(electrified),
+        electrified,
+        kms,
+        solar_size,
+        battery_capacity,
+    )
+
+    upfront_cost = calculate_upfront_cost(current, electrified)
+    solar_costs = _get_point_costs(
+        points.get(SOLAR_SIZE_FIELD),
+        lambda size: get_solar_upfront_cost(current.solar.copy(update={"size": size})),
+        upfront_cost.solar,
+        n_points,
+    )
+    battery_costs = _get_point_costs(
+        points.get(BATTERY_CAPACITY_FIELD),
+        lambda capacity: get_battery_upfront_cost(
+            current.battery.copy(update={"capacity": capacity})
+        ),
+        upfront_cost.battery,
+        n_points,
+    )
+    appliance_costs = (
+        upfront_cost.cooktop + upfront_cost.water_heating + upfront_cost.space_heating
+    )
+
+    return SavingsCurve(
+        axes=[
+            SweepAxis(field=field, values=values.tolist())
+            for field, values in zip(fields, axes)
+        ],
+        emissions=_get_curve_periods(before["emissions"], after["emissions"]),
+        opex=_get_curve_periods(before["opex"], after["opex"]),
+        upfrontCost=np.round(appliance_costs + solar_costs + battery_costs, 2).tolist(),
+    )
+
+
+def _set_field(household: Household, field: str, value: float) -> Household:
+    if field == SOLAR_SIZE_FIELD:
+        return household.copy(
+            update={"solar": household.solar.copy(update={"size": float(value)})}
+        )
+    if field == BATTERY_CAPACITY_FIELD:
+        return household.copy(
+            update={
+                "battery": household.battery.copy(update={"capacity": float(value)})
+            }
+        )
+
+    index = _get_vehicle_index(field)
+    if index >= len(household.vehicles or []):
+        raise ValueError(f"Can't sweep {field}, the household has no such vehicle")
+    vehicles = list(household.vehicles)
+    vehicles[index] = vehicles[index].copy(update={"kms_per_week": int(value)})
+    return household.copy(update={"vehicles": vehicles})
+
+
+def _get_vehicle_index(field: str) -> int:
+    match = VEHICLE_KMS_FIELD.match(field)
+    if match is None:
+        raise ValueError(
+            f"Can't sweep {field}, sweep one of {SOLAR_SIZE_FIELD}, "
+            f"{BATTERY_CAPACITY_FIELD} or vehicles.<index>.kmsPerWeek"
+        )
+    return int(match.group(1))
+
+
+def _get_point_costs(
+    values: Optional[np.ndarray],
+    get_cost: Callable[[float], float],
+    default: float,
+    n_points: int,
+) -> np.ndarray:
+    # Costs are only looked up once per distinct value
+    if values is None:
+        return np.full(n_points, default, dtype=float)
+    distinct_values, indices = np.unique(values, return_inverse=True)
+    costs = np.array([get_cost(float(value)) for value in distinct_values])
+    return costs[indices]
+
+
+def _get_curve_periods(before: np.ndarray, after: np.ndarray) -> SavingsCurvePeriods:
+    # The values are floats straight from numpy, so skip validating each of them;
+    # that would take far longer than calculating them
+    weekly, yearly, lifetime = [
+        SavingsCurveValues.construct(**_round_curve_values(before[:, i], after[:, i]))
+        for i in range(before.shape[1])
+    ]
+    return SavingsCurvePeriods(
+        perWeek=weekly,
+        perYear=yearly,
+        overLifetime=lifetime,
+        operationalLifetime=OPERATIONAL_LIFETIME,
+    )
+
+
+def _round_curve_values(before: np.ndarray, after: np.ndarray) -> Dict[str, list]:
+    return {
+        "before": np.round(before, 2).tolist(),
+        "after": np.round(after, 2).tolist(),
+        "difference": np.round(after - before, 2).tolist(),
+    }
@@ -0,0 +1,287 @@
+import calendar
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from constants.fuel_stats import FuelTypeEnum
+from constants.machines.space_heating import SPACE_HEATING_INFO
+from constants.seasonal_shapes import SOLAR_MONTHLY_SHAPE, SPACE_HEATING_MONTHLY_SHAPE
+from constants.utils import DAYS_PER_YEAR, MONTHS_PER_YEAR, PROFILE_YEAR, PeriodEnum
+from openapi_client.models import Household, Solar, Vehicle
+from savings.emissions.calculate_emissions import get_total_emissions
+from savings.emissions.get_machine_emissions import (
+    get_appliance_emissions,
+    get_vehicle_emissions,
+)
+from savings.energy.get_electricity_consumption import (
+    get_battery_storage_capacity,
+    get_e_generated_from_solar,
+    get_max_e_consumed_from_solar,
+    sum_energy_for_fuel_type,
+)
+from savings.energy.get_machine_energy import (
+    MachineEnergyNeeds,
+    get_energy_per_period,
+    get_total_energy_needs,
+    get_vehicle_energy,
+)
+from savings.energy.get_other_energy_consumption import get_other_energy_consumption
+from savings.opex.calculate_opex import (
+    get_effective_grid_price,
+    get_rucs_per_kms_per_week,
+    get_solar_feedin_tariff,
+)
+from savings.opex.get_fixed_costs import get_fixed_costs
+from savings.opex.get_other_energy_costs import get_other_energy_costs
+from utils.fuel_vector import FuelVector
+from utils.household_projections import (
+    project_appliances,
+    project_meter_calibration,
+    project_occupancy,
+    project_vehicle_fuel_types,
+)
+from utils.memoise_stage import memoise_stage
+
+# The periods reported in Opex & Emissions, in order. Every array in a
+# LinearHouseholdModel has one row per period.
+CLOSED_FORM_PERIODS = [
+    PeriodEnum.WEEKLY,
+    PeriodEnum.YEARLY,
+    PeriodEnum.OPERATIONAL_LIFETIME,
+]
+
+
+@dataclass(frozen=True)
+class LinearHouseholdModel:
+    """A household's opex & emissions as a function of its continuous inputs
+
+    Once the discrete inputs (location, occupancy, appliances, vehicle fuel types and
+    whether there's solar and a battery) are fixed, every quantity in the pipeline is
+    linear in each vehicle's kms_per_week, the solar size and the battery capacity,
+    except for the few min/max branches applied in evaluate_household_model.
+
+    Each field is a base value (shape (n_periods,)) or a coefficient per kms_per_week
+    of each vehicle, in the household's vehicle order (shape (n_periods, n_vehicles)).
+    """
+
+    e_needs: np.ndarray  # kWh of electricity needed without vehicles
+    e_needs_per_km: np.ndarray
+    e_self_consumption: np.ndarray  # kWh that could be consumed straight from solar
+    e_self_consumption_per_km: np.ndarray
+    e_solar_per_kw: np.ndarray  # kWh generated per kW of solar, 0 without solar
+    e_battery_per_kwh: np.ndarray  # kWh stored per kWh of capacity, 0 without battery
+    other_energy_costs: np.ndarray  # NZD on fuels other than electricity
+    other_energy_costs_per_km: np.ndarray
+    fixed_costs: np.ndarray
+    rucs_per_km: np.ndarray
+    volume_rate: np.ndarray  # NZD/kWh
+    off_peak_rate: np.ndarray
+    feed_in_tariff: np.ndarray
+    emissions: np.ndarray  # kgCO2e
+    emissions_per_km: np.ndarray
+
+
+def has_solar(household: Household) -> bool:
+    return household.solar.has_solar is True and household.solar.size is not None
+
+
+def has_battery(household: Household) -> bool:
+    return (
+        household.battery.has_battery is True and household.battery.capacity is not None
+    )
+
+
+def project_discrete_inputs(household: Household):
+    """The inputs a household's linear model depends on. Households that share them
+    share a model."""
+    return (
+        household.location,
+        project_occupancy(household.occupancy),
+        project_appliances(household),
+        project_vehicle_fuel_types(household.vehicles),
+        has_solar(household),
+        has_battery(household),
+        project_meter_calibration(household.meter_calibration),
+    )
+
+
+@memoise_stage("compile_household_model", project_discrete_inputs)
+def compile_household_model(household: Household) -> LinearHouseholdModel:
+    """Precomputes the base values & coefficients for the household's discrete inputs
+
+    The coefficients are found by running the pipeline's own building blocks without
+    vehicles, and with a single vehicle driving 1 km/week for each of the vehicles.
+
+    Args:
+        household (Household): the household. Only its discrete inputs are used.
+
+    Returns:
+        LinearHouseholdModel: the household's linear model
+    """
+    return _compile_linear_model(household, CLOSED_FORM_PERIODS)
+
+
+@memoise_stage("compile_monthly_household_model", project_discrete_inputs)
+def compile_monthly_household_model(household: Household) -> LinearHouseholdModel:
+    """Precomputes the household's linear model for each month of a typical year
+
+    Each month is the household's daily model times the days in the month, except that
+    space heating & solar generation follow the seasons in the household's region (see
+    SPACE_HEATING_MONTHLY_SHAPE & SOLAR_MONTHLY_SHAPE). The months add up to the
+    YEARLY model's energy, but the year's solar is no longer spread evenly over it.
+
+    Args:
+        household (Household): the household. Only its discrete inputs are used.
+
+    Returns:
+        LinearHouseholdModel: the household's linear model, with one row per month,
+            January first
+    """
+    daily = _compile_linear_model(household, [PeriodEnum.DAILY])
+    days = get_days_per_month()
+    heating_shape = _normalise_monthly_shape(
+        SPACE_HEATING_MONTHLY_SHAPE[household.location], days
+    )
+    solar_shape = _normalise_monthly_shape(
+        SOLAR_MONTHLY_SHAPE[household.location], days
+    )
+
+    fields = {}
+    for name in LinearHouseholdModel.__dataclass_fields__:
+        value = getattr(daily, name)
+        # Rates are the same whatever the period; everything else adds up over days
+        fields[name] = (
+            np.repeat(value, MONTHS_PER_YEAR, axis=0)
+            if name in ("volume_rate", "off_peak_rate", "feed_in_tariff")
+            else _scale_rows(days, value)
+        )
+
+    # Space heating moves from the summer months into the winter ones
+    for name, value in _compile_space_heating_values(household).items():
+        fields[name] = fields[name] + days * (heating_shape - 1) * value
+    fields["e_solar_per_kw"] = days * solar_shape * daily.e_solar_per_kw[0]
+    return LinearHouseholdModel(**fields)
+
+
+def get_days_per_month(year: int = PROFILE_YEAR) -> np.ndarray:
+    """The days in each month, stretched so that the months add up to DAYS_PER_YEAR
+    like the YEARLY period, shape (12,)"""
+    days = np.array(
+        [calendar.monthrange(year, month)[1] for month in range(1, 13)], dtype=float
+    )
+    return days * DAYS_PER_YEAR / days.sum()
+
+
+def _normalise_monthly_shape(shape: List[float], days: np.ndarray) -> np.ndarray:
+    # Scales a relative monthly shape so that its average day is 1
+    shape = np.array(shape, dtype=float)
+    return shape * days.sum() / (shape @ days)
+
+
+def _scale_rows(days: np.ndarray, value: np.ndarray) -> np.ndarray:
+    # Scales a daily model's single row to one row per month
+    return days.reshape((-1,) + (1,) * (value.ndim - 1)) * value
+
+
+def _compile_space_heating_values(household: Household) -> Dict[str, float]:
+    # The part of the daily model's base values that comes from space heating
+    _, space_heating_factor = project_meter_calibration(household.meter_calibration)
+    e_space_heating = (
+        get_energy_per_period(
+            household.space_heating,
+            SPACE_HEATING_INFO,
+            household.occupancy,
+            PeriodEnum.DAILY,
+            household.location,
+        )
+        * space_heating_factor
+    )
+    e_needs: MachineEnergyNeeds = {
+        "appliances": e_space_heating,
+        "vehicles": FuelVector(),
+        "other_appliances": FuelVector(),
+    }
+    return {
+        "e_needs": _get_electricity(e_needs),
+        "e_self_consumption": _get_electricity(get_max_e_consumed_from_solar(e_needs)),
+        "other_energy_costs": get_other_energy_costs(
+            get_other_energy_consumption(e_needs), PeriodEnum.DAILY
+        ),
+        "emissions": get_appliance_emissions(
+            household.space_heating,
+            SPACE_HEATING_INFO,
+            household.location,
+            household.occupancy,
+            PeriodEnum.DAILY,
+        )
+        * space_heating_factor,
+    }
+
+
+def _compile_linear_model(
+    household: Household, periods: List[PeriodEnum]
+) -> LinearHouseholdModel:
+    location = household.location
+    fuel_types = project_vehicle_fuel_types(household.vehicles)
+    unit_vehicles = [
+        Vehicle(fuel_type=fuel_type, kms_per_week=1) for fuel_type in fuel_types
+    ]
+    household_without_vehicles = household.copy(update={"vehicles": []})
+
+    rows = {name: [] for name in LinearHouseholdModel.__dataclass_fields__}
+    for period in periods:
+        e_needs = get_total_energy_needs(household_without_vehicles, period, location)
+        e_needs_per_km: List[MachineEnergyNeeds] = [
+            {"vehicles": get_vehicle_energy([vehicle], period)}
+            for vehicle in unit_vehicles
+        ]
+
+        rows["e_needs"].append(_get_electricity(e_needs))
+        rows["e_needs_per_km"].append([_get_electricity(e) for e in e_needs_per_km])
+        rows["e_self_consumption"].append(
+            _get_electricity(get_max_e_consumed_from_solar(e_needs))
+        )
+        rows["e_self_consumption_per_km"].append(
+            [_get_electricity(get_max_e_consumed_from_solar(e)) for e in e_needs_per_km]
+        )
+        rows["e_solar_per_kw"].append(
+            get_e_generated_from_solar(Solar(has_solar=True, size=1), location, period)
+            if has_solar(household)
+            else 0
+        )
+        rows["e_battery_per_kwh"].append(
+            get_battery_storage_capacity(1, period) if has_battery(household) else 0
+        )
+        rows["other_energy_costs"].append(
+            get_other_energy_costs(get_other_energy_consumption(e_needs), period)
+        )
+        rows["other_energy_costs_per_km"].append(
+            [
+                get_other_energy_costs(get_other_energy_consumption(e), period)
+                for e in e_needs_per_km
+            ]
+        )
+        rows["fixed_costs"].append(get_fixed_costs(household, period))
+        rows["rucs_per_km"].append(
+            [get_rucs_per_kms_per_week(fuel_type, period) for fuel_type in fuel_types]
+        )
+        # The effective grid price is the volume rate if nothing comes from the
+        # battery, and the off peak rate if everything does
+        rows["volume_rate"].append(get_effective_grid_price(1, 0, period))
+        rows["off_peak_rate"].append(get_effective_grid_price(1, 1, period))
+        rows["feed_in_tariff"].append(get_solar_feedin_tariff(1, period))
+        rows["emissions"].append(
+            get_total_emissions(household_without_vehicles, period, location)
+        )
+        rows["emissions_per_km"].append(
+            [get_vehicle_emissions([vehicle], period) for vehicle in unit_vehicles]
+        )
+
+    return LinearHouseholdModel(
+        **{name: np.array(values, dtype=float) for name, values in rows.items()}
+    )
+
+
+def _get_electricity(e_needs: MachineEnergyNeeds) -> float:
+    return sum_energy_for_fuel_type(e_needs, FuelTypeEnum.ELECTRICITY)
@@ -0,0 +1,573 @@
+import calendar
+from typing import Optional, Tuple, TypedDict
+
+import numpy as np
+
+from openapi_client.models import (
+    Emissions,
+    EmissionsValues,
+    Household,
+    MonthlySavings,
+    MonthSavings,
+    Opex,
+    OpexValues,
+    SeasonSavings,
+    Solar,
+)
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.seasonal_shapes import SEASON_MONTHS
+from constants.solar import SOLAR_FEEDIN_TARIFF_2024
+from constants.tou_tariffs import TOU_TARIFF_2024, TOU_TARIFF_AVG_15_YEARS
+from constants.utils import DAYS_PER_YEAR, MONTHS_PER_YEAR, PROFILE_YEAR, PeriodEnum
+from params import (
+    OPERATIONAL_LIFETIME,
+    OPTIMISE_BATTERY_DISPATCH,
+    SCHEDULE_FLEXIBLE_LOADS,
+)
+from savings.closed_form.compile_household_model import (
+    CLOSED_FORM_PERIODS,
+    LinearHouseholdModel,
+    compile_household_model,
+    compile_monthly_household_model,
+    has_battery,
+    has_solar,
+)
+from savings.energy.get_electricity_consumption import (
+    get_battery_storage_capacity,
+    get_e_generated_from_solar,
+)
+from savings.energy.schedule_flexible_loads import (
+    get_hourly_electricity_consumption,
+    schedule_household_loads,
+)
+from savings.energy.synthesise_load_profiles import (
+    get_daily_kwh_by_category,
+    get_profile_shapes,
+    get_solar_generation_shape,
+)
+from savings.opex.optimise_battery_dispatch import optimise_battery_dispatch
+from utils.household_projections import project_savings_inputs
+from utils.memoise_stage import memoise_stage
+from utils.scale_daily_to_period import scale_daily_to_period
+from utils.tou_tariff import get_days_in_year, get_hourly_rates
+
+
+class HouseholdTotals(TypedDict):
+    # One value per period in CLOSED_FORM_PERIODS, or one row of them per point
+    # when evaluated at many points
+    opex: np.ndarray  # NZD
+    emissions: np.ndarray  # kgCO2e
+
+
+class ElectricityFlows(TypedDict):
+    # kWh, one value per period in CLOSED_FORM_PERIODS, per point
+    consumed_from_solar: np.ndarray
+    stored_in_battery: np.ndarray
+    consumed_from_grid: np.ndarray
+    bought_off_peak: (
+        np.ndarray
+    )  # the part of consumed_from_grid bought to charge the battery
+    exported_to_grid: np.ndarray
+
+
+class HourlyElectricityFlows(ElectricityFlows):
+    # NZD of consumed_from_grid, priced in each hour it's bought
+    grid_volume_costs: np.ndarray
+
+
+# Hourly flows take ~1 MB per point, so are found this many points at a time
+HOURLY_FLOWS_CHUNK_SIZE = 64
+
+
+def evaluate_household_model(
+    model: LinearHouseholdModel, household: Household
+) -> HouseholdTotals:
+    """Evaluates a household's opex & emissions from its linear model
+
+    Args:
+        model (LinearHouseholdModel): the model compiled for the household's discrete inputs
+        household (Household): the household, for its kms_per_week, solar size & battery capacity
+
+    Returns:
+        HouseholdTotals: opex & emissions for each period
+    """
+    totals = evaluate_household_at_points(
+        model, household, *get_continuous_inputs(household)
+    )
+    return {"opex": totals["opex"][0], "emissions": totals["emissions"][0]}
+
+
+def evaluate_household_at_points(
+    model: LinearHouseholdModel,
+    household: Household,
+    kms: np.ndarray,
+    solar_size: np.ndarray,
+    battery_capacity: np.ndarray,
+) -> HouseholdTotals:
+    """Evaluates a household's linear model at many points of its continuous inputs,
+    with its electricity flows found hour by hour if it needs them (see
+    uses_hourly_flows)
+
+    Args:
+        model (LinearHouseholdModel): the model compiled for the household's discrete inputs
+        household (Household): the household, cleaned (see clean_household), for its discrete inputs
+        kms (np.ndarray): each vehicle's kms_per_week at each point, shape (n_points, n_vehicles)
+        solar_size (np.ndarray): the solar size in kW at each point, shape (n_points,)
+        battery_capacity (np.ndarray): the battery capacity in kWh at each point, shape (n_points,)
+
+    Returns:
+        HouseholdTotals: opex & emissions, shape (n_points, n_periods)
+    """
+    return evaluate_linear_model(
+        model,
+        kms,
+        solar_size,
+        battery_capacity,
+        (
+            get_hourly_electricity_flows(household, kms, solar_size, battery_capacity)
+            if uses_hourly_flows()
+            else None
+        ),
+    )
+
+
+def get_continuous_inputs(
+    household: Household,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The household's kms_per_week, solar size & battery capacity, as a single point
+    to evaluate a linear model at (see evaluate_linear_model)"""
+    vehicles = household.vehicles or []
+    if any(vehicle.kms_per_week is None for vehicle in vehicles):
+        raise ValueError("Every vehicle needs kms_per_week")
+    return (
+        np.array([[vehicle.kms_per_week for vehicle in vehicles]], dtype=float),
+        np.array([household.solar.size or 0], dtype=float),
+        np.array([household.battery.capacity or 0], dtype=float),
+    )
+
+
+def evaluate_linear_model(
+    model: LinearHouseholdModel,
+    kms: np.ndarray,
+    solar_size: np.ndarray,
+    battery_capacity: np.ndarray,
+    flows: Optional[ElectricityFlows] = None,
+) -> HouseholdTotals:
+    """Evaluates a linear model at many points of its continuous inputs at once
+
+    This gives the same results as the step-by-step pipeline.
+
+    Args:
+        model (LinearHouseholdModel): the model compiled for the household's discrete inputs
+        kms (np.ndarray): each vehicle's kms_per_week at each point, shape (n_points, n_vehicles)
+        solar_size (np.ndarray): the solar size in kW at each point, shape (n_points,)
+        battery_capacity (np.ndarray): the battery capacity in kWh at each point, shape (n_points,)
+        flows (ElectricityFlows, optional): electricity flows found some other way (e.g. get_hourly_electricity_flows) to price instead of the model's. Defaults to None.
+
+    Returns:
+        HouseholdTotals: opex & emissions, shape (n_points, n_periods)
+    """
+    if flows is None:
+        flows = get_electricity_flows(model, kms, solar_size, battery_capacity)
+    if "grid_volume_costs" in flows:
+        # Already priced hour by hour
+        grid_volume_costs = flows["grid_volume_costs"]
+    else:
+        e_bought_off_peak = flows["bought_off_peak"]
+        grid_volume_costs = model.off_peak_rate * e_bought_off_peak + (
+            model.volume_rate * (flows["consumed_from_grid"] - e_bought_off_peak)
+        )
+    other_energy_costs = (
+        model.other_energy_costs + kms @ model.other_energy_costs_per_km.T
+    )
+    # RUCs are rounded to the cent in the pipeline
+    rucs = np.round(kms @ model.rucs_per_km.T, 2)
+    revenue_from_solar_export = model.feed_in_tariff * flows["exported_to_grid"]
+
+    return {
+        "opex": grid_volume_costs
+        + other_energy_costs
+        + model.fixed_costs
+        + rucs
+        - revenue_from_solar_export,
+        "emissions": model.emissions + kms @ model.emissions_per_km.T,
+    }
+
+
+def get_electricity_flows(
+    model: LinearHouseholdModel,
+    kms: np.ndarray,
+    solar_size: np.ndarray,
+    battery_capacity: np.ndarray,
+) -> ElectricityFlows:
+    """The household's electricity flows at many points of its continuous inputs
+
+    Electricity flows are linear except where they're capped:
+        consumed from solar = min(self-consumption, generated)
+        stored in battery = min(generated - consumed from solar, battery capacity)
+        consumed from grid = max(needs - consumed from solar - stored in battery, 0)
+        bought off peak = min(stored in battery, consumed from grid)
+
+    Args:
+        model (LinearHouseholdModel): the model compiled for the household's discrete inputs
+        kms (np.ndarray): each vehicle's kms_per_week at each point, shape (n_points, n_vehicles)
+        solar_size (np.ndarray): the solar size in kW at each point, shape (n_points,)
+        battery_capacity (np.ndarray): the battery capacity in kWh at each point, shape (n_points,)
+
+    Returns:
+        ElectricityFlows: kWh of each flow, shape (n_points, n_periods)
+    """
+    solar_size = np.maximum(solar_size, 0)[:, np.newaxis]
+    battery_capacity = battery_capacity[:, np.newaxis]
+
+    e_needs = model.e_needs + kms @ model.e_needs_per_km.T
+    e_self_consumption = (
+        model.e_self_consumption + kms @ model.e_self_consumption_per_km.T
+    )
+    e_generated = model.e_solar_per_kw * solar_size
+    e_consumed_from_solar = np.minimum(e_self_consumption, e_generated)
+    e_stored_in_battery = np.minimum(
+        e_generated - e_consumed_from_solar,
+        model.e_battery_per_kwh * battery_capacity,
+    )
+    e_consumed_from_grid = np.maximum(
+        e_needs - e_consumed_from_solar - e_stored_in_battery, 0
+    )
+    return {
+        "consumed_from_solar": e_consumed_from_solar,
+        "stored_in_battery": e_stored_in_battery,
+        "consumed_from_grid": e_consumed_from_grid,
+        "bought_off_peak": np.minimum(e_stored_in_battery, e_consumed_from_grid),
+        "exported_to_grid": e_generated - e_stored_in_battery - e_consumed_from_solar,
+    }
+
+
+def uses_hourly_flows() -> bool:
+    """Whether households' electricity flows are found hour by hour (see
+    get_hourly_electricity_flows) rather than from their linear models. Every
+    household is then priced with the TOU tariff, whether it has a battery or not."""
+    return SCHEDULE_FLEXIBLE_LOADS or OPTIMISE_BATTERY_DISPATCH
+
+
+def get_hourly_electricity_flows(
+    household: Household,
+    kms: np.ndarray,
+    solar_size: np.ndarray,
+    battery_capacity: np.ndarray,
+    monthly: bool = False,
+    year: int = PROFILE_YEAR,
+) -> HourlyElectricityFlows:
+    """The household's electricity flows hour by hour, at many points of its
+    continuous inputs
+
+    Instead of a flat self-consumption rate for every category, the household's loads
+    & solar generation are synthesised hour by hour. With SCHEDULE_FLEXIBLE_LOADS on,
+    its water heating & EV charging are moved onto surplus solar or the cheapest TOU
+    hours (see schedule_household_loads). With OPTIMISE_BATTERY_DISPATCH on, a battery
+    charges & discharges to make each day's electricity cheapest (see
+    optimise_battery_dispatch), from the grid as well as solar, rather than only
+    storing surplus solar. Electricity from the grid is then priced in
+    each hour it's bought, with the same TOU tariff it was scheduled with (the 2024
+    rates, or their 15 year average over the operational lifetime), so nothing is
+    bought at the off-peak rate. The year's flows are scaled to each row of the model
+    like its daily values. Points are found HOURLY_FLOWS_CHUNK_SIZE at a time.
+
+    Args:
+        household (Household): the household, cleaned (see clean_household), for its discrete inputs
+        kms (np.ndarray): each vehicle's kms_per_week at each point, shape (n_points, n_vehicles)
+        solar_size (np.ndarray): the solar size in kW at each point, shape (n_points,)
+        battery_capacity (np.ndarray): the battery capacity in kWh at each point, shape (n_points,)
+        monthly (bool, optional): whether to give a row per month, like compile_monthly_household_model, rather than a row per period in CLOSED_FORM_PERIODS. Defaults to False.
+        year (int, optional): the year to lay the profiles out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        HourlyElectricityFlows: kWh of each flow & NZD of the electricity consumed from the grid, shape (n_points, n_rows)
+    """
+    n_days = get_days_in_year(year)
+    day_weights, row_rates = _get_hourly_rows(monthly, year)
+    rates = get_hourly_rates(TOU_TARIFF_2024, year).reshape(n_days, 24)
+    profile_shapes = get_profile_shapes(year).reshape(-1, n_days, 24)
+    solar_shape = get_solar_generation_shape(year).reshape(n_days, 24)
+    e_solar_per_kw = (
+        get_e_generated_from_solar(
+            Solar(has_solar=True, size=1), household.location, PeriodEnum.DAILY
+        )
+        if has_solar(household)
+        else 0
+    )
+    e_battery_per_kwh = (
+        get_battery_storage_capacity(1, PeriodEnum.DAILY)
+        if has_battery(household)
+        else 0
+    )
+
+    # Only the vehicles' kWh change with kms, so each distinct kms is looked up once
+    distinct_kms, kms_index = np.unique(kms, axis=0, return_inverse=True)
+    daily_kwh = get_daily_kwh_by_category(
+        [_with_kms(household, point_kms) for point_kms in distinct_kms]
+    )[kms_index.ravel()]
+
+    chunks = []
+    for start in range(0, len(kms), HOURLY_FLOWS_CHUNK_SIZE):
+        chunk = slice(start, start + HOURLY_FLOWS_CHUNK_SIZE)
+        e_by_category = dict(
+            zip(
+                PROFILE_CATEGORIES,
+                np.moveaxis(
+                    daily_kwh[chunk, :, np.newaxis, np.newaxis] * profile_shapes, 1, 0
+                ),
+            )
+        )
+        e_generated_from_solar = (e_solar_per_kw * np.maximum(solar_size[chunk], 0))[
+            :, np.newaxis, np.newaxis
+        ] * solar_shape
+        e_inflexible = (
+            e_by_category["space_heating"]
+            + e_by_category["cooktop"]
+            + e_by_category["other_appliances"]
+        )
+        if SCHEDULE_FLEXIBLE_LOADS:
+            e_load = schedule_household_loads(
+                e_inflexible,
+                e_by_category["water_heating"],
+                e_by_category["vehicles"].sum(axis=-1),
+                e_generated_from_solar,
+                rates,
+                year,
+            )
+        else:
+            e_load = (
+                e_inflexible
+                + e_by_category["water_heating"]
+                + e_by_category["vehicles"]
+            )
+        if OPTIMISE_BATTERY_DISPATCH and has_battery(household):
+            dispatch = optimise_battery_dispatch(
+                rates,
+                e_load,
+                e_generated_from_solar,
+                np.maximum(battery_capacity[chunk], 0),
+                SOLAR_FEEDIN_TARIFF_2024,
+            )
+            consumption = {
+                "consumed_from_solar": np.minimum(e_load, e_generated_from_solar),
+                "consumed_from_battery": dispatch["discharged"],
+                "consumed_from_grid": dispatch["consumed_from_grid"],
+                "exported_to_grid": dispatch["exported_to_grid"],
+            }
+        else:
+            consumption = get_hourly_electricity_consumption(
+                e_load,
+                e_generated_from_solar,
+                e_battery_per_kwh * battery_capacity[chunk],
+                rates,
+            )
+
+        def per_row(e_hourly: np.ndarray) -> np.ndarray:
+            return e_hourly.sum(axis=-1) @ day_weights.T
+
+        e_consumed_from_grid = consumption["consumed_from_grid"]
+        chunks.append(
+            {
+                "consumed_from_solar": per_row(consumption["consumed_from_solar"]),
+                "stored_in_battery": per_row(consumption["consumed_from_battery"]),
+                "consumed_from_grid": per_row(e_consumed_from_grid),
+                "bought_off_peak": np.zeros((len(e_load), len(day_weights))),
+                "exported_to_grid": per_row(consumption["exported_to_grid"]),
+                "grid_volume_costs": np.einsum(
+                    "pdh,rdh,rd->pr",
+                    e_consumed_from_grid,
+                    row_rates,
+                    day_weights,
+                ),
+            }
+        )
+    return {
+        name: np.concatenate([flows[name] for flows in chunks])
+        for name in HourlyElectricityFlows.__annotations__
+    }
+
+
+def _get_hourly_rows(monthly: bool, year: int) -> Tuple[np.ndarray, np.ndarray]:
+    # How much each day of the year counts towards each row of the model, shape
+    # (n_rows, n_days), & the TOU rates each row is priced with, shape
+    # (n_rows, n_days, 24)
+    n_days = get_days_in_year(year)
+    if monthly:
+        month = np.repeat(
+            np.arange(MONTHS_PER_YEAR),
+            [calendar.monthrange(year, m)[1] for m in range(1, MONTHS_PER_YEAR + 1)],
+        )
+        day_weights = (month == np.arange(MONTHS_PER_YEAR)[:, np.newaxis]) * (
+            DAYS_PER_YEAR / n_days
+        )
+        tariffs = [TOU_TARIFF_2024] * MONTHS_PER_YEAR
+    else:
+        day_weights = np.array(
+            [
+                np.full(n_days, scale_daily_to_period(1, period) / n_days)
+                for period in CLOSED_FORM_PERIODS
+            ]
+        )
+        tariffs = [
+            (
+                TOU_TARIFF_AVG_15_YEARS
+                if period == PeriodEnum.OPERATIONAL_LIFETIME
+                else TOU_TARIFF_2024
+            )
+            for period in CLOSED_FORM_PERIODS
+        ]
+    row_rates = np.array(
+        [get_hourly_rates(tariff, year).reshape(n_days, 24) for tariff in tariffs]
+    )
+    return day_weights, row_rates
+
+
+def _with_kms(household: Household, kms: np.ndarray) -> Household:
+    vehicles = [
+        vehicle.copy(update={"kms_per_week": float(vehicle_kms)})
+        for vehicle, vehicle_kms in zip(household.vehicles or [], kms)
+    ]
+    return household.copy(update={"vehicles": vehicles})
+
+
+@memoise_stage("get_household_totals", project_savings_inputs)
+def get_household_totals(household: Household) -> HouseholdTotals:
+    """The household's opex & emissions for each period, from its linear model
+
+    Returns:
+        HouseholdTotals: opex & emissions, shape (n_periods,). Read-only, as they're
+            shared between callers (see memoise_stage).
+    """
+    return evaluate_household_model(compile_household_model(household), household)
+
+
+def get_opex_from_totals(before: HouseholdTotals, after: HouseholdTotals) -> Opex:
+    """The opex before & after electrification, from each household's totals"""
+    weekly, yearly, lifetime = [
+        OpexValues(**_round_values(b, a)) for b, a in zip(before["opex"], after["opex"])
+    ]
+    return Opex(
+        perWeek=weekly,
+        perYear=yearly,
+        overLifetime=lifetime,
+        operationalLifetime=OPERATIONAL_LIFETIME,
+    )
+
+
+def get_emissions_from_totals(
+    before: HouseholdTotals, after: HouseholdTotals
+) -> Emissions:
+    """The emissions before & after electrification, from each household's totals"""
+    weekly, yearly, lifetime = [
+        EmissionsValues(**_round_values(b, a))
+        for b, a in zip(before["emissions"], after["emissions"])
+    ]
+    return Emissions(
+        perWeek=weekly,
+        perYear=yearly,
+        overLifetime=lifetime,
+        operationalLifetime=OPERATIONAL_LIFETIME,
+    )
+
+
+def calculate_opex_closed_form(
+    current_household: Household, electrified_household: Household
+) -> Opex:
+    """Same as calculate_opex, but evaluated from the households' linear models"""
+    return get_opex_from_totals(
+        get_household_totals(current_household),
+        get_household_totals(electrified_household),
+    )
+
+
+def calculate_emissions_closed_form(
+    current_household: Household, electrified_household: Household
+) -> Emissions:
+    """Same as calculate_emissions, but evaluated from the households' linear models"""
+    return get_emissions_from_totals(
+        get_household_totals(current_household),
+        get_household_totals(electrified_household),
+    )
+
+
+def get_monthly_totals(household: Household) -> HouseholdTotals:
+    """The household's opex & emissions in each month, January first
+
+    Every month is evaluated at once from the household's monthly model (see
+    compile_monthly_household_model).
+
+    Returns:
+        HouseholdTotals: opex & emissions, shape (12,)
+    """
+    inputs = get_continuous_inputs(household)
+    totals = evaluate_linear_model(
+        compile_monthly_household_model(household),
+        *inputs,
+        (
+            get_hourly_electricity_flows(household, *inputs, monthly=True)
+            if uses_hourly_flows()
+            else None
+        ),
+    )
+    return {"opex": totals["opex"][0], "emissions": totals["emissions"][0]}
+
+
+@memoise_stage(
+    "calculate_monthly_savings_closed_form",
+    lambda current, electrified: (
+        project_savings_inputs(current),
+        project_savings_inputs(electrified),
+    ),
+)
+def calculate_monthly_savings_closed_form(
+    current_household: Household, electrified_household: Household
+) -> MonthlySavings:
+    """The household's opex & emissions before & after electrification in each month &
+    season of a typical year"""
+    before = get_monthly_totals(current_household)
+    after = get_monthly_totals(electrified_household)
+    month_season = {
+        month: season for season, months in SEASON_MONTHS.items() for month in months
+    }
+    return MonthlySavings(
+        perMonth=[
+            MonthSavings(
+                month=i + 1,
+                season=month_season[i + 1],
+                opex=OpexValues(**_round_values(before["opex"][i], after["opex"][i])),
+                emissions=EmissionsValues(
+                    **_round_values(before["emissions"][i], after["emissions"][i])
+                ),
+            )
+            for i in range(MONTHS_PER_YEAR)
+        ],
+        perSeason=[
+            SeasonSavings(
+                season=season,
+                opex=OpexValues(
+                    **_round_values(
+                        before["opex"][months].sum(), after["opex"][months].sum()
+                    )
+                ),
+                emissions=EmissionsValues(
+                    **_round_values(
+                        before["emissions"][months].sum(),
+                        after["emissions"][months].sum(),
+                    )
+                ),
+            )
+            for season, months in (
+                (season, np.array(months) - 1)
+                for season, months in SEASON_MONTHS.items()
+            )
+        ],
+    )
+
+
+def _round_values(before: float, after: float) -> dict:
+    return {
+        "before": round(float(before), 2),
+        "after": round(float(after), 2),
+        "difference": round(float(after - before), 2),
+    }
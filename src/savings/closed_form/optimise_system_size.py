@@ -0,0 +1,267 @@
+from typing import Optional
+
+import numpy as np
+
+from constants.utils import PeriodEnum
+from models.electrify_household import electrify_household
+from openapi_client.models import (
+    Battery,
+    Household,
+    Solar,
+    SystemSize,
+    SystemSizeObjectiveEnum,
+)
+from params import OPTIMISE_BATTERY_DISPATCH
+from savings.closed_form.compile_household_model import (
+    CLOSED_FORM_PERIODS,
+    LinearHouseholdModel,
+    compile_household_model,
+)
+from savings.closed_form.evaluate_household_model import (
+    evaluate_household_at_points,
+    uses_hourly_flows,
+)
+from savings.upfront_cost.get_machine_upfront_cost import (
+    BATTERY_COST_PER_KWH,
+    SOLAR_COST_PER_KW,
+)
+from utils.clean_household import clean_household
+from utils.validate_household import validate_household
+
+DEFAULT_MAX_SOLAR_SIZE = 15  # kW
+DEFAULT_MAX_BATTERY_CAPACITY = 20  # kWh
+
+# With hourly flows, opex isn't piecewise linear, so sizes on a grid this many steps
+# across each range are evaluated too
+HOURLY_FLOWS_GRID_STEPS = 10
+
+YEARLY = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+LIFETIME = CLOSED_FORM_PERIODS.index(PeriodEnum.OPERATIONAL_LIFETIME)
+
+
+def optimise_system_size(
+    household: Household,
+    objective: Optional[SystemSizeObjectiveEnum] = None,
+    max_solar_size: Optional[float] = None,
+    max_battery_capacity: Optional[float] = None,
+) -> SystemSize:
+    """Finds the solar size & battery capacity that are best for the household
+
+    Systems are compared against the electrified household with only the solar &
+    battery it already has. Only a system the household doesn't have yet is sized,
+    whatever it says about installing one.
+
+    With the household's other inputs fixed, its opex is piecewise linear in the solar
+    size & battery capacity: the kinks are where solar generation covers
+    self-consumption, where the battery fills up, where the battery covers everything
+    bought from the grid and where nothing is bought from the grid. Upfront costs are
+    linear too, so both the lifetime net savings & the payback period (a ratio of two
+    linear functions) are best at a corner of the regions between the kinks. Only
+    those corners are evaluated, together in one batch. When the household's flows are
+    found hour by hour (see uses_hourly_flows), like in /savings, the corners are only
+    a guide, so a grid of sizes is evaluated with them.
+
+    Args:
+        household (Household): the household
+        objective (SystemSizeObjectiveEnum, optional): what to optimise for. Defaults to NET_SAVINGS.
+        max_solar_size (float, optional): the largest solar size to consider in kW. Defaults to DEFAULT_MAX_SOLAR_SIZE.
+        max_battery_capacity (float, optional): the largest battery capacity to consider in kWh. Defaults to DEFAULT_MAX_BATTERY_CAPACITY.
+
+    Raises:
+        ValueError: if the household is invalid
+
+    Returns:
+        SystemSize: the best system
+    """
+    objective = objective or SystemSizeObjectiveEnum.NET_SAVINGS
+    max_solar_size = (
+        DEFAULT_MAX_SOLAR_SIZE if max_solar_size is None else max_solar_size
+    )
+    max_battery_capacity = (
+        DEFAULT_MAX_BATTERY_CAPACITY
+        if max_battery_capacity is None
+        else max_battery_capacity
+    )
+
+    validate_household(household)
+    electrified = electrify_household(clean_household(household.copy()))
+    existing_solar_size = (
+        household.solar.size or 0 if household.solar.has_solar else None
+    )
+    existing_battery_capacity = (
+        household.battery.capacity or 0 if household.battery.has_battery else None
+    )
+
+    # The model of a household with both solar & a battery covers every system,
+    # including none at all (a size or capacity of 0)
+    model_household = electrified.copy(
+        update={
+            "solar": Solar(has_solar=True, size=1),
+            "battery": Battery(has_battery=True, capacity=1),
+        }
+    )
+    model = compile_household_model(model_household)
+    kms = np.array([[v.kms_per_week for v in electrified.vehicles]], dtype=float)
+
+    solar_bounds = (
+        [existing_solar_size]
+        if existing_solar_size is not None
+        else [0, max_solar_size]
+    )
+    battery_bounds = (
+        [existing_battery_capacity]
+        if existing_battery_capacity is not None
+        else [0, max_battery_capacity]
+    )
+    solar_size, battery_capacity = _get_candidate_sizes(
+        model, kms, solar_bounds, battery_bounds
+    )
+    if uses_hourly_flows():
+        grid_solar, grid_battery = np.meshgrid(
+            np.linspace(
+                min(solar_bounds), max(solar_bounds), HOURLY_FLOWS_GRID_STEPS + 1
+            ),
+            np.linspace(
+                min(battery_bounds), max(battery_bounds), HOURLY_FLOWS_GRID_STEPS + 1
+            ),
+        )
+        # Finding flows hour by hour is slow, so each system is only evaluated once
+        solar_size, battery_capacity = np.unique(
+            [
+                np.append(solar_size, grid_solar.ravel()),
+                np.append(battery_capacity, grid_battery.ravel()),
+            ],
+            axis=1,
+        )
+    if existing_battery_capacity is None and not OPTIMISE_BATTERY_DISPATCH:
+        # A battery can't be installed without solar, unless it can charge from the grid
+        valid = (solar_size > 0) | (battery_capacity == 0)
+        solar_size, battery_capacity = solar_size[valid], battery_capacity[valid]
+
+    opex = evaluate_household_at_points(
+        model,
+        model_household,
+        np.repeat(kms, len(solar_size), axis=0),
+        solar_size,
+        battery_capacity,
+    )["opex"]
+    opex_without_system = evaluate_household_at_points(
+        model,
+        model_household,
+        kms,
+        np.array([existing_solar_size or 0], dtype=float),
+        np.array([existing_battery_capacity or 0], dtype=float),
+    )["opex"][0]
+
+    upfront_cost = np.zeros(len(solar_size))
+    if existing_solar_size is None:
+        upfront_cost += np.round(SOLAR_COST_PER_KW * solar_size, 2)
+    if existing_battery_capacity is None:
+        upfront_cost += np.round(BATTERY_COST_PER_KWH * battery_capacity, 2)
+    savings = opex_without_system - opex
+    net_savings = savings[:, LIFETIME] - upfront_cost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payback = np.where(
+            savings[:, YEARLY] > 0, upfront_cost / savings[:, YEARLY], np.inf
+        )
+
+    if objective == SystemSizeObjectiveEnum.PAYBACK:
+        # A system that costs nothing has no payback period to speak of. Of the
+        # systems that pay back the quickest, pick the one that saves the most.
+        payback = np.where(upfront_cost > 0, payback, np.inf)
+        best = np.lexsort((-net_savings, np.round(payback, 6)))[0]
+        if not np.isfinite(payback[best]):
+            best = np.argmin(upfront_cost)
+    else:
+        # Of the systems that save the most, pick the cheapest
+        best = np.lexsort((upfront_cost, -np.round(net_savings, 6)))[0]
+
+    return SystemSize(
+        solarSize=round(float(solar_size[best]), 2),
+        batteryCapacity=round(float(battery_capacity[best]), 2),
+        upfrontCost=round(float(upfront_cost[best]), 2),
+        opexSavingsPerYear=round(float(savings[best, YEARLY]), 2),
+        netSavingsOverLifetime=round(float(net_savings[best]), 2),
+        paybackYears=(
+            round(float(payback[best]), 2) if np.isfinite(payback[best]) else None
+        ),
+    )
+
+
+def _get_candidate_sizes(
+    model: LinearHouseholdModel,
+    kms: np.ndarray,
+    solar_bounds: list,
+    battery_bounds: list,
+):
+    """The corners of the regions in which opex is linear in solar size & battery capacity
+
+    With N the electricity needed, M the self-consumption and g & k the energy
+    generated per kW & stored per kWh, the kinks are at
+        solar size = M / g, (N + M) / 2g and N / g
+        battery capacity = (N - M) / 2k and (N - M) / k
+        g * solar size - M = k * battery capacity
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the solar size & battery capacity of each candidate
+    """
+    e_needs = (model.e_needs + kms @ model.e_needs_per_km.T)[0, LIFETIME]
+    e_self_consumption = (
+        model.e_self_consumption + kms @ model.e_self_consumption_per_km.T
+    )[0, LIFETIME]
+    e_solar_per_kw = model.e_solar_per_kw[LIFETIME]
+    e_battery_per_kwh = model.e_battery_per_kwh[LIFETIME]
+
+    def clip(values, bounds):
+        return np.clip(np.asarray(values, dtype=float), min(bounds), max(bounds))
+
+    solar_sizes = np.unique(
+        np.append(
+            clip(
+                [
+                    e_self_consumption / e_solar_per_kw,
+                    (e_needs + e_self_consumption) / (2 * e_solar_per_kw),
+                    e_needs / e_solar_per_kw,
+                ],
+                solar_bounds,
+            ),
+            solar_bounds,
+        )
+    )
+    battery_capacities = np.unique(
+        np.append(
+            clip(
+                [
+                    (e_needs - e_self_consumption) / (2 * e_battery_per_kwh),
+                    (e_needs - e_self_consumption) / e_battery_per_kwh,
+                ],
+                battery_bounds,
+            ),
+            battery_bounds,
+        )
+    )
+
+    # Every crossing of the solar & battery kinks, and of each with the diagonal kink
+    grid_solar, grid_battery = np.meshgrid(solar_sizes, battery_capacities)
+    solar = np.concatenate(
+        [
+            grid_solar.ravel(),
+            clip(
+                (e_self_consumption + e_battery_per_kwh * battery_capacities)
+                / e_solar_per_kw,
+                solar_bounds,
+            ),
+            solar_sizes,
+        ]
+    )
+    battery = np.concatenate(
+        [
+            grid_battery.ravel(),
+            battery_capacities,
+            clip(
+                (e_solar_per_kw * solar_sizes - e_self_consumption) / e_battery_per_kwh,
+                battery_bounds,
+            ),
+        ]
+    )
+    return solar, battery
@@ -15,6 +15,8 @@ from savings.emissions.get_machine_emissions import (
     get_other_appliance_emissions,
     get_vehicle_emissions,
 )
+from savings.energy.get_machine_energy import get_baseload_factor
+from utils.household_projections import project_meter_calibration
 
 
 def calculate_emissions(
@@ -22,26 +24,26 @@ def calculate_emissions(
 ) -> Emissions:
 
     # Weekly
-    weekly_before = _get_total_emissions(
+    weekly_before = get_total_emissions(
         current_household, PeriodEnum.WEEKLY, current_household.location
     )
-    weekly_after = _get_total_emissions(
+    weekly_after = get_total_emissions(
         electrified_household, PeriodEnum.WEEKLY, electrified_household.location
     )
 
     # Yearly
-    yearly_before = _get_total_emissions(
+    yearly_before = get_total_emissions(
         current_household, PeriodEnum.YEARLY, current_household.location
     )
-    yearly_after = _get_total_emissions(
+    yearly_after = get_total_emissions(
         electrified_household, PeriodEnum.YEARLY, electrified_household.location
     )
 
     # Operational lifetime
-    lifetime_before = _get_total_emissions(
+    lifetime_before = get_total_emissions(
         current_household, PeriodEnum.OPERATIONAL_LIFETIME, current_household.location
     )
-    lifetime_after = _get_total_emissions(
+    lifetime_after = get_total_emissions(
         electrified_household,
         PeriodEnum.OPERATIONAL_LIFETIME,
         electrified_household.location,
@@ -67,20 +69,24 @@ def calculate_emissions(
     )
 
 
-def _get_total_emissions(
+def get_total_emissions(
     household: Household,
     period: PeriodEnum,
     location: LocationEnum,
 ):
     appliance_emissions = _get_total_appliance_emissions(household, period, location)
     vehicle_emissions = get_vehicle_emissions(household.vehicles, period)
-    other_emissions = get_other_appliance_emissions(household.occupancy, period)
+    baseload_factor, _ = project_meter_calibration(household.meter_calibration)
+    other_emissions = (
+        get_other_appliance_emissions(household.occupancy, period) * baseload_factor
+    )
     return appliance_emissions + vehicle_emissions + other_emissions
 
 
 def _get_total_appliance_emissions(
     household: Household, period: PeriodEnum, location: LocationEnum
 ):
+    _, space_heating_factor = project_meter_calibration(household.meter_calibration)
     return (
         get_appliance_emissions(
             household.space_heating,
@@ -89,6 +95,7 @@ def _get_total_appliance_emissions(
             household.occupancy,
             period,
         )
+        * space_heating_factor
         + get_appliance_emissions(
             household.water_heating,
             WATER_HEATING_INFO,
@@ -96,6 +103,7 @@ def _get_total_appliance_emissions(
             household.occupancy,
             period,
         )
+        * get_baseload_factor(household, household.water_heating, WATER_HEATING_INFO)
         + get_appliance_emissions(
             household.cooktop,
             COOKTOP_INFO,
@@ -103,4 +111,5 @@ def _get_total_appliance_emissions(
             household.occupancy,
             period,
         )
+        * get_baseload_factor(household, household.cooktop, COOKTOP_INFO)
     )
@@ -0,0 +1,114 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from constants.fuel_stats import EMISSIONS_FACTORS, FuelTypeEnum
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.machines.replacement import MACHINE_LIFESPAN_YEARS
+from constants.utils import DAYS_PER_YEAR
+from openapi_client.models import EmissionsValues, Household, YearEmissions
+from savings.emissions.get_machine_emissions import (
+    get_yearly_grid_emissions_multipliers,
+)
+from savings.energy.synthesise_load_profiles import get_daily_kwh_by_category
+from utils.grid_emissions import get_lifetime_years
+from utils.household_projections import project_emissions_inputs
+from utils.memoise_stage import memoise_stage
+
+# Solar has no emissions, so it's left out
+EMISSIONS_FUEL_TYPES = [
+    fuel_type for fuel_type, factor in EMISSIONS_FACTORS.items() if factor > 0
+]
+
+
+def get_replaced_fractions(n_years: int) -> np.ndarray:
+    """How much of each category's machines has been replaced by the end of each year
+    (see MACHINE_LIFESPAN_YEARS)
+
+    Args:
+        n_years (int): the number of years, from the first year of the lifetime
+
+    Returns:
+        np.ndarray: shape (n_categories, n_years), in PROFILE_CATEGORIES order. Categories
+            without machines (i.e. other appliances) are 1.
+    """
+    lifespans = np.array(
+        [MACHINE_LIFESPAN_YEARS.get(category, 1) for category in PROFILE_CATEGORIES],
+        dtype=float,
+    )
+    return np.minimum(1, np.arange(1, n_years + 1) / lifespans[:, np.newaxis])
+
+
+def get_yearly_emissions_by_category(
+    households: Sequence[Household], years: Sequence[int]
+) -> np.ndarray:
+    """Each household's emissions from each category in each year
+
+    The same emissions as get_total_emissions, but for each year separately (with the
+    electricity emissions factor of each year, see get_yearly_grid_emissions_multipliers)
+    and for the whole batch at once, as one product of each household's kWh/day by fuel
+    & category with the emissions factors by fuel, category & year.
+
+    Args:
+        households (Sequence[Household]): the households, cleaned (see clean_household)
+        years (Sequence[int]): the years, e.g. get_lifetime_years()
+
+    Returns:
+        np.ndarray: kgCO2e, shape (n_households, n_categories, n_years)
+    """
+    daily_kwh = np.stack(
+        [
+            get_daily_kwh_by_category(households, fuel_type)
+            for fuel_type in EMISSIONS_FUEL_TYPES
+        ]
+    )
+    factors = np.array(
+        [EMISSIONS_FACTORS[fuel_type] for fuel_type in EMISSIONS_FUEL_TYPES]
+    )[:, np.newaxis, np.newaxis] * np.ones((len(PROFILE_CATEGORIES), len(years)))
+    factors[
+        EMISSIONS_FUEL_TYPES.index(FuelTypeEnum.ELECTRICITY)
+    ] *= get_yearly_grid_emissions_multipliers(years)
+    return np.einsum("fhc,fcy->hcy", daily_kwh, factors) * DAYS_PER_YEAR
+
+
+@memoise_stage(
+    "calculate_emissions_trajectory",
+    lambda current, electrified: (
+        project_emissions_inputs(current),
+        project_emissions_inputs(electrified),
+    ),
+)
+def calculate_emissions_trajectory(
+    current_household: Household, electrified_household: Household
+) -> List[YearEmissions]:
+    """The household's emissions in each year of the operational lifetime
+
+    Before is the current household's emissions. After is the electrified household's,
+    except that its machines are replaced as the current ones wear out (see
+    get_replaced_fractions), so it only reaches the electrified household's emissions
+    once they all have been. So the years' after doesn't add up to overLifetime.after.
+
+    Args:
+        current_household (Household): the household, cleaned (see clean_household)
+        electrified_household (Household): the household, electrified
+
+    Returns:
+        List[YearEmissions]: one per year of the lifetime, first year first
+    """
+    years = get_lifetime_years()
+    before, electrified = get_yearly_emissions_by_category(
+        [current_household, electrified_household], years
+    )
+    after = before + get_replaced_fractions(len(years)) * (electrified - before)
+    before, after = before.sum(axis=0), after.sum(axis=0)
+    return [
+        YearEmissions(
+            year=year,
+            emissions=EmissionsValues(
+                before=round(float(before[i]), 2),
+                after=round(float(after[i]), 2),
+                difference=round(float(after[i] - before[i]), 2),
+            ),
+        )
+        for i, year in enumerate(years)
+    ]
@@ -1,23 +1,42 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from constants.machines.space_heating import SPACE_HEATING_ENERGY_LOCATION_MULTIPLIER
+from openapi_client.models.cooktop_enum import CooktopEnum
 from openapi_client.models.location_enum import LocationEnum
 from openapi_client.models.space_heating_enum import SpaceHeatingEnum
 from openapi_client.models.vehicle import Vehicle
 from openapi_client.models.vehicle_fuel_type_enum import VehicleFuelTypeEnum
+from openapi_client.models.water_heating_enum import WaterHeatingEnum
 
 from constants.fuel_stats import EMISSIONS_FACTORS, FuelTypeEnum
+from constants.fuel_vectors import EMISSIONS_FACTORS_VECTOR
+from constants.load_profiles import PROFILE_CATEGORIES
 from constants.machines.machine_info import MachineEnum, MachineInfoMap
 from constants.machines.other_machines import ENERGY_NEEDS_OTHER_MACHINES_PER_DAY
 from constants.machines.vehicles import (
     VEHICLE_AVG_KMS_PER_WEEK,
     VEHICLE_INFO,
 )
-from constants.utils import PeriodEnum
+from constants.utils import PROFILE_YEAR, PeriodEnum
+from params import TIME_VARYING_GRID_EMISSIONS
 from savings.energy.scale_energy_by_location import scale_energy_by_location
 from savings.energy.scale_energy_by_occupancy import scale_energy_by_occupancy
+from savings.energy.synthesise_load_profiles import get_profile_shapes
+from utils.fuel_vector import FuelVector
+from utils.grid_emissions import calculate_grid_emissions, get_lifetime_years
 from utils.scale_daily_to_period import scale_daily_to_period
 
+# The load profile category that each kind of machine's electricity follows
+MACHINE_PROFILE_CATEGORY = {
+    SpaceHeatingEnum: "space_heating",
+    WaterHeatingEnum: "water_heating",
+    CooktopEnum: "cooktop",
+    VehicleFuelTypeEnum: "vehicles",
+}
+
 
 def get_emissions_per_day(
     machine_type: MachineEnum,
@@ -46,6 +65,63 @@ def get_emissions_per_day(
     return emissions
 
 
+def get_grid_emissions_multiplier(
+    category: str, period: PeriodEnum = PeriodEnum.DAILY
+) -> float:
+    """How a category's grid electricity emissions over a period compare to the flat
+    electricity emissions factor
+
+    1 unless TIME_VARYING_GRID_EMISSIONS, in which case the grid's carbon intensity
+    varies by the hour (weighted by when the category uses electricity) and by the year
+    (averaged over the years of the period). See calculate_grid_emissions.
+
+    Args:
+        category (str): the load profile category, one of PROFILE_CATEGORIES
+        period (PeriodEnum, optional): the period. Periods up to a year are in PROFILE_YEAR. Defaults to PeriodEnum.DAILY.
+
+    Returns:
+        float: the multiplier on EMISSIONS_FACTORS[FuelTypeEnum.ELECTRICITY]
+    """
+    if not TIME_VARYING_GRID_EMISSIONS:
+        return 1.0
+    years = (
+        get_lifetime_years()
+        if period == PeriodEnum.OPERATIONAL_LIFETIME
+        else [PROFILE_YEAR]
+    )
+    return float(
+        get_yearly_grid_emissions_multipliers(years)[
+            PROFILE_CATEGORIES.index(category)
+        ].mean()
+    )
+
+
+def get_yearly_grid_emissions_multipliers(years: Sequence[int]) -> np.ndarray:
+    """How each category's grid electricity emissions in each year compare to the flat
+    electricity emissions factor (see get_grid_emissions_multiplier)
+
+    Args:
+        years (Sequence[int]): the years, e.g. get_lifetime_years()
+
+    Returns:
+        np.ndarray: shape (n_categories, n_years), in PROFILE_CATEGORIES order
+    """
+    if not TIME_VARYING_GRID_EMISSIONS:
+        return np.ones((len(PROFILE_CATEGORIES), len(years)))
+    return _get_yearly_grid_emissions_multipliers(tuple(years))
+
+
+@lru_cache(maxsize=8)
+def _get_yearly_grid_emissions_multipliers(years: Tuple[int, ...]) -> np.ndarray:
+    # Each category's profile-weighted kgCO2e/kWh in each year, over the flat factor
+    shapes = get_profile_shapes()
+    multipliers = calculate_grid_emissions(shapes, years) / (
+        shapes.sum(axis=1, keepdims=True) * EMISSIONS_FACTORS[FuelTypeEnum.ELECTRICITY]
+    )
+    multipliers.flags.writeable = False
+    return multipliers
+
+
 def get_appliance_emissions(
     appliance: MachineEnum,
     appliance_info: MachineInfoMap,
@@ -68,6 +144,10 @@ def get_appliance_emissions(
     emissions_daily = get_emissions_per_day(
         appliance, appliance_info, occupancy, location
     )
+    if appliance_info[appliance]["fuel_type"] == FuelTypeEnum.ELECTRICITY:
+        emissions_daily *= get_grid_emissions_multiplier(
+            MACHINE_PROFILE_CATEGORY[type(appliance)], period
+        )
     return scale_daily_to_period(emissions_daily, period)
 
 
@@ -85,10 +165,13 @@ def get_other_appliance_emissions(
     Returns:
         float: kgCO2e emitted from other appliances over given period
     """
-    energy_scaled = scale_energy_by_occupancy(
-        ENERGY_NEEDS_OTHER_MACHINES_PER_DAY, occupancy
+    energy_scaled = FuelVector.of(
+        FuelTypeEnum.ELECTRICITY,
+        scale_energy_by_occupancy(ENERGY_NEEDS_OTHER_MACHINES_PER_DAY, occupancy),
     )
-    emissions_daily = energy_scaled * EMISSIONS_FACTORS[FuelTypeEnum.ELECTRICITY]
+    emissions_daily = energy_scaled.dot(
+        EMISSIONS_FACTORS_VECTOR
+    ) * get_grid_emissions_multiplier("other_appliances", period)
     return scale_daily_to_period(emissions_daily, period)
 
 
@@ -110,12 +193,16 @@ def get_vehicle_emissions(
             VehicleFuelTypeEnum.PLUG_IN_HYBRID,
             VehicleFuelTypeEnum.HYBRID,
         ]:
-            avg_emissions_daily = _get_hybrid_emissions_per_day(vehicle.fuel_type)
+            avg_emissions_daily = _get_hybrid_emissions_per_day(
+                vehicle.fuel_type, period
+            )
         else:
             avg_emissions_daily = get_emissions_per_day(
                 vehicle.fuel_type,
                 VEHICLE_INFO,
             )
+            if vehicle.fuel_type == VehicleFuelTypeEnum.ELECTRIC:
+                avg_emissions_daily *= get_grid_emissions_multiplier("vehicles", period)
 
         # Weight the emissions based on how much they use the vehicle compared to average
         weighting_factor = vehicle.kms_per_week / VEHICLE_AVG_KMS_PER_WEEK
@@ -129,7 +216,9 @@ def get_vehicle_emissions(
     return total_emissions
 
 
-def _get_hybrid_emissions_per_day(vehicle_type: VehicleFuelTypeEnum) -> float:
+def _get_hybrid_emissions_per_day(
+    vehicle_type: VehicleFuelTypeEnum, period: PeriodEnum = PeriodEnum.DAILY
+) -> float:
     petrol = get_emissions_per_day(
         VehicleFuelTypeEnum.PETROL,
         VEHICLE_INFO,
@@ -137,7 +226,7 @@ def _get_hybrid_emissions_per_day(vehicle_type: VehicleFuelTypeEnum) -> float:
     ev = get_emissions_per_day(
         VehicleFuelTypeEnum.ELECTRIC,
         VEHICLE_INFO,
-    )
+    ) * get_grid_emissions_multiplier("vehicles", period)
     if vehicle_type == VehicleFuelTypeEnum.PLUG_IN_HYBRID:
         # PHEV: Assume 60/40 split between petrol and electric
         return petrol * 0.6 + ev * 0.4
@@ -0,0 +1,153 @@
+from typing import Optional, TypedDict
+
+import numpy as np
+
+from constants.fuel_stats import FuelTypeEnum
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.machines.cooktop import COOKTOP_INFO
+from constants.machines.space_heating import SPACE_HEATING_INFO
+from constants.machines.water_heating import WATER_HEATING_INFO
+from constants.utils import PROFILE_YEAR, PeriodEnum
+from openapi_client.models import (
+    Household,
+    LocationEnum,
+    MeterCalibration,
+    MeterDataFormatEnum,
+)
+from savings.energy.get_machine_energy import (
+    get_energy_per_period,
+    get_other_appliances_energy_per_period,
+    get_vehicle_energy,
+)
+from savings.energy.scale_energy_by_weather import get_space_heating_shape
+from savings.energy.synthesise_load_profiles import get_profile_shapes
+from utils.clean_household import clean_household
+from utils.meter_data import get_meter_data_year, read_meter_data
+from utils.tou_tariff import get_days_in_year
+from utils.validate_household import validate_household
+
+
+class MeterDisaggregation(TypedDict):
+    # kWh/day, averaged over the year
+    baseload: float
+    space_heating: float
+
+
+def get_daily_space_heating_shape(
+    location: Optional[LocationEnum], year: int = PROFILE_YEAR
+) -> np.ndarray:
+    """How a location's space heating is spread over the days of the year
+
+    From the location's weather where it has a weather station, and otherwise from the
+    national space heating profile.
+
+    Returns:
+        np.ndarray: shape (n_days,), averaging 1
+    """
+    hourly = get_space_heating_shape(location) if year == PROFILE_YEAR else None
+    if hourly is None:
+        hourly = get_profile_shapes(year)[PROFILE_CATEGORIES.index("space_heating")]
+    return (
+        np.asarray(hourly, dtype=float).reshape(get_days_in_year(year), -1).sum(axis=1)
+    )
+
+
+def disaggregate_meter_data(
+    kwh: np.ndarray,
+    location: Optional[LocationEnum],
+    year: int = PROFILE_YEAR,
+) -> MeterDisaggregation:
+    """Splits a year of meter data into baseload & space heating
+
+    Each day's use is fitted (by least squares) as a baseload that's the same every
+    day, plus space heating that follows the location's daily heating shape (see
+    get_daily_space_heating_shape). Neither can be negative.
+
+    Args:
+        kwh (np.ndarray): kWh in each interval of the year (see read_meter_data)
+        location (LocationEnum, optional): the household's location
+        year (int, optional): the year the data is for. Defaults to PROFILE_YEAR.
+
+    Returns:
+        MeterDisaggregation: the average kWh/day of each
+    """
+    daily_kwh = kwh.reshape(get_days_in_year(year), -1).sum(axis=1)
+    shape = get_daily_space_heating_shape(location, year)
+    (baseload, space_heating), *_ = np.linalg.lstsq(
+        np.stack([np.ones_like(shape), shape], axis=1), daily_kwh, rcond=None
+    )
+    if space_heating < 0:
+        baseload, space_heating = daily_kwh.mean(), 0.0
+    elif baseload < 0:
+        baseload, space_heating = 0.0, (daily_kwh @ shape) / (shape @ shape)
+    # As the shape averages 1, the heating's average kWh/day is its coefficient
+    return {"baseload": float(baseload), "space_heating": float(space_heating)}
+
+
+def calibrate_energy_needs(
+    household: Household,
+    meter_data: bytes,
+    data_format: MeterDataFormatEnum = MeterDataFormatEnum.CSV,
+    year: Optional[int] = None,
+) -> MeterCalibration:
+    """Compares a household's measured electricity use to the average household's
+
+    The measured baseload (less the modelled EV charging, as kms_per_week is already
+    the household's own) is compared to the modelled electricity of the household's
+    water heating, cooktop & other appliances, and the measured space heating to its
+    modelled space heating. Where the household doesn't use electricity for them, they
+    can't be compared, and are left at the average; so the baseload factor only
+    applies to electric water heating & cooktops (see get_baseload_factor).
+
+    Args:
+        household (Household): the household, without a meter calibration
+        meter_data (bytes): a year of its interval data (see read_meter_data)
+        data_format (MeterDataFormatEnum, optional): the data's format. Defaults to CSV.
+        year (int, optional): the year the data is for. Defaults to None, i.e. from the data's length (see get_meter_data_year).
+
+    Raises:
+        ValueError: if the household or the data are invalid
+
+    Returns:
+        MeterCalibration: the household's calibration, to set as its meter_calibration
+    """
+    validate_household(household)
+    household = clean_household(household.copy(update={"meter_calibration": None}))
+    kwh = read_meter_data(meter_data, data_format, year)
+    if year is None:
+        year = get_meter_data_year(len(kwh))
+    measured = disaggregate_meter_data(kwh, household.location, year)
+
+    def get_electricity(machine, info) -> float:
+        return get_energy_per_period(
+            machine, info, household.occupancy, PeriodEnum.DAILY, household.location
+        ).get(FuelTypeEnum.ELECTRICITY, 0)
+
+    modelled_baseload = (
+        get_electricity(household.water_heating, WATER_HEATING_INFO)
+        + get_electricity(household.cooktop, COOKTOP_INFO)
+        + get_other_appliances_energy_per_period(household.occupancy).get(
+            FuelTypeEnum.ELECTRICITY, 0
+        )
+    )
+    modelled_space_heating = get_electricity(
+        household.space_heating, SPACE_HEATING_INFO
+    )
+    e_vehicles = get_vehicle_energy(household.vehicles or []).get(
+        FuelTypeEnum.ELECTRICITY, 0
+    )
+
+    return MeterCalibration(
+        baseloadFactor=_get_factor(
+            max(measured["baseload"] - e_vehicles, 0), modelled_baseload
+        ),
+        spaceHeatingFactor=_get_factor(
+            measured["space_heating"], modelled_space_heating
+        ),
+        baseloadKwhPerDay=round(measured["baseload"], 2),
+        spaceHeatingKwhPerDay=round(measured["space_heating"], 2),
+    )
+
+
+def _get_factor(measured: float, modelled: float) -> float:
+    return round(measured / modelled, 3) if modelled > 0 else 1.0
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Tuple, TypedDict
+from typing import Tuple, TypedDict
 
 from constants.battery import (
     BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS,
@@ -16,9 +16,9 @@ from constants.solar import (
 from openapi_client.models.battery import Battery
 from openapi_client.models.location_enum import LocationEnum
 from openapi_client.models.solar import Solar
-from constants.utils import DAYS_PER_YEAR, PeriodEnum
-from params import OPERATIONAL_LIFETIME
+from constants.utils import PeriodEnum
 from savings.energy.get_machine_energy import MachineEnergyNeeds
+from utils.fuel_vector import FuelVector
 from utils.scale_daily_to_period import scale_daily_to_period
 
 
@@ -41,7 +41,7 @@ def get_electricity_consumption(
 
     if period == PeriodEnum.YEARLY:
         print("\n\nEnergy consumption")
-        print("\nenergy_needs: ", json.dumps(energy_needs, indent=4))
+        print("\nenergy_needs: ", json.dumps(energy_needs, indent=4, default=dict))
 
     # Energy generated by solar
     total_e_generated_from_solar = get_e_generated_from_solar(solar, location, period)
@@ -59,7 +59,7 @@ def get_electricity_consumption(
 
     # Consumed by battery
     # We assume all machine types have the same self-consumption rates from the battery, so we can ignore how much of each machine category's needs are met by the battery storage. In future, we may wish to be more sophisticated about how certain machines pull more from the battery due to usage patterns.
-    # We assume that all the electricity stored in the battery is from solar. We don't yet allow for batteries (and therefore arbitrage) without solar.
+    # We assume that all the electricity stored in the battery is from solar. This step-by-step pipeline doesn't allow for batteries (and therefore arbitrage) without solar; with OPTIMISE_BATTERY_DISPATCH on, the closed-form models charge batteries from the grid against hourly prices instead (see get_hourly_electricity_flows).
     total_e_stored_in_battery = 0
     if battery.has_battery and battery.capacity is not None:
         # electricity stored in battery, then consumed or exported
@@ -101,14 +101,10 @@ def sum_energy_for_fuel_type(
     e_needs: MachineEnergyNeeds, fuel_type: FuelTypeEnum
 ) -> float:
     # Sums the energy needs across categories for a given fuel type
-    e = 0
-    for cat in MACHINE_CATEGORIES:
-        if e_needs.get(cat) is not None:
-            fuel_type_needs_for_cat = [
-                need for fuel, need in e_needs.get(cat).items() if fuel == fuel_type
-            ]
-            e += sum(fuel_type_needs_for_cat)
-    return e
+    total_needs = FuelVector.sum(
+        e_needs[cat] for cat in MACHINE_CATEGORIES if e_needs.get(cat) is not None
+    )
+    return total_needs.get(fuel_type, 0)
 
 
 def get_e_generated_from_solar(
@@ -135,12 +131,13 @@ def get_e_generated_from_solar(
     return scale_daily_to_period(e_daily, period)
 
 
-def _get_max_e_consumed_from_solar(e_needs: MachineEnergyNeeds) -> MachineEnergyNeeds:
+def get_max_e_consumed_from_solar(e_needs: MachineEnergyNeeds) -> MachineEnergyNeeds:
     return {
-        cat: {
-            FuelTypeEnum.ELECTRICITY: e_needs[cat].get(FuelTypeEnum.ELECTRICITY, 0)
-            * MACHINE_CATEGORY_TO_SELF_CONSUMPTION_RATE[cat]
-        }
+        cat: FuelVector.of(
+            FuelTypeEnum.ELECTRICITY,
+            e_needs[cat].get(FuelTypeEnum.ELECTRICITY, 0)
+            * MACHINE_CATEGORY_TO_SELF_CONSUMPTION_RATE[cat],
+        )
         for cat in MACHINE_CATEGORIES
         if cat in e_needs
     }
@@ -169,12 +166,11 @@ def get_e_consumed_from_solar(
         Tuple[MachineEnergyNeeds, float, MachineEnergyNeeds]: kWh consumed from the generated solar, kWh remaining from the generated solar, kWh remaining to be met by other sources
     """
     # Default to meeting all electricity needs at self-consumption rate
-    e_consumed_from_solar = _get_max_e_consumed_from_solar(e_needs)
+    e_consumed_from_solar = get_max_e_consumed_from_solar(e_needs)
 
     # Calculate total maximum energy consumed from solar at self-consumption rate
-    total_max_consumed_from_solar = sum(
-        e_needs_for_cat[FuelTypeEnum.ELECTRICITY]
-        for e_needs_for_cat in e_consumed_from_solar.values()
+    total_max_consumed_from_solar = sum_energy_for_fuel_type(
+        e_consumed_from_solar, FuelTypeEnum.ELECTRICITY
     )
 
     # If all electric needs can be met with solar, some solar remains, energy needs remain based on self-consumption
@@ -185,27 +181,22 @@ def get_e_consumed_from_solar(
     # Distribute the deficit across categories, proportional to self-consumed energy size
     if total_max_consumed_from_solar > e_generated_from_solar:
         deficit = total_max_consumed_from_solar - e_generated_from_solar
-        for cat in MACHINE_CATEGORIES:
-            e_consumed_from_solar[cat][FuelTypeEnum.ELECTRICITY] = (
+        e_consumed_from_solar = {
+            cat: FuelVector.of(
+                FuelTypeEnum.ELECTRICITY,
                 _calculate_e_consumed_from_solar_with_deficit(
-                    e_consumed_from_solar[cat][FuelTypeEnum.ELECTRICITY],
+                    e_consumed[FuelTypeEnum.ELECTRICITY],
                     total_max_consumed_from_solar,
                     deficit,
-                )
+                ),
             )
+            for cat, e_consumed in e_consumed_from_solar.items()
+        }
         remaining_solar = 0
 
+    # Remaining electricity needs after solar consumption; other fuel types stay as is
     e_needs_remaining = {
-        cat: {
-            fuel_type: (
-                # Calculate remaining electricity need after solar consumption
-                e_needs[cat][fuel_type] - e_consumed_from_solar[cat][fuel_type]
-                if fuel_type == FuelTypeEnum.ELECTRICITY
-                # Other fuel types stay as is
-                else val
-            )
-            for fuel_type, val in e_needs[cat].items()
-        }
+        cat: FuelVector.from_mapping(e_needs[cat]) - e_consumed_from_solar[cat]
         for cat in MACHINE_CATEGORIES
         if cat in e_needs
     }
@@ -237,23 +228,7 @@ def get_e_stored_in_battery(
         raise ValueError("Energy consumed is higher than energy generated.")
 
     e_remaining_after_self_consumption = e_generated_from_solar - e_consumed_from_solar
-
-    # TODO: put this into separate function
-    capacity_per_day = (
-        battery_capacity  # kWh/cycle
-        * BATTERY_CYCLES_PER_DAY  # cycle/day
-        * BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS
-        * (1 - BATTERY_LOSSES)
-    )  # kWh/day
-    e_battery_storage_capacity = capacity_per_day
-    if period == PeriodEnum.WEEKLY:
-        e_battery_storage_capacity = capacity_per_day * 7
-    if period == PeriodEnum.YEARLY:
-        e_battery_storage_capacity = capacity_per_day * DAYS_PER_YEAR
-    if period == PeriodEnum.OPERATIONAL_LIFETIME:
-        e_battery_storage_capacity = (
-            capacity_per_day * DAYS_PER_YEAR * OPERATIONAL_LIFETIME
-        )
+    e_battery_storage_capacity = get_battery_storage_capacity(battery_capacity, period)
 
     # If the energy remaining from generation after self-consumption is less than the battery's capacity, battery stores all the remaining energy
     if e_remaining_after_self_consumption < e_battery_storage_capacity:
@@ -261,3 +236,24 @@ def get_e_stored_in_battery(
 
     # If there is more energy remaining than the capacity, the battery is filled to capacity
     return e_battery_storage_capacity
+
+
+def get_battery_storage_capacity(
+    battery_capacity: float, period: PeriodEnum = PeriodEnum.YEARLY
+) -> float:
+    """Calculate how much energy the battery can store over a period
+
+    Args:
+        battery_capacity (float): battery nameplate capacity in kWh/cycle
+        period (PeriodEnum): the period over which to calculate
+
+    Returns:
+        float: energy in kWh per period
+    """
+    capacity_per_day = (
+        battery_capacity  # kWh/cycle
+        * BATTERY_CYCLES_PER_DAY  # cycle/day
+        * BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS
+        * (1 - BATTERY_LOSSES)
+    )  # kWh/day
+    return scale_daily_to_period(capacity_per_day, period)
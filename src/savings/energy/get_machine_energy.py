@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, TypedDict
+from typing import List, Optional, TypedDict
 
 from constants.fuel_stats import FuelTypeEnum
 from constants.machines.cooktop import COOKTOP_INFO
@@ -19,13 +19,15 @@ from savings.energy.scale_energy_by_occupancy import scale_energy_by_occupancy
 from utils.scale_daily_to_period import scale_daily_to_period
 
 from openapi_client.models import Vehicle, Household
-from utils.sum_dicts import sum_dicts
+from utils.fuel_vector import FuelVector
+from utils.household_projections import project_meter_calibration, project_occupancy
+from utils.memoise_stage import memoise_stage
 
 
 class MachineEnergyNeeds(TypedDict):
-    appliances: Dict[FuelTypeEnum, float]
-    vehicles: Dict[FuelTypeEnum, float]
-    other_appliances: Dict[FuelTypeEnum, float]
+    appliances: FuelVector
+    vehicles: FuelVector
+    other_appliances: FuelVector
 
 
 def get_total_energy_needs(
@@ -33,9 +35,15 @@ def get_total_energy_needs(
     period: PeriodEnum,
     location: LocationEnum,
 ) -> MachineEnergyNeeds:
+    baseload_factor, _ = project_meter_calibration(household.meter_calibration)
     appliance_energy = get_total_appliance_energy(household, period, location)
     vehicle_energy = get_vehicle_energy(household.vehicles, period)
-    other_energy = get_other_appliances_energy_per_period(household.occupancy, period)
+    other_energy = (
+        FuelVector.from_mapping(
+            get_other_appliances_energy_per_period(household.occupancy, period)
+        )
+        * baseload_factor
+    )
     return {
         "appliances": appliance_energy,
         "vehicles": vehicle_energy,
@@ -43,12 +51,41 @@ def get_total_energy_needs(
     }
 
 
+def get_baseload_factor(
+    household: Household, machine: MachineEnum, machine_info: MachineInfoMap
+) -> float:
+    """The household's baseload factor for its water heating or cooktop (see
+    calibrate_energy_needs)
+
+    The factor is measured by the household's electricity meter, so it only applies to
+    machines that run on electricity.
+
+    Args:
+        household (Household): the household
+        machine (MachineEnum): its water heating or cooktop
+        machine_info (MachineInfoMap): info about the machine's fuel type
+
+    Returns:
+        float: the factor, or 1 if the machine doesn't run on electricity
+    """
+    baseload_factor, _ = project_meter_calibration(household.meter_calibration)
+    return baseload_factor if uses_electricity(machine, machine_info) else 1.0
+
+
+def uses_electricity(machine: MachineEnum, machine_info: MachineInfoMap) -> bool:
+    """Whether any of the machine's energy is electricity"""
+    machine_infos = machine_info[machine]
+    if type(machine_infos) != list:
+        machine_infos = [machine_infos]
+    return any(info["fuel_type"] == FuelTypeEnum.ELECTRICITY for info in machine_infos)
+
+
 def get_energy_per_day(
     machine_type: MachineEnum,
     machine_stats_map: MachineInfoMap,
     occupancy: Optional[int] = None,
     location: Optional[LocationEnum] = None,
-) -> Dict[FuelTypeEnum, float]:
+) -> FuelVector:
     """Get energy needs per day for a given machine
 
     Args:
@@ -58,13 +95,13 @@ def get_energy_per_day(
         location (LocationEnum, optional): The location of the machine (for determining heating needs)
 
     Returns:
-        Dict[FuelTypeEnum, float]: machine's energy needs per day per fuel type
+        FuelVector: machine's energy needs per day per fuel type
     """
     machine_infos = machine_stats_map[machine_type]
     if type(machine_stats_map[machine_type]) != list:
         machine_infos = [machine_infos]
 
-    e_fuel_type = {}
+    e_fuel_type = FuelVector()
 
     for machine_info in machine_infos:
         e_daily = machine_info["kwh_per_day"]
@@ -80,7 +117,7 @@ def get_energy_per_day(
             machine_type, e_daily_scaled, location
         )
 
-        e_fuel_type[fuel_type] = e_daily_scaled
+        e_fuel_type = e_fuel_type + FuelVector.of(fuel_type, e_daily_scaled)
 
     return e_fuel_type
 
@@ -91,7 +128,7 @@ def get_energy_per_period(
     occupancy: Optional[int] = None,
     period: PeriodEnum = PeriodEnum.DAILY,
     location: Optional[LocationEnum] = None,
-) -> Dict[FuelTypeEnum, float]:
+) -> FuelVector:
     """Calculates the energy needs of machines in given household over given period
 
     Args:
@@ -102,21 +139,20 @@ def get_energy_per_period(
         location (LocationEnum, optional): The location of the machine (for determining heating needs)
 
     Returns:
-        Dict[FuelTypeEnum, float]: energy needs per fuel type of operating machine over given period in kWh
+        FuelVector: energy needs per fuel type of operating machine over given period in kWh
     """
     e_daily = get_energy_per_day(machine, machine_info, occupancy, location)
-    e_daily_scaled = {
-        fuel_type: scale_daily_to_period(e, period) for fuel_type, e in e_daily.items()
-    }
-    return e_daily_scaled
+    return scale_daily_to_period(FuelVector.from_mapping(e_daily), period)
 
 
 def get_total_appliance_energy(
     household: Household,
     period: PeriodEnum,
     location: LocationEnum,
-) -> Dict[FuelTypeEnum, float]:
+) -> FuelVector:
 
+    # Calibrated households use more or less than average (see calibrate_energy_needs)
+    _, space_heating_factor = project_meter_calibration(household.meter_calibration)
     space_heating_energy = get_energy_per_period(
         household.space_heating,
         SPACE_HEATING_INFO,
@@ -134,22 +170,25 @@ def get_total_appliance_energy(
     cooktop_energy = get_energy_per_period(
         household.cooktop, COOKTOP_INFO, household.occupancy, period, location
     )
-    energy_dict = {}
-    for fuel in FuelTypeEnum:
-        # Exclude solar because the energy consumed from solar is calculated separately
-        if fuel != FuelTypeEnum.SOLAR:
-            energy_dict[fuel] = energy_dict.get(fuel, 0) + space_heating_energy.get(
-                fuel, 0
-            )
-            energy_dict[fuel] += water_heating_energy.get(fuel, 0)
-            energy_dict[fuel] += cooktop_energy.get(fuel, 0)
-
-    return energy_dict
+    total_energy = FuelVector.sum(
+        [
+            FuelVector.from_mapping(space_heating_energy) * space_heating_factor,
+            FuelVector.from_mapping(water_heating_energy)
+            * get_baseload_factor(
+                household, household.water_heating, WATER_HEATING_INFO
+            ),
+            FuelVector.from_mapping(cooktop_energy)
+            * get_baseload_factor(household, household.cooktop, COOKTOP_INFO),
+        ]
+    )
+    # Every fuel is included (even if zero) except solar, because the energy consumed
+    # from solar is calculated separately
+    return FuelVector.dense(total_energy.array).without(FuelTypeEnum.SOLAR)
 
 
 def get_vehicle_energy(
     vehicles: List[Vehicle], period: PeriodEnum = PeriodEnum.DAILY
-) -> float:
+) -> FuelVector:
     """Calculates the energy of a list of vehicles
 
     Args:
@@ -157,9 +196,9 @@ def get_vehicle_energy(
         period (PeriodEnum, optional): the period over which to calculate the energy. Calculations over a longer period of time (e.g. 15 years) should use this feature, as there may be external economic factors which impact the result, making it different to simply multiplying the daily energy value. Defaults to PeriodEnum.DAILY.
 
     Returns:
-        Dict[FuelTypeEnum, float]: total energy required from vehicles over given period per fuel type
+        FuelVector: total energy required from vehicles over given period per fuel type
     """
-    total_energy = {}
+    total_energy = FuelVector()
     for vehicle in vehicles:
         avg_e_daily = get_energy_per_day(
             vehicle.fuel_type,
@@ -168,25 +207,24 @@ def get_vehicle_energy(
 
         # Weight the energy based on how much they use the vehicle compared to average
         weighting_factor = vehicle.kms_per_week / VEHICLE_AVG_KMS_PER_WEEK
-        weighted_e_daily = {
-            fuel_type: e * weighting_factor for fuel_type, e in avg_e_daily.items()
-        }
-
-        # Convert to given period
-        weighted_e_daily_scaled = {
-            fuel_type: scale_daily_to_period(e, period)
-            for fuel_type, e in weighted_e_daily.items()
-        }
-
-        # Add to totals
-        total_energy = sum_dicts([total_energy, weighted_e_daily_scaled])
+        weighted_e_daily = avg_e_daily * weighting_factor
+
+        # Convert to given period and add to totals
+        total_energy = total_energy + scale_daily_to_period(weighted_e_daily, period)
     return total_energy
 
 
+@memoise_stage(
+    "get_other_appliances_energy_per_period",
+    lambda occupancy=None, period=PeriodEnum.DAILY: (
+        project_occupancy(occupancy),
+        period,
+    ),
+)
 def get_other_appliances_energy_per_period(
     occupancy: Optional[int] = None,
     period: PeriodEnum = PeriodEnum.DAILY,
-) -> Dict[FuelTypeEnum, float]:
+) -> FuelVector:
     """Calculates the energy of other appliances in a household
     These may include space cooling (fans, aircon), refrigeration, laundry, lighting, etc.
     We assume that these are all electric.
@@ -196,14 +234,10 @@ def get_other_appliances_energy_per_period(
         period (PeriodEnum, optional): the period over which to calculate the energy. Calculations over a longer period of time (e.g. 15 years) should use this feature, as there may be external economic factors which impact the result, making it different to simply multiplying the daily energy value. Defaults to PeriodEnum.DAILY.
 
     Returns:
-        Dict[FuelTypeEnum, float]: energy of operating other appliances over given period per fuel type
+        FuelVector: energy of operating other appliances over given period per fuel type
     """
-    e_daily = {
-        FuelTypeEnum.ELECTRICITY: scale_energy_by_occupancy(
-            ENERGY_NEEDS_OTHER_MACHINES_PER_DAY, occupancy
-        )
-    }
-    e_daily_scaled = {
-        fuel_type: scale_daily_to_period(e, period) for fuel_type, e in e_daily.items()
-    }
-    return e_daily_scaled
+    e_daily = FuelVector.of(
+        FuelTypeEnum.ELECTRICITY,
+        scale_energy_by_occupancy(ENERGY_NEEDS_OTHER_MACHINES_PER_DAY, occupancy),
+    )
+    return scale_daily_to_period(e_daily, period)
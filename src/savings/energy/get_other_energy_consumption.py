@@ -1,8 +1,8 @@
-from typing import Dict
 from constants.fuel_stats import FuelTypeEnum
 from savings.energy.get_machine_energy import MachineEnergyNeeds
+from utils.fuel_vector import FuelVector
 
-OtherEnergyConsumption = Dict[FuelTypeEnum, float]
+OtherEnergyConsumption = FuelVector
 
 
 def get_other_energy_consumption(
@@ -17,9 +17,4 @@ def get_other_energy_consumption(
     Returns:
         OtherEnergyConsumption: energy needs per fuel type except electricity
     """
-    result = {}
-    for category_needs in energy_needs.values():
-        for fuel_type, consumption in category_needs.items():
-            if fuel_type != FuelTypeEnum.ELECTRICITY:
-                result[fuel_type] = result.get(fuel_type, 0) + consumption
-    return result
+    return FuelVector.sum(energy_needs.values()).without(FuelTypeEnum.ELECTRICITY)
@@ -4,6 +4,8 @@ from constants.machines.space_heating import SPACE_HEATING_ENERGY_LOCATION_MULTI
 from openapi_client.models.location_enum import LocationEnum
 from constants.machines.machine_info import MachineEnum
 from openapi_client.models.space_heating_enum import SpaceHeatingEnum
+from params import WEATHER_AWARE_SPACE_HEATING
+from savings.energy.scale_energy_by_weather import scale_energy_by_weather
 
 
 def scale_energy_by_location(
@@ -22,6 +24,11 @@ def scale_energy_by_location(
         float: energy consumption scaled according to region's energy needs
     """
 
+    if WEATHER_AWARE_SPACE_HEATING:
+        return scale_energy_by_weather(
+            machine_type, energy_per_average_household, location
+        )
+
     multiplier = 1
 
     if type(machine_type) == SpaceHeatingEnum:
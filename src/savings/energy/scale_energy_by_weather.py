@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+from constants.machines.machine_info import MachineEnum
+from constants.weather import LOCATION_WEATHER_STATION
+from openapi_client.models.location_enum import LocationEnum
+from openapi_client.models.space_heating_enum import SpaceHeatingEnum
+from utils.weather_tables import load_weather_tables
+
+
+@lru_cache(maxsize=1)
+def get_weather_location_multipliers() -> Dict[LocationEnum, float]:
+    """How much space heating each location needs, relative to the reference climate
+
+    The reference climate is the average of the weather stations' heating degree-hours,
+    so the multipliers play the same role as SPACE_HEATING_ENERGY_LOCATION_MULTIPLIER.
+    """
+    tables = load_weather_tables()
+    reference = tables.heating_degree_hours.mean()
+    return {
+        location: float(
+            tables.heating_degree_hours[tables.get_station_index(station)] / reference
+        )
+        for location, station in LOCATION_WEATHER_STATION.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def get_heat_pump_cop_multipliers() -> Dict[LocationEnum, float]:
+    """How much electricity a heat pump uses for the same heat in each location
+
+    ELECTRIC_HEAT_PUMP's kWh/day assumes the reference climate's seasonal COP, i.e. the
+    COP over all the stations' heating degree-hours together. Colder locations have
+    lower COPs, so use more electricity for each kWh of heat.
+    """
+    tables = load_weather_tables()
+    reference_cop = (
+        tables.heating_degree_hours.sum()
+        / (tables.heating_degree_hours / tables.seasonal_cop).sum()
+    )
+    return {
+        location: float(
+            reference_cop / tables.seasonal_cop[tables.get_station_index(station)]
+        )
+        for location, station in LOCATION_WEATHER_STATION.items()
+    }
+
+
+def scale_energy_by_weather(
+    machine_type: MachineEnum,
+    energy_per_average_household: float,
+    location: Optional[LocationEnum] = None,
+) -> float:
+    """Scales energy consumption by the location's weather
+
+    Like scale_energy_by_location, but space heating is scaled by the location's
+    heating degree-hours, and a heat pump's electricity by its COP there too.
+
+    Args:
+        machine_type (MachineEnum): the type of machine
+        energy_per_average_household (float): energy consumption in kWh for NZ average household
+        location (LocationEnum, optional): The location of the machine
+
+    Returns:
+        float: energy consumption scaled according to region's weather
+    """
+    if type(machine_type) != SpaceHeatingEnum or location is None:
+        return energy_per_average_household
+
+    multiplier = get_weather_location_multipliers().get(location, 1)
+    if machine_type == SpaceHeatingEnum.ELECTRIC_HEAT_PUMP:
+        multiplier *= get_heat_pump_cop_multipliers().get(location, 1)
+    return energy_per_average_household * multiplier
+
+
+def get_space_heating_shape(location: Optional[LocationEnum]) -> Optional[np.ndarray]:
+    """The hourly shape of a location's space heating over PROFILE_YEAR, from its weather
+
+    Args:
+        location (LocationEnum, optional): the location
+
+    Returns:
+        np.ndarray: shape (n_hours,), summing to the number of days in the year like
+            get_profile_shapes. None if the location has no weather station.
+    """
+    station = LOCATION_WEATHER_STATION.get(location)
+    if station is None:
+        return None
+    tables = load_weather_tables()
+    shape = tables.heating_shape[tables.get_station_index(station)]
+    return shape * (shape.size / 24)
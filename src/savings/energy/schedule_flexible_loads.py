@@ -0,0 +1,170 @@
+from datetime import date
+from typing import TypedDict
+
+import numpy as np
+
+from constants.flexible_loads import (
+    EV_AT_HOME_WEEKDAY_HOURS,
+    EV_CHARGER_POWER,
+    HOT_WATER_CYLINDER_FLEXIBLE_KWH,
+    HOT_WATER_HEATER_POWER,
+)
+from constants.utils import PROFILE_YEAR
+from utils.tou_tariff import get_days_in_year
+
+
+class HourlyElectricityConsumption(TypedDict):
+    # kWh in each hour, shape (n_households, n_days, 24)
+    consumed_from_solar: np.ndarray
+    consumed_from_battery: np.ndarray
+    consumed_from_grid: np.ndarray
+    exported_to_grid: np.ndarray
+
+
+def schedule_flexible_load(
+    e_daily: np.ndarray,
+    max_power: float,
+    available: np.ndarray,
+    e_surplus: np.ndarray,
+    rates: np.ndarray,
+) -> np.ndarray:
+    """Schedules a flexible load onto surplus solar, then the cheapest hours
+
+    Within each day, as much of the load as possible is moved into hours with surplus
+    solar, up to the surplus & the load's power in each hour. The rest is moved into the
+    day's cheapest hours, earliest first. Every day of every household is scheduled at
+    once, with the hours of each day sorted by rate rather than visited in turn.
+
+    Args:
+        e_daily (np.ndarray): kWh the load needs each day, shape (..., n_days)
+        max_power (float): the most kWh the load can use in an hour
+        available (np.ndarray): whether the load can run in each hour, broadcastable to (..., n_days, 24)
+        e_surplus (np.ndarray): kWh of solar generated but not consumed in each hour, shape (..., n_days, 24)
+        rates (np.ndarray): $/kWh of grid electricity in each hour, broadcastable to (..., n_days, 24)
+
+    Returns:
+        np.ndarray: kWh the load uses in each hour, shape (..., n_days, 24). Each day
+            sums to e_daily unless it can't fit in the available hours.
+    """
+    capacity = np.broadcast_to(np.where(available, max_power, 0.0), e_surplus.shape)
+
+    # Surplus solar, in hour order
+    on_solar = _fill(e_daily, np.minimum(capacity, np.maximum(e_surplus, 0)))
+
+    # Then the cheapest hours, with ties going to the earliest hour
+    by_rate = np.argsort(np.broadcast_to(rates, capacity.shape), axis=-1, kind="stable")
+    remaining = e_daily - on_solar.sum(axis=-1)
+    on_grid_by_rate = _fill(
+        remaining, np.take_along_axis(capacity - on_solar, by_rate, axis=-1)
+    )
+    on_grid = np.empty_like(on_grid_by_rate)
+    np.put_along_axis(on_grid, by_rate, on_grid_by_rate, axis=-1)
+    return on_solar + on_grid
+
+
+def _fill(e_daily: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    # Fills each day's hours up to their capacity, in order, until e_daily is used
+    filled_before = np.cumsum(capacity, axis=-1) - capacity
+    return np.clip(e_daily[..., np.newaxis] - filled_before, 0, capacity)
+
+
+def get_ev_availability(year: int = PROFILE_YEAR) -> np.ndarray:
+    """Whether a car is at home to charge in each hour, shape (n_days, 24)"""
+    n_days = get_days_in_year(year)
+    is_weekend = (date(year, 1, 1).weekday() + np.arange(n_days)) % 7 >= 5
+    weekday = np.isin(np.arange(24), EV_AT_HOME_WEEKDAY_HOURS)
+    return np.where(is_weekend[:, np.newaxis], True, weekday)
+
+
+def schedule_household_loads(
+    e_inflexible: np.ndarray,
+    e_water_heating: np.ndarray,
+    e_vehicles: np.ndarray,
+    e_generated_from_solar: np.ndarray,
+    rates: np.ndarray,
+    year: int = PROFILE_YEAR,
+) -> np.ndarray:
+    """Schedules households' water heating & EV charging around their other loads
+
+    Water heating is scheduled first: up to HOT_WATER_CYLINDER_FLEXIBLE_KWH of it a day
+    can be heated ahead of use, and the rest keeps its usual shape. EVs then charge on
+    what surplus solar is left, when they're at home, and otherwise when it's cheapest.
+
+    Args:
+        e_inflexible (np.ndarray): kWh of the loads that can't be moved, shape (n_households, n_days, 24)
+        e_water_heating (np.ndarray): kWh of water heating at its usual times, shape (n_households, n_days, 24)
+        e_vehicles (np.ndarray): kWh of EV charging needed each day, shape (n_households, n_days)
+        e_generated_from_solar (np.ndarray): kWh generated, shape (n_households, n_days, 24)
+        rates (np.ndarray): $/kWh of grid electricity in each hour, shape (n_days, 24)
+        year (int, optional): the year the profiles are laid out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: kWh of all the loads together in each hour, shape (n_households, n_days, 24)
+    """
+    e_water_daily = e_water_heating.sum(axis=-1)
+    e_water_flexible = np.minimum(e_water_daily, HOT_WATER_CYLINDER_FLEXIBLE_KWH)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fixed_share = np.where(
+            e_water_daily > 0, 1 - e_water_flexible / e_water_daily, 0
+        )
+    e_load = e_inflexible + e_water_heating * fixed_share[..., np.newaxis]
+
+    e_load += schedule_flexible_load(
+        e_water_flexible,
+        HOT_WATER_HEATER_POWER,
+        True,
+        e_generated_from_solar - e_load,
+        rates,
+    )
+    e_load += schedule_flexible_load(
+        e_vehicles,
+        EV_CHARGER_POWER,
+        get_ev_availability(year),
+        e_generated_from_solar - e_load,
+        rates,
+    )
+    return e_load
+
+
+def get_hourly_electricity_consumption(
+    e_load: np.ndarray,
+    e_generated_from_solar: np.ndarray,
+    e_battery_storage_per_day: np.ndarray,
+    rates: np.ndarray,
+) -> HourlyElectricityConsumption:
+    """Splits hourly consumption into what comes from solar, the battery & the grid
+
+    Each hour's load is met by that hour's solar first. Like get_e_stored_in_battery,
+    the battery stores surplus solar, up to its capacity each day, and the grid is
+    spared that much. The battery charges on the day's first surplus & discharges in
+    the day's dearest hours.
+
+    Args:
+        e_load (np.ndarray): kWh consumed, shape (n_households, n_days, 24)
+        e_generated_from_solar (np.ndarray): kWh generated, shape (n_households, n_days, 24)
+        e_battery_storage_per_day (np.ndarray): kWh the battery can store a day, shape (n_households,)
+        rates (np.ndarray): $/kWh of grid electricity in each hour, shape (n_days, 24)
+
+    Returns:
+        HourlyElectricityConsumption: the kWh of each in each hour
+    """
+    e_consumed_from_solar = np.minimum(e_load, e_generated_from_solar)
+    e_surplus = e_generated_from_solar - e_consumed_from_solar
+    e_needs_remaining = e_load - e_consumed_from_solar
+    e_stored_in_battery = np.minimum(
+        e_surplus.sum(axis=-1), e_battery_storage_per_day[:, np.newaxis]
+    )
+
+    # The dearest hours first, with ties going to the earliest hour
+    by_rate = np.argsort(-np.broadcast_to(rates, e_load.shape), axis=-1, kind="stable")
+    e_discharged_by_rate = _fill(
+        e_stored_in_battery, np.take_along_axis(e_needs_remaining, by_rate, axis=-1)
+    )
+    e_discharged = np.empty_like(e_discharged_by_rate)
+    np.put_along_axis(e_discharged, by_rate, e_discharged_by_rate, axis=-1)
+    return {
+        "consumed_from_solar": e_consumed_from_solar,
+        "consumed_from_battery": e_discharged,
+        "consumed_from_grid": e_needs_remaining - e_discharged,
+        "exported_to_grid": e_surplus - _fill(e_stored_in_battery, e_surplus),
+    }
@@ -0,0 +1,289 @@
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from constants.fuel_stats import FuelTypeEnum
+from constants.load_profiles import DIURNAL_SHAPES, PROFILE_CATEGORIES, SEASONAL_SHAPES
+from constants.machines.cooktop import COOKTOP_INFO
+from constants.machines.space_heating import SPACE_HEATING_INFO
+from constants.machines.vehicles import VEHICLE_AVG_KMS_PER_WEEK, VEHICLE_INFO
+from constants.machines.water_heating import WATER_HEATING_INFO
+from constants.solar import SOLAR_LATITUDE
+from constants.utils import PROFILE_YEAR
+from openapi_client.models import (
+    CooktopEnum,
+    Household,
+    LocationEnum,
+    SpaceHeatingEnum,
+    VehicleFuelTypeEnum,
+    WaterHeatingEnum,
+)
+from savings.energy.get_machine_energy import (
+    get_energy_per_day,
+    get_other_appliances_energy_per_period,
+    uses_electricity,
+)
+from utils.household_projections import (
+    MAX_OCCUPANCY_BUCKET,
+    project_meter_calibration,
+    project_occupancy,
+)
+from utils.tou_tariff import get_days_in_year
+
+# Occupancy buckets index the daily kWh tables, with None (the NZ average household)
+# as bucket 0
+OCCUPANCY_BUCKETS = [None] + list(range(1, MAX_OCCUPANCY_BUCKET + 1))
+
+# Locations index the daily kWh tables, with None (no scaling) last
+LOCATIONS = list(LocationEnum) + [None]
+
+APPLIANCE_INFO = {
+    "space_heating": (SpaceHeatingEnum, SPACE_HEATING_INFO),
+    "water_heating": (WaterHeatingEnum, WATER_HEATING_INFO),
+    "cooktop": (CooktopEnum, COOKTOP_INFO),
+}
+
+
+@lru_cache(maxsize=8)
+def get_profile_shapes(year: int = PROFILE_YEAR) -> np.ndarray:
+    """The hourly shape of each category over a year
+
+    Each month's relative use is interpolated between the middles of the months, so
+    that the seasons change smoothly, then spread over the day's hours by the weekday
+    or weekend shape.
+
+    Args:
+        year (int, optional): the year the profiles are laid out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: shape (n_categories, n_hours) in PROFILE_CATEGORIES order. Each row
+            sums to the number of days in the year, i.e. a kWh/day figure times a row is
+            the hourly kWh. Read-only, as it's shared between callers.
+    """
+    n_days = get_days_in_year(year)
+    day_of_year = np.arange(n_days) + 0.5
+    mid_months = np.array(
+        [
+            (date(year, month, 1) - date(year, 1, 1)).days
+            + (date(year + month // 12, month % 12 + 1, 1) - date(year, month, 1)).days
+            / 2
+            for month in range(1, 13)
+        ]
+    )
+    first_weekday = date(year, 1, 1).weekday()
+    is_weekend = (first_weekday + np.arange(n_days)) % 7 >= 5
+
+    shapes = np.empty((len(PROFILE_CATEGORIES), n_days * 24))
+    for i, category in enumerate(PROFILE_CATEGORIES):
+        seasonal = np.interp(
+            day_of_year, mid_months, SEASONAL_SHAPES[category], period=n_days
+        )
+        seasonal *= n_days / seasonal.sum()
+        diurnal = np.array(
+            [DIURNAL_SHAPES[category]["weekday"], DIURNAL_SHAPES[category]["weekend"]]
+        )
+        diurnal /= diurnal.sum(axis=1, keepdims=True)
+        shapes[i] = (seasonal[:, np.newaxis] * diurnal[is_weekend.astype(int)]).ravel()
+    shapes.flags.writeable = False
+    return shapes
+
+
+@lru_cache(maxsize=8)
+def get_solar_generation_shape(year: int = PROFILE_YEAR) -> np.ndarray:
+    """The hourly shape of solar generation over a year
+
+    Generation follows the height of the sun in the sky at SOLAR_LATITUDE, so days are
+    longer & stronger in summer. Clock hours are NZ standard time, so solar noon is at
+    about 12:30.
+
+    Args:
+        year (int, optional): the year the profiles are laid out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: shape (n_hours,), summing to the number of days in the year like
+            get_profile_shapes, i.e. the average kWh generated per day times the shape
+            is the hourly kWh. Read-only, as it's shared between callers.
+    """
+    n_days = get_days_in_year(year)
+    day_of_year = np.arange(n_days)[:, np.newaxis] + 1
+    hour_angle = np.radians(15 * (np.arange(24) + 0.5 - 12.5))
+    declination = np.radians(23.44) * np.sin(2 * np.pi * (284 + day_of_year) / 365)
+    latitude = np.radians(SOLAR_LATITUDE)
+    sun_height = np.sin(latitude) * np.sin(declination) + np.cos(latitude) * np.cos(
+        declination
+    ) * np.cos(hour_angle)
+    shape = np.maximum(sun_height, 0).ravel()
+    shape *= n_days / shape.sum()
+    shape.flags.writeable = False
+    return shape
+
+
+@lru_cache(maxsize=32)
+def _get_appliance_kwh_table(category: str, fuel_type: FuelTypeEnum) -> np.ndarray:
+    # kWh/day of the fuel, shape (n_machines, n_occupancy_buckets, n_locations)
+    machines, info = APPLIANCE_INFO[category]
+    table = np.array(
+        [
+            [
+                [
+                    get_energy_per_day(machine, info, occupancy, location).get(
+                        fuel_type, 0
+                    )
+                    for location in LOCATIONS
+                ]
+                for occupancy in OCCUPANCY_BUCKETS
+            ]
+            for machine in machines
+        ]
+    )
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=32)
+def _get_other_appliances_kwh_table(fuel_type: FuelTypeEnum) -> np.ndarray:
+    # kWh/day of the fuel, shape (n_occupancy_buckets,)
+    table = np.array(
+        [
+            get_other_appliances_energy_per_period(occupancy).get(fuel_type, 0)
+            for occupancy in OCCUPANCY_BUCKETS
+        ]
+    )
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=32)
+def _get_vehicle_kwh_per_km_table(fuel_type: FuelTypeEnum) -> np.ndarray:
+    # kWh/day of the fuel for each kms_per_week, shape (n_vehicle_fuel_types,)
+    table = np.array(
+        [
+            get_energy_per_day(vehicle_fuel_type, VEHICLE_INFO).get(fuel_type, 0)
+            / VEHICLE_AVG_KMS_PER_WEEK
+            for vehicle_fuel_type in VehicleFuelTypeEnum
+        ]
+    )
+    table.flags.writeable = False
+    return table
+
+
+def get_daily_kwh_by_category(
+    households: Sequence[Household],
+    fuel_type: FuelTypeEnum = FuelTypeEnum.ELECTRICITY,
+) -> np.ndarray:
+    """Each household's average kWh/day of a fuel, by category
+
+    The same daily kWh as get_total_energy_needs (scaled by occupancy, location & meter
+    calibration), but looked up for the whole batch at once from tables of every
+    machine, occupancy & location. Only reading the households' fields loops over them.
+
+    Args:
+        households (Sequence[Household]): the households, cleaned (see clean_household)
+        fuel_type (FuelTypeEnum, optional): the fuel. Defaults to ELECTRICITY.
+
+    Returns:
+        np.ndarray: kWh/day, shape (n_households, n_categories) in PROFILE_CATEGORIES order
+    """
+    occupancy = np.array(
+        [OCCUPANCY_BUCKETS.index(project_occupancy(h.occupancy)) for h in households],
+        dtype=int,
+    )
+    location = np.array([LOCATIONS.index(h.location) for h in households], dtype=int)
+    daily_kwh = np.zeros((len(households), len(PROFILE_CATEGORIES)))
+
+    for category, (machines, _) in APPLIANCE_INFO.items():
+        machine = _get_member_indices(
+            machines, [getattr(h, category) for h in households]
+        )
+        daily_kwh[:, PROFILE_CATEGORIES.index(category)] = _get_appliance_kwh_table(
+            category, fuel_type
+        )[machine, occupancy, location]
+
+    # Vehicles are flattened into one row per vehicle, then summed per household
+    vehicles = [(i, v) for i, h in enumerate(households) for v in h.vehicles or []]
+    vehicle_owner = np.array([i for i, _ in vehicles], dtype=int)
+    vehicle_fuel_type = _get_member_indices(
+        VehicleFuelTypeEnum, [v.fuel_type for _, v in vehicles]
+    )
+    vehicle_kms = np.array([v.kms_per_week for _, v in vehicles], dtype=float)
+    daily_kwh[:, PROFILE_CATEGORIES.index("vehicles")] = np.bincount(
+        vehicle_owner,
+        weights=_get_vehicle_kwh_per_km_table(fuel_type)[vehicle_fuel_type]
+        * vehicle_kms,
+        minlength=len(households),
+    )
+
+    daily_kwh[:, PROFILE_CATEGORIES.index("other_appliances")] = (
+        _get_other_appliances_kwh_table(fuel_type)[occupancy]
+    )
+
+    # Calibrated households use more or less than average (see calibrate_energy_needs)
+    baseload_factor, space_heating_factor = (
+        np.array(
+            [project_meter_calibration(h.meter_calibration) for h in households],
+            dtype=float,
+        )
+        .reshape(-1, 2)
+        .T
+    )
+    daily_kwh[:, PROFILE_CATEGORIES.index("other_appliances")] *= baseload_factor
+    # The factor is measured by the meter, so only applies to electric machines
+    for category in ["water_heating", "cooktop"]:
+        _, info = APPLIANCE_INFO[category]
+        electric = np.array(
+            [uses_electricity(getattr(h, category), info) for h in households],
+            dtype=bool,
+        )
+        daily_kwh[:, PROFILE_CATEGORIES.index(category)] *= np.where(
+            electric, baseload_factor, 1.0
+        )
+    daily_kwh[:, PROFILE_CATEGORIES.index("space_heating")] *= space_heating_factor
+    return daily_kwh
+
+
+def _get_member_indices(enum, members: List) -> np.ndarray:
+    indices = {member: i for i, member in enumerate(enum)}
+    return np.array([indices[member] for member in members], dtype=int)
+
+
+def synthesise_load_profiles(
+    daily_kwh: np.ndarray,
+    year: int = PROFILE_YEAR,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Synthesises households' total hourly load over a year
+
+    Args:
+        daily_kwh (np.ndarray): kWh/day by category, shape (n_households, n_categories) (see get_daily_kwh_by_category)
+        year (int, optional): the year to lay the profiles out over. Defaults to PROFILE_YEAR.
+        out (np.ndarray, optional): a preallocated array to write the profiles to, shape (n_households, n_hours). Defaults to None, i.e. a new array.
+
+    Returns:
+        np.ndarray: kWh in each hour, shape (n_households, n_hours)
+    """
+    return np.matmul(daily_kwh, get_profile_shapes(year), out=out)
+
+
+def synthesise_category_load_profiles(
+    daily_kwh: np.ndarray,
+    category: str,
+    year: int = PROFILE_YEAR,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Synthesises households' hourly load over a year for one category
+
+    Args:
+        daily_kwh (np.ndarray): kWh/day by category, shape (n_households, n_categories) (see get_daily_kwh_by_category)
+        category (str): one of PROFILE_CATEGORIES
+        year (int, optional): the year to lay the profiles out over. Defaults to PROFILE_YEAR.
+        out (np.ndarray, optional): a preallocated array to write the profiles to, shape (n_households, n_hours). Defaults to None, i.e. a new array.
+
+    Returns:
+        np.ndarray: kWh in each hour, shape (n_households, n_hours)
+    """
+    i = PROFILE_CATEGORIES.index(category)
+    return np.multiply(
+        daily_kwh[:, i, np.newaxis], get_profile_shapes(year)[i], out=out
+    )
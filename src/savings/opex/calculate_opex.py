@@ -5,6 +5,7 @@ from constants.solar import SOLAR_FEEDIN_TARIFF_2024, SOLAR_FEEDIN_TARIFF_AVG_15
 from constants.utils import DAYS_PER_YEAR, WEEKS_PER_YEAR, PeriodEnum
 from openapi_client.models.location_enum import LocationEnum
 from openapi_client.models.vehicle import Vehicle
+from openapi_client.models.vehicle_fuel_type_enum import VehicleFuelTypeEnum
 from params import (
     OPERATIONAL_LIFETIME,
 )
@@ -112,7 +113,7 @@ def _get_total_opex(
         )
         print(
             "\nother_energy_consumption: ",
-            json.dumps(other_energy_consumption, indent=4),
+            json.dumps(other_energy_consumption, indent=4, default=dict),
         )
         print("\n\n")
     total_bills = get_total_bills(
@@ -235,6 +236,22 @@ def get_rucs(vehicles: List[Vehicle], period: PeriodEnum = PeriodEnum.DAILY) ->
     return round(total_rucs, 2)
 
 
+def get_rucs_per_kms_per_week(
+    fuel_type: VehicleFuelTypeEnum, period: PeriodEnum = PeriodEnum.DAILY
+) -> float:
+    """The RUCs over a period for each km/week a vehicle of the given fuel type is driven
+
+    Args:
+        fuel_type (VehicleFuelTypeEnum): the vehicle's fuel type
+        period (PeriodEnum, optional): the period over which to calculate the RUCs.
+
+    Returns:
+        float: NZD per km/week, unrounded
+    """
+    rucs_daily = RUCS[fuel_type] * WEEKS_PER_YEAR / 1000 / DAYS_PER_YEAR
+    return scale_daily_to_period(rucs_daily, period)
+
+
 def get_solar_feedin_tariff(e_exported: float, period: PeriodEnum) -> float:
     if period == PeriodEnum.OPERATIONAL_LIFETIME:
         return e_exported * SOLAR_FEEDIN_TARIFF_AVG_15_YEARS
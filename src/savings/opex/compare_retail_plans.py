@@ -0,0 +1,177 @@
+from typing import Optional
+
+import numpy as np
+
+from constants.utils import DAYS_PER_YEAR, PeriodEnum
+from models.electrify_household import electrify_household
+from openapi_client.models import (
+    Household,
+    PlanTypeEnum,
+    RetailPlanComparison,
+    RetailPlanCost,
+)
+from savings.closed_form.compile_household_model import (
+    CLOSED_FORM_PERIODS,
+    compile_household_model,
+)
+from savings.closed_form.evaluate_household_model import get_electricity_flows
+from utils.clean_household import clean_household
+from utils.plan_catalogue import PlanCatalogue, load_plan_catalogue
+from utils.tou_tariff import TOU_PERIODS, TouPeriodEnum, get_kwh_by_tou_period
+from utils.validate_household import validate_household
+
+
+def get_kwh_by_schedule(
+    catalogue: PlanCatalogue, e_consumed_from_grid: np.ndarray
+) -> np.ndarray:
+    """Splits hourly or half-hourly grid consumption into each schedule's TOU periods
+
+    Args:
+        catalogue (PlanCatalogue): the catalogue
+        e_consumed_from_grid (np.ndarray): kWh bought in each interval of the year, shape (n_households, n_intervals)
+
+    Returns:
+        np.ndarray: kWh, shape (n_households, n_schedules, n_tou_periods)
+    """
+    return np.stack(
+        [
+            get_kwh_by_tou_period(e_consumed_from_grid, schedule)
+            for schedule in catalogue.schedules
+        ],
+        axis=1,
+    )
+
+
+def get_flat_kwh_by_schedule(
+    catalogue: PlanCatalogue,
+    e_consumed_from_grid: np.ndarray,
+    e_bought_off_peak: np.ndarray,
+) -> np.ndarray:
+    """Splits yearly grid consumption into each schedule's TOU periods, without a profile
+
+    Like get_effective_grid_price, electricity bought to charge the battery is bought
+    at night, where the schedule has a night period. The rest is assumed to be bought evenly across the hours of the year.
+
+    Args:
+        catalogue (PlanCatalogue): the catalogue
+        e_consumed_from_grid (np.ndarray): kWh bought per year, shape (n_households,)
+        e_bought_off_peak (np.ndarray): the part of it bought for the battery, shape (n_households,)
+
+    Returns:
+        np.ndarray: kWh, shape (n_households, n_schedules, n_tou_periods)
+    """
+    hourly_share = np.stack(
+        [
+            get_kwh_by_tou_period(np.full(8760, 1 / 8760), schedule)
+            for schedule in catalogue.schedules
+        ]
+    )
+    # Schedules without a night period charge the battery evenly too
+    night = TOU_PERIODS.index(TouPeriodEnum.NIGHT)
+    off_peak_share = np.where(
+        hourly_share[:, [night]] > 0, np.eye(len(TOU_PERIODS))[night], hourly_share
+    )
+    anytime = e_consumed_from_grid - e_bought_off_peak
+    return (
+        anytime[:, np.newaxis, np.newaxis] * hourly_share
+        + e_bought_off_peak[:, np.newaxis, np.newaxis] * off_peak_share
+    )
+
+
+def get_plan_costs(
+    catalogue: PlanCatalogue,
+    plan_indices: np.ndarray,
+    kwh_by_schedule: np.ndarray,
+    e_exported_to_grid: np.ndarray,
+) -> np.ndarray:
+    """Prices households' yearly electricity against many plans at once
+
+    Args:
+        catalogue (PlanCatalogue): the catalogue
+        plan_indices (np.ndarray): the plans to price against, shape (n_plans,)
+        kwh_by_schedule (np.ndarray): kWh bought per year, shape (n_households, n_schedules, n_tou_periods)
+        e_exported_to_grid (np.ndarray): kWh exported per year, shape (n_households,)
+
+    Returns:
+        np.ndarray: NZD per year, shape (n_households, n_plans). inf where a household
+            uses too much electricity to be on a plan.
+    """
+    kwh = kwh_by_schedule[:, catalogue.schedule_index[plan_indices], :]
+    costs = (
+        np.einsum("hpk,pk->hp", kwh, catalogue.rates[plan_indices])
+        + catalogue.daily_charges[plan_indices] * DAYS_PER_YEAR
+        - np.outer(e_exported_to_grid, catalogue.solar_buy_back[plan_indices])
+    )
+    annual_kwh = kwh_by_schedule[:, 0, :].sum(axis=1)
+    too_much = annual_kwh[:, np.newaxis] > catalogue.max_annual_kwh[plan_indices]
+    return np.where(too_much, np.inf, costs)
+
+
+def compare_retail_plans(
+    household: Household,
+    plan_type: Optional[PlanTypeEnum] = None,
+    catalogue: Optional[PlanCatalogue] = None,
+) -> RetailPlanComparison:
+    """Finds the cheapest retail plan for the household before & after electrification
+
+    Args:
+        household (Household): the household
+        plan_type (PlanTypeEnum, optional): only consider plans of this type. Defaults to None, i.e. all types.
+        catalogue (PlanCatalogue, optional): the plans. Defaults to the default catalogue.
+
+    Raises:
+        ValueError: if the household is invalid, or there are no plans for it
+
+    Returns:
+        RetailPlanComparison: the cheapest plan before & after
+    """
+    catalogue = catalogue or load_plan_catalogue()
+    validate_household(household)
+    current = clean_household(household.copy())
+    electrified = electrify_household(current)
+
+    plan_indices = catalogue.get_plan_indices(current.location, plan_type)
+    if len(plan_indices) == 0:
+        raise ValueError(f"There are no retail plans for {current.location.value}")
+
+    yearly = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+    flows = [
+        get_electricity_flows(
+            compile_household_model(h),
+            np.array([[v.kms_per_week for v in h.vehicles]], dtype=float),
+            np.array([h.solar.size or 0], dtype=float),
+            np.array([h.battery.capacity or 0], dtype=float),
+        )
+        for h in [current, electrified]
+    ]
+    costs = get_plan_costs(
+        catalogue,
+        plan_indices,
+        get_flat_kwh_by_schedule(
+            catalogue,
+            np.array([f["consumed_from_grid"][0, yearly] for f in flows]),
+            np.array([f["bought_off_peak"][0, yearly] for f in flows]),
+        ),
+        np.array([f["exported_to_grid"][0, yearly] for f in flows]),
+    )
+
+    before, after = [
+        _get_retail_plan_cost(catalogue, plan_indices, household_costs)
+        for household_costs in costs
+    ]
+    return RetailPlanComparison(before=before, after=after)
+
+
+def _get_retail_plan_cost(
+    catalogue: PlanCatalogue, plan_indices: np.ndarray, costs: np.ndarray
+) -> Optional[RetailPlanCost]:
+    cheapest = np.argmin(costs)
+    if not np.isfinite(costs[cheapest]):
+        return None
+    plan = plan_indices[cheapest]
+    return RetailPlanCost(
+        id=catalogue.ids[plan],
+        name=catalogue.names[plan],
+        planType=catalogue.plan_types[plan],
+        costPerYear=round(float(costs[cheapest]), 2),
+    )
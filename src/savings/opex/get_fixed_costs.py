@@ -9,9 +9,19 @@ from constants.fuel_stats import (
 )
 from constants.utils import DAYS_PER_YEAR, PeriodEnum
 from openapi_client.models.water_heating_enum import WaterHeatingEnum
+from utils.household_projections import project_appliances
+from utils.memoise_stage import memoise_stage
 from utils.scale_daily_to_period import scale_daily_to_period
 
 
+@memoise_stage(
+    "get_fixed_costs",
+    lambda household, period=PeriodEnum.DAILY, ignore_lpg_if_ngas_present=False: (
+        project_appliances(household),
+        period,
+        ignore_lpg_if_ngas_present,
+    ),
+)
 def get_fixed_costs(
     household: Household,
     period: PeriodEnum = PeriodEnum.DAILY,
@@ -1,8 +1,12 @@
-from constants.fuel_stats import COST_PER_FUEL_KWH_AVG_15_YEARS, COST_PER_FUEL_KWH_TODAY
+from constants.fuel_vectors import (
+    OTHER_FUEL_COST_PER_KWH_AVG_15_YEARS_VECTOR,
+    OTHER_FUEL_COST_PER_KWH_TODAY_VECTOR,
+)
 from constants.utils import PeriodEnum
 from savings.energy.get_other_energy_consumption import (
     OtherEnergyConsumption,
 )
+from utils.fuel_vector import FuelVector
 
 
 def get_other_energy_costs(
@@ -11,18 +15,15 @@ def get_other_energy_costs(
     """Get energy costs for fuels other than electricity (e.g. gas, LPG, petrol, diesel)
 
     Args:
-        other_e_consumption (OtherEnergyConsumption): dict with kWh of energy use per fuel type
+        other_e_consumption (OtherEnergyConsumption): kWh of energy use per fuel type
         period (PeriodEnum): the period for which this calculation is over
 
     Returns:
         float: cost in NZD
     """
-    total = 0
     costs = (
-        COST_PER_FUEL_KWH_AVG_15_YEARS
+        OTHER_FUEL_COST_PER_KWH_AVG_15_YEARS_VECTOR
         if period == PeriodEnum.OPERATIONAL_LIFETIME
-        else COST_PER_FUEL_KWH_TODAY
+        else OTHER_FUEL_COST_PER_KWH_TODAY_VECTOR
     )
-    for fuel_type, energy in other_e_consumption.items():
-        total += energy * costs[fuel_type]
-    return total
+    return FuelVector.from_mapping(other_e_consumption).dot(costs)
@@ -0,0 +1,39 @@
+import numpy as np
+
+from constants.tou_tariffs import TOU_TARIFF_2024, TOU_TARIFF_AVG_15_YEARS
+from constants.utils import PROFILE_YEAR, PeriodEnum
+from utils.scale_daily_to_period import scale_daily_to_period
+from utils.tou_tariff import get_days_in_year, price_consumption
+
+
+def get_tou_grid_costs(
+    e_consumed_from_grid: np.ndarray,
+    period: PeriodEnum = PeriodEnum.DAILY,
+    year: int = PROFILE_YEAR,
+) -> np.ndarray:
+    """Get the cost of electricity bought from the grid on a time-of-use tariff
+
+    Unlike get_effective_grid_price, this prices each kWh at the rate of the hour (or
+    half-hour) it's bought in.
+
+    If period is DAILY, WEEKLY or YEARLY, will use 2024 prices.
+    If period is OPERATIONAL_LIFETIME, will use real prices averaged over next 15 years (takes inflation into account).
+
+    Args:
+        e_consumed_from_grid (np.ndarray): kWh bought in each hour or half-hour of the
+            year, the last axis, e.g. shape (8760,) or (n_households, 17520)
+        period (PeriodEnum, optional): the period to scale the cost to. (default: PeriodEnum.DAILY)
+        year (int, optional): the year the profile is laid out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: cost in NZD, one per profile
+    """
+    tariff = (
+        TOU_TARIFF_AVG_15_YEARS
+        if period == PeriodEnum.OPERATIONAL_LIFETIME
+        else TOU_TARIFF_2024
+    )
+    daily_cost = price_consumption(e_consumed_from_grid, tariff, year) / (
+        get_days_in_year(year)
+    )
+    return scale_daily_to_period(daily_cost, period)
@@ -0,0 +1,199 @@
+from typing import Optional, TypedDict
+
+import numpy as np
+
+from constants.battery import (
+    BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS,
+    BATTERY_LOSSES,
+    BATTERY_MAX_C_RATE,
+)
+
+# The battery's state of charge is tracked in steps of 5% of its usable capacity
+DEFAULT_N_CHARGE_LEVELS = 21
+
+# Days are optimised in chunks of this many, across households, to bound memory
+DISPATCH_CHUNK_SIZE = 1024
+
+
+class BatteryDispatch(TypedDict):
+    # kWh in each hour, shape (n_households, n_days, 24)
+    charged_from_solar: np.ndarray
+    charged_from_grid: np.ndarray
+    discharged: np.ndarray  # kWh delivered to the household, after losses
+    consumed_from_grid: np.ndarray
+    exported_to_grid: np.ndarray
+    # NZD for each day's electricity, shape (n_households, n_days)
+    cost: np.ndarray
+
+
+def get_grid_costs(
+    e_net: np.ndarray, prices: np.ndarray, export_prices: np.ndarray
+) -> np.ndarray:
+    """The cost of each hour's net grid consumption
+
+    Args:
+        e_net (np.ndarray): kWh bought from the grid if positive, or exported if negative
+        prices (np.ndarray): $/kWh to buy, broadcastable against e_net
+        export_prices (np.ndarray): $/kWh paid for exports, broadcastable against e_net
+
+    Returns:
+        np.ndarray: NZD, shaped like e_net
+    """
+    # Exports never pay more than imports cost, so the dearer of the two is right
+    return np.maximum(prices * e_net, export_prices * e_net)
+
+
+def optimise_battery_dispatch(
+    prices: np.ndarray,
+    e_needs: np.ndarray,
+    e_generated_from_solar: Optional[np.ndarray],
+    battery_capacity: np.ndarray,
+    export_prices: Optional[np.ndarray] = None,
+    n_charge_levels: int = DEFAULT_N_CHARGE_LEVELS,
+) -> BatteryDispatch:
+    """Charges & discharges each household's battery to make its electricity cheapest
+
+    The battery charges from surplus solar or from the grid, and discharges to cover
+    the household's needs or to export, against hourly prices. Each day is solved on
+    its own, starting with an empty battery, by dynamic programming over the battery's
+    state of charge: a day is 24 steps with n_charge_levels ** 2 transitions each, and
+    every day of every household is solved together, a chunk of days at a time.
+
+    Exported electricity must not pay more than bought electricity costs (that would
+    pay to export & buy back the same kWh), so the cost of each hour is convex in the
+    battery's charge and the solution is optimal to within a charge level.
+
+    Args:
+        prices (np.ndarray): $/kWh to buy from the grid, shape (n_days, 24) or (n_households, n_days, 24)
+        e_needs (np.ndarray): kWh needed, shape (n_households, n_days, 24)
+        e_generated_from_solar (np.ndarray, optional): kWh generated, shaped like e_needs. None if no household has solar.
+        battery_capacity (np.ndarray): battery nameplate capacity in kWh, shape (n_households,)
+        export_prices (np.ndarray, optional): $/kWh paid for exports, broadcastable against e_needs. Defaults to prices, i.e. a spot price buy-back.
+        n_charge_levels (int, optional): how many states of charge to consider, from empty to full. Defaults to DEFAULT_N_CHARGE_LEVELS.
+
+    Raises:
+        ValueError: if the shapes don't match, a capacity is negative or exports pay more than imports cost
+
+    Returns:
+        BatteryDispatch: the cheapest dispatch, and what it costs
+    """
+    e_needs = np.asarray(e_needs, dtype=float)
+    if e_needs.ndim != 3 or e_needs.shape[2] != 24:
+        raise ValueError("Needs must be shaped (n_households, n_days, 24)")
+    n_households, n_days, _ = e_needs.shape
+    e_generated_from_solar = (
+        np.zeros_like(e_needs)
+        if e_generated_from_solar is None
+        else np.broadcast_to(e_generated_from_solar, e_needs.shape)
+    )
+    prices = np.broadcast_to(prices, e_needs.shape)
+    export_prices = (
+        prices
+        if export_prices is None
+        else np.broadcast_to(export_prices, e_needs.shape)
+    )
+    battery_capacity = np.asarray(battery_capacity, dtype=float)
+    if battery_capacity.shape != (n_households,):
+        raise ValueError("There must be one battery capacity per household")
+    if np.any(battery_capacity < 0):
+        raise ValueError("Battery capacity can't be negative")
+    if np.any(export_prices > prices):
+        raise ValueError("Exports can't pay more than imports cost")
+    if n_charge_levels < 2:
+        raise ValueError("There must be at least 2 charge levels, empty & full")
+
+    # One row per day of each household
+    e_surplus = (e_generated_from_solar - e_needs).reshape(-1, 24)
+    level_size = np.repeat(
+        battery_capacity
+        * BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS
+        / (n_charge_levels - 1),
+        n_days,
+    )
+    levels = np.empty((len(e_surplus), 25), dtype=np.int64)
+    for start in range(0, len(e_surplus), DISPATCH_CHUNK_SIZE):
+        rows = slice(start, start + DISPATCH_CHUNK_SIZE)
+        levels[rows] = _optimise_charge_levels(
+            e_surplus[rows],
+            prices.reshape(-1, 24)[rows],
+            export_prices.reshape(-1, 24)[rows],
+            level_size[rows],
+            n_charge_levels,
+        )
+
+    # kWh stored (> 0) or taken out of (< 0) the battery in each hour
+    e_stored = np.diff(levels, axis=1) * level_size[:, np.newaxis]
+    e_charged = np.maximum(e_stored, 0)
+    e_discharged = np.maximum(-e_stored, 0) * (1 - BATTERY_LOSSES)
+    e_net = e_charged - e_discharged - e_surplus
+    e_charged_from_solar = np.minimum(e_charged, np.maximum(e_surplus, 0))
+
+    def by_household(flow: np.ndarray) -> np.ndarray:
+        return flow.reshape(n_households, n_days, 24)
+
+    return {
+        "charged_from_solar": by_household(e_charged_from_solar),
+        "charged_from_grid": by_household(e_charged - e_charged_from_solar),
+        "discharged": by_household(e_discharged),
+        "consumed_from_grid": by_household(np.maximum(e_net, 0)),
+        "exported_to_grid": by_household(np.maximum(-e_net, 0)),
+        "cost": get_grid_costs(by_household(e_net), prices, export_prices).sum(axis=2),
+    }
+
+
+def _optimise_charge_levels(
+    e_surplus: np.ndarray,
+    prices: np.ndarray,
+    export_prices: np.ndarray,
+    level_size: np.ndarray,
+    n_charge_levels: int,
+) -> np.ndarray:
+    """The cheapest charge level at each hour boundary of each day, shape (n_days, 25)"""
+    n_days = len(e_surplus)
+    # The change in level from each level to each other level, [from, to]
+    level_change = np.subtract.outer(
+        np.arange(n_charge_levels), np.arange(n_charge_levels)
+    ).T
+    max_level_change = int(
+        BATTERY_MAX_C_RATE
+        * (n_charge_levels - 1)
+        / BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS
+        + 1e-9
+    )
+    changes = np.arange(-max_level_change, max_level_change + 1)
+    # kWh the battery draws (> 0) or delivers (< 0) at each feasible change in level.
+    # Its cost only depends on the change, so it's priced once per change rather than
+    # once per pair of levels.
+    e_battery = level_size[:, np.newaxis] * np.where(
+        changes > 0, changes, changes * (1 - BATTERY_LOSSES)
+    )
+    # Changes beyond the battery's power index an infinite cost
+    change_index = np.where(
+        np.abs(level_change) <= max_level_change,
+        level_change + max_level_change,
+        len(changes),
+    )
+
+    # Backwards through the day: the cheapest cost from each level to the end of the day
+    cost_to_go = np.zeros((n_days, n_charge_levels))
+    best_next_level = np.empty(
+        (24, n_days, n_charge_levels), dtype=np.min_scalar_type(n_charge_levels - 1)
+    )
+    days = np.arange(n_days)[:, np.newaxis]
+    from_levels = np.arange(n_charge_levels)
+    change_costs = np.full((n_days, len(changes) + 1), np.inf)
+    for hour in range(23, -1, -1):
+        change_costs[:, :-1] = get_grid_costs(
+            e_battery - e_surplus[:, hour, np.newaxis],
+            prices[:, hour, np.newaxis],
+            export_prices[:, hour, np.newaxis],
+        )
+        costs = change_costs[:, change_index] + cost_to_go[:, np.newaxis, :]
+        best_next_level[hour] = np.argmin(costs, axis=2)
+        cost_to_go = costs[days, from_levels, best_next_level[hour]]
+
+    # Forwards from an empty battery, following the cheapest levels
+    levels = np.zeros((n_days, 25), dtype=np.int64)
+    for hour in range(24):
+        levels[:, hour + 1] = best_next_level[hour][days[:, 0], levels[:, hour]]
+    return levels
@@ -10,8 +10,26 @@ from openapi_client.models import (
     Household,
     UpfrontCost,
 )
+from utils.household_projections import (
+    project_appliances,
+    project_battery,
+    project_solar,
+)
+from utils.memoise_stage import memoise_stage
+
+
+def _project_upfront_cost_inputs(current: Household, electrified: Household):
+    # Upfront costs don't depend on occupancy or vehicles
+    return (
+        project_solar(current.solar),
+        project_battery(current.battery),
+        project_appliances(current),
+        project_appliances(electrified),
+        electrified.location,
+    )
 
 
+@memoise_stage("calculate_upfront_cost", _project_upfront_cost_inputs)
 def calculate_upfront_cost(current: Household, electrified: Household) -> UpfrontCost:
     # TODO: incorporate occupancy into upfront cost calcs
     return UpfrontCost(
@@ -0,0 +1,11 @@
+import pytest
+
+from utils.memoise_stage import clear_stage_caches
+
+
+@pytest.fixture(autouse=True)
+def empty_stage_caches():
+    # Stage caches are module-level, so stop results leaking between tests
+    clear_stage_caches()
+    yield
+    clear_stage_caches()
@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+
+from constants.utils import PeriodEnum
+from models.aggregate_network_demand import (
+    NETWORK_LOAD_CATEGORIES,
+    aggregate_network_demand,
+    get_daily_kwh_by_network_load,
+)
+from models.electrify_household import electrify_household
+from openapi_client.models import (
+    LocationEnum,
+    SpaceHeatingEnum,
+    WaterHeatingEnum,
+)
+from savings.energy.get_electricity_consumption import get_e_generated_from_solar
+from savings.energy.synthesise_load_profiles import (
+    get_daily_kwh_by_category,
+    get_solar_generation_shape,
+    synthesise_load_profiles,
+)
+from tests.mocks import mock_household
+from utils.clean_household import clean_household
+
+households = [
+    clean_household(mock_household),
+    clean_household(
+        mock_household.copy(
+            update={
+                "location": LocationEnum.CANTERBURY,
+                "space_heating": SpaceHeatingEnum.GAS,
+                "occupancy": 2,
+            }
+        )
+    ),
+    clean_household(
+        mock_household.copy(
+            update={
+                "location": LocationEnum.OTAGO,
+                "water_heating": WaterHeatingEnum.ELECTRIC_HEAT_PUMP,
+                "vehicles": [],
+            }
+        )
+    ),
+]
+
+
+def get_profiles(households):
+    """Each household's hourly load, synthesised one by one"""
+    return np.array(
+        [
+            synthesise_load_profiles(get_daily_kwh_by_category([h]))[0]
+            - get_e_generated_from_solar(h.solar, h.location, PeriodEnum.DAILY)
+            * get_solar_generation_shape()
+            for h in households
+        ]
+    )
+
+
+class TestGetDailyKwhByNetworkLoad:
+    def test_solar_is_the_last_category(self):
+        electrified = electrify_household(households[0])
+        daily_kwh = get_daily_kwh_by_network_load([households[0], electrified])
+        assert daily_kwh.shape == (2, len(NETWORK_LOAD_CATEGORIES))
+        # mock_household installs 7 kW of solar when it's electrified
+        assert daily_kwh[0, -1] == 0
+        assert daily_kwh[1, -1] == get_e_generated_from_solar(
+            electrified.solar, electrified.location, PeriodEnum.DAILY
+        )
+
+
+class TestAggregateNetworkDemand:
+    def test_it_sums_the_households_profiles(self):
+        demand = aggregate_network_demand(households)
+        before = get_profiles(households)
+        after = get_profiles([electrify_household(h) for h in households])
+        for load, profiles in [(demand.before, before), (demand.after, after)]:
+            assert load.load == pytest.approx(profiles.sum(axis=0))
+            assert load.sum_of_peaks == pytest.approx(profiles.max(axis=1).sum())
+            assert load.coincident_peak == pytest.approx(profiles.sum(axis=0).max())
+            assert load.diversity_factor >= 1
+        assert demand.households == 3
+
+    def test_the_chunks_dont_change_the_result(self):
+        demand = aggregate_network_demand(households, chunk_size=2)
+        expected = aggregate_network_demand(households)
+        for name in ["before", "after"]:
+            load, expected_load = getattr(demand, name), getattr(expected, name)
+            assert load.load == pytest.approx(expected_load.load)
+            assert load.sum_of_peaks == pytest.approx(expected_load.sum_of_peaks)
+
+    def test_electrifying_raises_the_peak(self):
+        demand = aggregate_network_demand(households)
+        assert demand.peak_increase > 0
+        peak = dict(zip(NETWORK_LOAD_CATEGORIES, demand.after.peak_by_category))
+        before_peak = dict(zip(NETWORK_LOAD_CATEGORIES, demand.before.peak_by_category))
+        # EV charging & heat pumps add to the peak
+        assert peak["vehicles"] > before_peak["vehicles"] == 0
+        assert peak["space_heating"] > 0
+        assert sum(peak.values()) == pytest.approx(demand.after.coincident_peak)
+
+    def test_solar_lowers_the_load_in_the_day(self):
+        no_solar = households[0].copy(
+            update={"solar": households[0].solar.copy(update={"install_solar": False})}
+        )
+        with_solar, without_solar = (
+            aggregate_network_demand([h]).after.load for h in (households[0], no_solar)
+        )
+        sunny = get_solar_generation_shape() > 0
+        assert np.all(with_solar[sunny] < without_solar[sunny])
+        assert with_solar[~sunny] == pytest.approx(without_solar[~sunny])
+
+    def test_identical_households_peak_together(self):
+        demand = aggregate_network_demand([households[0]] * 4)
+        assert demand.before.diversity_factor == pytest.approx(1)
+        assert demand.before.coincident_peak == pytest.approx(
+            4 * aggregate_network_demand([households[0]]).before.coincident_peak
+        )
+
+    def test_weights_count_households_more_than_once(self):
+        demand = aggregate_network_demand(households[:2], weights=[2, 1])
+        expected = aggregate_network_demand([households[0]] * 2 + [households[1]])
+        assert demand.households == 3
+        assert demand.after.load == pytest.approx(expected.after.load)
+        assert demand.after.sum_of_peaks == pytest.approx(expected.after.sum_of_peaks)
+
+    def test_the_load_duration_curve_sorts_the_hours(self):
+        load = aggregate_network_demand(households).after
+        curve = load.get_load_duration_curve()
+        assert len(curve) == 8760
+        assert curve[0] == load.coincident_peak
+        assert np.all(np.diff(curve) <= 0)
+        assert curve.sum() == pytest.approx(load.load.sum())
+
+    def test_it_checks_the_households_and_weights(self):
+        with pytest.raises(ValueError, match="No households"):
+            aggregate_network_demand([])
+        with pytest.raises(ValueError, match="shape"):
+            aggregate_network_demand(households, weights=[1, 2])
+        with pytest.raises(ValueError, match="negative"):
+            aggregate_network_demand(households, weights=[1, -1, 1])
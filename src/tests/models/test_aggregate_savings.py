@@ -0,0 +1,59 @@
+import pytest
+
+from models.aggregate_savings import aggregate_savings, aggregate_savings_in_processes
+from models.electrify_household import electrify_household
+from openapi_client.models import Battery, LocationEnum, SpaceHeatingEnum
+from savings.closed_form.evaluate_household_model import calculate_opex_closed_form
+from tests.mocks import mock_household
+from utils.clean_household import clean_household
+
+households = [
+    mock_household.copy(update={"location": location, "space_heating": space_heating})
+    for location in [LocationEnum.AUCKLAND_CENTRAL, LocationEnum.OTAGO]
+    for space_heating in [SpaceHeatingEnum.GAS, SpaceHeatingEnum.WOOD]
+]
+rows = [household.to_dict() for household in households]
+invalid_row = mock_household.copy(
+    update={"battery": Battery(has_battery=True, capacity=-10)}
+).to_dict()
+
+
+class TestAggregateSavings:
+    def test_it_aggregates_each_households_savings(self):
+        aggregate = aggregate_savings(rows + [invalid_row], ["location"])
+        auckland, otago = aggregate.summarise()
+        assert auckland["location"] == LocationEnum.AUCKLAND_CENTRAL.value
+        assert auckland["households"] == 2
+        assert auckland["errors"] == 1
+        assert otago["errors"] == 0
+        opex = [
+            calculate_opex_closed_form(
+                clean_household(household),
+                electrify_household(clean_household(household)),
+            ).per_year.difference
+            for household in households[2:]
+        ]
+        assert otago["opex.perYear.difference.total"] == pytest.approx(sum(opex))
+
+    def test_it_reads_the_households_as_it_goes(self):
+        aggregate = aggregate_savings(iter(rows), ["spaceHeating"])
+        assert [row["households"] for row in aggregate.summarise()] == [2, 2]
+
+    def test_unreadable_households_are_errors(self):
+        aggregate = aggregate_savings([{"location": "Atlantis"}], ["location"])
+        (row,) = aggregate.summarise()
+        assert (row["location"], row["households"], row["errors"]) == (None, 0, 1)
+
+
+class TestAggregateSavingsInProcesses:
+    def test_it_matches_aggregating_in_one_process(self):
+        batches = [rows[:1], rows[1:3], [invalid_row], rows[3:]]
+        merged = aggregate_savings_in_processes(
+            iter(batches), ["location", "spaceHeating"], max_workers=2
+        )
+        whole = aggregate_savings(
+            rows + [invalid_row], ["location", "spaceHeating"]
+        ).summarise()
+        assert len(merged.summarise()) == len(whole)
+        for merged_row, row in zip(merged.summarise(), whole):
+            assert merged_row == pytest.approx(row)
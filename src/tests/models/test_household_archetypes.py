@@ -0,0 +1,128 @@
+import random
+
+import numpy as np
+import pytest
+
+from models.household_archetypes import (
+    calculate_archetype_values,
+    compress_households,
+    estimate_compression_error,
+    get_archetype_key,
+)
+from models.savings_cube import calculate_cell_values
+from openapi_client.models import MeterCalibration, Solar
+from tests.mocks import mock_household
+from tests.savings.closed_form.test_evaluate_household_model import (
+    make_random_household,
+)
+
+rng = random.Random(0)
+configurations = [make_random_household(rng) for _ in range(5)]
+# Households that differ from their configuration in their continuous inputs only
+population = [
+    household.copy(
+        update={
+            "vehicles": [
+                vehicle.copy(update={"kms_per_week": rng.randint(0, 600)})
+                for vehicle in household.vehicles
+            ],
+            "solar": (
+                household.solar.copy(update={"size": round(rng.uniform(0, 15), 2)})
+                if household.solar.size is not None
+                else household.solar
+            ),
+        }
+    )
+    for household in rng.choices(configurations, k=200)
+]
+
+
+@pytest.fixture(scope="module")
+def full_run():
+    return np.array([calculate_cell_values(h.copy(deep=True)) for h in population])
+
+
+class TestCompressHouseholds:
+    def test_it_gives_each_configuration_an_archetype(self):
+        archetypes = compress_households(population)
+        assert len(archetypes.archetypes) == len(
+            {get_archetype_key(h) for h in population}
+        )
+        assert archetypes.weights.sum() == len(population)
+        for i, household in enumerate(population):
+            archetype = archetypes.archetypes[archetypes.assignments[i]]
+            assert get_archetype_key(archetype) == get_archetype_key(household)
+
+    def test_archetypes_have_their_members_mean_inputs(self):
+        households = [
+            mock_household.copy(
+                update={
+                    "solar": Solar(has_solar=True, size=size),
+                    "meter_calibration": MeterCalibration(baseload_factor=factor),
+                }
+            )
+            for size, factor in [(2.0, 0.5), (4.0, 1.5), (9.0, 2.0)]
+        ]
+        archetypes = compress_households(households, weights=[1, 1, 2])
+        (archetype,) = archetypes.archetypes
+        assert archetype.solar.size == pytest.approx(6)
+        assert archetype.meter_calibration.baseload_factor == pytest.approx(1.5)
+        assert archetype.meter_calibration.space_heating_factor == 1
+        assert archetype.vehicles == mock_household.vehicles
+        assert archetypes.weights.tolist() == [4]
+
+    def test_it_splits_the_most_spread_out_configurations(self):
+        households = [
+            mock_household.copy(update={"solar": Solar(has_solar=True, size=size)})
+            for size in [1, 1.2, 10, 10.5]
+        ] + [mock_household.copy(update={"occupancy": 1})] * 3
+        archetypes = compress_households(households, n_archetypes=3)
+        assert archetypes.assignments.tolist() == [0, 0, 1, 1, 2, 2, 2]
+        assert [a.solar.size for a in archetypes.archetypes[:2]] == pytest.approx(
+            [1.1, 10.25]
+        )
+
+    def test_every_distinct_household_can_be_an_archetype(self, full_run):
+        archetypes = compress_households(population, n_archetypes=len(population))
+        values = calculate_archetype_values(archetypes)
+        assert values[archetypes.assignments] == pytest.approx(full_run)
+
+    def test_it_checks_the_number_of_archetypes_and_weights(self):
+        with pytest.raises(ValueError, match="Need at least 5 archetypes"):
+            compress_households(population, n_archetypes=4)
+        with pytest.raises(ValueError, match="weight"):
+            compress_households(population, weights=[1, 2])
+
+
+class TestEstimateCompressionError:
+    def test_running_every_household_gives_the_exact_error(self, full_run):
+        archetypes = compress_households(population, n_archetypes=20)
+        values = calculate_archetype_values(archetypes)
+        error = estimate_compression_error(
+            population, archetypes, values, sample_size=None
+        )
+        assert error.total + error.error == pytest.approx(full_run.sum(axis=0))
+        assert error.margin.tolist() == [0] * len(error.total)
+        assert error.sampled == len(population)
+        assert np.all(error.relative_bound < 0.05)
+
+    def test_more_archetypes_are_more_accurate(self):
+        bounds = []
+        for n_archetypes in [5, 50]:
+            archetypes = compress_households(population, n_archetypes=n_archetypes)
+            values = calculate_archetype_values(archetypes)
+            bounds.append(
+                estimate_compression_error(
+                    population, archetypes, values, sample_size=None
+                ).bound.sum()
+            )
+        assert bounds[1] < bounds[0]
+
+    def test_a_sample_bounds_the_full_runs_totals(self, full_run):
+        archetypes = compress_households(population, n_archetypes=10)
+        values = calculate_archetype_values(archetypes)
+        error = estimate_compression_error(
+            population, archetypes, values, sample_size=100
+        )
+        assert error.sampled == 100
+        assert np.all(np.abs(full_run.sum(axis=0) - error.total) <= error.bound)
@@ -0,0 +1,370 @@
+import itertools
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from constants.fuel_stats import EMISSIONS_FACTORS
+from constants.machines.replacement import MACHINE_LIFESPAN_YEARS
+from constants.utils import PeriodEnum
+from models.project_stock_turnover import (
+    REGIONS,
+    STOCK_CATEGORIES,
+    UptakeRule,
+    _get_rules_apply,
+    get_replaced_shares,
+    get_replacement_household,
+    get_yearly_opex,
+    project_stock_turnover,
+)
+from openapi_client.models import (
+    CooktopEnum,
+    LocationEnum,
+    Solar,
+    SpaceHeatingEnum,
+    VehicleFuelTypeEnum,
+    WaterHeatingEnum,
+)
+from savings.closed_form.compile_household_model import CLOSED_FORM_PERIODS
+from savings.closed_form.evaluate_household_model import get_household_totals
+from savings.emissions.calculate_emissions_trajectory import (
+    EMISSIONS_FUEL_TYPES,
+    get_yearly_emissions_by_category,
+)
+from tests.mocks import mock_household
+from utils.clean_household import clean_household
+from utils.memoise_stage import STAGE_CACHES
+
+households = [
+    clean_household(mock_household),
+    clean_household(
+        mock_household.copy(
+            update={
+                "location": LocationEnum.CANTERBURY,
+                "space_heating": SpaceHeatingEnum.GAS,
+                "occupancy": 2,
+            }
+        )
+    ),
+    clean_household(
+        mock_household.copy(
+            update={
+                "location": LocationEnum.OTAGO,
+                "water_heating": WaterHeatingEnum.ELECTRIC_HEAT_PUMP,
+                "vehicles": [],
+            }
+        )
+    ),
+]
+
+rules = [
+    UptakeRule("space_heating", SpaceHeatingEnum.ELECTRIC_HEAT_PUMP),
+    UptakeRule(
+        "water_heating",
+        WaterHeatingEnum.ELECTRIC_HEAT_PUMP,
+        frozenset({WaterHeatingEnum.GAS, WaterHeatingEnum.LPG}),
+    ),
+    UptakeRule("cooktop", CooktopEnum.ELECTRIC_INDUCTION),
+    UptakeRule("vehicles", VehicleFuelTypeEnum.ELECTRIC),
+]
+
+years = list(range(2023, 2031))
+
+new_ages = np.zeros((len(households), len(STOCK_CATEGORIES)))
+worn_out_ages = np.array(
+    [[MACHINE_LIFESPAN_YEARS[c] for c in STOCK_CATEGORIES]] * len(households)
+)
+
+
+class TestUptakeRule:
+    def test_it_checks_the_category(self):
+        with pytest.raises(ValueError, match="Unknown machine category"):
+            UptakeRule("heating", SpaceHeatingEnum.ELECTRIC_HEAT_PUMP)
+        with pytest.raises(ValueError, match="can't replace"):
+            UptakeRule("water_heating", SpaceHeatingEnum.ELECTRIC_HEAT_PUMP)
+
+    def test_it_checks_the_uptake(self):
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            UptakeRule("cooktop", CooktopEnum.ELECTRIC_INDUCTION, uptake=1.5)
+
+    def test_it_applies_to_the_machines_it_replaces(self):
+        rule = rules[1]
+        assert rule.applies_to(WaterHeatingEnum.GAS)
+        assert not rule.applies_to(WaterHeatingEnum.ELECTRIC_RESISTANCE)
+        assert not rule.applies_to(WaterHeatingEnum.ELECTRIC_HEAT_PUMP)
+        assert rules[0].applies_to(SpaceHeatingEnum.WOOD)
+        assert not rules[0].applies_to(SpaceHeatingEnum.ELECTRIC_HEAT_PUMP)
+
+
+class TestGetReplacementHousehold:
+    def test_it_replaces_the_machines_the_rules_apply_to(self):
+        household = households[0]
+        replacement = get_replacement_household(household, rules)
+        assert replacement.space_heating == SpaceHeatingEnum.ELECTRIC_HEAT_PUMP
+        assert replacement.water_heating == WaterHeatingEnum.ELECTRIC_HEAT_PUMP
+        assert replacement.cooktop == CooktopEnum.ELECTRIC_INDUCTION
+        assert [v.fuel_type for v in replacement.vehicles] == [
+            VehicleFuelTypeEnum.ELECTRIC
+        ] * len(household.vehicles)
+        assert [v.kms_per_week for v in replacement.vehicles] == [
+            v.kms_per_week for v in household.vehicles
+        ]
+        # The household itself is unchanged
+        assert household.space_heating == SpaceHeatingEnum.WOOD
+
+    def test_it_leaves_machines_without_a_rule(self):
+        replacement = get_replacement_household(households[0], rules[:1])
+        assert replacement.water_heating == households[0].water_heating
+        assert replacement.vehicles == households[0].vehicles
+
+
+class TestGetReplacedShares:
+    lifespans = np.array([MACHINE_LIFESPAN_YEARS[c] for c in STOCK_CATEGORIES])
+
+    def test_machines_are_replaced_when_they_wear_out(self):
+        ages = (self.lifespans - 3)[np.newaxis]
+        shares = get_replaced_shares(
+            ages,
+            np.ones(ages.shape, dtype=bool),
+            np.ones(len(STOCK_CATEGORIES)),
+            np.zeros(len(STOCK_CATEGORIES), dtype=int),
+            5,
+        )
+        assert shares.shape == (1, len(STOCK_CATEGORIES), 5)
+        assert np.all(shares[:, :, :3] == 0)
+        assert np.all(shares[:, :, 3:] == 1)
+
+    def test_uptake_compounds_each_time_a_machine_wears_out(self):
+        n_years = 2 * MACHINE_LIFESPAN_YEARS["cooktop"] + 1
+        shares = get_replaced_shares(
+            np.array([self.lifespans]),
+            np.ones((1, len(STOCK_CATEGORIES)), dtype=bool),
+            np.full(len(STOCK_CATEGORIES), 0.5),
+            np.zeros(len(STOCK_CATEGORIES), dtype=int),
+            n_years,
+        )
+        cooktop = shares[0, STOCK_CATEGORIES.index("cooktop")]
+        lifespan = MACHINE_LIFESPAN_YEARS["cooktop"]
+        assert cooktop[0] == 0.5
+        assert cooktop[lifespan - 1] == 0.5
+        assert cooktop[lifespan] == 0.75
+        assert cooktop[2 * lifespan] == 0.875
+
+    def test_it_waits_for_the_rule_to_start(self):
+        shares = get_replaced_shares(
+            np.array([self.lifespans]),
+            np.array([[True, False, True, True]]),
+            np.ones(len(STOCK_CATEGORIES)),
+            np.array([0, 0, 0, 2]),
+            4,
+        )
+        assert np.all(shares[0, 0] == 1)
+        # The rule doesn't apply
+        assert np.all(shares[0, 1] == 0)
+        # Worn out before the rule starts, so replaced like for like
+        assert np.all(shares[0, 3] == 0)
+
+
+class TestGetYearlyOpex:
+    # Households that share discrete inputs, with different kms & solar sizes
+    households = households + [
+        households[0].copy(
+            update={
+                "vehicles": [
+                    v.copy(update={"kms_per_week": 50}) for v in households[0].vehicles
+                ],
+                "solar": Solar(has_solar=True, size=4),
+            }
+        ),
+        households[0].copy(update={"solar": Solar(has_solar=True, size=9)}),
+    ]
+
+    def get_inputs(self):
+        rules_by_category = {rule.category: rule for rule in rules}
+        applies = _get_rules_apply(self.households, rules_by_category)
+        shares = np.random.default_rng(0).random(
+            (len(self.households), len(STOCK_CATEGORIES), 3)
+        )
+        return shares, applies, rules_by_category
+
+    def get_expected(self, shares, applies, rules_by_category):
+        # Each combination of each household, one at a time
+        yearly = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+        expected = np.zeros((len(self.households), shares.shape[2]))
+        for i, household in enumerate(self.households):
+            categories = np.flatnonzero(applies[i])
+            for replaced in itertools.product([False, True], repeat=len(categories)):
+                weight = np.prod(
+                    [
+                        shares[i, c] if r else 1 - shares[i, c]
+                        for c, r in zip(categories, replaced)
+                    ],
+                    axis=0,
+                )
+                combination = get_replacement_household(
+                    household,
+                    [
+                        rules_by_category[STOCK_CATEGORIES[c]]
+                        for c, r in zip(categories, replaced)
+                        if r
+                    ],
+                )
+                expected[i] += (
+                    weight * get_household_totals(combination)["opex"][yearly]
+                )
+        return expected
+
+    @pytest.mark.parametrize("schedule", [False, True])
+    def test_it_matches_each_households_savings(self, schedule):
+        inputs = self.get_inputs()
+        with patch(
+            "savings.closed_form.evaluate_household_model.SCHEDULE_FLEXIBLE_LOADS",
+            schedule,
+        ):
+            opex = get_yearly_opex(self.households, *inputs)
+            assert opex == pytest.approx(self.get_expected(*inputs))
+
+    def test_it_leaves_the_stage_caches_alone(self):
+        models = {}
+        get_yearly_opex(self.households, *self.get_inputs(), models)
+        for stage in ["compile_household_model", "get_household_totals"]:
+            assert STAGE_CACHES[stage].stats()["misses"] == 0
+        # The models are shared with the caller instead, e.g. for the next chunk
+        assert len(models) > 0
+
+
+class TestProjectStockTurnover:
+    def test_without_rules_nothing_changes(self):
+        projection = project_stock_turnover(households, worn_out_ages, [], years=years)
+        assert projection.years == tuple(years)
+        assert projection.energy.shape == (
+            len(REGIONS),
+            len(EMISSIONS_FUEL_TYPES),
+            len(years),
+        )
+        assert np.all(projection.replaced == 0)
+        assert np.allclose(
+            projection.energy, projection.energy[:, :, :1].repeat(len(years), axis=2)
+        )
+        assert projection.emissions.sum(axis=0) == pytest.approx(
+            get_yearly_emissions_by_category(households, years).sum(axis=(0, 1))
+        )
+
+    def test_worn_out_machines_are_replaced_in_the_first_year(self):
+        projection = project_stock_turnover(
+            households, worn_out_ages, rules, years=years
+        )
+        replacements = [get_replacement_household(h, rules) for h in households]
+        assert projection.emissions.sum(axis=0) == pytest.approx(
+            get_yearly_emissions_by_category(replacements, years).sum(axis=(0, 1))
+        )
+        assert projection.emissions.sum() < (
+            project_stock_turnover(
+                households, worn_out_ages, [], years=years
+            ).emissions.sum()
+        )
+        # Households with a machine that a rule applies to
+        region = REGIONS.index(LocationEnum.AUCKLAND_CENTRAL)
+        assert np.all(projection.replaced[region, :, 0] == 1)
+        region = REGIONS.index(LocationEnum.OTAGO)
+        assert list(projection.replaced[region, :, 0]) == [1, 0, 1, 0]
+
+    def test_new_machines_arent_replaced(self):
+        projection = project_stock_turnover(households, new_ages, rules, years=years)
+        without_rules = project_stock_turnover(households, new_ages, [], years=years)
+        assert np.all(projection.replaced == 0)
+        assert projection.emissions == pytest.approx(without_rules.emissions)
+        assert projection.opex == pytest.approx(without_rules.opex)
+
+    def test_it_sums_by_region_with_weights(self):
+        weights = np.array([2.0, 0.5, 0])
+        projection = project_stock_turnover(
+            households, worn_out_ages, rules, weights=weights, years=years
+        )
+        for i, household in enumerate(households):
+            single = project_stock_turnover(
+                [household], worn_out_ages[:1], rules, years=years
+            )
+            region = REGIONS.index(household.location)
+            assert projection.energy[region] == pytest.approx(
+                weights[i] * single.energy[region]
+            )
+            assert projection.replaced[region] == pytest.approx(
+                weights[i] * single.replaced[region]
+            )
+        other_regions = [
+            i
+            for i, region in enumerate(REGIONS)
+            if region not in {h.location for h in households}
+        ]
+        assert np.all(projection.energy[other_regions] == 0)
+
+    def test_opex_reconciles_with_savings(self):
+        yearly = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+        region = REGIONS.index(LocationEnum.CANTERBURY)
+        for stock_rules, household in [
+            ([], households[1]),
+            (rules, get_replacement_household(households[1], rules)),
+        ]:
+            projection = project_stock_turnover(
+                households, worn_out_ages, stock_rules, years=years
+            )
+            assert projection.opex.shape == (len(REGIONS), len(years))
+            # Including fixed costs, RUCs & solar
+            assert projection.opex[region] == pytest.approx(
+                [get_household_totals(household)["opex"][yearly]] * len(years)
+            )
+        # Only fuels with emissions are counted in the energy
+        assert all(EMISSIONS_FACTORS[f] > 0 for f in projection.fuel_types)
+
+    def test_opex_is_expected_over_which_machines_are_replaced(self):
+        yearly = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+        half_rules = [
+            UptakeRule(
+                "space_heating", SpaceHeatingEnum.ELECTRIC_HEAT_PUMP, uptake=0.5
+            ),
+            UptakeRule("cooktop", CooktopEnum.ELECTRIC_INDUCTION, uptake=0.5),
+        ]
+        household = households[1]
+        projection = project_stock_turnover(
+            [household], worn_out_ages[:1], half_rules, years=years[:1]
+        )
+        expected = np.mean(
+            [
+                get_household_totals(get_replacement_household(household, r))["opex"][
+                    yearly
+                ]
+                for r in ([], half_rules[:1], half_rules[1:], half_rules)
+            ]
+        )
+        assert projection.opex[REGIONS.index(household.location)] == pytest.approx(
+            [expected]
+        )
+
+    def test_it_doesnt_depend_on_the_chunk_size(self):
+        ages = np.array([[3, 11, 14, 13], [15, 2, 20, 0], [7, 12, 1, 14]])
+        whole = project_stock_turnover(households, ages, rules, years=years)
+        chunked = project_stock_turnover(
+            households, ages, rules, years=years, chunk_size=2
+        )
+        assert chunked.energy == pytest.approx(whole.energy)
+        assert chunked.emissions == pytest.approx(whole.emissions)
+        assert chunked.opex == pytest.approx(whole.opex)
+        assert chunked.replaced == pytest.approx(whole.replaced)
+
+    def test_it_defaults_to_the_operational_lifetime(self):
+        projection = project_stock_turnover(households[:1], new_ages[:1], [])
+        assert len(projection.years) == 15
+
+    @pytest.mark.parametrize(
+        "ages, weights, stock_rules, match",
+        [
+            (new_ages[:2], None, rules, "Ages need to have shape"),
+            (new_ages, np.ones(2), rules, "Weights need to have shape"),
+            (-worn_out_ages, None, rules, "can't be negative"),
+            (new_ages, None, rules + rules[:1], "only have one uptake rule"),
+        ],
+    )
+    def test_it_checks_its_inputs(self, ages, weights, stock_rules, match):
+        with pytest.raises(ValueError, match=match):
+            project_stock_turnover(households, ages, stock_rules, weights=weights)
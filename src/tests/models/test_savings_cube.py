@@ -0,0 +1,246 @@
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from main import calculate_household_savings
+from models.savings_cube import (
+    CUBE_DIMENSIONS,
+    CUBE_MEASURES,
+    SAVINGS_CUBE_VERSION,
+    build_savings_cube,
+    calculate_cell_values,
+    get_cell_household,
+    get_dimension_weights,
+    get_savings_cube_source,
+    load_savings_cube,
+    main,
+    read_savings_cube,
+    write_savings_cube,
+)
+from openapi_client.models import VehicleFuelTypeEnum
+
+shares = {
+    "location": {"OTAGO": 1000, "AUCKLAND_CENTRAL": 3000},
+    "spaceHeating": {"GAS": 1, "ELECTRIC_HEAT_PUMP": 3},
+    "waterHeating": {"ELECTRIC_RESISTANCE": 1},
+    "cooktop": {"GAS": 0.5, "ELECTRIC_INDUCTION": 0.5},
+    "occupancy": {"2": 0.6, "5": 0.4},
+    "vehicles": {"NONE": 0.2, "PETROL+ELECTRIC": 0.8, "DIESEL": 0},
+}
+
+
+@pytest.fixture(scope="module")
+def cube():
+    return build_savings_cube(shares, max_workers=1)
+
+
+class TestGetDimensionWeights:
+    def test_it_spreads_each_locations_households_over_the_cells(self):
+        labels, households = get_dimension_weights(shares)
+        assert labels[0] == ("OTAGO", "AUCKLAND_CENTRAL")
+        assert labels[CUBE_DIMENSIONS.index("occupancy")] == (2, 5)
+        assert households.shape == (2, 2, 1, 2, 2, 3)
+        assert households.sum(axis=(1, 2, 3, 4, 5)) == pytest.approx([1000, 3000])
+        # GAS is a quarter of space heating, PETROL+ELECTRIC 80% of vehicles
+        assert households[0, 0, 0, 0, 0, 1] == pytest.approx(
+            1000 * 0.25 * 0.5 * 0.6 * 0.8
+        )
+
+    @pytest.mark.parametrize(
+        "update, match",
+        [
+            ({"cooktop": {}}, "need cooktop"),
+            ({"location": {"ATLANTIS": 10}}, "Invalid location"),
+            ({"vehicles": {"PETROL+STEAM": 1}}, "Invalid vehicles"),
+            ({"occupancy": {"2": -1, "3": 2}}, "non-negative"),
+        ],
+    )
+    def test_it_checks_the_shares(self, update, match):
+        with pytest.raises(ValueError, match=match):
+            get_dimension_weights({**shares, **update})
+
+
+class TestGetCellHousehold:
+    def test_it_parses_the_vehicle_mix(self):
+        household = get_cell_household(
+            "OTAGO", "GAS", "GAS", "GAS", 2, "PETROL+ELECTRIC"
+        )
+        assert [v.fuel_type for v in household.vehicles] == [
+            VehicleFuelTypeEnum.PETROL,
+            VehicleFuelTypeEnum.ELECTRIC,
+        ]
+        assert all(v.switch_to_ev for v in household.vehicles)
+        assert household.solar.has_solar is False
+        assert (
+            get_cell_household("OTAGO", "GAS", "GAS", "GAS", 2, "NONE").vehicles == []
+        )
+
+
+class TestCalculateCellValues:
+    def test_it_matches_the_savings_endpoint(self):
+        household = get_cell_household(
+            "OTAGO", "GAS", "ELECTRIC_RESISTANCE", "GAS", 5, "PETROL+ELECTRIC"
+        )
+        savings = calculate_household_savings(household)
+        values = dict(zip(CUBE_MEASURES, calculate_cell_values(household)))
+        assert values["opex.perYear.before"] == savings.opex.per_year.before
+        assert values["emissions.perYear.difference"] == (
+            savings.emissions.per_year.difference
+        )
+        assert values["upfrontCost.total"] == pytest.approx(
+            sum(cost or 0 for cost in savings.upfront_cost.dict().values())
+        )
+
+
+class TestSavingsCube:
+    def test_cells_have_the_households_savings(self, cube):
+        assert cube.values.shape == (len(CUBE_MEASURES), 2, 2, 1, 2, 2, 3)
+        assert cube.values.dtype == np.float32
+        household = get_cell_household(
+            "AUCKLAND_CENTRAL",
+            "ELECTRIC_HEAT_PUMP",
+            "ELECTRIC_RESISTANCE",
+            "GAS",
+            2,
+            "NONE",
+        )
+        assert cube.values[:, 1, 1, 0, 0, 0, 0] == pytest.approx(
+            calculate_cell_values(household)
+        )
+
+    def test_it_rolls_up_everything(self, cube):
+        (row,) = cube.query()
+        assert row["households"] == pytest.approx(4000)
+        opex = cube.values[CUBE_MEASURES.index("opex.perYear.difference")]
+        assert row["opex.perYear.difference.total"] == pytest.approx(
+            (opex * cube.households).sum()
+        )
+        assert row["opex.perYear.difference.mean"] == pytest.approx(
+            row["opex.perYear.difference.total"] / 4000
+        )
+
+    def test_it_slices_and_groups(self, cube):
+        rows = cube.query(
+            {"location": ["OTAGO"], "occupancy": [5]}, ["cooktop", "spaceHeating"]
+        )
+        assert [(row["cooktop"], row["spaceHeating"]) for row in rows] == [
+            ("GAS", "GAS"),
+            ("GAS", "ELECTRIC_HEAT_PUMP"),
+            ("ELECTRIC_INDUCTION", "GAS"),
+            ("ELECTRIC_INDUCTION", "ELECTRIC_HEAT_PUMP"),
+        ]
+        assert sum(row["households"] for row in rows) == pytest.approx(400)
+        cell = cube.values[:, 0, 1, 0, 1, 1, :]
+        households = cube.households[0, 1, 0, 1, 1, :]
+        assert rows[3]["emissions.perYear.after.total"] == pytest.approx(
+            (cell[CUBE_MEASURES.index("emissions.perYear.after")] * households).sum()
+        )
+
+    def test_groups_without_households_have_no_mean(self, cube):
+        rows = cube.query({"vehicles": ["DIESEL", "NONE"]}, ["vehicles"])
+        assert [row["vehicles"] for row in rows] == ["DIESEL", "NONE"]
+        assert rows[0]["households"] == 0
+        assert rows[0]["opex.perYear.after.mean"] is None
+        assert rows[1]["opex.perYear.after.mean"] is not None
+
+    def test_it_checks_the_query(self, cube):
+        with pytest.raises(ValueError, match="Unknown savings cube dimensions"):
+            cube.query(group_by=["solar"])
+        with pytest.raises(ValueError, match="Unknown location in the savings cube"):
+            cube.query({"location": ["WELLINGTON"]})
+
+
+class TestLoadSavingsCube:
+    def test_it_caches_the_cube(self, cube, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text('{"location": {"OTAGO": 1}}')
+        with patch(
+            "models.savings_cube.build_savings_cube", return_value=cube
+        ) as mock_build:
+            load_savings_cube(shares_path)
+            load_savings_cube.cache_clear()
+            loaded = load_savings_cube(shares_path)
+            assert mock_build.call_count == 1
+            with patch(
+                "models.savings_cube.SAVINGS_CUBE_VERSION", SAVINGS_CUBE_VERSION + 1
+            ):
+                load_savings_cube.cache_clear()
+                load_savings_cube(shares_path)
+            assert mock_build.call_count == 2
+        load_savings_cube.cache_clear()
+        assert (tmp_path / "savings_cube.npz").exists()
+        assert loaded.labels == cube.labels
+        assert loaded.query(group_by=["location"]) == cube.query(group_by=["location"])
+
+    def test_it_rebuilds_a_corrupt_cache(self, cube, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text('{"location": {"OTAGO": 1}}')
+        # e.g. a cache left half written
+        (tmp_path / "savings_cube.npz").write_bytes(b"PK\x03\x04 not a whole zip")
+        with patch(
+            "models.savings_cube.build_savings_cube", return_value=cube
+        ) as mock_build:
+            read_savings_cube(shares_path)
+            read_savings_cube(shares_path)
+        assert mock_build.call_count == 1
+        # The cache is written to a temporary file that's moved over it
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "savings_cube.npz",
+            "shares.json",
+        ]
+
+    def test_concurrent_reads_share_one_build(self, cube, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text('{"location": {"OTAGO": 1}}')
+
+        def build(*args):
+            time.sleep(0.2)
+            return cube
+
+        cubes = []
+        with patch(
+            "models.savings_cube.build_savings_cube", side_effect=build
+        ) as mock_build:
+            threads = [
+                threading.Thread(
+                    target=lambda: cubes.append(read_savings_cube(shares_path))
+                )
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert mock_build.call_count == 1
+        assert [c.labels for c in cubes] == [cube.labels] * 2
+
+    def test_it_can_be_built_offline(self, cube, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text('{"location": {"OTAGO": 1}}')
+        cache_path = tmp_path / "cache" / "cube.npz"
+        cache_path.parent.mkdir()
+        with patch("models.savings_cube.build_savings_cube", return_value=cube):
+            main(["--shares", str(shares_path), "--cache", str(cache_path)])
+        with patch(
+            "models.savings_cube.build_savings_cube", side_effect=AssertionError
+        ):
+            loaded = read_savings_cube(shares_path, cache_path)
+        assert loaded.query(group_by=["location"]) == cube.query(group_by=["location"])
+
+    def test_a_failed_write_leaves_the_cache_alone(self, cube, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text('{"location": {"OTAGO": 1}}')
+        cache_path = tmp_path / "savings_cube.npz"
+        source = get_savings_cube_source(shares_path)
+        write_savings_cube(cube, source, cache_path)
+        with patch("numpy.savez_compressed", side_effect=OSError):
+            with pytest.raises(OSError):
+                write_savings_cube(cube, source, cache_path)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "savings_cube.npz",
+            "shares.json",
+        ]
+        assert read_savings_cube(shares_path).labels == cube.labels
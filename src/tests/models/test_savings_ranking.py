@@ -0,0 +1,149 @@
+import os
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from models.savings_cube import CUBE_MEASURES, SavingsCube, get_dimension_weights
+from models.savings_ranking import (
+    SavingsDistribution,
+    SavingsRankingIndex,
+    build_savings_ranking,
+    rank_household_savings,
+)
+from openapi_client.models import (
+    Emissions,
+    EmissionsValues,
+    LocationEnum,
+    Opex,
+    OpexValues,
+)
+from tests.mocks import mock_household
+
+labels, households = get_dimension_weights(
+    {
+        "location": {"OTAGO": 1000, "AUCKLAND_CENTRAL": 3000},
+        "spaceHeating": {"GAS": 1, "WOOD": 3},
+        "waterHeating": {"GAS": 1},
+        "cooktop": {"GAS": 1},
+        "occupancy": {"2": 1, "4": 1},
+        "vehicles": {"NONE": 1, "PETROL": 1},
+    }
+)
+# Each cell's savings are its index, so households save more with WOOD, at occupancy
+# 4 and with a PETROL car
+values = np.zeros((len(CUBE_MEASURES),) + households.shape, dtype=np.float32)
+for measure in ["opex.perYear.difference", "emissions.perYear.difference"]:
+    values[CUBE_MEASURES.index(measure)] = -np.arange(households.size).reshape(
+        households.shape
+    )
+cube = SavingsCube(labels=labels, households=households, values=values)
+
+
+def get_savings(opex: float, emissions: float):
+    return (
+        Opex(perYear=OpexValues(before=0, after=-opex, difference=-opex)),
+        Emissions(
+            perYear=EmissionsValues(before=0, after=-emissions, difference=-emissions)
+        ),
+    )
+
+
+class TestSavingsDistribution:
+    distribution = SavingsDistribution(
+        savings=np.array([1, 2, 2, 5], dtype=np.float32),
+        households=np.array([10, 20, 30, 40], dtype=float),
+    )
+
+    @pytest.mark.parametrize(
+        "savings, percentile",
+        [(0, 0), (1, 12.5), (1.5, 25), (2, 50), (4, 75), (5, 87.5), (10, 100)],
+    )
+    def test_it_counts_the_households_that_save_less(self, savings, percentile):
+        assert self.distribution.get_percentile(savings) == percentile
+
+
+class TestBuildSavingsRanking:
+    ranking = build_savings_ranking(cube)
+
+    def test_it_ranks_within_the_location_and_occupancy(self):
+        household = mock_household.copy(update={"occupancy": 4})
+        # AUCKLAND_CENTRAL at occupancy 4 has the cells 10, 11, 14 & 15, with 1/8,
+        # 1/8, 3/8 & 3/8 of its households
+        percentiles = self.ranking.rank(household, *get_savings(14, 11))
+        # 25% + half of 37.5%, and 12.5% + half of 12.5%, to 1 decimal place
+        assert percentiles.opex == 43.8
+        assert percentiles.emissions == 18.8
+        assert percentiles.households == pytest.approx(1500)
+
+    def test_households_without_occupancy_are_ranked_in_their_location(self):
+        otago = mock_household.copy(
+            update={"location": LocationEnum.OTAGO, "occupancy": None}
+        )
+        percentiles = self.ranking.rank(otago, *get_savings(100, 0))
+        assert percentiles.opex == 100
+        assert percentiles.households == pytest.approx(1000)
+        # 7 is in the 5+ bucket, which has no households here
+        assert (
+            self.ranking.rank(otago.copy(update={"occupancy": 7}), *get_savings(0, 0))
+            is None
+        )
+
+    def test_households_elsewhere_arent_ranked(self):
+        household = mock_household.copy(update={"location": LocationEnum.WEST_COAST})
+        assert self.ranking.rank(household, *get_savings(1, 1)) is None
+        assert rank_household_savings(None, mock_household, *get_savings(1, 1)) is None
+
+
+class TestSavingsRankingIndex:
+    def test_it_builds_the_ranking_in_the_background(self, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text("{}")
+        index = SavingsRankingIndex(shares_path, check_interval=0)
+        with patch(
+            "models.savings_ranking.read_savings_cube", return_value=cube
+        ) as mock_read:
+            assert index.get() is None
+            ranking = index.wait(timeout=5)
+            assert ranking is not None
+            assert index.get() is ranking
+            mock_read.assert_called_once()
+
+            # The shares changed, so the ranking is rebuilt while the old one is served
+            os.utime(shares_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+            assert index.get() is ranking
+            assert index.wait(timeout=5) is not ranking
+            assert mock_read.call_count == 2
+
+    def test_it_keeps_the_last_ranking_if_a_rebuild_fails(self, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text("{}")
+        index = SavingsRankingIndex(shares_path, check_interval=0)
+        with patch("models.savings_ranking.read_savings_cube", return_value=cube):
+            index.get()
+            ranking = index.wait(timeout=5)
+        os.utime(shares_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        with patch(
+            "models.savings_ranking.read_savings_cube", side_effect=ValueError
+        ) as mock_read:
+            index.get()
+            assert index.wait(timeout=5) is ranking
+            # It tries again at the next check
+            index.get()
+            index.wait(timeout=5)
+            assert mock_read.call_count == 2
+
+    def test_it_checks_for_changes_at_most_every_interval(self, tmp_path):
+        shares_path = tmp_path / "shares.json"
+        shares_path.write_text("{}")
+        index = SavingsRankingIndex(shares_path, check_interval=3600)
+        with patch(
+            "models.savings_ranking.read_savings_cube", return_value=cube
+        ) as mock_read:
+            index.get()
+            index.wait(timeout=5)
+            os.utime(shares_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+            index.get()
+            index.wait(timeout=5)
+            mock_read.assert_called_once()
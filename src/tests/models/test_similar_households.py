@@ -0,0 +1,149 @@
+import json
+import random
+
+import numpy as np
+import pytest
+
+from models.savings_cube import CUBE_MEASURES, calculate_cell_values
+from models.similar_households import (
+    build_similar_households_index,
+    find_similar_households,
+    get_similarity_features,
+    load_similar_households_index,
+    main,
+    read_reference_population,
+)
+from openapi_client.models import Battery, CooktopEnum, LocationEnum
+from tests.mocks import mock_household
+from tests.savings.closed_form.test_evaluate_household_model import (
+    make_random_household,
+)
+from utils.arrow_batch import write_household_batch
+
+rng = random.Random(0)
+locations = [LocationEnum.AUCKLAND_CENTRAL, LocationEnum.OTAGO]
+population = [
+    make_random_household(rng).copy(update={"location": rng.choice(locations)})
+    for _ in range(300)
+]
+invalid_household = mock_household.copy(
+    update={"battery": Battery(has_battery=True, capacity=-10)}
+)
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    path = tmp_path_factory.mktemp("similar_households")
+    build_similar_households_index(
+        population + [invalid_household], path, max_workers=1
+    )
+    return load_similar_households_index(path)
+
+
+def brute_force(index, household, k):
+    point = get_similarity_features(household, index.scales)
+    distances = np.sqrt(((index.features - point) ** 2).sum(axis=1))
+    in_location = [
+        index.get_household(row).location == household.location
+        for row in range(len(index.features))
+    ]
+    return np.sort(distances[in_location])[:k]
+
+
+class TestGetSimilarityFeatures:
+    def test_a_different_appliance_is_a_standard_deviation_away(self):
+        scales = np.array([1.0, 100.0, 2.0])
+        features = get_similarity_features(mock_household, scales)
+        other = get_similarity_features(
+            mock_household.copy(update={"cooktop": CooktopEnum.GAS}), scales
+        )
+        assert np.linalg.norm(features - other) == pytest.approx(1)
+        # Occupancy 4 scales energy by 1.07, 300 kms/week, 7 kW of solar to install
+        assert features[:3] == pytest.approx([1.07, 3, 3.5])
+
+
+class TestSimilarHouseholdsIndex:
+    def test_it_leaves_out_households_that_cant_be_scored(self, index):
+        assert len(index.features) == len(population)
+        assert index.savings.shape == (len(population), len(CUBE_MEASURES))
+
+    @pytest.mark.parametrize("k", [1, 5, 40])
+    def test_it_finds_the_nearest_households_in_the_location(self, index, k):
+        for household in [make_random_household(rng) for _ in range(20)]:
+            household.location = rng.choice(locations)
+            distances = [distance for _, distance in index.query(household, k)]
+            assert distances == pytest.approx(
+                brute_force(index, household, k), abs=1e-5
+            )
+
+    def test_a_household_in_the_index_is_nearest_to_itself(self, index):
+        household = population[7]
+        row, distance = index.query(household, 1)[0]
+        assert distance == 0
+        assert index.get_household(row) == household
+
+    def test_households_elsewhere_have_none(self, index):
+        household = mock_household.copy(update={"location": LocationEnum.WEST_COAST})
+        assert index.query(household) == []
+
+
+class TestFindSimilarHouseholds:
+    def test_it_returns_the_households_and_their_savings(self, index):
+        household = population[3]
+        similar = find_similar_households(index, household, k=3)
+        assert len(similar) == 3
+        assert similar[0].household == household
+        assert similar[0].distance == 0
+        assert [s.distance for s in similar] == sorted(s.distance for s in similar)
+        values = dict(
+            zip(CUBE_MEASURES, calculate_cell_values(household.copy(deep=True)))
+        )
+        assert similar[0].opex.difference == pytest.approx(
+            values["opex.perYear.difference"]
+        )
+        assert similar[0].emissions.before == pytest.approx(
+            values["emissions.perYear.before"]
+        )
+
+    def test_there_are_none_without_an_index(self):
+        assert find_similar_households(None, mock_household) is None
+
+
+class TestLoadSimilarHouseholdsIndex:
+    def test_it_needs_an_index(self, tmp_path):
+        assert load_similar_households_index(tmp_path) is None
+
+    def test_it_doesnt_load_old_indexes(self, tmp_path):
+        (tmp_path / "index.json").write_text(json.dumps({"version": 0}))
+        assert load_similar_households_index(tmp_path) is None
+
+    def test_it_memory_maps_the_arrays(self, index):
+        assert not index.features.flags.owndata
+        assert not index.features.flags.writeable
+
+
+def test_it_needs_households_to_index(tmp_path):
+    with pytest.raises(ValueError, match="No households"):
+        build_similar_households_index([invalid_household], tmp_path, max_workers=1)
+
+
+class TestReadReferencePopulation:
+    def test_it_reads_json_lines(self, tmp_path):
+        path = tmp_path / "population.jsonl"
+        path.write_text("\n".join(h.to_json() for h in population[:3]) + "\n\n")
+        assert read_reference_population(path) == population[:3]
+
+    def test_it_reads_arrow_streams(self, tmp_path):
+        path = tmp_path / "population.arrow"
+        path.write_bytes(write_household_batch(population[:3]))
+        households = read_reference_population(path)
+        assert [h.location for h in households] == [h.location for h in population[:3]]
+        assert [h.vehicles for h in households] == [h.vehicles for h in population[:3]]
+
+
+def test_it_can_be_built_offline(tmp_path):
+    population_path = tmp_path / "population.jsonl"
+    population_path.write_text("\n".join(h.to_json() for h in population[:20]))
+    main([str(population_path), "--index", str(tmp_path / "index"), "--workers", "1"])
+    index = load_similar_households_index(tmp_path / "index")
+    assert len(index.features) == 20
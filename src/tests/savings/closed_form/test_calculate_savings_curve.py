@@ -0,0 +1,145 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from models.electrify_household import electrify_household
+from openapi_client.models import Sweep
+from savings.closed_form.calculate_savings_curve import (
+    MAX_SAVINGS_CURVE_POINTS,
+    calculate_savings_curve,
+    get_sweep_values,
+)
+from savings.closed_form.evaluate_household_model import (
+    calculate_emissions_closed_form,
+    calculate_opex_closed_form,
+)
+from savings.upfront_cost.calculate_upfront_cost import calculate_upfront_cost
+from tests.mocks import mock_household
+
+
+class TestGetSweepValues:
+    def test_it_includes_the_stop(self):
+        values = get_sweep_values(
+            Sweep(field="solar.size", start=0, stop=15, step=0.25)
+        )
+        assert len(values) == 61
+        assert values[-1] == 15
+        assert values[1] == 0.25
+
+    def test_it_stops_before_a_partial_step(self):
+        values = get_sweep_values(Sweep(field="solar.size", start=1, stop=2, step=0.3))
+        assert values.tolist() == [1, 1.3, 1.6, 1.9]
+
+    @pytest.mark.parametrize(
+        "start, stop, step",
+        [(0, 10, 0), (0, 10, -1), (-1, 10, 1), (10, 0, 1)],
+    )
+    def test_it_rejects_invalid_ranges(self, start, stop, step):
+        with pytest.raises(ValueError):
+            get_sweep_values(
+                Sweep(field="solar.size", start=start, stop=stop, step=step)
+            )
+
+    def test_it_rejects_too_many_points(self):
+        with pytest.raises(ValueError):
+            get_sweep_values(
+                Sweep(
+                    field="solar.size", start=0, stop=MAX_SAVINGS_CURVE_POINTS, step=1
+                )
+            )
+
+
+class TestCalculateSavingsCurve:
+    def test_it_matches_the_savings_at_each_point(self):
+        sweeps = [
+            Sweep(field="solar.size", start=0, stop=10, step=2.5),
+            Sweep(field="vehicles.1.kmsPerWeek", start=0, stop=400, step=100),
+        ]
+        curve = calculate_savings_curve(mock_household, sweeps)
+
+        assert [axis.field for axis in curve.axes] == [
+            "solar.size",
+            "vehicles.1.kmsPerWeek",
+        ]
+        assert curve.axes[0].values == [0, 2.5, 5, 7.5, 10]
+        assert len(curve.upfront_cost) == 25
+
+        for i, size in enumerate(curve.axes[0].values):
+            for j, kms in enumerate(curve.axes[1].values):
+                vehicles = list(mock_household.vehicles)
+                vehicles[1] = vehicles[1].copy(update={"kms_per_week": int(kms)})
+                household = mock_household.copy(
+                    update={
+                        "solar": mock_household.solar.copy(update={"size": size}),
+                        "vehicles": vehicles,
+                    }
+                )
+                electrified = electrify_household(household)
+                opex = calculate_opex_closed_form(household, electrified)
+                emissions = calculate_emissions_closed_form(household, electrified)
+                upfront_cost = calculate_upfront_cost(household, electrified)
+
+                k = i * len(curve.axes[1].values) + j
+                for period in ["per_week", "per_year", "over_lifetime"]:
+                    for value in ["before", "after", "difference"]:
+                        assert getattr(getattr(curve.opex, period), value)[
+                            k
+                        ] == getattr(getattr(opex, period), value)
+                        assert getattr(getattr(curve.emissions, period), value)[
+                            k
+                        ] == getattr(getattr(emissions, period), value)
+                assert curve.upfront_cost[k] == pytest.approx(
+                    sum(upfront_cost.dict().values())
+                )
+
+    @patch("savings.closed_form.evaluate_household_model.SCHEDULE_FLEXIBLE_LOADS", True)
+    def test_it_matches_the_savings_when_scheduling(self):
+        curve = calculate_savings_curve(
+            mock_household, [Sweep(field="solar.size", start=0, stop=10, step=5)]
+        )
+        for k, size in enumerate(curve.axes[0].values):
+            household = mock_household.copy(
+                update={"solar": mock_household.solar.copy(update={"size": size})}
+            )
+            opex = calculate_opex_closed_form(
+                household, electrify_household(household)
+            ).per_year
+            assert curve.opex.per_year.before[k] == opex.before
+            assert curve.opex.per_year.after[k] == opex.after
+
+    def test_it_sweeps_battery_capacity(self):
+        curve = calculate_savings_curve(
+            mock_household,
+            [Sweep(field="battery.capacity", start=0, stop=20, step=5)],
+        )
+        assert len(curve.opex.per_year.after) == 5
+        # More storage never costs more to run
+        assert np.all(np.diff(curve.opex.per_year.after) <= 0)
+
+    def test_it_does_not_change_the_household(self):
+        household = mock_household.copy(deep=True)
+        calculate_savings_curve(
+            household, [Sweep(field="solar.size", start=0, stop=1, step=1)]
+        )
+        assert household == mock_household
+
+    @pytest.mark.parametrize(
+        "sweeps",
+        [
+            [Sweep(field="solar.orientation", start=0, stop=1, step=1)],
+            [Sweep(field="vehicles.5.kmsPerWeek", start=0, stop=100, step=10)],
+            [Sweep(field="vehicles.0.kmsPerWeek", start=0, stop=100, step=0.5)],
+            [
+                Sweep(field="solar.size", start=0, stop=1, step=1),
+                Sweep(field="solar.size", start=0, stop=2, step=1),
+            ],
+            [
+                Sweep(field="solar.size", start=0, stop=1000, step=1),
+                Sweep(field="battery.capacity", start=0, stop=1000, step=1),
+            ],
+        ],
+    )
+    def test_it_rejects_invalid_sweeps(self, sweeps):
+        with pytest.raises(ValueError):
+            calculate_savings_curve(mock_household, sweeps)
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from constants.utils import PeriodEnum
+from openapi_client.models import (
+    Battery,
+    LocationEnum,
+    Solar,
+    SpaceHeatingEnum,
+    Vehicle,
+    VehicleFuelTypeEnum,
+)
+from savings.closed_form.compile_household_model import (
+    CLOSED_FORM_PERIODS,
+    compile_household_model,
+    compile_monthly_household_model,
+    get_days_per_month,
+)
+from savings.emissions.get_machine_emissions import get_vehicle_emissions
+from savings.energy.get_electricity_consumption import get_battery_storage_capacity
+from tests.mocks import mock_household
+from utils.memoise_stage import STAGE_CACHES
+
+
+class TestCompileHouseholdModel:
+    def test_it_has_a_coefficient_per_vehicle_and_period(self):
+        model = compile_household_model(mock_household)
+        assert model.e_needs.shape == (len(CLOSED_FORM_PERIODS),)
+        assert model.emissions_per_km.shape == (
+            len(CLOSED_FORM_PERIODS),
+            len(mock_household.vehicles),
+        )
+        petrol = Vehicle(fuel_type=VehicleFuelTypeEnum.PETROL, kms_per_week=1)
+        assert model.emissions_per_km[1, 0] == get_vehicle_emissions(
+            [petrol], PeriodEnum.YEARLY
+        )
+        # Petrol & diesel cars don't use electricity
+        np.testing.assert_array_equal(model.e_needs_per_km, 0)
+
+    def test_it_ignores_continuous_inputs(self):
+        compile_household_model(mock_household)
+        other = mock_household.copy(
+            update={
+                "vehicles": [
+                    v.copy(update={"kms_per_week": 1}) for v in mock_household.vehicles
+                ],
+                "battery": Battery(has_battery=False, capacity=2),
+            }
+        )
+        compile_household_model(other)
+        assert STAGE_CACHES["compile_household_model"].hits == 1
+
+    def test_it_has_no_generation_without_solar(self):
+        household = mock_household.copy(update={"solar": Solar(has_solar=False)})
+        np.testing.assert_array_equal(
+            compile_household_model(household).e_solar_per_kw, 0
+        )
+
+    def test_it_has_battery_storage_with_a_battery(self):
+        household = mock_household.copy(
+            update={
+                "solar": Solar(has_solar=True, size=5),
+                "battery": Battery(has_battery=True, capacity=10),
+            }
+        )
+        model = compile_household_model(household)
+        assert model.e_battery_per_kwh[0] == get_battery_storage_capacity(
+            1, PeriodEnum.WEEKLY
+        )
+
+
+class TestCompileMonthlyHouseholdModel:
+    household = mock_household.copy(
+        update={
+            "location": LocationEnum.OTAGO,
+            "space_heating": SpaceHeatingEnum.ELECTRIC_HEAT_PUMP,
+            "solar": Solar(has_solar=True, size=5),
+            "battery": Battery(has_battery=True, capacity=10),
+        }
+    )
+
+    def test_the_months_add_up_to_the_year(self):
+        monthly = compile_monthly_household_model(self.household)
+        yearly = compile_household_model(self.household)
+        yearly_row = CLOSED_FORM_PERIODS.index(PeriodEnum.YEARLY)
+        for name in [
+            "e_needs",
+            "e_solar_per_kw",
+            "e_battery_per_kwh",
+            "emissions",
+            "fixed_costs",
+            "emissions_per_km",
+        ]:
+            np.testing.assert_allclose(
+                getattr(monthly, name).sum(axis=0), getattr(yearly, name)[yearly_row]
+            )
+        assert monthly.e_needs.shape == (12,)
+        np.testing.assert_array_equal(monthly.volume_rate, yearly.volume_rate[0])
+
+    def test_heating_is_in_winter_and_solar_in_summer(self):
+        monthly = compile_monthly_household_model(self.household)
+        days = get_days_per_month()
+        # July vs January, per day
+        assert monthly.e_needs[6] / days[6] > 1.5 * monthly.e_needs[0] / days[0]
+        assert monthly.e_solar_per_kw[0] / days[0] > 3 * (
+            monthly.e_solar_per_kw[6] / days[6]
+        )
+        # Everything else is the same every day
+        np.testing.assert_allclose(
+            monthly.fixed_costs / days, monthly.fixed_costs[0] / days[0]
+        )
+
+
+class TestGetDaysPerMonth:
+    def test_the_months_add_up_to_the_year(self):
+        days = get_days_per_month()
+        assert days.sum() == pytest.approx(365.25)
+        assert days[1] < days[0]
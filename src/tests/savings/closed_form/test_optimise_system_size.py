@@ -0,0 +1,179 @@
+import random
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from models.electrify_household import electrify_household
+from openapi_client.models import Battery, Solar, SystemSizeObjectiveEnum
+from savings.closed_form.compile_household_model import compile_household_model
+from savings.closed_form.evaluate_household_model import (
+    evaluate_linear_model,
+    get_household_totals,
+)
+from savings.closed_form.optimise_system_size import optimise_system_size
+from savings.upfront_cost.get_machine_upfront_cost import (
+    BATTERY_COST_PER_KWH,
+    SOLAR_COST_PER_KW,
+)
+from tests.mocks import mock_household
+from tests.savings.closed_form.test_evaluate_household_model import (
+    make_random_household,
+)
+from utils.clean_household import clean_household
+
+household_installing_both = mock_household.copy(
+    update={
+        "solar": Solar(has_solar=False, install_solar=True),
+        "battery": Battery(has_battery=False, install_battery=True),
+    }
+)
+
+
+def brute_force(household, solar_sizes, battery_capacities):
+    """Net savings & payback of every system on a grid"""
+    electrified = electrify_household(clean_household(household.copy()))
+    model = compile_household_model(
+        electrified.copy(
+            update={
+                "solar": Solar(has_solar=True, size=1),
+                "battery": Battery(has_battery=True, capacity=1),
+            }
+        )
+    )
+    kms = np.array([[v.kms_per_week for v in electrified.vehicles]], dtype=float)
+    solar, battery = [
+        grid.ravel() for grid in np.meshgrid(solar_sizes, battery_capacities)
+    ]
+    valid = (solar > 0) | (battery == 0)
+    solar, battery = solar[valid], battery[valid]
+
+    opex = evaluate_linear_model(
+        model, np.repeat(kms, len(solar), axis=0), solar, battery
+    )
+    opex_without_system = evaluate_linear_model(model, kms, np.zeros(1), np.zeros(1))[
+        "opex"
+    ][0]
+    savings = opex_without_system - opex["opex"]
+    cost = SOLAR_COST_PER_KW * solar + BATTERY_COST_PER_KWH * battery
+    payback = np.full(len(cost), np.inf)
+    pays_back = (savings[:, 1] > 0) & (cost > 0)
+    payback[pays_back] = cost[pays_back] / savings[pays_back, 1]
+    return savings[:, 2] - cost, payback
+
+
+rng = random.Random(1)
+random_households = [
+    make_random_household(rng).copy(
+        update={
+            "solar": Solar(has_solar=False, install_solar=True),
+            "battery": Battery(has_battery=False, install_battery=True),
+        }
+    )
+    for _ in range(20)
+]
+
+
+class TestOptimiseSystemSize:
+    @pytest.mark.parametrize(
+        "household", [household_installing_both] + random_households
+    )
+    def test_it_beats_every_system_on_a_grid(self, household):
+        net_savings, payback = brute_force(
+            household, np.arange(0, 15.01, 0.25), np.arange(0, 20.01, 0.25)
+        )
+
+        best = optimise_system_size(household)
+        assert best.net_savings_over_lifetime >= net_savings.max() - 0.01
+
+        quickest = optimise_system_size(household, SystemSizeObjectiveEnum.PAYBACK)
+        if np.isfinite(payback.min()):
+            assert quickest.payback_years <= payback.min() + 0.01
+
+    def test_it_respects_the_maximum_sizes(self):
+        best = optimise_system_size(
+            household_installing_both, max_solar_size=3, max_battery_capacity=2
+        )
+        assert 0 <= best.solar_size <= 3
+        assert 0 <= best.battery_capacity <= 2
+
+    @patch("savings.closed_form.evaluate_household_model.SCHEDULE_FLEXIBLE_LOADS", True)
+    def test_it_matches_the_savings_when_scheduling(self):
+        best = optimise_system_size(household_installing_both)
+        assert best.solar_size > 0
+
+        def yearly_opex(solar, battery):
+            household = mock_household.copy(update={"solar": solar, "battery": battery})
+            electrified = electrify_household(clean_household(household))
+            return get_household_totals(electrified)["opex"][1]
+
+        savings = yearly_opex(
+            Solar(has_solar=False, install_solar=False),
+            Battery(has_battery=False, install_battery=False),
+        ) - yearly_opex(
+            Solar(has_solar=True, size=best.solar_size),
+            Battery(has_battery=True, capacity=best.battery_capacity),
+        )
+        # Less the rounding of the sizes
+        assert best.opex_savings_per_year == pytest.approx(savings, abs=1)
+
+    @patch("savings.closed_form.optimise_system_size.OPTIMISE_BATTERY_DISPATCH", True)
+    @patch(
+        "savings.closed_form.evaluate_household_model.OPTIMISE_BATTERY_DISPATCH", True
+    )
+    @patch("utils.validate_household.OPTIMISE_BATTERY_DISPATCH", True)
+    def test_it_sizes_a_battery_without_solar_when_dispatch_is_on(self):
+        household = mock_household.copy(
+            update={
+                "solar": Solar(has_solar=False, install_solar=False),
+                "battery": Battery(has_battery=False, install_battery=True),
+            }
+        )
+        best = optimise_system_size(
+            household, max_solar_size=0, max_battery_capacity=10
+        )
+        assert best.solar_size == 0
+        assert 0 <= best.battery_capacity <= 10
+        assert best.net_savings_over_lifetime >= 0
+
+    def test_it_keeps_an_existing_solar_size(self):
+        household = household_installing_both.copy(
+            update={"solar": Solar(has_solar=True, size=4)}
+        )
+        best = optimise_system_size(household)
+        assert best.solar_size == 4
+        # Only the battery is paid for. Its capacity is rounded to 2 dp.
+        assert best.upfront_cost == pytest.approx(
+            BATTERY_COST_PER_KWH * best.battery_capacity, abs=5
+        )
+
+    def test_it_has_nothing_to_size_with_both_systems(self):
+        household = mock_household.copy(
+            update={
+                "solar": Solar(has_solar=True, size=4),
+                "battery": Battery(has_battery=True, capacity=10),
+            }
+        )
+        best = optimise_system_size(household)
+        assert best.solar_size == 4
+        assert best.battery_capacity == 10
+        assert best.upfront_cost == 0
+        assert best.net_savings_over_lifetime == 0
+        assert best.payback_years is None
+
+    def test_it_rejects_invalid_households(self):
+        household = mock_household.copy(
+            update={"battery": Battery(has_battery=True, capacity=-10)}
+        )
+        with pytest.raises(ValueError):
+            optimise_system_size(household)
+
+    def test_it_rejects_a_battery_without_solar(self):
+        household = mock_household.copy(
+            update={
+                "solar": Solar(has_solar=False, install_solar=False),
+                "battery": Battery(has_battery=True, capacity=10),
+            }
+        )
+        with pytest.raises(ValueError):
+            optimise_system_size(household)
@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.utils import PeriodEnum
+from models.electrify_household import electrify_household
+from openapi_client.models import SpaceHeatingEnum
+from savings.emissions.calculate_emissions import (
+    calculate_emissions,
+    get_total_emissions,
+)
+from savings.emissions.calculate_emissions_trajectory import (
+    calculate_emissions_trajectory,
+    get_replaced_fractions,
+    get_yearly_emissions_by_category,
+)
+from tests.mocks import mock_household, mock_household_electrified
+from utils.grid_emissions import get_lifetime_years
+
+households = [
+    mock_household,
+    mock_household_electrified,
+    mock_household.copy(update={"vehicles": [], "occupancy": 1}),
+    mock_household.copy(update={"space_heating": SpaceHeatingEnum.LPG}),
+]
+
+
+class TestGetReplacedFractions:
+    def test_machines_are_replaced_as_they_wear_out(self):
+        replaced = get_replaced_fractions(15)
+        space_heating = replaced[PROFILE_CATEGORIES.index("space_heating")]
+        assert space_heating[0] == pytest.approx(1 / 15)
+        assert space_heating[-1] == 1
+        assert np.all(np.diff(space_heating) > 0)
+        # Other appliances don't change
+        assert np.all(replaced[PROFILE_CATEGORIES.index("other_appliances")] == 1)
+
+
+class TestGetYearlyEmissionsByCategory:
+    @pytest.mark.parametrize("time_varying", [False, True])
+    def test_it_matches_the_total_emissions(self, time_varying):
+        with patch(
+            "savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS",
+            time_varying,
+        ):
+            emissions = get_yearly_emissions_by_category(
+                households, get_lifetime_years()
+            )
+            for household, by_category in zip(households, emissions):
+                assert by_category[:, 0].sum() == pytest.approx(
+                    get_total_emissions(
+                        household, PeriodEnum.YEARLY, household.location
+                    )
+                )
+                assert by_category.sum() == pytest.approx(
+                    get_total_emissions(
+                        household,
+                        PeriodEnum.OPERATIONAL_LIFETIME,
+                        household.location,
+                    )
+                )
+
+    def test_the_years_are_the_same_with_a_flat_emissions_factor(self):
+        emissions = get_yearly_emissions_by_category(households, get_lifetime_years())
+        assert emissions.shape == (4, len(PROFILE_CATEGORIES), 15)
+        assert np.allclose(emissions, emissions[:, :, :1])
+
+    @patch("savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS", True)
+    def test_electricity_emissions_fall_as_the_grid_decarbonises(self):
+        emissions = get_yearly_emissions_by_category(
+            [mock_household_electrified], get_lifetime_years()
+        )[0].sum(axis=0)
+        assert np.all(np.diff(emissions) < 0)
+
+
+class TestCalculateEmissionsTrajectory:
+    def test_it_covers_each_year_of_the_lifetime(self):
+        electrified = electrify_household(mock_household)
+        trajectory = calculate_emissions_trajectory(mock_household, electrified)
+        assert [year.year for year in trajectory] == list(get_lifetime_years())
+
+        emissions = calculate_emissions(mock_household, electrified)
+        assert sum(year.emissions.before for year in trajectory) == pytest.approx(
+            emissions.over_lifetime.before, abs=0.1
+        )
+        # Once every machine has been replaced, it's the electrified household
+        assert trajectory[-1].emissions.after == pytest.approx(
+            emissions.per_year.after, abs=0.01
+        )
+
+    def test_the_machines_are_replaced_gradually(self):
+        electrified = electrify_household(mock_household)
+        trajectory = calculate_emissions_trajectory(mock_household, electrified)
+        after = [year.emissions.after for year in trajectory]
+        assert np.all(np.diff(after) < 0)
+        assert trajectory[0].emissions.difference > trajectory[-1].emissions.difference
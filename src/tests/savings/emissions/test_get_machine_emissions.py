@@ -18,6 +18,7 @@ from openapi_client.models.location_enum import LocationEnum
 from savings.emissions.get_machine_emissions import (
     get_appliance_emissions,
     get_emissions_per_day,
+    get_grid_emissions_multiplier,
     get_other_appliance_emissions,
     get_vehicle_emissions,
 )
@@ -261,3 +262,66 @@ class TestGetVehicleEmissionsPerDay(TestCase):
         )
         expected = ((self.petrol * (250 / 210)) + (self.ev * (250 / 210))) * 7
         assert result == expected
+
+
+class TestGetGridEmissionsMultiplier:
+    def test_it_is_one_by_default(self):
+        assert get_grid_emissions_multiplier("space_heating", PeriodEnum.YEARLY) == 1
+
+    @patch("savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS", True)
+    def test_it_weights_each_category_by_when_it_uses_electricity(self):
+        # Space heating is in winter, when the grid burns more gas & coal
+        space_heating = get_grid_emissions_multiplier("space_heating")
+        assert space_heating > 1
+        assert space_heating > get_grid_emissions_multiplier("other_appliances")
+
+    @patch("savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS", True)
+    def test_the_lifetime_follows_the_grids_decarbonisation(self):
+        yearly = get_grid_emissions_multiplier("vehicles", PeriodEnum.YEARLY)
+        lifetime = get_grid_emissions_multiplier(
+            "vehicles", PeriodEnum.OPERATIONAL_LIFETIME
+        )
+        assert get_grid_emissions_multiplier("vehicles", PeriodEnum.WEEKLY) == yearly
+        assert lifetime < yearly
+
+    @patch("savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS", True)
+    def test_it_only_changes_electricity_emissions(self):
+        multiplier = get_grid_emissions_multiplier(
+            "water_heating", PeriodEnum.OPERATIONAL_LIFETIME
+        )
+        for water_heating, expected in [
+            (WaterHeatingEnum.ELECTRIC_HEAT_PUMP, multiplier),
+            (WaterHeatingEnum.GAS, 1),
+        ]:
+            with patch(
+                "savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS",
+                False,
+            ):
+                flat = get_appliance_emissions(
+                    water_heating,
+                    WATER_HEATING_INFO,
+                    LocationEnum.OTAGO,
+                    period=PeriodEnum.OPERATIONAL_LIFETIME,
+                )
+            varying = get_appliance_emissions(
+                water_heating,
+                WATER_HEATING_INFO,
+                LocationEnum.OTAGO,
+                period=PeriodEnum.OPERATIONAL_LIFETIME,
+            )
+            assert varying == pytest.approx(flat * expected)
+
+    @patch("savings.emissions.get_machine_emissions.TIME_VARYING_GRID_EMISSIONS", True)
+    def test_it_changes_evs_and_hybrids_electricity(self):
+        multiplier = get_grid_emissions_multiplier("vehicles")
+        petrol = 31.4 * 0.258
+        ev = 7.324 * 0.074 * multiplier
+        assert get_vehicle_emissions([mock_vehicle_ev]) == pytest.approx(
+            ev * (250 / 210)
+        )
+        assert get_vehicle_emissions([mock_vehicle_phev]) == pytest.approx(
+            (petrol * 0.6 + ev * 0.4) * (175 / 210)
+        )
+        assert get_vehicle_emissions([mock_vehicle_petrol]) == pytest.approx(
+            petrol * (250 / 210)
+        )
@@ -0,0 +1,191 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from constants.fuel_stats import FuelTypeEnum
+from constants.utils import PeriodEnum
+from openapi_client.models import (
+    LocationEnum,
+    MeterCalibration,
+    MeterDataFormatEnum,
+    CooktopEnum,
+    SpaceHeatingEnum,
+    WaterHeatingEnum,
+)
+from savings.emissions.calculate_emissions import get_total_emissions
+from savings.energy.calibrate_energy_needs import (
+    calibrate_energy_needs,
+    disaggregate_meter_data,
+    get_daily_space_heating_shape,
+)
+from savings.energy.get_machine_energy import get_total_energy_needs
+from tests.mocks import mock_household, mock_vehicle_ev
+
+electric_household = mock_household.copy(
+    update={
+        "location": LocationEnum.WELLINGTON,
+        "space_heating": SpaceHeatingEnum.ELECTRIC_HEAT_PUMP,
+        "water_heating": WaterHeatingEnum.ELECTRIC_HEAT_PUMP,
+        "vehicles": [mock_vehicle_ev],
+    }
+)
+
+
+def synthesise_meter_data(
+    baseload: float, space_heating: float, location: LocationEnum
+) -> np.ndarray:
+    # Half-hourly kWh with a flat baseload & heating following the location's shape
+    shape = get_daily_space_heating_shape(location)
+    daily_kwh = baseload + space_heating * shape
+    return np.repeat(daily_kwh / 48, 48)
+
+
+def to_arrow(kwh: np.ndarray) -> bytes:
+    table = pa.table({"kwh": kwh})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def get_electricity(household, category: str) -> float:
+    needs = get_total_energy_needs(household, PeriodEnum.DAILY, household.location)
+    return needs[category].get(FuelTypeEnum.ELECTRICITY, 0)
+
+
+class TestGetDailySpaceHeatingShape:
+    @pytest.mark.parametrize("location", [LocationEnum.WELLINGTON, LocationEnum.OTHER])
+    def test_it_averages_one_over_the_days_of_the_year(self, location):
+        shape = get_daily_space_heating_shape(location)
+        assert shape.shape == (365,)
+        assert shape.mean() == pytest.approx(1)
+        assert np.all(shape >= 0)
+
+    def test_it_is_higher_in_winter(self):
+        shape = get_daily_space_heating_shape(LocationEnum.WELLINGTON)
+        assert shape[170:200].mean() > shape[0:30].mean()
+
+
+class TestDisaggregateMeterData:
+    def test_it_recovers_the_baseload_and_space_heating(self):
+        kwh = synthesise_meter_data(12, 8, LocationEnum.WELLINGTON)
+        disaggregation = disaggregate_meter_data(kwh, LocationEnum.WELLINGTON)
+        assert disaggregation["baseload"] == pytest.approx(12)
+        assert disaggregation["space_heating"] == pytest.approx(8)
+
+    def test_flat_use_is_all_baseload(self):
+        disaggregation = disaggregate_meter_data(np.full(8760, 0.5), None)
+        assert disaggregation["baseload"] == pytest.approx(12)
+        assert disaggregation["space_heating"] == pytest.approx(0, abs=1e-9)
+
+    def test_neither_is_negative(self):
+        # Use that peaks in summer would otherwise need negative space heating
+        shape = get_daily_space_heating_shape(LocationEnum.WELLINGTON)
+        kwh = np.repeat((20 - 5 * shape).clip(0) / 24, 24)
+        disaggregation = disaggregate_meter_data(kwh, LocationEnum.WELLINGTON)
+        assert disaggregation["baseload"] == pytest.approx(kwh.sum() / 365)
+        assert disaggregation["space_heating"] == 0
+
+
+class TestCalibrateEnergyNeeds:
+    def test_it_compares_the_household_to_the_average(self):
+        # Its appliances' electricity, with & without each of them being electric
+        appliances = get_electricity(electric_household, "appliances")
+        space_heating = appliances - get_electricity(
+            electric_household.copy(update={"space_heating": SpaceHeatingEnum.WOOD}),
+            "appliances",
+        )
+        # Water heating, the (electric resistance) cooktop & other appliances
+        baseload = appliances - space_heating
+        baseload += get_electricity(electric_household, "other_appliances")
+        vehicles = get_electricity(electric_household, "vehicles")
+        kwh = synthesise_meter_data(
+            2 * baseload + vehicles, 1.5 * space_heating, LocationEnum.WELLINGTON
+        )
+
+        calibration = calibrate_energy_needs(
+            electric_household, to_arrow(kwh), MeterDataFormatEnum.ARROW
+        )
+        assert calibration.baseload_factor == pytest.approx(2, abs=1e-3)
+        assert calibration.space_heating_factor == pytest.approx(1.5, abs=1e-3)
+        assert calibration.baseload_kwh_per_day == pytest.approx(
+            2 * baseload + vehicles, abs=0.01
+        )
+
+    def test_it_leaves_machines_that_dont_use_electricity_at_the_average(self):
+        kwh = synthesise_meter_data(20, 10, LocationEnum.AUCKLAND_CENTRAL)
+        calibration = calibrate_energy_needs(
+            mock_household, to_arrow(kwh), MeterDataFormatEnum.ARROW
+        )
+        assert mock_household.space_heating == SpaceHeatingEnum.WOOD
+        assert calibration.space_heating_factor == 1
+        assert calibration.space_heating_kwh_per_day == pytest.approx(10, abs=0.01)
+
+    def test_it_ignores_an_existing_calibration(self):
+        kwh = to_arrow(synthesise_meter_data(20, 10, LocationEnum.WELLINGTON))
+        calibrated = electric_household.copy(
+            update={"meter_calibration": MeterCalibration(baseloadFactor=3)}
+        )
+        assert calibrate_energy_needs(
+            calibrated, kwh, MeterDataFormatEnum.ARROW
+        ) == calibrate_energy_needs(electric_household, kwh, MeterDataFormatEnum.ARROW)
+
+    def test_it_reads_a_leap_year(self):
+        kwh = np.ones(17568)
+        calibration = calibrate_energy_needs(
+            electric_household, to_arrow(kwh), MeterDataFormatEnum.ARROW
+        )
+        assert calibration.baseload_kwh_per_day == pytest.approx(48, abs=0.01)
+
+    def test_it_rejects_invalid_data(self):
+        with pytest.raises(ValueError):
+            calibrate_energy_needs(electric_household, b"datetime,kwh\n")
+
+
+class TestCalibratedEnergyNeeds:
+    def test_the_calibration_scales_energy_and_emissions(self):
+        calibrated = electric_household.copy(
+            update={
+                "meter_calibration": MeterCalibration(
+                    baseloadFactor=2, spaceHeatingFactor=0.5
+                )
+            }
+        )
+        without_heating = {"space_heating": SpaceHeatingEnum.WOOD}
+        heating = get_electricity(electric_household, "appliances") - get_electricity(
+            electric_household.copy(update=without_heating), "appliances"
+        )
+        calibrated_heating = get_electricity(
+            calibrated, "appliances"
+        ) - get_electricity(calibrated.copy(update=without_heating), "appliances")
+        assert calibrated_heating == pytest.approx(0.5 * heating)
+        assert get_electricity(calibrated, "other_appliances") == pytest.approx(
+            2 * get_electricity(electric_household, "other_appliances")
+        )
+        assert get_electricity(calibrated, "vehicles") == get_electricity(
+            electric_household, "vehicles"
+        )
+        assert get_total_emissions(
+            calibrated, PeriodEnum.YEARLY, calibrated.location
+        ) != get_total_emissions(
+            electric_household, PeriodEnum.YEARLY, electric_household.location
+        )
+
+    def test_the_baseload_factor_only_scales_electric_machines(self):
+        gas_household = electric_household.copy(
+            update={
+                "water_heating": WaterHeatingEnum.GAS,
+                "cooktop": CooktopEnum.GAS,
+            }
+        )
+        calibrated = gas_household.copy(
+            update={"meter_calibration": MeterCalibration(baseloadFactor=2)}
+        )
+        needs, calibrated_needs = (
+            get_total_energy_needs(h, PeriodEnum.DAILY, h.location)
+            for h in (gas_household, calibrated)
+        )
+        assert calibrated_needs["appliances"] == needs["appliances"]
+        assert calibrated_needs["other_appliances"].get(
+            FuelTypeEnum.ELECTRICITY
+        ) == pytest.approx(2 * needs["other_appliances"].get(FuelTypeEnum.ELECTRICITY))
@@ -8,8 +8,9 @@ from params import OPERATIONAL_LIFETIME
 from savings.energy.get_electricity_consumption import (
     get_e_generated_from_solar,
     get_e_consumed_from_solar,
+    get_battery_storage_capacity,
     get_e_stored_in_battery,
-    _get_max_e_consumed_from_solar,
+    get_max_e_consumed_from_solar,
     sum_energy_for_fuel_type,
 )
 
@@ -144,7 +145,7 @@ class TestGetMaxEConsumedFromSolar:
             },
             "other_appliances": {FuelTypeEnum.ELECTRICITY: 14.0},
         }
-        assert _get_max_e_consumed_from_solar(
+        assert get_max_e_consumed_from_solar(
             e_needs,
         ) == {
             "appliances": {
@@ -163,7 +164,7 @@ class TestGetMaxEConsumedFromSolar:
                 FuelTypeEnum.NATURAL_GAS: 2000.0,
             },
         }
-        assert _get_max_e_consumed_from_solar(e_needs) == {
+        assert get_max_e_consumed_from_solar(e_needs) == {
             "appliances": {
                 FuelTypeEnum.ELECTRICITY: 2500.0,
             },
@@ -179,7 +180,7 @@ class TestGetMaxEConsumedFromSolar:
                 FuelTypeEnum.DIESEL: 2000.0,
             },
         }
-        assert _get_max_e_consumed_from_solar(e_needs) == {
+        assert get_max_e_consumed_from_solar(e_needs) == {
             "appliances": {
                 FuelTypeEnum.ELECTRICITY: 0,
             },
@@ -499,3 +500,16 @@ class TestGetEnergyFromBattery:
             )
             == expected_daily * DAYS_PER_YEAR * OPERATIONAL_LIFETIME
         )
+
+
+class TestGetBatteryStorageCapacity:
+    def test_it_scales_with_period(self):
+        daily = get_battery_storage_capacity(10, PeriodEnum.DAILY)
+        assert get_battery_storage_capacity(10, PeriodEnum.WEEKLY) == daily * 7
+        assert get_battery_storage_capacity(10, PeriodEnum.YEARLY) == pytest.approx(
+            daily * DAYS_PER_YEAR
+        )
+
+    def test_it_caps_battery_storage(self):
+        capacity = get_battery_storage_capacity(10, PeriodEnum.YEARLY)
+        assert get_e_stored_in_battery(10, capacity * 2, 0) == capacity
@@ -25,6 +25,7 @@ from savings.energy.get_machine_energy import (
     get_total_appliance_energy,
     get_vehicle_energy,
 )
+from utils.fuel_vector import FuelVector
 from tests.mocks import (
     mock_household,
     mock_vehicle_petrol,
@@ -88,7 +89,7 @@ class TestGetEnergyPerDay(TestCase):
 
 @patch(
     "savings.energy.get_machine_energy.scale_daily_to_period",
-    return_value=mock_energy_weekly[FuelTypeEnum.ELECTRICITY],
+    return_value=FuelVector.from_mapping(mock_energy_weekly),
 )
 @patch(
     "savings.energy.get_machine_energy.get_energy_per_day",
@@ -122,7 +123,7 @@ class TestGetEnergyPerPeriod:
             mock_household.cooktop, COOKTOP_INFO, 1, PeriodEnum.WEEKLY
         )
         mock_scale_daily_to_period.assert_called_once_with(
-            mock_energy_daily[FuelTypeEnum.ELECTRICITY], PeriodEnum.WEEKLY
+            mock_energy_daily, PeriodEnum.WEEKLY
         )
 
     def test_it_calls_scale_daily_to_period_correctly_with_default(
@@ -130,10 +131,10 @@ class TestGetEnergyPerPeriod:
     ):
         get_energy_per_period(mock_household.cooktop, COOKTOP_INFO)
         mock_scale_daily_to_period.assert_called_once_with(
-            mock_energy_daily[FuelTypeEnum.ELECTRICITY], PeriodEnum.DAILY
+            mock_energy_daily, PeriodEnum.DAILY
         )
 
-    def test_it_calls_scale_daily_to_period_per_fuel_type(
+    def test_it_scales_all_fuel_types_at_once(
         self, mock_get_energy_per_day, mock_scale_daily_to_period
     ):
         mock_get_energy_per_day.side_effect = [
@@ -144,9 +145,13 @@ class TestGetEnergyPerPeriod:
         ]
 
         get_energy_per_period(mock_household.cooktop, COOKTOP_INFO)
-        assert len(mock_scale_daily_to_period.call_args_list) == 2
-        mock_scale_daily_to_period.assert_any_call(2, PeriodEnum.DAILY)
-        mock_scale_daily_to_period.assert_any_call(3, PeriodEnum.DAILY)
+        mock_scale_daily_to_period.assert_called_once_with(
+            {
+                FuelTypeEnum.ELECTRICITY: 2,
+                FuelTypeEnum.PETROL: 3,
+            },
+            PeriodEnum.DAILY,
+        )
 
     def test_it_returns_energy_per_period(self, _, __):
         result = get_energy_per_period(mock_household.space_heating, SPACE_HEATING_INFO)
@@ -240,7 +245,7 @@ class TestGetTotalApplianceEnergy:
 
 @patch(
     "savings.energy.get_machine_energy.scale_daily_to_period",
-    return_value=mock_energy_weekly[FuelTypeEnum.ELECTRICITY],
+    return_value=FuelVector.from_mapping(mock_energy_weekly),
 )
 @patch(
     "savings.energy.get_machine_energy.scale_energy_by_occupancy",
@@ -266,7 +271,7 @@ class TestGetOtherAppliancesEnergyPerPeriod:
     ):
         get_other_appliances_energy_per_period(None, PeriodEnum.WEEKLY)
         mock_scale_daily_to_period.assert_called_once_with(
-            mock_energy_daily[FuelTypeEnum.ELECTRICITY], PeriodEnum.WEEKLY
+            mock_energy_daily, PeriodEnum.WEEKLY
         )
 
     def test_it_calls_scale_daily_to_period_correctly_with_default(
@@ -274,7 +279,7 @@ class TestGetOtherAppliancesEnergyPerPeriod:
     ):
         get_other_appliances_energy_per_period()
         mock_scale_daily_to_period.assert_called_once_with(
-            mock_energy_daily[FuelTypeEnum.ELECTRICITY], PeriodEnum.DAILY
+            mock_energy_daily, PeriodEnum.DAILY
         )
 
     def test_it_returns_energy_per_period(self, _, __):
@@ -357,11 +362,12 @@ class TestGetVehicleEnergyPerDay(TestCase):
 
         assert len(mock_scale_daily_to_period.call_args_list) == 2
         mock_scale_daily_to_period.assert_any_call(
-            self.expected_weighted_energy_daily_petrol,
+            {FuelTypeEnum.PETROL: self.expected_weighted_energy_daily_petrol},
             PeriodEnum.WEEKLY,
         )
         mock_scale_daily_to_period.assert_any_call(
-            self.expected_weighted_energy_daily_ev, PeriodEnum.WEEKLY
+            {FuelTypeEnum.ELECTRICITY: self.expected_weighted_energy_daily_ev},
+            PeriodEnum.WEEKLY,
         )
 
     @patch(
@@ -373,11 +379,12 @@ class TestGetVehicleEnergyPerDay(TestCase):
         get_vehicle_energy([mock_vehicle_ev, mock_vehicle_petrol])
         assert len(mock_scale_daily_to_period.call_args_list) == 2
         mock_scale_daily_to_period.assert_any_call(
-            self.expected_weighted_energy_daily_petrol,
+            {FuelTypeEnum.PETROL: self.expected_weighted_energy_daily_petrol},
             PeriodEnum.DAILY,
         )
         mock_scale_daily_to_period.assert_any_call(
-            self.expected_weighted_energy_daily_ev, PeriodEnum.DAILY
+            {FuelTypeEnum.ELECTRICITY: self.expected_weighted_energy_daily_ev},
+            PeriodEnum.DAILY,
         )
 
     def test_it_returns_energy_with_default_period(self):
@@ -2,6 +2,8 @@ from openapi_client.models.cooktop_enum import CooktopEnum
 from openapi_client.models.location_enum import LocationEnum
 from openapi_client.models.space_heating_enum import SpaceHeatingEnum
 from openapi_client.models.water_heating_enum import WaterHeatingEnum
+from unittest.mock import patch
+
 from savings.energy.scale_energy_by_location import scale_energy_by_location
 
 
@@ -33,3 +35,17 @@ class TestScaleEnergyByLocation:
             scale_energy_by_location(SpaceHeatingEnum.GAS, 10, LocationEnum.OTAGO)
             == 16.01023022
         )
+
+    @patch("savings.energy.scale_energy_by_location.WEATHER_AWARE_SPACE_HEATING", True)
+    @patch(
+        "savings.energy.scale_energy_by_location.scale_energy_by_weather",
+        return_value=12.5,
+    )
+    def test_it_can_scale_by_weather(self, mock_scale_energy_by_weather):
+        assert (
+            scale_energy_by_location(SpaceHeatingEnum.GAS, 10, LocationEnum.OTAGO)
+            == 12.5
+        )
+        mock_scale_energy_by_weather.assert_called_once_with(
+            SpaceHeatingEnum.GAS, 10, LocationEnum.OTAGO
+        )
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from openapi_client.models.cooktop_enum import CooktopEnum
+from openapi_client.models.location_enum import LocationEnum
+from openapi_client.models.space_heating_enum import SpaceHeatingEnum
+from savings.energy.scale_energy_by_weather import (
+    get_heat_pump_cop_multipliers,
+    get_space_heating_shape,
+    get_weather_location_multipliers,
+    scale_energy_by_weather,
+)
+
+
+class TestScaleEnergyByWeather:
+    def test_it_returns_same_if_machine_type_is_not_space_heating(self):
+        assert scale_energy_by_weather(CooktopEnum.GAS, 10, LocationEnum.OTAGO) == 10
+
+    def test_it_returns_same_without_a_weather_station(self):
+        assert scale_energy_by_weather(SpaceHeatingEnum.GAS, 10) == 10
+        assert (
+            scale_energy_by_weather(SpaceHeatingEnum.GAS, 10, LocationEnum.OTHER) == 10
+        )
+
+    def test_it_scales_space_heating_by_heating_degree_hours(self):
+        northland = scale_energy_by_weather(
+            SpaceHeatingEnum.GAS, 10, LocationEnum.NORTHLAND
+        )
+        southland = scale_energy_by_weather(
+            SpaceHeatingEnum.GAS, 10, LocationEnum.SOUTHLAND
+        )
+        assert northland < 10 < southland
+        assert southland == pytest.approx(
+            10 * get_weather_location_multipliers()[LocationEnum.SOUTHLAND]
+        )
+
+    def test_heat_pumps_are_less_efficient_in_the_cold(self):
+        assert get_heat_pump_cop_multipliers()[LocationEnum.SOUTHLAND] > 1
+        assert get_heat_pump_cop_multipliers()[LocationEnum.NORTHLAND] < 1
+        assert scale_energy_by_weather(
+            SpaceHeatingEnum.ELECTRIC_HEAT_PUMP, 10, LocationEnum.SOUTHLAND
+        ) > scale_energy_by_weather(SpaceHeatingEnum.GAS, 10, LocationEnum.SOUTHLAND)
+
+
+class TestGetSpaceHeatingShape:
+    def test_it_spreads_a_day_over_each_day_of_the_year(self):
+        shape = get_space_heating_shape(LocationEnum.CANTERBURY)
+        assert shape.shape == (8760,)
+        assert shape.sum() == pytest.approx(365, rel=1e-5)
+        # More heating in July than January
+        assert shape[181 * 24 : 212 * 24].sum() > shape[: 31 * 24].sum()
+        assert np.all(shape >= 0)
+
+    def test_it_has_no_shape_without_a_weather_station(self):
+        assert get_space_heating_shape(LocationEnum.OVERSEAS) is None
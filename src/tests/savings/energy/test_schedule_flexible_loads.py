@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from constants.flexible_loads import (
+    EV_CHARGER_POWER,
+    HOT_WATER_CYLINDER_FLEXIBLE_KWH,
+)
+from savings.energy.schedule_flexible_loads import (
+    get_ev_availability,
+    get_hourly_electricity_consumption,
+    schedule_flexible_load,
+    schedule_household_loads,
+)
+
+# Cheap overnight, dear in the evening
+rates = np.array([[0.1] * 7 + [0.25] * 10 + [0.4] * 4 + [0.25] * 3])
+midday_surplus = np.zeros((1, 24))
+midday_surplus[0, 10:14] = 2
+
+
+class TestScheduleFlexibleLoad:
+    def test_it_fills_surplus_solar_first(self):
+        load = schedule_flexible_load(np.array([6.0]), 3, True, midday_surplus, rates)
+        assert load.sum() == pytest.approx(6)
+        assert load[0, 10:14].tolist() == [2, 2, 2, 0]
+
+    def test_it_then_uses_the_cheapest_hours(self):
+        load = schedule_flexible_load(np.array([12.0]), 3, True, midday_surplus, rates)
+        assert load.sum() == pytest.approx(12)
+        assert load[0, 10:14].tolist() == [2, 2, 2, 2]
+        # The 4 kWh left go in the first of the cheapest hours
+        assert load[0, :2].tolist() == [3, 1]
+        assert load[0, 17:21].sum() == 0
+
+    def test_it_only_runs_when_available(self):
+        available = np.zeros((1, 24), dtype=bool)
+        available[0, 18:24] = True
+        load = schedule_flexible_load(
+            np.array([5.0]), 3, available, midday_surplus, rates
+        )
+        assert load[0, :18].sum() == 0
+        # 21:00 is the first of the cheapest available hours
+        assert load[0, 21] == 3
+        assert load.sum() == pytest.approx(5)
+
+    def test_it_runs_over_days_and_households(self):
+        e_daily = np.array([[1.0, 2.0], [3.0, 4.0]])
+        load = schedule_flexible_load(
+            e_daily, 3, True, np.zeros((2, 2, 24)), np.tile(rates, (2, 1))
+        )
+        assert load.shape == (2, 2, 24)
+        np.testing.assert_allclose(load.sum(axis=-1), e_daily)
+
+
+class TestScheduleHouseholdLoads:
+    def test_it_moves_water_heating_and_ev_charging(self):
+        e_inflexible = np.full((1, 365, 24), 0.5)
+        e_water_heating = np.zeros((1, 365, 24))
+        e_water_heating[..., 7] = 8
+        e_generated = np.zeros((1, 365, 24))
+        e_generated[..., 10:15] = 3
+        e_load = schedule_household_loads(
+            e_inflexible,
+            e_water_heating,
+            np.full((1, 365), 10.0),
+            e_generated,
+            np.tile(rates, (365, 1)),
+        )
+        # Every kWh is still used each day
+        np.testing.assert_allclose(e_load.sum(axis=-1), 12 + 8 + 10)
+        # Only the part of the water heating a cylinder can't do ahead stays put
+        assert e_load[0, 0, 7] == pytest.approx(
+            0.5 + 8 - HOT_WATER_CYLINDER_FLEXIBLE_KWH
+        )
+        # 2023 starts on a Sunday, when the car is home to use the solar; on
+        # Monday it's out, so it charges overnight
+        assert e_load[0, 0, 10:15].sum() == pytest.approx(15)
+        assert e_load[0, 1, 0] == pytest.approx(0.5 + EV_CHARGER_POWER)
+
+
+class TestGetEvAvailability:
+    def test_the_car_is_out_on_weekdays(self):
+        available = get_ev_availability()
+        assert available.shape == (365, 24)
+        assert available[0].all()  # Sunday
+        assert not available[1, 12]  # Monday
+        assert available[1, 20]
+
+
+class TestGetHourlyElectricityConsumption:
+    def test_it_splits_consumption(self):
+        e_load = np.full((1, 2, 24), 1.0)
+        e_generated = np.zeros((1, 2, 24))
+        e_generated[..., 12] = 5
+        consumption = get_hourly_electricity_consumption(
+            e_load, e_generated, np.array([3.0]), np.full((2, 24), 0.2)
+        )
+        assert consumption["consumed_from_solar"].sum() == 2
+        assert consumption["consumed_from_battery"].sum() == 6
+        assert consumption["consumed_from_grid"].sum() == 40
+        assert consumption["exported_to_grid"].sum() == 2
+
+    def test_the_battery_discharges_in_the_dearest_hours(self):
+        e_load = np.full((1, 1, 24), 1.0)
+        e_generated = np.zeros((1, 1, 24))
+        e_generated[..., 12] = 5
+        rates = np.full((1, 24), 0.2)
+        rates[0, 18:20] = 0.3
+        consumption = get_hourly_electricity_consumption(
+            e_load, e_generated, np.array([3.0]), rates
+        )
+        discharged = consumption["consumed_from_battery"][0, 0]
+        assert discharged[18:20].tolist() == [1, 1]
+        assert discharged.sum() == 3
+        assert consumption["consumed_from_grid"][0, 0, 18:20].tolist() == [0, 0]
@@ -0,0 +1,144 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from constants.fuel_stats import FuelTypeEnum
+from constants.load_profiles import PROFILE_CATEGORIES
+from constants.utils import PeriodEnum
+from models.electrify_household import electrify_household
+from openapi_client.models import (
+    CooktopEnum,
+    LocationEnum,
+    MeterCalibration,
+    SpaceHeatingEnum,
+    Vehicle,
+    VehicleFuelTypeEnum,
+    WaterHeatingEnum,
+)
+from savings.energy.get_machine_energy import get_total_energy_needs
+from savings.energy.synthesise_load_profiles import (
+    get_daily_kwh_by_category,
+    get_profile_shapes,
+    get_solar_generation_shape,
+    synthesise_category_load_profiles,
+    synthesise_load_profiles,
+)
+from tests.mocks import mock_household
+
+households = [
+    mock_household.copy(
+        update={
+            "space_heating": space_heating,
+            "water_heating": water_heating,
+            "cooktop": cooktop,
+            "occupancy": occupancy,
+            "location": location,
+            "vehicles": [
+                Vehicle(fuel_type=fuel_type, kms_per_week=kms, switch_to_ev=None)
+                for fuel_type in [vehicle_fuel_type] * n_vehicles
+            ],
+            "meter_calibration": meter_calibration,
+        }
+    )
+    for (
+        space_heating,
+        water_heating,
+        cooktop,
+        occupancy,
+        location,
+        vehicle_fuel_type,
+        n_vehicles,
+        kms,
+        meter_calibration,
+    ) in zip(
+        itertools.cycle(SpaceHeatingEnum),
+        itertools.cycle(WaterHeatingEnum),
+        itertools.cycle(CooktopEnum),
+        itertools.cycle([None, 1, 2, 3, 4, 5, 7]),
+        itertools.cycle(LocationEnum),
+        itertools.cycle(VehicleFuelTypeEnum),
+        itertools.cycle([0, 1, 2]),
+        range(0, 400, 13),
+        itertools.cycle(
+            [None, MeterCalibration(baseloadFactor=1.5, spaceHeatingFactor=0.4)]
+        ),
+    )
+]
+
+
+class TestGetProfileShapes:
+    def test_each_shape_spreads_a_day_over_each_day_of_the_year(self):
+        shapes = get_profile_shapes()
+        assert shapes.shape == (len(PROFILE_CATEGORIES), 8760)
+        assert shapes.sum(axis=1) == pytest.approx(
+            np.full(len(PROFILE_CATEGORIES), 365)
+        )
+        assert get_profile_shapes(2024).shape == (len(PROFILE_CATEGORIES), 8784)
+
+    def test_space_heating_is_mostly_in_winter_evenings(self):
+        shapes = get_profile_shapes().reshape(len(PROFILE_CATEGORIES), 365, 24)
+        space_heating = shapes[PROFILE_CATEGORIES.index("space_heating")]
+        # July vs January
+        assert space_heating[181:212].sum() > 10 * space_heating[:31].sum()
+        assert space_heating[:, 18].sum() > space_heating[:, 3].sum()
+
+    def test_it_is_shared_read_only(self):
+        with pytest.raises(ValueError):
+            get_profile_shapes()[0, 0] = 1
+
+
+class TestGetSolarGenerationShape:
+    def test_it_spreads_a_day_over_the_daylight_hours(self):
+        shape = get_solar_generation_shape()
+        assert shape.sum() == pytest.approx(365)
+        days = shape.reshape(365, 24)
+        assert np.all(days[:, 0] == 0)
+        assert np.all(days.argmax(axis=1) == 12)
+        # More in December than June
+        assert days[334:].sum() > 2 * days[151:181].sum()
+
+
+class TestGetDailyKwhByCategory:
+    @pytest.mark.parametrize(
+        "fuel_type", [FuelTypeEnum.ELECTRICITY, FuelTypeEnum.NATURAL_GAS]
+    )
+    def test_it_matches_the_total_energy_needs(self, fuel_type):
+        batch = households + [electrify_household(h) for h in households]
+        daily_kwh = get_daily_kwh_by_category(batch, fuel_type)
+        for household, kwh in zip(batch, daily_kwh):
+            needs = get_total_energy_needs(
+                household, PeriodEnum.DAILY, household.location
+            )
+            appliances = kwh[: PROFILE_CATEGORIES.index("vehicles")].sum()
+            assert appliances == pytest.approx(needs["appliances"].get(fuel_type, 0))
+            assert kwh[PROFILE_CATEGORIES.index("vehicles")] == pytest.approx(
+                needs["vehicles"].get(fuel_type, 0)
+            )
+            assert kwh[PROFILE_CATEGORIES.index("other_appliances")] == pytest.approx(
+                needs["other_appliances"].get(fuel_type, 0)
+            )
+
+    def test_it_handles_an_empty_batch(self):
+        assert get_daily_kwh_by_category([]).shape == (0, len(PROFILE_CATEGORIES))
+
+
+class TestSynthesiseLoadProfiles:
+    def test_it_keeps_the_daily_kwh(self):
+        daily_kwh = get_daily_kwh_by_category(households)
+        profiles = synthesise_load_profiles(daily_kwh)
+        assert profiles.shape == (len(households), 8760)
+        assert profiles.sum(axis=1) == pytest.approx(daily_kwh.sum(axis=1) * 365)
+
+    def test_it_writes_to_a_preallocated_array(self):
+        daily_kwh = get_daily_kwh_by_category(households)
+        out = np.empty((len(households), 8760))
+        assert synthesise_load_profiles(daily_kwh, out=out) is out
+
+    def test_category_profiles_add_up_to_the_total(self):
+        daily_kwh = get_daily_kwh_by_category(households)
+        total = sum(
+            synthesise_category_load_profiles(daily_kwh, category)
+            for category in PROFILE_CATEGORIES
+        )
+        assert total == pytest.approx(synthesise_load_profiles(daily_kwh))
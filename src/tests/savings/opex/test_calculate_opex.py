@@ -2,7 +2,7 @@ from openapi_client.models import VehicleFuelTypeEnum, Vehicle
 from constants.utils import DAYS_PER_YEAR, PeriodEnum
 from params import OPERATIONAL_LIFETIME
 
-from savings.opex.calculate_opex import get_rucs
+from savings.opex.calculate_opex import get_rucs, get_rucs_per_kms_per_week
 
 
 class TestGetRucs:
@@ -90,3 +90,15 @@ class TestGetRucs:
         ]
         result = get_rucs(vehicles)
         assert result == round(76 * 100 * 52 / 1000 / 365.25 * 2, 2)
+
+
+class TestGetRucsPerKmsPerWeek:
+    def test_it_matches_get_rucs(self):
+        vehicles = [Vehicle(fuel_type=VehicleFuelTypeEnum.DIESEL, kms_per_week=100)]
+        per_km = get_rucs_per_kms_per_week(
+            VehicleFuelTypeEnum.DIESEL, PeriodEnum.YEARLY
+        )
+        assert round(per_km * 100, 2) == get_rucs(vehicles, PeriodEnum.YEARLY)
+
+    def test_petrol_vehicles_pay_no_rucs(self):
+        assert get_rucs_per_kms_per_week(VehicleFuelTypeEnum.PETROL) == 0
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from constants.utils import DAYS_PER_YEAR
+from openapi_client.models import LocationEnum, PlanTypeEnum
+from savings.opex.compare_retail_plans import (
+    compare_retail_plans,
+    get_flat_kwh_by_schedule,
+    get_kwh_by_schedule,
+    get_plan_costs,
+)
+from tests.mocks import mock_household
+from tests.utils.test_plan_catalogue import catalogue_json
+from utils.plan_catalogue import parse_plan_catalogue
+from utils.tou_tariff import TOU_PERIODS, TouPeriodEnum
+
+catalogue = parse_plan_catalogue(catalogue_json)
+both_plans = np.array([0, 1])
+night = TOU_PERIODS.index(TouPeriodEnum.NIGHT)
+shoulder = TOU_PERIODS.index(TouPeriodEnum.SHOULDER)
+
+
+class TestGetKwhBySchedule:
+    def test_it_splits_profiles_by_each_schedule(self):
+        # 1 kWh at 3am every day
+        profile = np.tile(np.eye(24)[3], 365)[np.newaxis]
+        kwh = get_kwh_by_schedule(catalogue, profile)
+        assert kwh.shape == (1, 2, len(TOU_PERIODS))
+        assert kwh[0, 0, shoulder] == 365
+        assert kwh[0, 1, night] == 365
+
+
+class TestGetFlatKwhBySchedule:
+    def test_it_buys_for_the_battery_at_night(self):
+        kwh = get_flat_kwh_by_schedule(catalogue, np.array([876.0]), np.array([100.0]))
+        assert kwh[0, 0, shoulder] == pytest.approx(876)
+        # 8 of 24 hours are at night
+        assert kwh[0, 1, night] == pytest.approx(776 / 3 + 100)
+        assert kwh[0, 1].sum() == pytest.approx(876)
+
+
+class TestGetPlanCosts:
+    def test_it_prices_every_plan(self):
+        kwh = get_flat_kwh_by_schedule(catalogue, np.array([3000.0]), np.zeros(1))
+        costs = get_plan_costs(catalogue, both_plans, kwh, np.array([500.0]))
+        assert costs[0] == pytest.approx(
+            [
+                3000 * 0.3 + 2 * DAYS_PER_YEAR - 500 * 0.1,
+                2000 * 0.32 + 1000 * 0.15 + 1 * DAYS_PER_YEAR,
+            ]
+        )
+
+    def test_it_excludes_plans_a_household_uses_too_much_for(self):
+        kwh = get_flat_kwh_by_schedule(catalogue, np.array([9000.0]), np.zeros(1))
+        costs = get_plan_costs(catalogue, both_plans, kwh, np.zeros(1))
+        assert np.isfinite(costs[0, 0])
+        assert costs[0, 1] == np.inf
+
+
+class TestCompareRetailPlans:
+    def test_it_finds_the_cheapest_plans(self):
+        comparison = compare_retail_plans(mock_household, catalogue=catalogue)
+        assert comparison.before.id in catalogue.ids
+        assert comparison.after.id in catalogue.ids
+        assert comparison.before.cost_per_year > 0
+
+    def test_it_only_considers_the_plan_type(self):
+        comparison = compare_retail_plans(
+            mock_household, PlanTypeEnum.ANYTIME, catalogue=catalogue
+        )
+        assert comparison.before.id == "auckland-anytime"
+        assert comparison.after.id == "auckland-anytime"
+
+    def test_it_matches_pricing_the_cheapest_plan(self):
+        comparison = compare_retail_plans(mock_household)
+        anytime = compare_retail_plans(mock_household, PlanTypeEnum.ANYTIME)
+        assert comparison.before.cost_per_year <= anytime.before.cost_per_year
+        assert comparison.after.cost_per_year <= anytime.after.cost_per_year
+
+    def test_it_rejects_regions_without_plans(self):
+        household = mock_household.copy(update={"location": LocationEnum.OTAGO})
+        with pytest.raises(ValueError):
+            compare_retail_plans(household, PlanTypeEnum.ANYTIME, catalogue=catalogue)
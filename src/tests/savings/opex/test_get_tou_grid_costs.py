@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from constants.tou_tariffs import TOU_TARIFF_2024, TOU_TARIFF_AVG_15_YEARS
+from constants.utils import DAYS_PER_YEAR, PeriodEnum
+from params import OPERATIONAL_LIFETIME
+from savings.opex.get_tou_grid_costs import get_tou_grid_costs
+from utils.tou_tariff import TouPeriodEnum
+
+# 1 kWh at 3am every day, i.e. always at the night rate
+night_only = np.tile(np.eye(24)[3], 365)
+
+
+class TestGetTouGridCosts:
+    def test_it_gives_the_daily_cost(self):
+        assert get_tou_grid_costs(night_only) == pytest.approx(
+            TOU_TARIFF_2024.rates[TouPeriodEnum.NIGHT]
+        )
+
+    def test_it_scales_to_the_period(self):
+        assert get_tou_grid_costs(night_only, PeriodEnum.YEARLY) == pytest.approx(
+            TOU_TARIFF_2024.rates[TouPeriodEnum.NIGHT] * DAYS_PER_YEAR
+        )
+
+    def test_it_uses_average_prices_over_the_lifetime(self):
+        assert get_tou_grid_costs(
+            night_only, PeriodEnum.OPERATIONAL_LIFETIME
+        ) == pytest.approx(
+            TOU_TARIFF_AVG_15_YEARS.rates[TouPeriodEnum.NIGHT]
+            * DAYS_PER_YEAR
+            * OPERATIONAL_LIFETIME
+        )
+
+    def test_it_prices_many_households_at_once(self):
+        costs = get_tou_grid_costs(np.stack([night_only, 2 * night_only]))
+        assert costs == pytest.approx(
+            [
+                TOU_TARIFF_2024.rates[TouPeriodEnum.NIGHT],
+                2 * TOU_TARIFF_2024.rates[TouPeriodEnum.NIGHT],
+            ]
+        )
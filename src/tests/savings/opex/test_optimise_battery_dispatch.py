@@ -0,0 +1,143 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from constants.battery import (
+    BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS,
+    BATTERY_LOSSES,
+    BATTERY_MAX_C_RATE,
+)
+from savings.opex.optimise_battery_dispatch import (
+    get_grid_costs,
+    optimise_battery_dispatch,
+)
+
+# Cheap overnight, dear in the evening
+prices = np.array([[0.1] * 7 + [0.25] * 10 + [0.4] * 4 + [0.25] * 3])
+flat_needs = np.full((1, 1, 24), 1.0)
+
+
+def brute_force_cost(prices, e_surplus, export_prices, capacity, n_levels):
+    """The cheapest day on a small grid of levels, by trying every path"""
+    level_size = capacity * BATTERY_AVG_DEGRADED_PERFORMANCE_15_YRS / (n_levels - 1)
+    max_change = BATTERY_MAX_C_RATE * capacity / level_size + 1e-9
+    best = np.inf
+    for path in itertools.product(range(n_levels), repeat=len(prices)):
+        changes = np.diff((0,) + path)
+        if np.any(np.abs(changes) > max_change):
+            continue
+        e_battery = level_size * np.where(
+            changes > 0, changes, changes * (1 - BATTERY_LOSSES)
+        )
+        best = min(
+            best,
+            get_grid_costs(e_battery - e_surplus, prices, export_prices).sum(),
+        )
+    return best
+
+
+class TestGetGridCosts:
+    def test_it_prices_imports_and_exports(self):
+        costs = get_grid_costs(np.array([2.0, -2.0]), 0.3, 0.1)
+        assert costs.tolist() == pytest.approx([0.6, -0.2])
+
+
+class TestOptimiseBatteryDispatch:
+    def test_it_charges_from_the_grid_without_solar(self):
+        dispatch = optimise_battery_dispatch(prices, flat_needs, None, np.array([10.0]))
+        assert dispatch["charged_from_solar"].sum() == 0
+        # Charges overnight, discharges in the evening peak
+        assert dispatch["charged_from_grid"][0, 0, :7].sum() > 0
+        assert dispatch["charged_from_grid"][0, 0, 7:].sum() == 0
+        assert dispatch["discharged"][0, 0, 17:21].sum() > 0
+        assert dispatch["cost"][0, 0] < (prices * flat_needs).sum()
+
+    def test_it_does_nothing_when_prices_are_flat(self):
+        dispatch = optimise_battery_dispatch(
+            np.full((1, 24), 0.3), flat_needs, None, np.array([10.0])
+        )
+        assert dispatch["charged_from_grid"].sum() == 0
+        assert dispatch["discharged"].sum() == 0
+        assert dispatch["cost"][0, 0] == pytest.approx(0.3 * 24)
+
+    def test_it_stores_surplus_solar_for_the_evening(self):
+        generated = np.zeros((1, 1, 24))
+        generated[0, 0, 10:14] = 3
+        dispatch = optimise_battery_dispatch(
+            prices, flat_needs, generated, np.array([10.0]), export_prices=0.05
+        )
+        assert dispatch["charged_from_solar"][0, 0, 10:14].sum() > 0
+        assert dispatch["exported_to_grid"].sum() < 8
+
+    def test_it_balances_energy(self):
+        rng = np.random.default_rng(1)
+        needs = rng.uniform(0, 2, (3, 5, 24))
+        generated = rng.uniform(0, 2, (3, 5, 24))
+        dispatch = optimise_battery_dispatch(
+            rng.uniform(0.05, 0.5, (5, 24)),
+            needs,
+            generated,
+            np.array([0.0, 5.0, 13.5]),
+        )
+        balance = (
+            needs
+            - generated
+            + dispatch["charged_from_solar"]
+            + dispatch["charged_from_grid"]
+            - dispatch["discharged"]
+            - dispatch["consumed_from_grid"]
+            + dispatch["exported_to_grid"]
+        )
+        assert np.abs(balance).max() == pytest.approx(0)
+        # Without a battery, nothing is dispatched
+        assert dispatch["charged_from_grid"][0].sum() == 0
+        assert dispatch["discharged"][0].sum() == 0
+
+    def test_it_matches_a_brute_force_search(self):
+        # Only the first 6 hours of the day are worth searching: after them nothing
+        # is needed or generated, and exports earn nothing
+        rng = np.random.default_rng(2)
+        for _ in range(5):
+            day_prices = rng.uniform(0.05, 0.5, 6)
+            day_export_prices = day_prices * rng.uniform(0, 1, 6)
+            e_surplus = rng.uniform(-2, 2, 6)
+            idle = np.zeros(18)
+            dispatch = optimise_battery_dispatch(
+                np.concatenate([day_prices, idle + 1])[np.newaxis],
+                np.concatenate([np.maximum(-e_surplus, 0), idle])[
+                    np.newaxis, np.newaxis
+                ],
+                np.concatenate([np.maximum(e_surplus, 0), idle])[
+                    np.newaxis, np.newaxis
+                ],
+                np.array([4.0]),
+                export_prices=np.concatenate([day_export_prices, idle]),
+                n_charge_levels=4,
+            )
+            assert dispatch["cost"][0, 0] == pytest.approx(
+                brute_force_cost(day_prices, e_surplus, day_export_prices, 4.0, 4)
+            )
+
+    def test_it_handles_many_charge_levels(self):
+        # 301 levels include every one of the default 21, so they can only be cheaper
+        coarse, fine = (
+            optimise_battery_dispatch(
+                prices, flat_needs, None, np.array([10.0]), n_charge_levels=n
+            )
+            for n in (21, 301)
+        )
+        assert fine["cost"][0, 0] <= coarse["cost"][0, 0] + 1e-9
+        assert fine["discharged"][0, 0, 17:21].sum() > 0
+
+    def test_it_rejects_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            optimise_battery_dispatch(prices, flat_needs, None, np.array([-1.0]))
+        with pytest.raises(ValueError):
+            optimise_battery_dispatch(prices, flat_needs, None, np.array([1.0, 2.0]))
+        with pytest.raises(ValueError):
+            optimise_battery_dispatch(
+                prices, flat_needs, None, np.array([1.0]), export_prices=1.0
+            )
+        with pytest.raises(ValueError):
+            optimise_battery_dispatch(prices, flat_needs[0], None, np.array([1.0]))
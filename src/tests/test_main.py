@@ -1,4 +1,19 @@
-from main import calculate_household_savings
+import base64
+
+from fastapi import HTTPException, Response
+import numpy as np
+import pyarrow as pa
+import json
+from main import (
+    aggregate_household_savings_batch,
+    query_savings_cube,
+    calculate_household_savings,
+    calculate_household_savings_batch,
+    calculate_household_savings_curve,
+    calculate_household_system_size,
+    calibrate_household_energy,
+    compare_household_retail_plans,
+)
 from unittest.mock import patch
 from unittest import TestCase
 from tests.mocks import (
@@ -9,13 +24,28 @@ from tests.mocks import (
     mock_upfront_cost,
     mock_recommendation,
 )
-from openapi_client.models import Savings
+from openapi_client.models import (
+    Battery,
+    LocationEnum,
+    MeterCalibration,
+    MeterCalibrationRequest,
+    MeterDataFormatEnum,
+    PlanTypeEnum,
+    Savings,
+    SavingsCurveRequest,
+    SavingsPercentiles,
+    Sweep,
+    SystemSize,
+    SystemSizeRequest,
+)
+from models.savings_cube import SavingsCube, get_dimension_weights
+from utils.arrow_batch import write_household_batch
 
 
 @patch("main.recommend_next_action", return_value=mock_recommendation)
 @patch("main.calculate_upfront_cost", return_value=mock_upfront_cost)
-@patch("main.calculate_opex", return_value=mock_opex)
-@patch("main.calculate_emissions", return_value=mock_emissions)
+@patch("main.get_opex_from_totals", return_value=mock_opex)
+@patch("main.get_emissions_from_totals", return_value=mock_emissions)
 @patch("main.electrify_household", return_value=mock_household_electrified)
 class TestCalculateHouseholdSavings(TestCase):
 
@@ -38,10 +68,14 @@ class TestCalculateHouseholdSavings(TestCase):
         mock_calculate_upfront_cost,
         mock_recommend_next_action,
     ):
-        calculate_household_savings(mock_household)
+        with patch(
+            "main.get_household_totals", side_effect=lambda h: ("totals", h)
+        ) as mock_get_household_totals:
+            calculate_household_savings(mock_household)
         mock_calculate_emissions.assert_called_once_with(
-            mock_household, mock_household_electrified
+            ("totals", mock_household), ("totals", mock_household_electrified)
         )
+        assert mock_get_household_totals.call_count == 2
 
     def test_it_calls_calculate_opex_correctly(
         self,
@@ -51,10 +85,14 @@ class TestCalculateHouseholdSavings(TestCase):
         mock_calculate_upfront_cost,
         mock_recommend_next_action,
     ):
-        calculate_household_savings(mock_household)
+        with patch(
+            "main.get_household_totals", side_effect=lambda h: ("totals", h)
+        ) as mock_get_household_totals:
+            calculate_household_savings(mock_household)
         mock_calculate_opex.assert_called_once_with(
-            mock_household, mock_household_electrified
+            ("totals", mock_household), ("totals", mock_household_electrified)
         )
+        assert mock_get_household_totals.call_count == 2
 
     def test_it_calls_calculate_upfront_cost_correctly(
         self,
@@ -80,6 +118,24 @@ class TestCalculateHouseholdSavings(TestCase):
         calculate_household_savings(mock_household)
         mock_recommend_next_action.assert_called_once_with(mock_household)
 
+    def test_it_rejects_a_battery_without_solar(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        battery_without_solar = mock_household.copy(
+            update={
+                "solar": mock_household.solar.copy(update={"install_solar": False}),
+                "battery": Battery(has_battery=True, capacity=10),
+            }
+        )
+        with self.assertRaises(ValueError):
+            calculate_household_savings(battery_without_solar)
+        mock_calculate_opex.assert_not_called()
+
     def test_it_returns_savings(
         self,
         mock_electrify_household,
@@ -95,3 +151,414 @@ class TestCalculateHouseholdSavings(TestCase):
             upfrontCost=mock_upfront_cost,
             recommendation=mock_recommendation,
         )
+
+
+@patch("main.recommend_next_action", return_value=mock_recommendation)
+@patch("main.calculate_upfront_cost", return_value=mock_upfront_cost)
+@patch("main.get_opex_from_totals", return_value=mock_opex)
+@patch("main.get_emissions_from_totals", return_value=mock_emissions)
+@patch("main.electrify_household", return_value=mock_household_electrified)
+class TestCalculateHouseholdSavingsWithFields(TestCase):
+
+    def test_it_only_calculates_requested_fields(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        result = calculate_household_savings(mock_household, "emissions,upfrontCost")
+        mock_calculate_emissions.assert_called_once()
+        mock_calculate_upfront_cost.assert_called_once()
+        mock_calculate_opex.assert_not_called()
+        mock_recommend_next_action.assert_not_called()
+        assert result.dict(by_alias=True, exclude_unset=True) == {
+            "emissions": mock_emissions.dict(by_alias=True),
+            "upfrontCost": mock_upfront_cost.dict(by_alias=True),
+        }
+
+    def test_it_skips_electrification_for_recommendation_only(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        result = calculate_household_savings(mock_household, "recommendation")
+        mock_electrify_household.assert_not_called()
+        assert result == Savings(recommendation=mock_recommendation)
+
+    def test_it_rejects_unknown_fields(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        with self.assertRaises(HTTPException) as context:
+            calculate_household_savings(mock_household, "emissions,carbon")
+        assert context.exception.status_code == 400
+        mock_calculate_emissions.assert_not_called()
+
+    def test_it_only_calculates_monthly_savings_when_requested(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        assert calculate_household_savings(mock_household).monthly is None
+
+        result = calculate_household_savings(mock_household, "monthly")
+        assert len(result.monthly.per_month) == 12
+        assert len(result.monthly.per_season) == 4
+        assert result.opex is None
+
+    def test_it_only_calculates_the_emissions_trajectory_when_requested(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        assert calculate_household_savings(mock_household).emissions_trajectory is None
+
+        result = calculate_household_savings(mock_household, "emissionsTrajectory")
+        assert len(result.emissions_trajectory) == 15
+        assert result.emissions_trajectory[0].year == 2023
+        assert result.emissions is None
+
+    def test_it_only_ranks_savings_when_requested(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        percentiles = SavingsPercentiles(opex=40.5, emissions=60, households=1200)
+        with patch("main.savings_ranking_index") as mock_index:
+            mock_index.get.return_value.rank.return_value = percentiles
+            assert calculate_household_savings(mock_household).percentiles is None
+            mock_index.get.assert_not_called()
+
+            result = calculate_household_savings(mock_household, "percentiles")
+        assert result.percentiles == percentiles
+        assert result.opex is None
+        mock_index.get.return_value.rank.assert_called_once_with(
+            mock_household, mock_opex, mock_emissions
+        )
+
+    def test_percentiles_are_null_until_the_ranking_is_built(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        with patch("main.savings_ranking_index") as mock_index:
+            mock_index.get.return_value = None
+            result = calculate_household_savings(mock_household, "opex,percentiles")
+        assert result.percentiles is None
+        assert "percentiles" in result.__fields_set__
+
+    def test_it_finds_similar_households_when_requested(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        with patch("main.find_similar_households", return_value=[]) as mock_find:
+            assert (
+                calculate_household_savings(mock_household).similar_households is None
+            )
+            mock_find.assert_not_called()
+
+            result = calculate_household_savings(mock_household, "similarHouseholds")
+        assert result.similar_households == []
+        assert result.opex is None
+        mock_find.assert_called_once()
+        assert mock_find.call_args.args[1] == mock_household
+
+    def test_it_reports_stage_timings(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        response = Response()
+        calculate_household_savings(mock_household, "opex", response)
+        timed_stages = [
+            timing.split(";")[0]
+            for timing in response.headers["Server-Timing"].split(", ")
+        ]
+        # Each household's totals can run at the same time, so in either order
+        assert sorted(timed_stages) == [
+            "electrified_household",
+            "electrified_household_totals",
+            "household",
+            "household_totals",
+            "opex",
+        ]
+
+
+@patch("main.recommend_next_action", return_value=mock_recommendation)
+@patch("main.calculate_upfront_cost", return_value=mock_upfront_cost)
+@patch("main.get_opex_from_totals", return_value=mock_opex)
+@patch("main.get_emissions_from_totals", return_value=mock_emissions)
+@patch("main.electrify_household", return_value=mock_household_electrified)
+class TestCalculateHouseholdSavingsBatch(TestCase):
+
+    def test_it_returns_a_row_per_household(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        negative_battery = mock_household.copy(
+            update={"battery": Battery(has_battery=True, capacity=-10)}
+        )
+        body = write_household_batch([mock_household, negative_battery, mock_household])
+
+        response = calculate_household_savings_batch(body, "opex,recommendation")
+
+        assert response.media_type == "application/vnd.apache.arrow.stream"
+        rows = pa.ipc.open_stream(response.body).read_all().to_pylist()
+        assert len(rows) == 3
+        assert rows[0]["opex.perWeek.difference"] == 160.41
+        assert rows[0]["recommendation.action"] == mock_recommendation.action.value
+        assert "emissions.perWeek.before" not in rows[0]
+        assert rows[1]["opex.perWeek.difference"] is None
+        assert rows[1]["error"] == "Battery capacity can't be negative"
+        assert rows[2]["error"] is None
+        assert mock_calculate_opex.call_count == 2
+        mock_calculate_emissions.assert_not_called()
+
+    def test_it_rejects_monthly_savings(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        body = write_household_batch([mock_household])
+        with self.assertRaises(HTTPException) as context:
+            calculate_household_savings_batch(body, "opex,monthly")
+        assert context.exception.status_code == 400
+
+    def test_it_streams_the_emissions_trajectory(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        body = write_household_batch([mock_household])
+        response = calculate_household_savings_batch(body, "emissionsTrajectory")
+        rows = pa.ipc.open_stream(response.body).read_all().to_pylist()
+        trajectory = rows[0]["emissionsTrajectory"]
+        assert [year["year"] for year in trajectory] == list(range(2023, 2038))
+        assert trajectory[-1]["emissions"]["difference"] < 0
+
+    def test_it_rejects_invalid_streams(
+        self,
+        mock_electrify_household,
+        mock_calculate_emissions,
+        mock_calculate_opex,
+        mock_calculate_upfront_cost,
+        mock_recommend_next_action,
+    ):
+        with self.assertRaises(HTTPException) as context:
+            calculate_household_savings_batch(b"{}")
+        assert context.exception.status_code == 400
+
+
+class TestAggregateHouseholdSavingsBatch(TestCase):
+    def test_it_returns_a_row_per_group(self):
+        negative_battery = mock_household.copy(
+            update={"battery": Battery(has_battery=True, capacity=-10)}
+        )
+        canterbury = mock_household.copy(update={"location": LocationEnum.CANTERBURY})
+        body = write_household_batch(
+            [mock_household, negative_battery, canterbury, mock_household]
+        )
+
+        response = aggregate_household_savings_batch(body, "location")
+
+        assert response.media_type == "application/vnd.apache.arrow.stream"
+        rows = pa.ipc.open_stream(response.body).read_all().to_pylist()
+        assert [row["location"] for row in rows] == [
+            LocationEnum.AUCKLAND_CENTRAL.value,
+            LocationEnum.CANTERBURY.value,
+        ]
+        assert [row["households"] for row in rows] == [2, 1]
+        assert [row["errors"] for row in rows] == [1, 0]
+        assert rows[0]["opex.perYear.difference.mean"] == (
+            rows[0]["opex.perYear.difference.total"] / 2
+        )
+
+    def test_it_rejects_unknown_groups(self):
+        body = write_household_batch([mock_household])
+        with self.assertRaises(HTTPException) as context:
+            aggregate_household_savings_batch(body, "location,colour")
+        assert context.exception.status_code == 400
+
+
+class TestQuerySavingsCube(TestCase):
+    labels, households = get_dimension_weights(
+        {
+            "location": {"OTAGO": 1000, "CANTERBURY": 3000},
+            "spaceHeating": {"GAS": 1, "WOOD": 1},
+            "waterHeating": {"GAS": 1},
+            "cooktop": {"GAS": 1},
+            "occupancy": {"1": 1, "2": 1},
+            "vehicles": {"NONE": 1},
+        }
+    )
+    cube = SavingsCube(
+        labels=labels,
+        households=households,
+        values=np.ones((7,) + households.shape, dtype=np.float32),
+    )
+
+    def test_it_returns_a_row_per_group(self):
+        with patch("main.load_savings_cube", return_value=self.cube):
+            response = query_savings_cube(
+                location="OTAGO,CANTERBURY",
+                space_heating="GAS",
+                water_heating=None,
+                cooktop=None,
+                occupancy="1, 2",
+                vehicles=None,
+                group_by="location,occupancy",
+            )
+        assert response.media_type == "application/vnd.apache.arrow.stream"
+        rows = pa.ipc.open_stream(response.body).read_all().to_pylist()
+        assert [(row["location"], row["occupancy"]) for row in rows] == [
+            ("OTAGO", 1),
+            ("OTAGO", 2),
+            ("CANTERBURY", 1),
+            ("CANTERBURY", 2),
+        ]
+        assert [row["households"] for row in rows] == [250, 250, 750, 750]
+        assert rows[0]["opex.perYear.after.total"] == 250
+
+    def test_it_rejects_unknown_labels(self):
+        with patch("main.load_savings_cube", return_value=self.cube):
+            with self.assertRaises(HTTPException) as context:
+                query_savings_cube(None, None, None, "INDUCTION", None, None, None)
+        assert context.exception.status_code == 400
+
+
+class TestCalculateHouseholdSavingsCurve(TestCase):
+
+    def test_it_returns_the_curve(self):
+        request = SavingsCurveRequest(
+            household=mock_household,
+            sweeps=[Sweep(field="solar.size", start=0, stop=15, step=0.25)],
+        )
+
+        response = calculate_household_savings_curve(request)
+
+        curve = json.loads(response.body)
+        assert curve["axes"][0]["field"] == "solar.size"
+        assert len(curve["axes"][0]["values"]) == 61
+        assert len(curve["opex"]["perWeek"]["difference"]) == 61
+        assert len(curve["upfrontCost"]) == 61
+
+    def test_it_rejects_invalid_sweeps(self):
+        request = SavingsCurveRequest(
+            household=mock_household,
+            sweeps=[Sweep(field="solar.size", start=0, stop=15, step=0)],
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            calculate_household_savings_curve(request)
+        assert context.exception.status_code == 400
+
+
+class TestCalculateHouseholdSystemSize(TestCase):
+
+    @patch("main.optimise_system_size")
+    def test_it_returns_the_system_size(self, mock_optimise_system_size):
+        system_size = SystemSize(solarSize=5, batteryCapacity=10)
+        mock_optimise_system_size.return_value = system_size
+        request = SystemSizeRequest(household=mock_household, maxSolarSize=8)
+
+        assert calculate_household_system_size(request) == system_size
+        mock_optimise_system_size.assert_called_once_with(mock_household, None, 8, None)
+
+    def test_it_rejects_invalid_households(self):
+        negative_battery = mock_household.copy(
+            update={"battery": Battery(has_battery=True, capacity=-10)}
+        )
+        request = SystemSizeRequest(household=negative_battery)
+
+        with self.assertRaises(HTTPException) as context:
+            calculate_household_system_size(request)
+        assert context.exception.status_code == 400
+
+
+class TestCompareHouseholdRetailPlans(TestCase):
+
+    def test_it_returns_the_cheapest_plans(self):
+        comparison = compare_household_retail_plans(
+            mock_household, PlanTypeEnum.TIME_OF_USE
+        )
+        assert comparison.before.plan_type == PlanTypeEnum.TIME_OF_USE
+        assert comparison.after.plan_type == PlanTypeEnum.TIME_OF_USE
+
+    @patch("main.compare_retail_plans", side_effect=ValueError("No plans"))
+    def test_it_rejects_households_without_plans(self, mock_compare_retail_plans):
+        household = mock_household.copy(update={"location": LocationEnum.OTHER})
+        with self.assertRaises(HTTPException) as context:
+            compare_household_retail_plans(household)
+        assert context.exception.status_code == 400
+
+
+class TestCalibrateHouseholdEnergy(TestCase):
+
+    def test_it_calibrates_the_household_against_its_meter_data(self):
+        csv = "datetime,kwh\n" + "2023-01-01T00:00,0.5\n" * 8760
+        request = MeterCalibrationRequest(
+            household=mock_household,
+            meterData=base64.b64encode(csv.encode()).decode(),
+        )
+        calibration = calibrate_household_energy(request)
+        assert calibration.baseload_kwh_per_day == 12
+        assert calibration.space_heating_factor == 1
+
+    @patch("main.calibrate_energy_needs", return_value=MeterCalibration())
+    def test_it_decodes_the_meter_data(self, mock_calibrate_energy_needs):
+        request = MeterCalibrationRequest(
+            household=mock_household,
+            meterData=base64.b64encode(b"arrow").decode(),
+            meterDataFormat=MeterDataFormatEnum.ARROW,
+        )
+        calibrate_household_energy(request)
+        mock_calibrate_energy_needs.assert_called_once_with(
+            mock_household, b"arrow", MeterDataFormatEnum.ARROW
+        )
+
+    def test_it_rejects_invalid_meter_data(self):
+        for meter_data in ["not base64!", base64.b64encode(b"kwh\n1\n").decode()]:
+            request = MeterCalibrationRequest(
+                household=mock_household, meterData=meter_data
+            )
+            with self.assertRaises(HTTPException) as context:
+                calibrate_household_energy(request)
+            assert context.exception.status_code == 400
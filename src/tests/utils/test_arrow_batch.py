@@ -0,0 +1,136 @@
+import pyarrow as pa
+import pytest
+
+from openapi_client.models import Household, MeterCalibration, Savings
+from tests.mocks import (
+    mock_emissions,
+    mock_household,
+    mock_household_electrified,
+    mock_opex,
+    mock_recommendation,
+    mock_upfront_cost,
+)
+from utils.arrow_batch import (
+    HOUSEHOLD_ARROW_SCHEMA,
+    read_household_rows,
+    savings_aggregate_arrow_schema,
+    savings_cube_arrow_schema,
+    savings_arrow_schema,
+    write_household_batch,
+    write_savings_aggregate,
+    write_savings_batch,
+    write_savings_cube_rows,
+)
+from utils.savings_aggregates import SavingsAggregate
+
+
+def to_stream(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def read_stream(body: bytes) -> pa.Table:
+    return pa.ipc.open_stream(body).read_all()
+
+
+class TestReadHouseholdRows:
+    def test_it_round_trips_households(self):
+        calibrated = mock_household.copy(
+            update={
+                "meter_calibration": MeterCalibration(
+                    baseloadFactor=1.2, spaceHeatingFactor=0.8
+                )
+            }
+        )
+        body = write_household_batch([calibrated, mock_household_electrified])
+        assert read_stream(body).schema == HOUSEHOLD_ARROW_SCHEMA
+        rows = read_household_rows(body)
+        assert [Household.from_dict(row) for row in rows] == [
+            calibrated,
+            mock_household_electrified,
+        ]
+
+    def test_it_treats_missing_columns_as_null(self):
+        table = pa.table({"occupancy": pa.array([3], pa.int64()), "other": [1]})
+        assert read_household_rows(to_stream(table)) == [{"occupancy": 3}]
+
+    def test_it_nests_dotted_columns(self):
+        table = pa.table({"solar.hasSolar": [True], "solar.size": [5]})
+        assert read_household_rows(to_stream(table)) == [
+            {"solar": {"hasSolar": True, "size": 5.0}}
+        ]
+
+    def test_it_rejects_columns_of_the_wrong_type(self):
+        table = pa.table({"vehicles": ["PETROL"]})
+        with pytest.raises(ValueError, match="vehicles"):
+            read_household_rows(to_stream(table))
+
+    def test_it_rejects_invalid_streams(self):
+        with pytest.raises(ValueError, match="Invalid Arrow IPC stream"):
+            read_household_rows(b"not arrow")
+
+
+class TestWriteSavingsBatch:
+    def test_it_flattens_savings(self):
+        savings = Savings(
+            emissions=mock_emissions,
+            upfrontCost=mock_upfront_cost,
+            recommendation=mock_recommendation,
+        )
+        table = read_stream(write_savings_batch([savings, None], [None, "Oops"]))
+        assert table.schema == savings_arrow_schema()
+        rows = table.to_pylist()
+        assert rows[0]["emissions.perWeek.before"] == 500.5
+        assert rows[0]["emissions.operationalLifetime"] == 15
+        assert rows[0]["upfrontCost.waterHeating"] == 3000.15
+        assert rows[0]["recommendation.action"] == mock_recommendation.action.value
+        assert rows[0]["opex.perWeek.before"] is None
+        assert rows[0]["error"] is None
+        assert rows[1]["emissions.perWeek.before"] is None
+        assert rows[1]["error"] == "Oops"
+
+    def test_it_only_includes_requested_sections(self):
+        table = read_stream(write_savings_batch([], [], {"upfrontCost"}))
+        assert table.column_names == [
+            "upfrontCost.solar",
+            "upfrontCost.battery",
+            "upfrontCost.cooktop",
+            "upfrontCost.waterHeating",
+            "upfrontCost.spaceHeating",
+            "error",
+        ]
+
+
+class TestWriteSavingsAggregate:
+    def test_it_writes_a_row_per_group(self):
+        aggregate = SavingsAggregate(["location", "occupancy"])
+        savings = Savings(emissions=mock_emissions, opex=mock_opex)
+        aggregate.add(mock_household, savings)
+        aggregate.add(mock_household, savings)
+        aggregate.add_error(None)
+
+        table = read_stream(write_savings_aggregate(aggregate))
+        assert table.schema == savings_aggregate_arrow_schema(["location", "occupancy"])
+        assert table.schema.field("occupancy").type == pa.int32()
+        assert table.to_pylist() == aggregate.summarise()
+        assert table.column("households").to_pylist() == [0, 2]
+        assert "opex.perYear.difference.p90" in table.column_names
+
+
+class TestWriteSavingsCubeRows:
+    def test_it_writes_the_rows(self):
+        row = {
+            "occupancy": 2,
+            "vehicles": "PETROL+ELECTRIC",
+            "households": 10.5,
+            **{
+                field.name: None if field.name.endswith(".mean") else 1.0
+                for field in savings_cube_arrow_schema([])
+                if field.name != "households"
+            },
+        }
+        table = read_stream(write_savings_cube_rows([row], ["occupancy", "vehicles"]))
+        assert table.schema.field("occupancy").type == pa.int32()
+        assert table.to_pylist() == [row]
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from constants.fuel_stats import EMISSIONS_FACTORS, FuelTypeEnum
+from constants.fuel_vectors import (
+    EMISSIONS_FACTORS_VECTOR,
+    OTHER_FUEL_COST_PER_KWH_TODAY_VECTOR,
+)
+from utils.fuel_vector import N_FUEL_TYPES, FuelVector
+
+
+class TestFuelVector:
+    def test_it_behaves_like_a_dict_of_set_fuels(self):
+        vector = FuelVector.from_mapping(
+            {FuelTypeEnum.PETROL: 2.0, FuelTypeEnum.ELECTRICITY: 0.0}
+        )
+        assert vector == {FuelTypeEnum.ELECTRICITY: 0.0, FuelTypeEnum.PETROL: 2.0}
+        assert len(vector) == 2
+        assert list(vector) == [FuelTypeEnum.ELECTRICITY, FuelTypeEnum.PETROL]
+        assert vector[FuelTypeEnum.PETROL] == 2.0
+        assert vector.get(FuelTypeEnum.DIESEL, 0) == 0
+        with pytest.raises(KeyError):
+            vector[FuelTypeEnum.DIESEL]
+
+    def test_it_is_empty_by_default(self):
+        assert FuelVector() == {}
+        assert FuelVector().total() == 0
+
+    def test_it_requires_one_slot_per_fuel(self):
+        with pytest.raises(ValueError):
+            FuelVector(np.zeros(3))
+
+    def test_dense_sets_every_fuel(self):
+        vector = FuelVector.dense(np.arange(N_FUEL_TYPES))
+        assert set(vector) == set(FuelTypeEnum)
+        assert vector[FuelTypeEnum.SOLAR] == N_FUEL_TYPES - 1
+
+    def test_add(self):
+        a = FuelVector.of(FuelTypeEnum.PETROL, 1)
+        b = {FuelTypeEnum.PETROL: 2, FuelTypeEnum.DIESEL: 3}
+        assert a + b == {FuelTypeEnum.PETROL: 3, FuelTypeEnum.DIESEL: 3}
+        assert b + a == {FuelTypeEnum.PETROL: 3, FuelTypeEnum.DIESEL: 3}
+
+    def test_sum(self):
+        assert FuelVector.sum(
+            [
+                {FuelTypeEnum.PETROL: 1},
+                FuelVector.of(FuelTypeEnum.PETROL, 2),
+                {FuelTypeEnum.WOOD: 4},
+            ]
+        ) == {FuelTypeEnum.PETROL: 3, FuelTypeEnum.WOOD: 4}
+        assert sum([FuelVector.of(FuelTypeEnum.LPG, 1)] * 3) == {FuelTypeEnum.LPG: 3}
+        assert FuelVector.sum([]) == {}
+
+    def test_subtract_keeps_fuels_set_in_either(self):
+        a = FuelVector.from_mapping({FuelTypeEnum.ELECTRICITY: 5, FuelTypeEnum.LPG: 1})
+        b = FuelVector.of(FuelTypeEnum.ELECTRICITY, 2)
+        assert a - b == {FuelTypeEnum.ELECTRICITY: 3, FuelTypeEnum.LPG: 1}
+
+    def test_scale(self):
+        vector = FuelVector.of(FuelTypeEnum.DIESEL, 2)
+        assert vector * 3 == {FuelTypeEnum.DIESEL: 6}
+        assert 3 * vector == {FuelTypeEnum.DIESEL: 6}
+        assert vector / 4 == {FuelTypeEnum.DIESEL: 0.5}
+
+    def test_dot_with_emissions_factors(self):
+        energy = FuelVector.from_mapping(
+            {FuelTypeEnum.NATURAL_GAS: 10, FuelTypeEnum.ELECTRICITY: 100}
+        )
+        assert energy.dot(EMISSIONS_FACTORS_VECTOR) == pytest.approx(
+            10 * EMISSIONS_FACTORS[FuelTypeEnum.NATURAL_GAS]
+            + 100 * EMISSIONS_FACTORS[FuelTypeEnum.ELECTRICITY]
+        )
+
+    def test_other_fuel_costs_exclude_electricity(self):
+        assert FuelTypeEnum.ELECTRICITY not in OTHER_FUEL_COST_PER_KWH_TODAY_VECTOR
+        energy = FuelVector.of(FuelTypeEnum.ELECTRICITY, 100)
+        assert energy.dot(OTHER_FUEL_COST_PER_KWH_TODAY_VECTOR) == 0
+
+    def test_only_and_without(self):
+        vector = FuelVector.from_mapping(
+            {FuelTypeEnum.ELECTRICITY: 5, FuelTypeEnum.LPG: 1}
+        )
+        assert vector.only(FuelTypeEnum.LPG) == {FuelTypeEnum.LPG: 1}
+        assert vector.without(FuelTypeEnum.LPG) == {FuelTypeEnum.ELECTRICITY: 5}
+        assert vector.without(FuelTypeEnum.LPG).total() == 5
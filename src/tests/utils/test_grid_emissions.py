@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from utils.grid_emissions import (
+    calculate_grid_emissions,
+    get_grid_emissions_trajectory,
+    get_lifetime_years,
+    load_hourly_grid_emissions,
+)
+
+
+class TestLoadHourlyGridEmissions:
+    def test_it_loads_the_default_intensities(self):
+        intensity = load_hourly_grid_emissions()
+        assert intensity.shape == (8760,)
+        assert intensity.mean() == pytest.approx(0.074, abs=1e-4)
+        # Winter evenings burn more gas & coal than summer afternoons
+        by_day = intensity.reshape(365, 24)
+        assert by_day[170:230, 18].mean() > by_day[0:60, 14].mean()
+
+    def test_it_shares_the_intensities_read_only(self):
+        intensity = load_hourly_grid_emissions()
+        assert load_hourly_grid_emissions() is intensity
+        with pytest.raises(ValueError):
+            intensity[0] = 0
+
+    def test_it_rejects_a_partial_year(self, tmp_path):
+        path = tmp_path / "grid.csv"
+        path.write_text("datetime,kgco2e_per_kwh\n2023-01-01T00:00,0.1\n")
+        with pytest.raises(ValueError):
+            load_hourly_grid_emissions(path)
+
+    def test_it_rejects_negative_intensities(self, tmp_path):
+        path = tmp_path / "grid.csv"
+        path.write_text("datetime,kgco2e_per_kwh\n" + "x,-0.1\n" * 8760)
+        with pytest.raises(ValueError):
+            load_hourly_grid_emissions(path)
+
+
+class TestGetGridEmissionsTrajectory:
+    def test_it_covers_the_lifetime(self):
+        trajectory = get_grid_emissions_trajectory(get_lifetime_years())
+        assert len(trajectory) == len(get_lifetime_years())
+        assert trajectory[0] == pytest.approx(0.074)
+        # The grid decarbonises
+        assert np.all(np.diff(trajectory) <= 0)
+
+    def test_it_rejects_missing_years(self, tmp_path):
+        path = tmp_path / "trajectory.csv"
+        path.write_text("year,kgco2e_per_kwh\n2023,0.07\n2024,0.06\n")
+        assert get_grid_emissions_trajectory([2024], path).tolist() == [0.06]
+        with pytest.raises(ValueError, match="2025"):
+            get_grid_emissions_trajectory([2024, 2025], path)
+
+
+class TestCalculateGridEmissions:
+    def test_flat_use_emits_each_years_average(self):
+        emissions = calculate_grid_emissions(np.ones(8760), [2023, 2030])
+        assert emissions == pytest.approx(
+            8760 * get_grid_emissions_trajectory([2023, 2030]), rel=1e-3
+        )
+
+    def test_it_weights_use_by_the_hourly_intensity(self):
+        intensity = load_hourly_grid_emissions()
+        kwh = np.zeros(8760)
+        kwh[intensity.argmax()] = 1
+        emissions = calculate_grid_emissions(kwh, [2023])
+        assert emissions[0] == pytest.approx(intensity.max() * 0.074 / intensity.mean())
+
+    def test_it_calculates_a_batch_at_once(self):
+        rng = np.random.default_rng(0)
+        kwh = rng.random((5, 8760))
+        years = list(get_lifetime_years())
+        emissions = calculate_grid_emissions(kwh, years)
+        assert emissions.shape == (5, len(years))
+        for row, household in zip(emissions, kwh):
+            assert row == pytest.approx(calculate_grid_emissions(household, years))
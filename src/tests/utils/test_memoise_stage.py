@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from constants.utils import PeriodEnum
+from models.electrify_household import electrify_household
+from openapi_client.models import Household, OpexValues
+from savings.closed_form.evaluate_household_model import (
+    calculate_emissions_closed_form,
+    calculate_opex_closed_form,
+)
+from savings.energy.get_machine_energy import get_other_appliances_energy_per_period
+from savings.upfront_cost.calculate_upfront_cost import calculate_upfront_cost
+from tests.mocks import mock_household, mock_household_electrified
+from savings.closed_form.compile_household_model import compile_household_model
+from utils.clean_household import clean_household
+from utils.memoise_stage import (
+    STAGE_CACHES,
+    StageCache,
+    get_stage_cache_stats,
+    memoise_stage,
+)
+
+
+class TestStageCache:
+    def test_it_only_computes_once_per_key(self):
+        cache = StageCache("test", max_size=2)
+        compute = MagicMock(return_value=5)
+        assert cache.get_or_compute("a", compute) == 5
+        assert cache.get_or_compute("a", compute) == 5
+        compute.assert_called_once()
+
+    def test_it_evicts_least_recently_used(self):
+        cache = StageCache("test", max_size=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)  # a is now most recently used
+        cache.get_or_compute("c", lambda: 3)  # evicts b
+
+        compute = MagicMock(return_value=2)
+        cache.get_or_compute("b", compute)
+        compute.assert_called_once()
+        assert cache.stats()["size"] == 2
+
+    def test_it_reports_hit_rate(self):
+        cache = StageCache("test")
+        assert cache.stats()["hit_rate"] == 0
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        assert cache.stats() == {
+            "hits": 2,
+            "misses": 2,
+            "hit_rate": 0.5,
+            "size": 2,
+            "max_size": 1024,
+        }
+
+    def test_it_does_not_cache_exceptions(self):
+        cache = StageCache("test")
+        with pytest.raises(ValueError):
+            cache.get_or_compute("a", MagicMock(side_effect=ValueError))
+        assert cache.get_or_compute("a", lambda: 1) == 1
+
+    def test_it_rejects_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            StageCache("test", max_size=0)
+
+
+class TestMemoiseStage:
+    def setup_method(self):
+        STAGE_CACHES.pop("test_stage", None)
+
+    def teardown_method(self):
+        STAGE_CACHES.pop("test_stage", None)
+
+    def test_it_caches_on_projection_only(self):
+        stage = MagicMock(side_effect=lambda x, y: x * 2)
+        memoised = memoise_stage("test_stage", lambda x, y: x)(stage)
+
+        assert memoised(2, "ignored") == 4
+        assert memoised(2, "also ignored") == 4
+        stage.assert_called_once_with(2, "ignored")
+        assert get_stage_cache_stats()["test_stage"]["hits"] == 1
+
+    def test_each_caller_gets_its_own_copy_of_models(self):
+        memoised = memoise_stage("test_stage", lambda x: x)(
+            lambda x: [OpexValues(before=x, after=0, difference=-x)]
+        )
+        first = memoised(1)
+        first[0].before = 2
+        assert memoised(1)[0].before == 1
+
+    def test_other_cached_results_are_read_only(self):
+        memoised = memoise_stage("test_stage", lambda x: x)(
+            lambda x: {"values": [np.full(2, x)]}
+        )
+        with pytest.raises(ValueError, match="read-only"):
+            memoised(1)["values"][0][0] = 2
+        assert memoised(1)["values"][0][0] == 1
+
+    def test_it_rejects_duplicate_names(self):
+        memoise_stage("test_stage", lambda x: x)(lambda x: x)
+        with pytest.raises(ValueError):
+            memoise_stage("test_stage", lambda x: x)(lambda x: x)
+
+
+class TestMemoisedStages:
+    def test_other_appliances_energy_shares_entries_for_5_plus_occupants(self):
+        five = get_other_appliances_energy_per_period(5, PeriodEnum.YEARLY)
+        eight = get_other_appliances_energy_per_period(8, PeriodEnum.YEARLY)
+        assert five == eight
+        assert STAGE_CACHES["get_other_appliances_energy_per_period"].hits == 1
+
+    def test_cached_fuel_vectors_and_models_are_read_only(self):
+        energy = get_other_appliances_energy_per_period(3, PeriodEnum.YEARLY)
+        with pytest.raises(ValueError, match="read-only"):
+            energy.array *= 2
+        model = compile_household_model(clean_household(mock_household))
+        with pytest.raises(ValueError, match="read-only"):
+            model.e_needs[0] = 0
+        assert get_other_appliances_energy_per_period(3, PeriodEnum.YEARLY) == energy
+
+    def test_upfront_cost_ignores_occupancy_and_vehicles(self):
+        calculate_upfront_cost(mock_household, mock_household_electrified)
+        other_household = mock_household.copy(update={"occupancy": 1, "vehicles": []})
+        calculate_upfront_cost(other_household, mock_household_electrified)
+        assert STAGE_CACHES["calculate_upfront_cost"].hits == 1
+
+    def test_upfront_cost_misses_when_solar_changes(self):
+        calculate_upfront_cost(mock_household, mock_household_electrified)
+        other_household = Household(
+            **{
+                **mock_household.dict(),
+                "solar": mock_household.solar.copy(update={"size": 3}),
+            }
+        )
+        calculate_upfront_cost(other_household, mock_household_electrified)
+        assert STAGE_CACHES["calculate_upfront_cost"].misses == 2
+
+    def test_household_totals_are_shared_by_opex_and_emissions(self):
+        current = clean_household(mock_household)
+        electrified = electrify_household(current)
+        calculate_opex_closed_form(current, electrified)
+        calculate_emissions_closed_form(current, electrified)
+        assert STAGE_CACHES["get_household_totals"].misses == 2
+        assert STAGE_CACHES["get_household_totals"].hits == 2
+
+        other = current.copy(update={"solar": current.solar.copy(update={"size": 3})})
+        calculate_opex_closed_form(other, electrify_household(other))
+        assert STAGE_CACHES["get_household_totals"].misses == 4
@@ -0,0 +1,79 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from openapi_client.models import MeterDataFormatEnum
+from utils.meter_data import METER_LEAP_YEAR, get_meter_data_year, read_meter_data
+
+
+def to_csv(kwh: np.ndarray) -> bytes:
+    rows = "".join(f"2023-01-01T00:00,{value}\n" for value in kwh)
+    return f"datetime,kwh\n{rows}".encode()
+
+
+def to_arrow(kwh: np.ndarray, batch_size: int = 1000) -> bytes:
+    table = pa.table({"kwh": kwh})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=batch_size)
+    return sink.getvalue().to_pybytes()
+
+
+class TestReadMeterData:
+    def test_it_reads_hourly_csvs(self):
+        kwh = np.arange(8760) / 100
+        np.testing.assert_array_almost_equal(read_meter_data(to_csv(kwh)), kwh)
+
+    def test_it_reads_half_hourly_arrow_streams(self):
+        kwh = np.arange(17520) / 100
+        np.testing.assert_array_equal(
+            read_meter_data(to_arrow(kwh), MeterDataFormatEnum.ARROW), kwh
+        )
+
+    def test_it_ignores_other_columns(self):
+        table = pa.table(
+            {"meter": ["A"] * 8760, "kwh": pa.array([1] * 8760, pa.int64())}
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        kwh = read_meter_data(sink.getvalue().to_pybytes(), MeterDataFormatEnum.ARROW)
+        assert kwh.dtype == float and kwh.sum() == 8760
+
+    def test_it_reads_other_years(self):
+        assert len(read_meter_data(to_csv(np.zeros(8784)), year=2024)) == 8784
+
+    def test_it_reads_leap_years_without_being_told_the_year(self):
+        kwh = np.ones(17568)
+        np.testing.assert_array_equal(
+            read_meter_data(to_arrow(kwh), MeterDataFormatEnum.ARROW), kwh
+        )
+        assert get_meter_data_year(17568) == METER_LEAP_YEAR == 2024
+        assert get_meter_data_year(8760) == 2023
+        with pytest.raises(ValueError):
+            read_meter_data(to_csv(np.zeros(8784)), year=2023)
+
+    def test_it_rejects_data_that_isnt_a_whole_year(self):
+        with pytest.raises(ValueError):
+            read_meter_data(to_csv(np.zeros(1000)))
+        with pytest.raises(ValueError):
+            read_meter_data(to_arrow(np.zeros(17521)), MeterDataFormatEnum.ARROW)
+        with pytest.raises(ValueError):
+            read_meter_data(to_arrow(np.zeros(17569)), MeterDataFormatEnum.ARROW)
+
+    def test_it_rejects_negative_or_missing_kwh(self):
+        kwh = np.ones(8760)
+        kwh[5] = -1
+        with pytest.raises(ValueError):
+            read_meter_data(to_csv(kwh))
+        kwh[5] = np.nan
+        with pytest.raises(ValueError):
+            read_meter_data(to_arrow(kwh), MeterDataFormatEnum.ARROW)
+
+    def test_it_rejects_data_without_a_kwh_column(self):
+        with pytest.raises(ValueError, match="kwh column"):
+            read_meter_data(b"datetime,usage\n2023-01-01T00:00,1\n")
+        with pytest.raises(ValueError):
+            read_meter_data(b"not arrow", MeterDataFormatEnum.ARROW)
+        with pytest.raises(ValueError):
+            read_meter_data(b"datetime,kwh\n2023-01-01T00:00,lots\n")
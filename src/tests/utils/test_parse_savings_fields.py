@@ -0,0 +1,38 @@
+import pytest
+
+from utils.parse_savings_fields import SAVINGS_FIELDS, parse_savings_fields
+
+
+class TestParseSavingsFields:
+    def test_it_defaults_to_all_fields(self):
+        assert parse_savings_fields() == set(SAVINGS_FIELDS)
+        assert parse_savings_fields("") == set(SAVINGS_FIELDS)
+
+    def test_it_parses_comma_separated_fields(self):
+        assert parse_savings_fields("emissions,upfrontCost") == {
+            "emissions",
+            "upfrontCost",
+        }
+
+    def test_it_ignores_whitespace_and_empty_entries(self):
+        assert parse_savings_fields(" opex , ,recommendation,") == {
+            "opex",
+            "recommendation",
+        }
+
+    def test_it_rejects_unknown_fields(self):
+        with pytest.raises(ValueError, match="upfront_cost"):
+            parse_savings_fields("opex,upfront_cost")
+
+    def test_it_only_includes_optional_fields_when_requested(self):
+        assert "monthly" not in parse_savings_fields()
+        assert parse_savings_fields("opex,monthly") == {"opex", "monthly"}
+
+    def test_it_can_restrict_the_optional_fields(self):
+        with pytest.raises(ValueError, match="monthly"):
+            parse_savings_fields("opex,monthly", optional_fields=[])
+        assert parse_savings_fields(
+            "emissionsTrajectory", optional_fields=["emissionsTrajectory"]
+        ) == {"emissionsTrajectory"}
+        with pytest.raises(ValueError, match="monthly"):
+            parse_savings_fields("monthly", optional_fields=["emissionsTrajectory"])
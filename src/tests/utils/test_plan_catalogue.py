@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from openapi_client.models import LocationEnum, PlanTypeEnum
+from utils.plan_catalogue import load_plan_catalogue, parse_plan_catalogue
+from utils.tou_tariff import TOU_PERIODS, TouPeriodEnum
+
+catalogue_json = {
+    "schedules": {
+        "anytime": {
+            "weekday": [{"start": 0, "end": 24, "period": "SHOULDER"}],
+            "weekend": [{"start": 0, "end": 24, "period": "SHOULDER"}],
+        },
+        "night": {
+            "weekday": [
+                {"start": 7, "end": 23, "period": "SHOULDER"},
+                {"start": 23, "end": 7, "period": "NIGHT"},
+            ],
+            "weekend": [
+                {"start": 7, "end": 23, "period": "SHOULDER"},
+                {"start": 23, "end": 7, "period": "NIGHT"},
+            ],
+        },
+    },
+    "plans": [
+        {
+            "id": "auckland-anytime",
+            "name": "Auckland Anytime",
+            "planType": "ANYTIME",
+            "regions": ["AUCKLAND_CENTRAL"],
+            "schedule": "anytime",
+            "dailyCharge": 2,
+            "rates": {"PEAK": 0.3, "SHOULDER": 0.3, "OFF_PEAK": 0.3, "NIGHT": 0.3},
+            "solarBuyBack": 0.1,
+            "maxAnnualKwh": None,
+        },
+        {
+            "id": "national-night",
+            "name": "National Night",
+            "planType": "TIME_OF_USE",
+            "regions": None,
+            "schedule": "night",
+            "dailyCharge": 1,
+            "rates": {"SHOULDER": 0.32, "NIGHT": 0.15},
+            "maxAnnualKwh": 8000,
+        },
+    ],
+}
+
+
+class TestParsePlanCatalogue:
+    def test_it_builds_plan_arrays(self):
+        catalogue = parse_plan_catalogue(catalogue_json)
+        assert catalogue.ids == ("auckland-anytime", "national-night")
+        assert catalogue.plan_types == (
+            PlanTypeEnum.ANYTIME,
+            PlanTypeEnum.TIME_OF_USE,
+        )
+        assert catalogue.schedule_index.tolist() == [0, 1]
+        assert catalogue.rates[1, TOU_PERIODS.index(TouPeriodEnum.NIGHT)] == 0.15
+        assert catalogue.rates[1, TOU_PERIODS.index(TouPeriodEnum.PEAK)] == 0
+        assert catalogue.solar_buy_back.tolist() == [0.1, 0]
+        assert catalogue.max_annual_kwh.tolist() == [np.inf, 8000]
+
+    def test_it_indexes_plans_by_region_and_type(self):
+        catalogue = parse_plan_catalogue(catalogue_json)
+        assert catalogue.get_plan_indices(LocationEnum.AUCKLAND_CENTRAL).tolist() == [
+            0,
+            1,
+        ]
+        assert catalogue.get_plan_indices(LocationEnum.OTAGO).tolist() == [1]
+        assert catalogue.get_plan_indices(
+            LocationEnum.AUCKLAND_CENTRAL, PlanTypeEnum.TIME_OF_USE
+        ).tolist() == [1]
+        assert (
+            catalogue.get_plan_indices(LocationEnum.OTAGO, PlanTypeEnum.ANYTIME).size
+            == 0
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"schedule": "weekends-only"},
+            {"regions": ["ATLANTIS"]},
+            {"planType": "SPOT"},
+            {"rates": {"SUPER_PEAK": 1}},
+        ],
+    )
+    def test_it_rejects_invalid_plans(self, change):
+        invalid = {
+            **catalogue_json,
+            "plans": [{**catalogue_json["plans"][0], **change}],
+        }
+        with pytest.raises(ValueError):
+            parse_plan_catalogue(invalid)
+
+
+class TestLoadPlanCatalogue:
+    def test_it_loads_the_default_catalogue(self):
+        catalogue = load_plan_catalogue()
+        assert len(catalogue.ids) > 0
+        # Every region has a plan
+        for location in LocationEnum:
+            assert catalogue.get_plan_indices(location).size > 0
@@ -0,0 +1,157 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from openapi_client.models import LocationEnum, Savings
+from tests.mocks import mock_emissions, mock_household, mock_opex
+from utils.savings_aggregates import (
+    SavingsAggregate,
+    StreamingSummary,
+    get_quantile_name,
+    parse_group_by,
+)
+
+mock_savings = Savings(emissions=mock_emissions, opex=mock_opex)
+
+
+def summarise(values, **kwargs) -> StreamingSummary:
+    summary = StreamingSummary(**kwargs)
+    for value in values:
+        summary.add(float(value))
+    return summary
+
+
+class TestStreamingSummary:
+    values = np.random.default_rng(0).normal(-300, 400, 10_000)
+
+    def test_it_counts_and_totals_exactly(self):
+        summary = summarise(self.values)
+        assert summary.count == len(self.values)
+        assert summary.total == pytest.approx(self.values.sum())
+        assert summary.mean == pytest.approx(self.values.mean())
+        assert summary.min == self.values.min()
+        assert summary.max == self.values.max()
+
+    @pytest.mark.parametrize("q", [0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1])
+    def test_quantiles_are_within_the_relative_accuracy(self, q):
+        summary = summarise(self.values)
+        # The sketch's quantile is within 1% of a value whose rank is q
+        exact = np.sort(self.values)[int(np.ceil(q * (len(self.values) - 1)))]
+        assert summary.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_its_size_doesnt_depend_on_the_number_of_values(self):
+        summary = summarise(np.tile(self.values, 10))
+        largest = np.abs(self.values).max()
+        max_buckets = np.log(largest / summary.min_value) / np.log(summary.gamma) + 1
+        assert len(summary.positive) <= max_buckets
+        assert len(summary.negative) <= max_buckets
+        assert summary.count == 10 * len(self.values)
+
+    def test_merging_matches_summarising_everything(self):
+        merged = summarise(self.values[:3000]).merge(summarise(self.values[3000:]))
+        whole = summarise(self.values)
+        assert merged.count == whole.count
+        assert merged.total == pytest.approx(whole.total)
+        assert merged.positive == whole.positive
+        assert merged.negative == whole.negative
+        assert merged.zero == whole.zero
+        assert merged.quantile(0.5) == whole.quantile(0.5)
+
+    def test_small_values_count_as_zero(self):
+        summary = summarise([0, 1e-5, -1e-5, 0, 5])
+        assert summary.zero == 4
+        assert summary.quantile(0.5) == 0
+
+    def test_it_only_merges_summaries_with_the_same_accuracy(self):
+        with pytest.raises(ValueError):
+            StreamingSummary().merge(StreamingSummary(relative_accuracy=0.05))
+
+    def test_an_empty_summary_has_no_quantiles(self):
+        assert StreamingSummary().quantile(0.5) is None
+        assert StreamingSummary().mean is None
+        with pytest.raises(ValueError):
+            summarise([1]).quantile(1.5)
+
+
+class TestSavingsAggregate:
+    def test_it_aggregates_by_group(self):
+        aggregate = SavingsAggregate(["location", "occupancy"])
+        canterbury = mock_household.copy(update={"location": LocationEnum.CANTERBURY})
+        for household in [mock_household, mock_household, canterbury]:
+            aggregate.add(household, mock_savings)
+        # Occupancy above 5 is grouped with 5
+        aggregate.add_error(canterbury.copy(update={"occupancy": 7}))
+        aggregate.add_error(None)
+
+        rows = aggregate.summarise()
+        assert [(row["location"], row["occupancy"]) for row in rows] == [
+            (None, None),
+            (LocationEnum.AUCKLAND_CENTRAL.value, 4),
+            (LocationEnum.CANTERBURY.value, 4),
+            (LocationEnum.CANTERBURY.value, 5),
+        ]
+        assert [row["households"] for row in rows] == [0, 2, 1, 0]
+        assert [row["errors"] for row in rows] == [1, 0, 0, 1]
+        auckland = rows[1]
+        difference = mock_opex.per_year.difference
+        assert auckland["opex.perYear.difference.total"] == pytest.approx(
+            2 * difference
+        )
+        assert auckland["opex.perYear.difference.mean"] == pytest.approx(difference)
+        assert auckland["opex.perYear.difference.p50"] == pytest.approx(
+            difference, rel=0.01
+        )
+        assert rows[0]["emissions.perYear.difference.mean"] is None
+
+    def test_merged_aggregates_match_one_aggregate(self):
+        households = [
+            mock_household.copy(update={"location": location, "occupancy": occupancy})
+            for location in list(LocationEnum)[:3]
+            for occupancy in range(1, 4)
+        ]
+        whole = SavingsAggregate(["location"])
+        parts = [SavingsAggregate(["location"]) for _ in range(3)]
+        for i, household in enumerate(households):
+            whole.add(household, mock_savings)
+            parts[i % 3].add(household, mock_savings)
+        parts[1].add_error(households[0])
+        whole.add_error(households[0])
+
+        merged = pickle.loads(pickle.dumps(parts[0]))
+        for part in parts[1:]:
+            merged.merge(part)
+        assert merged.summarise() == whole.summarise()
+
+    def test_it_only_merges_aggregates_with_the_same_groups(self):
+        with pytest.raises(ValueError):
+            SavingsAggregate(["location"]).merge(SavingsAggregate(["cooktop"]))
+
+    def test_it_checks_the_groups(self):
+        with pytest.raises(ValueError, match="Unknown group by fields: colour"):
+            SavingsAggregate(["location", "colour"])
+
+
+class TestParseGroupBy:
+    def test_it_defaults_to_location(self):
+        assert parse_group_by(None) == ("location",)
+        assert parse_group_by(" ") == ("location",)
+
+    def test_it_parses_a_list(self):
+        assert parse_group_by("location, spaceHeating,location") == (
+            "location",
+            "spaceHeating",
+        )
+
+    def test_it_rejects_unknown_fields(self):
+        with pytest.raises(ValueError, match="Choose from"):
+            parse_group_by("location,region")
+
+
+def test_quantile_names():
+    assert [get_quantile_name(q) for q in [0.1, 0.5, 0.9, 0.95]] == [
+        "p10",
+        "p50",
+        "p90",
+        "p95",
+    ]
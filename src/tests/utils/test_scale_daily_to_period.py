@@ -18,3 +18,11 @@ class TestConvertToPeriod:
     def test_it_returns_operational_lifetime_emissions(self):
         result = scale_daily_to_period(1, PeriodEnum.OPERATIONAL_LIFETIME)
         assert result == 1 * 365.25 * 15
+
+    def test_it_returns_monthly_emissions(self):
+        result = scale_daily_to_period(1, PeriodEnum.MONTHLY)
+        assert result == 1 * 365.25 / 12
+
+    def test_it_returns_seasonal_emissions(self):
+        result = scale_daily_to_period(1, PeriodEnum.SEASONAL)
+        assert result == 1 * 365.25 / 4
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.stage_graph import StageGraph, StageGraphResult, StageNode
+
+
+def make_graph(double=None):
+    double = double or MagicMock(side_effect=lambda x: x * 2)
+    return StageGraph(
+        [
+            StageNode("double", double, ("x",)),
+            StageNode("plus_one", lambda d: d + 1, ("double",)),
+            StageNode("minus_one", lambda d: d - 1, ("double",)),
+            StageNode("product", lambda a, b: a * b, ("plus_one", "minus_one")),
+            StageNode("constant", lambda: 42),
+        ],
+        inputs=["x"],
+    )
+
+
+class TestStageGraph:
+    def test_it_orders_nodes_after_their_dependencies(self):
+        order = make_graph().order
+        assert order.index("double") < order.index("plus_one")
+        assert order.index("plus_one") < order.index("product")
+        assert order.index("minus_one") < order.index("product")
+
+    def test_it_rejects_unknown_dependencies(self):
+        with pytest.raises(ValueError, match="unknown node y"):
+            StageGraph([StageNode("a", lambda y: y, ("y",))])
+
+    def test_it_rejects_duplicate_nodes(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            StageGraph([StageNode("a", lambda: 1), StageNode("a", lambda: 2)])
+
+    def test_it_rejects_cycles(self):
+        with pytest.raises(ValueError, match="cycle"):
+            StageGraph(
+                [
+                    StageNode("a", lambda b: b, ("b",)),
+                    StageNode("b", lambda a: a, ("a",)),
+                ]
+            )
+
+    def test_it_finds_required_nodes(self):
+        assert make_graph().required_nodes(["plus_one"]) == ["double", "plus_one"]
+
+    def test_it_rejects_unknown_targets(self):
+        with pytest.raises(ValueError, match="Unknown stage node"):
+            make_graph().required_nodes(["nope"])
+
+    def test_it_requires_inputs(self):
+        with pytest.raises(ValueError, match="Missing stage graph inputs: x"):
+            make_graph().run({})
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+class TestStageGraphRun:
+    def run(self, graph, use_executor, **kwargs):
+        if not use_executor:
+            return graph.run({"x": 3}, **kwargs)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return graph.run({"x": 3}, executor=executor, **kwargs)
+
+    def test_it_computes_all_nodes(self, use_executor):
+        result = self.run(make_graph(), use_executor)
+        assert result.values == {
+            "x": 3,
+            "double": 6,
+            "plus_one": 7,
+            "minus_one": 5,
+            "product": 35,
+            "constant": 42,
+        }
+        assert set(result.timings) == {
+            "double",
+            "plus_one",
+            "minus_one",
+            "product",
+            "constant",
+        }
+
+    def test_it_computes_shared_nodes_once(self, use_executor):
+        double = MagicMock(side_effect=lambda x: x * 2)
+        self.run(make_graph(double), use_executor)
+        double.assert_called_once_with(3)
+
+    def test_it_only_computes_what_targets_need(self, use_executor):
+        result = self.run(make_graph(), use_executor, targets=["minus_one"])
+        assert set(result.timings) == {"double", "minus_one"}
+        assert result.values["minus_one"] == 5
+
+    def test_it_raises_stage_errors(self, use_executor):
+        graph = StageGraph([StageNode("fail", MagicMock(side_effect=KeyError("x")))])
+        with pytest.raises(KeyError):
+            self.run(graph, use_executor)
+
+
+class TestStageGraphConcurrency:
+    def test_it_runs_independent_branches_concurrently(self):
+        # Both branches wait for each other, so this would deadlock if run serially
+        barrier = threading.Barrier(2, timeout=5)
+        graph = StageGraph(
+            [
+                StageNode("a", lambda: barrier.wait()),
+                StageNode("b", lambda: barrier.wait()),
+            ]
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = graph.run({}, executor=executor)
+        assert set(result.values) == {"a", "b"}
+
+
+class TestStageGraphResult:
+    def test_server_timing(self):
+        result = StageGraphResult(timings={"opex": 0.0123, "emissions": 0.001})
+        assert result.server_timing() == "opex;dur=12.30, emissions;dur=1.00"
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from constants.tou_tariffs import TOU_TARIFF_2024
+from utils.tou_tariff import (
+    TOU_PERIODS,
+    TouPeriodEnum,
+    TouTariff,
+    TouWindow,
+    get_hourly_rates,
+    get_intervals_per_hour,
+    get_kwh_by_tou_period,
+    price_consumption,
+)
+
+flat_tariff = TouTariff(
+    name="Flat",
+    rates={period: 0.25 for period in TOU_PERIODS},
+    weekday=(TouWindow(0, 24, TouPeriodEnum.SHOULDER),),
+    weekend=(TouWindow(0, 24, TouPeriodEnum.SHOULDER),),
+)
+
+
+def kwh_at(hour_of_year: int, intervals_per_hour: int = 1) -> np.ndarray:
+    consumption = np.zeros(8760 * intervals_per_hour)
+    consumption[hour_of_year * intervals_per_hour] = 1
+    return consumption
+
+
+class TestTouWindow:
+    def test_it_contains_its_hours(self):
+        window = TouWindow(7, 11, TouPeriodEnum.PEAK)
+        assert window.contains(np.array([6.5, 7, 10.5, 11])).tolist() == [
+            False,
+            True,
+            True,
+            False,
+        ]
+
+    def test_it_wraps_around_midnight(self):
+        window = TouWindow(23, 7, TouPeriodEnum.NIGHT)
+        assert window.contains(np.array([22, 23, 0, 6.5, 7])).tolist() == [
+            False,
+            True,
+            True,
+            True,
+            False,
+        ]
+
+
+class TestGetIntervalsPerHour:
+    def test_it_infers_hourly_and_half_hourly_profiles(self):
+        assert get_intervals_per_hour(8760) == 1
+        assert get_intervals_per_hour(17520) == 2
+        assert get_intervals_per_hour(8784, 2024) == 1
+
+    def test_it_rejects_partial_profiles(self):
+        with pytest.raises(ValueError):
+            get_intervals_per_hour(8000)
+
+
+class TestGetKwhByTouPeriod:
+    def test_it_uses_weekday_windows(self):
+        # 2023-01-02 is a Monday
+        monday_8am = 24 + 8
+        by_period = get_kwh_by_tou_period(kwh_at(monday_8am), TOU_TARIFF_2024)
+        assert by_period[TOU_PERIODS.index(TouPeriodEnum.PEAK)] == 1
+
+    def test_it_uses_weekend_windows(self):
+        # 2023-01-01 is a Sunday
+        sunday_8am = 8
+        by_period = get_kwh_by_tou_period(kwh_at(sunday_8am), TOU_TARIFF_2024)
+        assert by_period[TOU_PERIODS.index(TouPeriodEnum.SHOULDER)] == 1
+
+    def test_it_handles_half_hourly_profiles(self):
+        by_period = get_kwh_by_tou_period(kwh_at(24 + 23, 2), TOU_TARIFF_2024)
+        assert by_period[TOU_PERIODS.index(TouPeriodEnum.NIGHT)] == 1
+
+    def test_it_keeps_leading_axes(self):
+        consumption = np.ones((3, 8760))
+        by_period = get_kwh_by_tou_period(consumption, TOU_TARIFF_2024)
+        assert by_period.shape == (3, len(TOU_PERIODS))
+        assert by_period.sum(axis=1) == pytest.approx([8760] * 3)
+
+    def test_it_rejects_windows_with_gaps(self):
+        tariff = TouTariff(
+            name="Gappy",
+            rates=flat_tariff.rates,
+            weekday=(TouWindow(0, 12, TouPeriodEnum.PEAK),),
+            weekend=flat_tariff.weekend,
+        )
+        with pytest.raises(ValueError):
+            get_kwh_by_tou_period(np.ones(8760), tariff)
+
+
+class TestPriceConsumption:
+    def test_it_prices_a_flat_tariff(self):
+        assert price_consumption(np.ones(8760), flat_tariff) == pytest.approx(
+            8760 * 0.25
+        )
+
+    def test_it_prices_each_household(self):
+        consumption = np.stack([kwh_at(24 + 8), kwh_at(24 + 2)])
+        assert price_consumption(consumption, TOU_TARIFF_2024) == pytest.approx(
+            [
+                TOU_TARIFF_2024.rates[TouPeriodEnum.PEAK],
+                TOU_TARIFF_2024.rates[TouPeriodEnum.NIGHT],
+            ]
+        )
+
+
+class TestGetHourlyRates:
+    def test_it_gives_each_hours_rate(self):
+        rates = get_hourly_rates(TOU_TARIFF_2024)
+        assert rates.shape == (8760,)
+        # 2023-01-02 is a Monday
+        assert rates[24 + 8] == TOU_TARIFF_2024.rates[TouPeriodEnum.PEAK]
+        assert rates[24 + 2] == TOU_TARIFF_2024.rates[TouPeriodEnum.NIGHT]
+        assert price_consumption(np.ones(8760), TOU_TARIFF_2024) == pytest.approx(
+            rates.sum()
+        )
+
+    def test_it_handles_half_hourly_profiles(self):
+        assert get_hourly_rates(flat_tariff, intervals_per_hour=2).shape == (17520,)
@@ -3,23 +3,32 @@ import pytest
 from unittest import TestCase
 from unittest.mock import patch
 
-from models.electrify_household import install_battery
 from openapi_client.models import Household, Solar, Battery
 
-from utils.validate_household import validate_household, ensure_no_battery_without_solar
+from utils.validate_household import (
+    validate_household,
+    ensure_no_battery_without_solar,
+    ensure_no_negative_system_sizes,
+)
 
 
 class TestValidateHousehold(TestCase):
 
+    @patch("utils.validate_household.ensure_no_negative_system_sizes")
     @patch("utils.validate_household.ensure_no_battery_without_solar")
-    def test_validate_household_calls_ensure_no_battery_without_solar(
-        self, mock_ensure
+    def test_validate_household_calls_the_checks(
+        self, mock_ensure_no_battery_without_solar, mock_ensure_no_negative_sizes
     ):
         household = Household(
             solar=Solar(has_solar=True), battery=Battery(has_battery=True)
         )
         validate_household(household)
-        mock_ensure.assert_called_once_with(household.solar, household.battery)
+        mock_ensure_no_battery_without_solar.assert_called_once_with(
+            household.solar, household.battery
+        )
+        mock_ensure_no_negative_sizes.assert_called_once_with(
+            household.solar, household.battery
+        )
 
 
 class TestEnsureNoBatteryWithoutSolar(TestCase):
@@ -102,3 +111,55 @@ class TestEnsureNoBatteryWithoutSolar(TestCase):
                 Solar(has_solar=False, size=10, install_solar=False),
                 Battery(has_battery=False, capacity=10, install_battery=True),
             )
+
+    @patch("utils.validate_household.OPTIMISE_BATTERY_DISPATCH", True)
+    def test_it_passes_if_the_battery_can_charge_from_the_grid(self):
+        ensure_no_battery_without_solar(
+            Solar(has_solar=False),
+            Battery(has_battery=True, capacity=10),
+        )
+        ensure_no_battery_without_solar(
+            Solar(has_solar=False, install_solar=False),
+            Battery(has_battery=False, capacity=10, install_battery=True),
+        )
+
+
+class TestEnsureNoNegativeSystemSizes(TestCase):
+    def test_it_passes_if_solar_no_battery(self):
+        ensure_no_negative_system_sizes(
+            Solar(has_solar=True, size=10),
+            Battery(has_battery=False),
+        )
+        ensure_no_negative_system_sizes(
+            Solar(has_solar=False, size=10, install_solar=True),
+            Battery(has_battery=False, capacity=0, install_battery=False),
+        )
+
+    def test_it_passes_if_solar_and_battery(self):
+        ensure_no_negative_system_sizes(
+            Solar(has_solar=True, size=10),
+            Battery(has_battery=True, capacity=10),
+        )
+        ensure_no_negative_system_sizes(
+            Solar(has_solar=False, size=10, install_solar=True),
+            Battery(has_battery=False, capacity=10, install_battery=True),
+        )
+
+    def test_it_passes_if_no_solar_no_battery(self):
+        ensure_no_negative_system_sizes(
+            Solar(has_solar=False),
+            Battery(has_battery=False),
+        )
+        ensure_no_negative_system_sizes(None, None)
+
+    def test_it_fails_if_a_size_is_negative(self):
+        with pytest.raises(ValueError):
+            ensure_no_negative_system_sizes(
+                Solar(has_solar=True, size=-1),
+                Battery(has_battery=False),
+            )
+        with pytest.raises(ValueError):
+            ensure_no_negative_system_sizes(
+                Solar(has_solar=False),
+                Battery(has_battery=True, capacity=-10),
+            )
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from constants.weather import HEAT_PUMP_COP_AT_7C, HEATING_BASE_TEMPERATURE
+from utils.weather_tables import (
+    build_weather_tables,
+    get_heat_pump_cop,
+    load_temperatures,
+    load_weather_tables,
+)
+
+
+def write_temperatures(path, stations, temperatures):
+    rows = [",".join(["datetime"] + stations)] + [
+        ",".join(["x"] + [f"{t:.1f}" for t in hour]) for hour in temperatures.T
+    ]
+    path.write_text("\n".join(rows) + "\n")
+
+
+class TestGetHeatPumpCop:
+    def test_it_falls_as_it_gets_colder(self):
+        cop = get_heat_pump_cop(np.array([-30, 0, 7, 15, 60]))
+        assert cop[2] == HEAT_PUMP_COP_AT_7C
+        assert np.all(np.diff(cop) >= 0)
+        assert cop[0] > 0
+
+
+class TestBuildWeatherTables:
+    def test_it_counts_heating_degree_hours(self):
+        temperatures = np.array(
+            [
+                np.full(8760, HEATING_BASE_TEMPERATURE - 2.0),
+                np.full(8760, HEATING_BASE_TEMPERATURE + 5.0),
+            ]
+        )
+        tables = build_weather_tables(temperatures, ("COLD", "WARM"))
+        assert tables.heating_degree_hours.tolist() == [2 * 8760, 0]
+        assert tables.heating_shape[0].sum() == pytest.approx(1)
+        assert tables.heating_shape[1].sum() == 0
+        assert tables.heating_shape.dtype == np.float32
+        assert tables.seasonal_cop[0] == pytest.approx(
+            get_heat_pump_cop(np.array(HEATING_BASE_TEMPERATURE - 2.0))
+        )
+
+    def test_seasonal_cop_is_weighted_by_demand(self):
+        # Half the hours are cold and need 10x the heat of the mild ones
+        temperatures = np.array(
+            [
+                np.tile(
+                    [HEATING_BASE_TEMPERATURE - 10.0, HEATING_BASE_TEMPERATURE - 1.0],
+                    4380,
+                )
+            ]
+        )
+        tables = build_weather_tables(temperatures, ("A",))
+        cold, mild = get_heat_pump_cop(temperatures[0, :2])
+        assert tables.seasonal_cop[0] == pytest.approx(11 / (10 / cold + 1 / mild))
+
+
+class TestLoadWeatherTables:
+    def test_it_loads_the_default_temperatures(self):
+        temperatures, stations = load_temperatures()
+        assert temperatures.shape == (len(stations), 8760)
+        tables = load_weather_tables()
+        assert tables.stations == stations
+        # Invercargill is colder than Auckland
+        assert (
+            tables.heating_degree_hours[tables.get_station_index("INVERCARGILL")]
+            > tables.heating_degree_hours[tables.get_station_index("AUCKLAND")]
+        )
+
+    def test_it_builds_the_tables_in_memory(self, tmp_path):
+        path = tmp_path / "temperatures.csv"
+        write_temperatures(path, ["A", "B"], np.full((2, 8760), 30.0))
+        tables = load_weather_tables.__wrapped__(path)
+        assert tables.stations == ("A", "B")
+        assert tables.heating_degree_hours.sum() == 0
+        # Nothing is written next to the temperatures
+        assert [p.name for p in tmp_path.iterdir()] == ["temperatures.csv"]
+
+    def test_it_rejects_a_partial_year(self, tmp_path):
+        path = tmp_path / "temperatures.csv"
+        write_temperatures(path, ["A"], np.zeros((1, 24)))
+        with pytest.raises(ValueError):
+            load_weather_tables.__wrapped__(path)
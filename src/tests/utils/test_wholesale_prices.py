@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from utils.wholesale_prices import load_wholesale_prices
+
+
+class TestLoadWholesalePrices:
+    def test_it_loads_the_default_prices_by_day(self):
+        prices = load_wholesale_prices()
+        assert prices.shape == (365, 24)
+        assert np.all(prices > 0)
+        # Evenings are dearer than the small hours
+        assert prices[:, 18].mean() > prices[:, 3].mean()
+
+    def test_it_shares_the_prices_read_only(self):
+        prices = load_wholesale_prices()
+        assert load_wholesale_prices() is prices
+        with pytest.raises(ValueError):
+            prices[0, 0] = 0
+
+    def test_it_rejects_a_partial_year(self, tmp_path):
+        path = tmp_path / "prices.csv"
+        path.write_text("datetime,price\n2023-01-01T00:00,0.1\n")
+        with pytest.raises(ValueError):
+            load_wholesale_prices(path)
+
+    def test_it_allows_leap_years(self, tmp_path):
+        path = tmp_path / "prices.csv"
+        path.write_text("datetime,price\n" + "x,0.1\n" * 366 * 24)
+        assert load_wholesale_prices(path, 2024).shape == (366, 24)
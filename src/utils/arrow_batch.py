@@ -0,0 +1,324 @@
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import pyarrow as pa
+
+from models.savings_cube import CUBE_MEASURES
+from openapi_client.models import Household, Savings
+from utils.savings_aggregates import (
+    AGGREGATE_METRICS,
+    AGGREGATE_QUANTILES,
+    SavingsAggregate,
+    get_quantile_name,
+)
+
+# Columnar (Apache Arrow IPC stream) format for batches of households & savings.
+# Nested objects are flattened into one column per leaf, named by the dotted path of
+# camelCase keys from the JSON API, e.g. "solar.hasSolar" or "opex.perWeek.before".
+# A vehicle list stays a single list<struct> column, as a household can have any number.
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+VEHICLE_ARROW_TYPE = pa.struct(
+    [
+        pa.field("fuelType", pa.string()),
+        pa.field("kmsPerWeek", pa.int32()),
+        pa.field("switchToEV", pa.bool_()),
+    ]
+)
+
+HOUSEHOLD_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("location", pa.string()),
+        pa.field("occupancy", pa.int32()),
+        pa.field("spaceHeating", pa.string()),
+        pa.field("waterHeating", pa.string()),
+        pa.field("cooktop", pa.string()),
+        pa.field("vehicles", pa.list_(VEHICLE_ARROW_TYPE)),
+        pa.field("solar.hasSolar", pa.bool_()),
+        pa.field("solar.size", pa.float64()),
+        pa.field("solar.installSolar", pa.bool_()),
+        pa.field("battery.hasBattery", pa.bool_()),
+        pa.field("battery.capacity", pa.float64()),
+        pa.field("battery.powerOutput", pa.float64()),
+        pa.field("battery.peakPowerOutput", pa.float64()),
+        pa.field("battery.installBattery", pa.bool_()),
+        pa.field("meterCalibration.baseloadFactor", pa.float64()),
+        pa.field("meterCalibration.spaceHeatingFactor", pa.float64()),
+    ]
+)
+
+
+def _savings_values_fields(section: str) -> List[pa.Field]:
+    return [
+        pa.field(f"{section}.{period}.{value}", pa.float64())
+        for period in ["perWeek", "perYear", "overLifetime"]
+        for value in ["before", "after", "difference"]
+    ] + [pa.field(f"{section}.operationalLifetime", pa.int32())]
+
+
+# Columns for each Savings section, in the same order as SAVINGS_FIELDS then
+# OPTIONAL_SAVINGS_FIELDS. Optional sections without columns can't be batched.
+SAVINGS_ARROW_FIELDS = {
+    "emissions": _savings_values_fields("emissions"),
+    "opex": _savings_values_fields("opex"),
+    "upfrontCost": [
+        pa.field(f"upfrontCost.{appliance}", pa.float64())
+        for appliance in ["solar", "battery", "cooktop", "waterHeating", "spaceHeating"]
+    ],
+    "recommendation": [
+        pa.field("recommendation.action", pa.string()),
+        pa.field("recommendation.url", pa.string()),
+    ],
+    # One list per row, i.e. one element per year
+    "emissionsTrajectory": [
+        pa.field(
+            "emissionsTrajectory",
+            pa.list_(
+                pa.struct(
+                    [
+                        pa.field("year", pa.int32()),
+                        pa.field(
+                            "emissions",
+                            pa.struct(
+                                [
+                                    pa.field(value, pa.float64())
+                                    for value in ["before", "after", "difference"]
+                                ]
+                            ),
+                        ),
+                    ]
+                )
+            ),
+        )
+    ],
+}
+
+# Set on rows that couldn't be calculated (e.g. invalid households); their savings are null
+ERROR_ARROW_FIELD = pa.field("error", pa.string())
+
+
+def savings_arrow_schema(fields: Optional[Iterable[str]] = None) -> pa.Schema:
+    """The schema of a savings batch
+
+    Args:
+        fields (Iterable[str], optional): the Savings sections included. Defaults to None, i.e. all of them.
+
+    Returns:
+        pa.Schema: one column per value in the included sections, and an error column
+    """
+    sections = SAVINGS_ARROW_FIELDS if fields is None else fields
+    columns = [
+        field
+        for section in SAVINGS_ARROW_FIELDS
+        if section in sections
+        for field in SAVINGS_ARROW_FIELDS[section]
+    ]
+    return pa.schema(columns + [ERROR_ARROW_FIELD])
+
+
+def _split_path(name: str) -> Tuple[str, ...]:
+    return tuple(name.split("."))
+
+
+def read_household_rows(body: bytes) -> List[Dict[str, Any]]:
+    """Decodes an Arrow IPC stream of households
+
+    Columns are matched by name against HOUSEHOLD_ARROW_SCHEMA and cast to its types.
+    Missing columns are treated as null, and unknown columns are ignored.
+
+    Args:
+        body (bytes): an Arrow IPC stream
+
+    Raises:
+        ValueError: if the stream can't be read or a column has the wrong type
+
+    Returns:
+        List[Dict[str, Any]]: one dict per row, in the JSON API's (camelCase, nested)
+            shape, i.e. ready for Household.from_dict
+    """
+    try:
+        table = pa.ipc.open_stream(body).read_all()
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Invalid Arrow IPC stream: {e}")
+
+    n_rows = table.num_rows
+    columns = {}
+    for field in HOUSEHOLD_ARROW_SCHEMA:
+        if field.name not in table.column_names:
+            columns[field.name] = [None] * n_rows
+            continue
+        try:
+            column = table.column(field.name).cast(field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            raise ValueError(f"Invalid household column {field.name}: {e}")
+        columns[field.name] = column.to_pylist()
+
+    rows = [{} for _ in range(n_rows)]
+    for name, values in columns.items():
+        path = _split_path(name)
+        for row, value in zip(rows, values):
+            if value is None:
+                continue
+            if len(path) == 1:
+                row[name] = value
+            else:
+                row.setdefault(path[0], {})[path[1]] = value
+    return rows
+
+
+def write_household_batch(households: List[Household]) -> bytes:
+    """Encodes households as an Arrow IPC stream, i.e. the input to read_household_rows
+
+    Args:
+        households (List[Household]): the households
+
+    Returns:
+        bytes: an Arrow IPC stream with HOUSEHOLD_ARROW_SCHEMA
+    """
+    rows = [household.to_dict() for household in households]
+    return _write_stream(
+        HOUSEHOLD_ARROW_SCHEMA,
+        [
+            [_get_path(row, _split_path(field.name)) for row in rows]
+            for field in HOUSEHOLD_ARROW_SCHEMA
+        ],
+    )
+
+
+def write_savings_batch(
+    savings: List[Optional[Savings]],
+    errors: List[Optional[str]],
+    fields: Optional[Set[str]] = None,
+) -> bytes:
+    """Encodes a batch of savings as an Arrow IPC stream
+
+    Args:
+        savings (List[Optional[Savings]]): one per row, or None where the row failed
+        errors (List[Optional[str]]): one per row, the reason the row failed or None
+        fields (Set[str], optional): the Savings sections included. Defaults to None, i.e. all of them.
+
+    Returns:
+        bytes: an Arrow IPC stream with savings_arrow_schema(fields)
+    """
+    schema = savings_arrow_schema(fields)
+    rows = [row.dict(by_alias=True) if row is not None else None for row in savings]
+
+    return _write_stream(
+        schema,
+        [
+            (
+                errors
+                if field.name == ERROR_ARROW_FIELD.name
+                else [_get_path(row, _split_path(field.name)) for row in rows]
+            )
+            for field in schema
+        ],
+    )
+
+
+def savings_aggregate_arrow_schema(
+    group_by: Sequence[str], quantiles: Sequence[float] = AGGREGATE_QUANTILES
+) -> pa.Schema:
+    """The schema of a savings aggregate (see SavingsAggregate.summarise)
+
+    Args:
+        group_by (Sequence[str]): the household fields the aggregate is grouped by
+        quantiles (Sequence[float], optional): the quantiles included. Defaults to AGGREGATE_QUANTILES.
+
+    Returns:
+        pa.Schema: a column per group by field (with its household column's type), the
+            number of households & errors, and the total, mean & quantiles of each metric
+    """
+    return pa.schema(
+        [HOUSEHOLD_ARROW_SCHEMA.field(key) for key in group_by]
+        + [pa.field("households", pa.int64()), pa.field("errors", pa.int64())]
+        + [
+            pa.field(f"{metric}.{statistic}", pa.float64())
+            for metric in AGGREGATE_METRICS
+            for statistic in ["total", "mean"]
+            + [get_quantile_name(q) for q in quantiles]
+        ]
+    )
+
+
+def write_savings_aggregate(
+    aggregate: SavingsAggregate, quantiles: Sequence[float] = AGGREGATE_QUANTILES
+) -> bytes:
+    """Encodes a savings aggregate as an Arrow IPC stream, one row per group
+
+    Args:
+        aggregate (SavingsAggregate): the aggregate
+        quantiles (Sequence[float], optional): the quantiles included. Defaults to AGGREGATE_QUANTILES.
+
+    Returns:
+        bytes: an Arrow IPC stream with savings_aggregate_arrow_schema
+    """
+    schema = savings_aggregate_arrow_schema(aggregate.group_by, quantiles)
+    rows = aggregate.summarise(quantiles)
+    return _write_stream(
+        schema, [[row[field.name] for row in rows] for field in schema]
+    )
+
+
+def savings_cube_arrow_schema(group_by: Sequence[str]) -> pa.Schema:
+    """The schema of a savings cube query (see SavingsCube.query)
+
+    Args:
+        group_by (Sequence[str]): the cube dimensions the query is grouped by
+
+    Returns:
+        pa.Schema: a column per grouped dimension, the number of households, and the
+            mean & total of each measure
+    """
+    return pa.schema(
+        [
+            pa.field(dimension, pa.int32() if dimension == "occupancy" else pa.string())
+            for dimension in group_by
+        ]
+        + [pa.field("households", pa.float64())]
+        + [
+            pa.field(f"{measure}.{statistic}", pa.float64())
+            for measure in CUBE_MEASURES
+            for statistic in ["mean", "total"]
+        ]
+    )
+
+
+def write_savings_cube_rows(
+    rows: List[Dict[str, Any]], group_by: Sequence[str]
+) -> bytes:
+    """Encodes the rows of a savings cube query as an Arrow IPC stream
+
+    Args:
+        rows (List[Dict[str, Any]]): the rows, from SavingsCube.query
+        group_by (Sequence[str]): the cube dimensions the query is grouped by
+
+    Returns:
+        bytes: an Arrow IPC stream with savings_cube_arrow_schema
+    """
+    schema = savings_cube_arrow_schema(group_by)
+    return _write_stream(
+        schema, [[row[field.name] for row in rows] for field in schema]
+    )
+
+
+def _write_stream(schema: pa.Schema, columns: List[List[Any]]) -> bytes:
+    arrays = [
+        pa.array(values, type=field.type) for field, values in zip(schema, columns)
+    ]
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+    return sink.getvalue().to_pybytes()
+
+
+def _get_path(row: Optional[Dict[str, Any]], path: Tuple[str, ...]) -> Any:
+    value = row
+    for key in path:
+        if value is None:
+            return None
+        value = value.get(key)
+    if isinstance(value, Enum):
+        return value.value
+    return value
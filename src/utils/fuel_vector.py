@@ -0,0 +1,136 @@
+from collections.abc import Mapping
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from constants.fuel_stats import FuelTypeEnum
+
+FUEL_TYPES = list(FuelTypeEnum)
+FUEL_INDEX = {fuel_type: i for i, fuel_type in enumerate(FUEL_TYPES)}
+N_FUEL_TYPES = len(FUEL_TYPES)
+
+
+class FuelVector(Mapping):
+    """A per-fuel quantity (e.g. kWh, kgCO2e/kWh, $/kWh) stored as a fixed-size array
+
+    There is one slot per FuelTypeEnum, in enum order. Adding, scaling and taking dot
+    products are single array operations rather than dict merges.
+
+    It reads like a Dict[FuelTypeEnum, float] of the fuels that have been set, so it
+    compares equal to the equivalent dict. Slots that haven't been set are zero.
+    """
+
+    __slots__ = ("array", "present")
+
+    def __init__(
+        self,
+        array: Optional[np.ndarray] = None,
+        present: Optional[np.ndarray] = None,
+    ):
+        self.array = (
+            np.zeros(N_FUEL_TYPES) if array is None else np.asarray(array, dtype=float)
+        )
+        self.present = (
+            np.zeros(N_FUEL_TYPES, dtype=bool)
+            if present is None
+            else np.asarray(present, dtype=bool)
+        )
+        if self.array.shape != (N_FUEL_TYPES,) or self.present.shape != (N_FUEL_TYPES,):
+            raise ValueError(f"FuelVector must have {N_FUEL_TYPES} slots")
+
+    @classmethod
+    def of(cls, fuel_type: FuelTypeEnum, value: float) -> "FuelVector":
+        """A vector with a single fuel set"""
+        vector = cls()
+        vector.array[FUEL_INDEX[fuel_type]] = value
+        vector.present[FUEL_INDEX[fuel_type]] = True
+        return vector
+
+    @classmethod
+    def dense(cls, array: np.ndarray) -> "FuelVector":
+        """A vector with every fuel set"""
+        return cls(array, np.ones(N_FUEL_TYPES, dtype=bool))
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping) -> "FuelVector":
+        """Converts a Dict[FuelTypeEnum, float] (or another FuelVector) to a FuelVector"""
+        if isinstance(mapping, FuelVector):
+            return mapping
+        vector = cls()
+        for fuel_type, value in mapping.items():
+            vector.array[FUEL_INDEX[fuel_type]] = value
+            vector.present[FUEL_INDEX[fuel_type]] = True
+        return vector
+
+    @classmethod
+    def sum(cls, vectors: Iterable[Mapping]) -> "FuelVector":
+        """Sums vectors (or dicts) fuel by fuel. A fuel is set if it's set in any of them."""
+        total = cls()
+        for vector in vectors:
+            total = total + vector
+        return total
+
+    def __getitem__(self, fuel_type: FuelTypeEnum) -> float:
+        i = FUEL_INDEX[fuel_type]
+        if not self.present[i]:
+            raise KeyError(fuel_type)
+        return float(self.array[i])
+
+    def __iter__(self) -> Iterator[FuelTypeEnum]:
+        return (fuel_type for i, fuel_type in enumerate(FUEL_TYPES) if self.present[i])
+
+    def __len__(self) -> int:
+        return int(self.present.sum())
+
+    def __repr__(self) -> str:
+        return f"FuelVector({self.to_dict()})"
+
+    def __add__(self, other: Union[Mapping, int]) -> "FuelVector":
+        if isinstance(other, (int, float)) and other == 0:
+            # Allows sum() over vectors
+            return self
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        other = FuelVector.from_mapping(other)
+        return FuelVector(self.array + other.array, self.present | other.present)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Mapping) -> "FuelVector":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        other = FuelVector.from_mapping(other)
+        return FuelVector(self.array - other.array, self.present | other.present)
+
+    def __mul__(self, scalar: float) -> "FuelVector":
+        if isinstance(scalar, Mapping):
+            return NotImplemented
+        return FuelVector(self.array * scalar, self.present)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float) -> "FuelVector":
+        return FuelVector(self.array / scalar, self.present)
+
+    def dot(self, other: Mapping) -> float:
+        """Sum over fuels of self x other, e.g. kWh per fuel . kgCO2e/kWh per fuel"""
+        other = FuelVector.from_mapping(other)
+        return float(np.sum(self.array * other.array))
+
+    def total(self) -> float:
+        return float(np.sum(self.array))
+
+    def only(self, fuel_type: FuelTypeEnum) -> "FuelVector":
+        """A copy with every fuel except the given one removed"""
+        keep = np.zeros(N_FUEL_TYPES, dtype=bool)
+        keep[FUEL_INDEX[fuel_type]] = True
+        return FuelVector(np.where(keep, self.array, 0), self.present & keep)
+
+    def without(self, fuel_type: FuelTypeEnum) -> "FuelVector":
+        """A copy with the given fuel removed"""
+        keep = np.ones(N_FUEL_TYPES, dtype=bool)
+        keep[FUEL_INDEX[fuel_type]] = False
+        return FuelVector(np.where(keep, self.array, 0), self.present & keep)
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
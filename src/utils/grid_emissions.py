@@ -0,0 +1,117 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from constants.utils import PROFILE_YEAR
+from params import OPERATIONAL_LIFETIME
+from utils.tou_tariff import get_days_in_year
+
+# An illustrative series of the grid's hourly carbon intensity over PROFILE_YEAR, in
+# kgCO2e/kWh. The file is a CSV with a header and one "<local hour>,<intensity>" row
+# per hour of the year, in order, e.g. "2023-01-01T00:00,0.0485".
+DEFAULT_GRID_EMISSIONS_PATH = (
+    Path(__file__).parent.parent / "data" / "grid_emissions_2023.csv"
+)
+
+# The grid's average carbon intensity in each year as it decarbonises, in kgCO2e/kWh.
+# The file is a CSV with a header and one "<year>,<intensity>" row per year, e.g.
+# "2030,0.0520".
+DEFAULT_GRID_EMISSIONS_TRAJECTORY_PATH = (
+    Path(__file__).parent.parent / "data" / "grid_emissions_trajectory.csv"
+)
+
+
+def get_lifetime_years() -> range:
+    """The years of the operational lifetime, starting in PROFILE_YEAR"""
+    return range(PROFILE_YEAR, PROFILE_YEAR + OPERATIONAL_LIFETIME)
+
+
+@lru_cache(maxsize=4)
+def load_hourly_grid_emissions(
+    path: Path = DEFAULT_GRID_EMISSIONS_PATH, year: int = PROFILE_YEAR
+) -> np.ndarray:
+    """Loads a year of the grid's hourly carbon intensity, once per path
+
+    Args:
+        path (Path, optional): the intensity file. Defaults to DEFAULT_GRID_EMISSIONS_PATH.
+        year (int, optional): the year the intensities are for. Defaults to PROFILE_YEAR.
+
+    Raises:
+        ValueError: if the file doesn't have a non-negative intensity for each hour of the year
+
+    Returns:
+        np.ndarray: kgCO2e/kWh, shape (n_hours,). Read-only, as it's shared between callers.
+    """
+    intensity = np.loadtxt(
+        path, delimiter=",", skiprows=1, usecols=1, dtype=float, ndmin=1
+    )
+    n_hours = get_days_in_year(year) * 24
+    if intensity.shape != (n_hours,):
+        raise ValueError(
+            f"{path} has {intensity.size} intensities, not one for each of the "
+            f"{n_hours} hours of {year}"
+        )
+    if not np.all(intensity >= 0) or intensity.sum() == 0:
+        raise ValueError(f"{path} needs non-negative intensities that aren't all 0")
+    intensity.flags.writeable = False
+    return intensity
+
+
+@lru_cache(maxsize=4)
+def _load_grid_emissions_trajectory(path: Path) -> dict:
+    years, intensity = np.loadtxt(
+        path, delimiter=",", skiprows=1, dtype=float, ndmin=2, unpack=True
+    )
+    return dict(zip(years.astype(int).tolist(), intensity.tolist()))
+
+
+def get_grid_emissions_trajectory(
+    years: Sequence[int], path: Path = DEFAULT_GRID_EMISSIONS_TRAJECTORY_PATH
+) -> np.ndarray:
+    """The grid's average carbon intensity in each of the given years
+
+    Args:
+        years (Sequence[int]): the years, e.g. get_lifetime_years()
+        path (Path, optional): the trajectory file. Defaults to DEFAULT_GRID_EMISSIONS_TRAJECTORY_PATH.
+
+    Raises:
+        ValueError: if the file doesn't have an intensity for one of the years
+
+    Returns:
+        np.ndarray: kgCO2e/kWh, shape (n_years,)
+    """
+    trajectory = _load_grid_emissions_trajectory(path)
+    missing = [year for year in years if year not in trajectory]
+    if missing:
+        raise ValueError(
+            f"{path} has no grid emissions for {', '.join(map(str, missing))}"
+        )
+    return np.array([trajectory[year] for year in years], dtype=float)
+
+
+def calculate_grid_emissions(
+    hourly_kwh: np.ndarray,
+    years: Sequence[int],
+    year: int = PROFILE_YEAR,
+) -> np.ndarray:
+    """Calculates the emissions of hourly grid electricity in each of the given years
+
+    Each year's intensity follows the hourly series (see load_hourly_grid_emissions),
+    scaled to that year's average (see get_grid_emissions_trajectory). So a profile's
+    emissions in every year are its dot product with the hourly series, times the
+    year's scaling, which is one matrix-vector product for the whole batch however many
+    years there are.
+
+    Args:
+        hourly_kwh (np.ndarray): kWh in each hour, shape (..., n_hours), e.g. (n_households, n_hours) (see synthesise_load_profiles)
+        years (Sequence[int]): the years the profiles are repeated over
+        year (int, optional): the year the profiles are laid out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: kgCO2e in each year, shape (..., n_years)
+    """
+    intensity = load_hourly_grid_emissions(year=year)
+    weighted_kwh = hourly_kwh @ (intensity / intensity.mean())
+    return np.multiply.outer(weighted_kwh, get_grid_emissions_trajectory(years))
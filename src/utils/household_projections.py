@@ -0,0 +1,94 @@
+from typing import List, Optional, Tuple
+
+from openapi_client.models import (
+    Battery,
+    CooktopEnum,
+    Household,
+    MeterCalibration,
+    Solar,
+    SpaceHeatingEnum,
+    Vehicle,
+    VehicleFuelTypeEnum,
+    WaterHeatingEnum,
+)
+from savings.energy.scale_energy_by_occupancy import OCCUPANCY_MULTIPLIER
+
+# Projections of a household onto the fields that a calculation depends on.
+# These are used as cache keys, so they must be hashable and should collapse
+# inputs that are known to give identical results.
+
+MAX_OCCUPANCY_BUCKET = max(OCCUPANCY_MULTIPLIER)
+
+
+def project_occupancy(occupancy: Optional[int]) -> Optional[int]:
+    """Occupancy above the largest bucket (5+) is treated the same"""
+    if occupancy is None:
+        return None
+    return min(occupancy, MAX_OCCUPANCY_BUCKET)
+
+
+def project_appliances(
+    household: Household,
+) -> Tuple[SpaceHeatingEnum, WaterHeatingEnum, CooktopEnum]:
+    return (household.space_heating, household.water_heating, household.cooktop)
+
+
+def project_meter_calibration(
+    calibration: Optional[MeterCalibration],
+) -> Tuple[float, float]:
+    """The household's baseload & space heating factors, which are 1 (the average
+    household) unless it's been calibrated against its meter data"""
+    if calibration is None:
+        return (1.0, 1.0)
+    return (
+        1.0 if calibration.baseload_factor is None else calibration.baseload_factor,
+        (
+            1.0
+            if calibration.space_heating_factor is None
+            else calibration.space_heating_factor
+        ),
+    )
+
+
+def project_vehicles(
+    vehicles: Optional[List[Vehicle]],
+) -> Tuple[Tuple[VehicleFuelTypeEnum, Optional[int]], ...]:
+    return tuple((v.fuel_type, v.kms_per_week) for v in vehicles or [])
+
+
+def project_vehicle_fuel_types(
+    vehicles: Optional[List[Vehicle]],
+) -> Tuple[VehicleFuelTypeEnum, ...]:
+    return tuple(v.fuel_type for v in vehicles or [])
+
+
+def project_solar(solar: Optional[Solar]) -> Optional[Tuple]:
+    if solar is None:
+        return None
+    return (solar.has_solar, solar.size, solar.install_solar)
+
+
+def project_battery(battery: Optional[Battery]) -> Optional[Tuple]:
+    if battery is None:
+        return None
+    return (battery.has_battery, battery.capacity, battery.install_battery)
+
+
+def project_emissions_inputs(household: Household) -> Tuple:
+    """Every field that a household's emissions depend on, i.e. not solar or battery"""
+    return (
+        household.location,
+        project_occupancy(household.occupancy),
+        project_appliances(household),
+        project_vehicles(household.vehicles),
+        project_meter_calibration(household.meter_calibration),
+    )
+
+
+def project_savings_inputs(household: Household) -> Tuple:
+    """Every field that a household's opex & emissions depend on"""
+    return (
+        project_emissions_inputs(household),
+        project_solar(household.solar),
+        project_battery(household.battery),
+    )
@@ -0,0 +1,156 @@
+import dataclasses
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, TypedDict
+
+import numpy as np
+from pydantic import BaseModel
+
+from utils.fuel_vector import FuelVector
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class StageCacheStats(TypedDict):
+    hits: int
+    misses: int
+    hit_rate: float
+    size: int
+    max_size: int
+
+
+class StageCache:
+    """Bounded least-recently-used cache for a single pipeline stage
+
+    Entries are keyed on the stage's input projection, i.e. only the inputs that
+    the stage actually reads, so that households which differ in irrelevant
+    fields share the same entry.
+    """
+
+    def __init__(self, name: str, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError("Stage cache max_size must be at least 1")
+        self.name = name
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock so that slow stages don't block each other
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> StageCacheStats:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups > 0 else 0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+# All stage caches, by stage name
+STAGE_CACHES: Dict[str, StageCache] = {}
+
+
+def memoise_stage(
+    name: str,
+    projection: Callable[..., Hashable],
+    max_size: int = DEFAULT_MAX_SIZE,
+):
+    """Memoises a pipeline stage on a projection of its inputs
+
+    The projection is called with the same arguments as the stage and must return a
+    hashable key containing every input the stage depends on (and nothing else).
+    Pydantic models (and lists of them) are mutable, so each caller gets its own copy
+    of them. Other results are shared between callers, so their arrays (including
+    those in FuelVectors, dataclasses, dicts, lists & tuples) are made read-only
+    when they're cached.
+
+    Args:
+        name (str): unique name of the stage, used for reporting statistics
+        projection (Callable[..., Hashable]): maps the stage's arguments to its cache key
+        max_size (int, optional): maximum number of entries kept. Defaults to DEFAULT_MAX_SIZE.
+    """
+
+    def decorator(func):
+        if name in STAGE_CACHES:
+            raise ValueError(f"A stage cache named {name} already exists")
+        cache = StageCache(name, max_size)
+        STAGE_CACHES[name] = cache
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = projection(*args, **kwargs)
+            return _copy_models(
+                cache.get_or_compute(
+                    key, lambda: _make_read_only(func(*args, **kwargs))
+                )
+            )
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def _copy_models(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.copy(deep=True)
+    if isinstance(value, list):
+        return [_copy_models(item) for item in value]
+    return value
+
+
+def _make_read_only(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, FuelVector):
+        _make_read_only(value.array)
+        _make_read_only(value.present)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for field in dataclasses.fields(value):
+            _make_read_only(getattr(value, field.name))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _make_read_only(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _make_read_only(item)
+    return value
+
+
+def get_stage_cache_stats() -> Dict[str, StageCacheStats]:
+    """Gets hit/miss statistics for every memoised stage"""
+    return {name: cache.stats() for name, cache in STAGE_CACHES.items()}
+
+
+def clear_stage_caches():
+    """Empties every stage cache and resets its statistics"""
+    for cache in STAGE_CACHES.values():
+        cache.clear()
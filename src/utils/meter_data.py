@@ -0,0 +1,116 @@
+import calendar
+from typing import Iterator, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from constants.utils import PROFILE_YEAR
+from openapi_client.models import MeterDataFormatEnum
+from utils.tou_tariff import get_days_in_year, get_intervals_per_hour
+
+# Smart meter interval data has a "kwh" column with one row per interval of the year,
+# in order. It's either a CSV with a header row, e.g. "2023-01-01T00:00,0.412" rows
+# under "datetime,kwh", or an Arrow IPC stream. Other columns are ignored.
+METER_KWH_COLUMN = "kwh"
+
+# Meters record hourly or half-hourly
+METER_MAX_INTERVALS_PER_HOUR = 2
+
+# Meter data doesn't need timestamps, so a year of data that's 366 days long is laid
+# out over the first leap year from PROFILE_YEAR
+METER_LEAP_YEAR = next(
+    y for y in range(PROFILE_YEAR, PROFILE_YEAR + 4) if calendar.isleap(y)
+)
+
+
+def read_meter_data(
+    data: bytes,
+    data_format: MeterDataFormatEnum = MeterDataFormatEnum.CSV,
+    year: Optional[int] = None,
+) -> np.ndarray:
+    """Reads a year of smart meter interval data
+
+    The data is read a block of rows at a time, parsing only the kWh column, and each
+    block is copied straight into one preallocated array.
+
+    Args:
+        data (bytes): the interval data
+        data_format (MeterDataFormatEnum, optional): CSV or an Arrow IPC stream. Defaults to CSV.
+        year (int, optional): the year the data is for. Defaults to None, i.e. a year of 365 or 366 days (see get_meter_data_year).
+
+    Raises:
+        ValueError: if the data can't be read, or doesn't have a non-negative kWh for each hour or half hour of the year
+
+    Returns:
+        np.ndarray: kWh in each interval, shape (n_intervals,)
+    """
+    max_intervals = (
+        get_days_in_year(METER_LEAP_YEAR if year is None else year)
+        * 24
+        * METER_MAX_INTERVALS_PER_HOUR
+    )
+    kwh = np.empty(max_intervals)
+    n_intervals = 0
+    try:
+        for block in _read_kwh_blocks(data, data_format):
+            if n_intervals + len(block) > max_intervals:
+                raise ValueError(
+                    f"A year of meter data can't have more than {max_intervals} intervals"
+                )
+            kwh[n_intervals : n_intervals + len(block)] = block.to_numpy(
+                zero_copy_only=False
+            )
+            n_intervals += len(block)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        raise ValueError(f"Invalid meter data: {e}")
+
+    kwh = kwh[:n_intervals]
+    if year is None:
+        get_meter_data_year(n_intervals)
+    else:
+        get_intervals_per_hour(n_intervals, year)
+    if not np.all(kwh >= 0):
+        raise ValueError("Meter data needs a non-negative kWh for every interval")
+    return kwh
+
+
+def get_meter_data_year(n_intervals: int) -> int:
+    """The year that a year of meter data is laid out over, from its length: PROFILE_YEAR
+    if it's 365 days, or METER_LEAP_YEAR if it's 366
+
+    Raises:
+        ValueError: if the data isn't a whole number of intervals per hour over either
+    """
+    for year in (PROFILE_YEAR, METER_LEAP_YEAR):
+        hours = get_days_in_year(year) * 24
+        if n_intervals > 0 and n_intervals % hours == 0:
+            return year
+    raise ValueError(
+        f"A year of meter data needs a multiple of {get_days_in_year(PROFILE_YEAR) * 24} "
+        f"or {get_days_in_year(METER_LEAP_YEAR) * 24} intervals, not {n_intervals}"
+    )
+
+
+def _read_kwh_blocks(
+    data: bytes, data_format: MeterDataFormatEnum
+) -> Iterator[pa.Array]:
+    if data_format == MeterDataFormatEnum.ARROW:
+        for batch in pa.ipc.open_stream(data):
+            if METER_KWH_COLUMN not in batch.schema.names:
+                raise ValueError(f"Meter data needs a {METER_KWH_COLUMN} column")
+            yield batch.column(METER_KWH_COLUMN).cast(pa.float64())
+        return
+
+    try:
+        reader = pa_csv.open_csv(
+            pa.BufferReader(data),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=[METER_KWH_COLUMN],
+                column_types={METER_KWH_COLUMN: pa.float64()},
+            ),
+        )
+    except KeyError:
+        raise ValueError(f"Meter data needs a {METER_KWH_COLUMN} column")
+    for batch in reader:
+        yield batch.column(0)
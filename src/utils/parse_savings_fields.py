@@ -0,0 +1,39 @@
+from typing import Optional, Sequence, Set
+
+# The sections of a Savings response, by their API name
+SAVINGS_FIELDS = ["emissions", "opex", "upfrontCost", "recommendation"]
+
+# Sections that are only calculated when asked for by name
+OPTIONAL_SAVINGS_FIELDS = [
+    "monthly",
+    "emissionsTrajectory",
+    "percentiles",
+    "similarHouseholds",
+]
+
+
+def parse_savings_fields(
+    fields: Optional[str] = None,
+    optional_fields: Sequence[str] = OPTIONAL_SAVINGS_FIELDS,
+) -> Set[str]:
+    """Parses a comma-separated list of Savings sections to calculate
+
+    Args:
+        fields (str, optional): e.g. "emissions,upfrontCost". Defaults to None, which selects every section except the optional ones.
+        optional_fields (Sequence[str], optional): the optional sections that can be requested. Defaults to OPTIONAL_SAVINGS_FIELDS.
+
+    Returns:
+        Set[str]: the requested sections
+    """
+    if fields is None or fields.strip() == "":
+        return set(SAVINGS_FIELDS)
+
+    allowed = SAVINGS_FIELDS + list(optional_fields)
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise ValueError(
+            f"Unknown savings fields: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(allowed)}"
+        )
+    return requested
@@ -0,0 +1,146 @@
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from openapi_client.models import LocationEnum, PlanTypeEnum
+from utils.tou_tariff import TOU_PERIODS, TouPeriodEnum, TouTariff, TouWindow
+
+# An illustrative catalogue of plans from fictional retailers. The file format is:
+# {
+#   "schedules": {<name>: {"weekday": [<window>], "weekend": [<window>]}},
+#   "plans": [<plan>]
+# }
+# where a window is {"start": <hour>, "end": <hour>, "period": <TouPeriodEnum>} and a
+# plan is {"id", "name", "planType": <PlanTypeEnum>, "regions": [<LocationEnum>] or
+# null for everywhere, "schedule": <name>, "dailyCharge": $/day, "rates":
+# {<TouPeriodEnum>: $/kWh}, "solarBuyBack": $/kWh, "maxAnnualKwh": null or the most
+# kWh a year a household can use to be on the plan, e.g. for low user plans}.
+DEFAULT_PLAN_CATALOGUE_PATH = (
+    Path(__file__).parent.parent / "data" / "retail_plans.json"
+)
+
+
+@dataclass(frozen=True, eq=False)
+class PlanCatalogue:
+    """Retail electricity plans, as arrays with one entry per plan
+
+    Plans that share TOU windows share a schedule, so that consumption only needs to be
+    split into TOU periods once per schedule rather than once per plan.
+    """
+
+    ids: Tuple[str, ...]
+    names: Tuple[str, ...]
+    plan_types: Tuple[PlanTypeEnum, ...]
+    schedules: Tuple[TouTariff, ...]  # the TOU windows of each schedule, without rates
+    schedule_index: np.ndarray  # (n_plans,) the schedule of each plan
+    rates: np.ndarray  # (n_plans, n_tou_periods) $/kWh, in TOU_PERIODS order
+    daily_charges: np.ndarray  # (n_plans,) $/day
+    solar_buy_back: np.ndarray  # (n_plans,) $/kWh
+    max_annual_kwh: np.ndarray  # (n_plans,) inf if there's no limit
+    index: Dict[Tuple[LocationEnum, Optional[PlanTypeEnum]], np.ndarray]
+
+    def get_plan_indices(
+        self, region: LocationEnum, plan_type: Optional[PlanTypeEnum] = None
+    ) -> np.ndarray:
+        """The plans available in the region, optionally only of one type"""
+        return self.index.get((region, plan_type), np.array([], dtype=int))
+
+
+def parse_plan_catalogue(catalogue: dict) -> PlanCatalogue:
+    """Builds a PlanCatalogue from the catalogue file's JSON
+
+    Raises:
+        ValueError: if a plan refers to an unknown schedule, region, plan type or TOU period
+    """
+    schedule_names = list(catalogue["schedules"])
+    schedules = tuple(
+        TouTariff(
+            name=name,
+            rates={},
+            weekday=_parse_windows(schedule["weekday"]),
+            weekend=_parse_windows(schedule["weekend"]),
+        )
+        for name, schedule in catalogue["schedules"].items()
+    )
+
+    plans = catalogue["plans"]
+    plan_types = tuple(PlanTypeEnum(plan["planType"]) for plan in plans)
+    regions: List[List[LocationEnum]] = [
+        (
+            list(LocationEnum)
+            if plan.get("regions") is None
+            else [LocationEnum(region) for region in plan["regions"]]
+        )
+        for plan in plans
+    ]
+    for plan in plans:
+        if plan["schedule"] not in schedule_names:
+            raise ValueError(
+                f"Plan {plan['id']} has an unknown schedule {plan['schedule']}"
+            )
+        unknown_periods = set(plan["rates"]) - {period.value for period in TOU_PERIODS}
+        if unknown_periods:
+            raise ValueError(
+                f"Plan {plan['id']} has rates for unknown TOU periods {unknown_periods}"
+            )
+
+    index: Dict[Tuple[LocationEnum, Optional[PlanTypeEnum]], List[int]] = {}
+    for i, (plan_type, plan_regions) in enumerate(zip(plan_types, regions)):
+        for region in plan_regions:
+            index.setdefault((region, None), []).append(i)
+            index.setdefault((region, plan_type), []).append(i)
+
+    return PlanCatalogue(
+        ids=tuple(plan["id"] for plan in plans),
+        names=tuple(plan["name"] for plan in plans),
+        plan_types=plan_types,
+        schedules=schedules,
+        schedule_index=np.array(
+            [schedule_names.index(plan["schedule"]) for plan in plans], dtype=int
+        ),
+        # A period without a rate is never used by the plan's schedule
+        rates=np.array(
+            [
+                [plan["rates"].get(period.value, 0) for period in TOU_PERIODS]
+                for plan in plans
+            ],
+            dtype=float,
+        ).reshape(len(plans), len(TOU_PERIODS)),
+        daily_charges=np.array([plan["dailyCharge"] for plan in plans], dtype=float),
+        solar_buy_back=np.array(
+            [plan.get("solarBuyBack") or 0 for plan in plans], dtype=float
+        ),
+        max_annual_kwh=np.array(
+            [
+                np.inf if plan.get("maxAnnualKwh") is None else plan["maxAnnualKwh"]
+                for plan in plans
+            ],
+            dtype=float,
+        ),
+        index={key: np.array(indices, dtype=int) for key, indices in index.items()},
+    )
+
+
+def _parse_windows(windows: List[dict]) -> Tuple[TouWindow, ...]:
+    return tuple(
+        TouWindow(window["start"], window["end"], TouPeriodEnum(window["period"]))
+        for window in windows
+    )
+
+
+@lru_cache(maxsize=4)
+def load_plan_catalogue(path: Path = DEFAULT_PLAN_CATALOGUE_PATH) -> PlanCatalogue:
+    """Loads a catalogue of retail plans, once per path
+
+    Args:
+        path (Path, optional): the catalogue file. Defaults to DEFAULT_PLAN_CATALOGUE_PATH.
+
+    Returns:
+        PlanCatalogue: the catalogue
+    """
+    with open(path) as f:
+        return parse_plan_catalogue(json.load(f))
@@ -0,0 +1,260 @@
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from openapi_client.models import Household, Savings
+from utils.household_projections import project_occupancy
+
+# The household fields that savings can be grouped by, by their API name
+AGGREGATE_GROUP_KEYS: Dict[str, Callable[[Household], Any]] = {
+    "location": lambda household: household.location,
+    "occupancy": lambda household: project_occupancy(household.occupancy),
+    "spaceHeating": lambda household: household.space_heating,
+    "waterHeating": lambda household: household.water_heating,
+    "cooktop": lambda household: household.cooktop,
+}
+
+# The Savings sections the aggregated values come from
+AGGREGATE_SAVINGS_FIELDS = ["emissions", "opex"]
+
+# The aggregated values, by their batch column name (see SAVINGS_ARROW_FIELDS).
+# Differences are after less before, so savings are negative.
+AGGREGATE_METRICS: Dict[str, Callable[[Savings], float]] = {
+    "emissions.perYear.difference": lambda savings: savings.emissions.per_year.difference,
+    "opex.perYear.difference": lambda savings: savings.opex.per_year.difference,
+}
+
+AGGREGATE_QUANTILES = [0.1, 0.5, 0.9]
+
+
+class StreamingSummary:
+    """The count, total, min, max & approximate quantiles of a stream of values
+
+    Quantiles come from a sketch with logarithmic buckets (as in DDSketch): each value
+    is counted in the bucket of its magnitude, with one set of buckets for positive
+    values and one for negative values. Any quantile is then within
+    relative_accuracy of a value in the stream. Values smaller than min_value in
+    magnitude are counted as 0.
+
+    The number of buckets only depends on the range of the values (at most
+    log(max / min_value) / log(gamma) per sign, e.g. ~1,200 for values up to 10^7 with
+    the defaults), not on how many there are. Summaries of parts of a stream can be
+    merged into the summary of the whole.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "min_value",
+        "gamma",
+        "count",
+        "total",
+        "min",
+        "max",
+        "positive",
+        "negative",
+        "zero",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-3):
+        if not 0 < relative_accuracy < 1 or min_value <= 0:
+            raise ValueError(
+                "Relative accuracy must be between 0 & 1, and min value positive"
+            )
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        # Counts by bucket, where bucket k holds magnitudes in (gamma^(k-1), gamma^k]
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero = 0
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if abs(value) < self.min_value:
+            self.zero += 1
+            return
+        buckets = self.positive if value > 0 else self.negative
+        bucket = math.ceil(math.log(abs(value), self.gamma))
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    def merge(self, other: "StreamingSummary") -> "StreamingSummary":
+        """Adds the other summary's values to this one
+
+        Raises:
+            ValueError: if the summaries' buckets don't match
+
+        Returns:
+            StreamingSummary: this summary
+        """
+        if (self.relative_accuracy, self.min_value) != (
+            other.relative_accuracy,
+            other.min_value,
+        ):
+            raise ValueError("Only summaries with the same accuracy can be merged")
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zero += other.zero
+        for buckets, other_buckets in [
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ]:
+            for bucket, count in other_buckets.items():
+                buckets[bucket] = buckets.get(bucket, 0) + count
+        return self
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """The approximate q-quantile of the values, or None if there aren't any"""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        # From the most negative bucket to the most positive
+        for sign, bucket, count in (
+            [(-1, k, self.negative[k]) for k in sorted(self.negative, reverse=True)]
+            + [(0, 0, self.zero)]
+            + [(1, k, self.positive[k]) for k in sorted(self.positive)]
+        ):
+            seen += count
+            if seen > rank:
+                # The middle of the bucket, in relative terms
+                value = sign * 2 * self.gamma**bucket / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class SavingsAggregate:
+    """Streaming statistics of households' savings, by group
+
+    Each household's savings are folded into the StreamingSummary of each metric in
+    AGGREGATE_METRICS for its group, e.g. its location, so the memory used depends on
+    the number of groups, not households. Aggregates of different parts of a population
+    (e.g. from separate worker processes) can be merged into the aggregate of the whole.
+    """
+
+    def __init__(self, group_by: Sequence[str] = ("location",)):
+        _check_group_by(group_by)
+        self.group_by = tuple(group_by)
+        self.summaries: Dict[Tuple, Dict[str, StreamingSummary]] = {}
+        # Households that couldn't be calculated, by group
+        self.errors: Dict[Tuple, int] = {}
+
+    def get_group(self, household: Optional[Household]) -> Tuple:
+        """The household's group, where None is the group of unreadable households"""
+        return tuple(
+            None if household is None else AGGREGATE_GROUP_KEYS[key](household)
+            for key in self.group_by
+        )
+
+    def add(self, household: Household, savings: Savings):
+        group = self.get_group(household)
+        if group not in self.summaries:
+            self.summaries[group] = {
+                metric: StreamingSummary() for metric in AGGREGATE_METRICS
+            }
+        for metric, get_value in AGGREGATE_METRICS.items():
+            self.summaries[group][metric].add(get_value(savings))
+
+    def add_error(self, household: Optional[Household]):
+        group = self.get_group(household)
+        self.errors[group] = self.errors.get(group, 0) + 1
+
+    def merge(self, other: "SavingsAggregate") -> "SavingsAggregate":
+        """Adds the other aggregate's households to this one
+
+        Raises:
+            ValueError: if the aggregates are grouped differently
+
+        Returns:
+            SavingsAggregate: this aggregate
+        """
+        if other.group_by != self.group_by:
+            raise ValueError("Only aggregates with the same groups can be merged")
+        for group, summaries in other.summaries.items():
+            if group not in self.summaries:
+                self.summaries[group] = {
+                    metric: StreamingSummary() for metric in AGGREGATE_METRICS
+                }
+            for metric, summary in summaries.items():
+                self.summaries[group][metric].merge(summary)
+        for group, count in other.errors.items():
+            self.errors[group] = self.errors.get(group, 0) + count
+        return self
+
+    def summarise(
+        self, quantiles: Sequence[float] = AGGREGATE_QUANTILES
+    ) -> List[Dict[str, Any]]:
+        """One row per group, with its group by values (e.g. "location"), its number of
+        "households" & "errors", and the total, mean & quantiles (e.g. "p50") of each
+        metric, e.g. "opex.perYear.difference.mean"
+        """
+        rows = []
+        for group in sorted(
+            set(self.summaries) | set(self.errors),
+            key=lambda group: tuple(
+                (value is not None, getattr(value, "value", value)) for value in group
+            ),
+        ):
+            summaries = self.summaries.get(group, {})
+            row: Dict[str, Any] = {
+                key: getattr(value, "value", value)
+                for key, value in zip(self.group_by, group)
+            }
+            row["households"] = next(iter(summaries.values())).count if summaries else 0
+            row["errors"] = self.errors.get(group, 0)
+            for metric in AGGREGATE_METRICS:
+                summary = summaries.get(metric, StreamingSummary())
+                row[f"{metric}.total"] = summary.total
+                row[f"{metric}.mean"] = summary.mean
+                for q in quantiles:
+                    row[f"{metric}.{get_quantile_name(q)}"] = summary.quantile(q)
+            rows.append(row)
+        return rows
+
+
+def get_quantile_name(q: float) -> str:
+    """e.g. "p50" for the median"""
+    return f"p{100 * q:g}"
+
+
+def parse_group_by(group_by: Optional[str] = None) -> Tuple[str, ...]:
+    """Parses a comma-separated list of AGGREGATE_GROUP_KEYS
+
+    Args:
+        group_by (str, optional): e.g. "location,occupancy". Defaults to None, i.e. location.
+
+    Raises:
+        ValueError: if a field can't be grouped by
+
+    Returns:
+        Tuple[str, ...]: the fields, in order
+    """
+    if group_by is None or group_by.strip() == "":
+        return ("location",)
+    fields = tuple(
+        dict.fromkeys(field.strip() for field in group_by.split(",") if field.strip())
+    )
+    _check_group_by(fields)
+    return fields
+
+
+def _check_group_by(fields: Sequence[str]):
+    unknown = set(fields) - set(AGGREGATE_GROUP_KEYS)
+    if unknown:
+        raise ValueError(
+            f"Unknown group by fields: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(AGGREGATE_GROUP_KEYS)}"
+        )
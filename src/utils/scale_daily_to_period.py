@@ -1,4 +1,9 @@
-from constants.utils import DAYS_PER_YEAR, PeriodEnum
+from constants.utils import (
+    DAYS_PER_YEAR,
+    MONTHS_PER_YEAR,
+    SEASONS_PER_YEAR,
+    PeriodEnum,
+)
 from params import OPERATIONAL_LIFETIME
 
 
@@ -22,6 +27,10 @@ def scale_daily_to_period(
         return daily_val
     if period == PeriodEnum.WEEKLY:
         return daily_val * 7
+    if period == PeriodEnum.MONTHLY:
+        return daily_val * DAYS_PER_YEAR / MONTHS_PER_YEAR
+    if period == PeriodEnum.SEASONAL:
+        return daily_val * DAYS_PER_YEAR / SEASONS_PER_YEAR
     if period == PeriodEnum.YEARLY:
         return daily_val * DAYS_PER_YEAR
     if period == PeriodEnum.OPERATIONAL_LIFETIME:
@@ -0,0 +1,160 @@
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class StageNode:
+    """A named stage in a StageGraph
+
+    The stage function is called with the values of its dependencies, in order.
+    Dependencies can be other nodes or named graph inputs.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    dependencies: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageGraphResult:
+    values: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per node
+
+    def server_timing(self) -> str:
+        """Formats the node timings as a Server-Timing header value (in ms)"""
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.timings.items()
+        )
+
+
+class StageGraph:
+    """A directed acyclic graph of pipeline stages
+
+    Each node is computed at most once per run, and only if it's needed for the
+    requested targets. Given an executor, nodes whose dependencies are ready are run
+    concurrently, otherwise they're run one at a time in dependency order.
+    """
+
+    def __init__(self, nodes: Iterable[StageNode], inputs: Iterable[str] = ()):
+        self.nodes: Dict[str, StageNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate stage node: {node.name}")
+            self.nodes[node.name] = node
+
+        self.inputs = set(inputs)
+        for node in self.nodes.values():
+            for dependency in node.dependencies:
+                if dependency not in self.nodes and dependency not in self.inputs:
+                    raise ValueError(
+                        f"Stage node {node.name} depends on unknown node {dependency}"
+                    )
+        self.order = self._sort_topologically()
+
+    def _sort_topologically(self) -> List[str]:
+        order = []
+        visiting = set()
+        visited = set()
+
+        def visit(name: str):
+            if name in visited or name in self.inputs:
+                return
+            if name in visiting:
+                raise ValueError(f"Stage graph has a cycle through {name}")
+            visiting.add(name)
+            for dependency in self.nodes[name].dependencies:
+                visit(dependency)
+            visiting.remove(name)
+            visited.add(name)
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return order
+
+    def required_nodes(self, targets: Optional[Iterable[str]] = None) -> List[str]:
+        """Gets the nodes needed to compute the targets, in dependency order
+
+        Args:
+            targets (Iterable[str], optional): the nodes wanted. Defaults to None, i.e. all nodes.
+
+        Returns:
+            List[str]: node names, with every node after its dependencies
+        """
+        if targets is None:
+            return list(self.order)
+
+        required = set()
+        to_visit = list(targets)
+        while to_visit:
+            name = to_visit.pop()
+            if name in required or name in self.inputs:
+                continue
+            if name not in self.nodes:
+                raise ValueError(f"Unknown stage node: {name}")
+            required.add(name)
+            to_visit.extend(self.nodes[name].dependencies)
+        return [name for name in self.order if name in required]
+
+    def run(
+        self,
+        inputs: Dict[str, Any],
+        targets: Optional[Iterable[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> StageGraphResult:
+        """Computes the targets (and everything they depend on)
+
+        Args:
+            inputs (Dict[str, Any]): values for the graph inputs
+            targets (Iterable[str], optional): the nodes wanted. Defaults to None, i.e. all nodes.
+            executor (Executor, optional): runs independent nodes concurrently. Defaults to None, i.e. run serially.
+
+        Returns:
+            StageGraphResult: the value and run time of every computed node
+        """
+        missing = self.inputs - set(inputs)
+        if missing:
+            raise ValueError(
+                f"Missing stage graph inputs: {', '.join(sorted(missing))}"
+            )
+
+        result = StageGraphResult(values=dict(inputs))
+        required = self.required_nodes(targets)
+        if executor is None:
+            for name in required:
+                value, seconds = self._run_node(name, result.values)
+                result.values[name] = value
+                result.timings[name] = seconds
+            return result
+
+        pending = list(required)
+        running = {}
+        while pending or running:
+            for name in list(pending):
+                node = self.nodes[name]
+                if all(dep in result.values for dep in node.dependencies):
+                    pending.remove(name)
+                    future = executor.submit(self._run_node, name, result.values)
+                    running[future] = name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    value, seconds = future.result()
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    raise
+                result.values[name] = value
+                result.timings[name] = seconds
+        return result
+
+    def _run_node(self, name: str, values: Dict[str, Any]) -> Tuple[Any, float]:
+        node = self.nodes[name]
+        args = [values[dependency] for dependency in node.dependencies]
+        start = perf_counter()
+        value = node.func(*args)
+        return value, perf_counter() - start
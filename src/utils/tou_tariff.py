@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Mapping, Tuple
+
+import numpy as np
+from aenum import Enum
+
+from constants.utils import PROFILE_YEAR
+
+
+class TouPeriodEnum(str, Enum):
+    PEAK = "PEAK"
+    SHOULDER = "SHOULDER"
+    OFF_PEAK = "OFF_PEAK"
+    NIGHT = "NIGHT"
+
+
+# The order of the columns returned by get_kwh_by_tou_period
+TOU_PERIODS = list(TouPeriodEnum)
+
+
+@dataclass(frozen=True)
+class TouWindow:
+    """The hours of the day, from start (inclusive) to end (exclusive), in a TOU period
+
+    A window can wrap around midnight, e.g. 23 to 7. Hours can be fractional, e.g. 6.5
+    for a half-hourly schedule.
+    """
+
+    start: float
+    end: float
+    period: TouPeriodEnum
+
+    def contains(self, hours: np.ndarray) -> np.ndarray:
+        if self.start <= self.end:
+            return (hours >= self.start) & (hours < self.end)
+        return (hours >= self.start) | (hours < self.end)
+
+
+@dataclass(frozen=True)
+class TouTariff:
+    """A time-of-use electricity tariff
+
+    Every interval of a weekday falls in one of the weekday windows, and every interval
+    of a Saturday or Sunday in one of the weekend windows.
+    """
+
+    name: str
+    rates: Mapping[TouPeriodEnum, float]  # $/kWh
+    weekday: Tuple[TouWindow, ...]
+    weekend: Tuple[TouWindow, ...]
+
+    def rate_vector(self) -> np.ndarray:
+        return np.array([self.rates[period] for period in TOU_PERIODS], dtype=float)
+
+
+def get_intervals_per_hour(n_intervals: int, year: int = PROFILE_YEAR) -> int:
+    """How many intervals per hour a profile of the given length over the year has
+
+    Raises:
+        ValueError: if the profile isn't a whole number of intervals per hour
+    """
+    hours = get_days_in_year(year) * 24
+    if n_intervals == 0 or n_intervals % hours != 0:
+        raise ValueError(
+            f"A profile over {year} needs a multiple of {hours} intervals, not {n_intervals}"
+        )
+    return n_intervals // hours
+
+
+@lru_cache(maxsize=32)
+def _get_period_matrix(
+    weekday: Tuple[TouWindow, ...],
+    weekend: Tuple[TouWindow, ...],
+    year: int,
+    intervals_per_hour: int,
+) -> np.ndarray:
+    # One row per interval of the year, with a one in its TOU period's column
+    hours = np.arange(24 * intervals_per_hour) / intervals_per_hour
+    day_periods = np.stack(
+        [_get_day_periods(weekday, hours), _get_day_periods(weekend, hours)]
+    )
+    first_weekday = date(year, 1, 1).weekday()
+    is_weekend = (first_weekday + np.arange(get_days_in_year(year))) % 7 >= 5
+    periods = day_periods[is_weekend.astype(int)].ravel()
+
+    matrix = np.zeros((len(periods), len(TOU_PERIODS)))
+    matrix[np.arange(len(periods)), periods] = 1
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _get_day_periods(windows: Tuple[TouWindow, ...], hours: np.ndarray) -> np.ndarray:
+    periods = np.full(len(hours), -1)
+    for window in windows:
+        periods[window.contains(hours) & (periods == -1)] = TOU_PERIODS.index(
+            window.period
+        )
+    if np.any(periods == -1):
+        raise ValueError(
+            f"TOU windows don't cover the hours {hours[periods == -1].tolist()}"
+        )
+    return periods
+
+
+def get_days_in_year(year: int = PROFILE_YEAR) -> int:
+    return (date(year + 1, 1, 1) - date(year, 1, 1)).days
+
+
+def get_kwh_by_tou_period(
+    consumption: np.ndarray, tariff: TouTariff, year: int = PROFILE_YEAR
+) -> np.ndarray:
+    """Totals hourly or half-hourly consumption by TOU period
+
+    Args:
+        consumption (np.ndarray): kWh in each interval of the year, the last axis. Any
+            leading axes (e.g. one row per household) are kept.
+        tariff (TouTariff): the tariff whose windows split up the year
+        year (int, optional): the year the profile is laid out over, for its weekends. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: kWh in each of TOU_PERIODS, shape (..., n_tou_periods)
+    """
+    consumption = np.asarray(consumption, dtype=float)
+    intervals_per_hour = get_intervals_per_hour(consumption.shape[-1], year)
+    return consumption @ _get_period_matrix(
+        tariff.weekday, tariff.weekend, year, intervals_per_hour
+    )
+
+
+def price_consumption(
+    consumption: np.ndarray, tariff: TouTariff, year: int = PROFILE_YEAR
+) -> np.ndarray:
+    """Prices hourly or half-hourly consumption with a TOU tariff
+
+    Args:
+        consumption (np.ndarray): kWh in each interval of the year, the last axis
+        tariff (TouTariff): the tariff
+        year (int, optional): the year the profile is laid out over. Defaults to PROFILE_YEAR.
+
+    Returns:
+        np.ndarray: the cost in NZD, shape (...) i.e. one per leading index
+    """
+    return get_kwh_by_tou_period(consumption, tariff, year) @ tariff.rate_vector()
+
+
+def get_hourly_rates(
+    tariff: TouTariff, year: int = PROFILE_YEAR, intervals_per_hour: int = 1
+) -> np.ndarray:
+    """The tariff's rate in each hour (or half hour) of the year
+
+    Returns:
+        np.ndarray: $/kWh, shape (n_intervals,)
+    """
+    return (
+        _get_period_matrix(tariff.weekday, tariff.weekend, year, intervals_per_hour)
+        @ tariff.rate_vector()
+    )
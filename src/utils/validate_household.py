@@ -1,12 +1,25 @@
 from openapi_client.models import Household, Solar, Battery
+from params import OPTIMISE_BATTERY_DISPATCH
 
 
 def validate_household(household: Household):
     ensure_no_battery_without_solar(household.solar, household.battery)
+    ensure_no_negative_system_sizes(household.solar, household.battery)
 
 
 def ensure_no_battery_without_solar(solar: Solar, battery: Battery):
+    # /savings only charges a battery from solar, so it can't price a battery without
+    # it, unless batteries can charge from the grid too (see OPTIMISE_BATTERY_DISPATCH)
+    if solar is None or battery is None or OPTIMISE_BATTERY_DISPATCH:
+        return
     has_or_wants_solar = solar.has_solar or solar.install_solar
     has_or_wants_battery = battery.has_battery or battery.install_battery
     if not has_or_wants_solar and has_or_wants_battery:
         raise ValueError("Can't have battery without solar")
+
+
+def ensure_no_negative_system_sizes(solar: Solar, battery: Battery):
+    if solar is not None and solar.size is not None and solar.size < 0:
+        raise ValueError("Solar size can't be negative")
+    if battery is not None and battery.capacity is not None and battery.capacity < 0:
+        raise ValueError("Battery capacity can't be negative")
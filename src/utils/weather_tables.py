@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from constants.utils import PROFILE_YEAR
+from constants.weather import (
+    HEAT_PUMP_COP_AT_7C,
+    HEAT_PUMP_COP_PER_DEGREE,
+    HEAT_PUMP_MAX_COP,
+    HEAT_PUMP_MIN_COP,
+    HEATING_BASE_TEMPERATURE,
+)
+from utils.tou_tariff import get_days_in_year
+
+# Illustrative hourly outdoor temperatures at weather stations around NZ over
+# PROFILE_YEAR, in °C. The file is a CSV with a header of "datetime" then one column
+# per station, and one row per hour of the year, in order.
+DEFAULT_TEMPERATURES_PATH = (
+    Path(__file__).parent.parent / "data" / "hourly_temperatures_2023.csv"
+)
+
+
+@dataclass(frozen=True, eq=False)
+class WeatherTables:
+    """Space heating demand & heat pump efficiency at each weather station
+
+    The hourly tables are float32 to keep them compact.
+    """
+
+    stations: Tuple[str, ...]
+    heating_degree_hours: np.ndarray  # (n_stations,) °C·h per year
+    seasonal_cop: np.ndarray  # (n_stations,) heat pump COP over the heating season
+    heating_shape: np.ndarray  # (n_stations, n_hours) share of the year's heating
+    cop: np.ndarray  # (n_stations, n_hours) heat pump COP in each hour
+
+    def get_station_index(self, station: str) -> int:
+        return self.stations.index(station)
+
+
+def get_heat_pump_cop(temperatures: np.ndarray) -> np.ndarray:
+    """A heat pump's coefficient of performance at each outdoor temperature"""
+    return np.clip(
+        HEAT_PUMP_COP_AT_7C + HEAT_PUMP_COP_PER_DEGREE * (temperatures - 7),
+        HEAT_PUMP_MIN_COP,
+        HEAT_PUMP_MAX_COP,
+    )
+
+
+def build_weather_tables(
+    temperatures: np.ndarray, stations: Tuple[str, ...]
+) -> WeatherTables:
+    """Builds the tables from hourly temperatures
+
+    Heating demand in each hour is proportional to how far the temperature is below
+    HEATING_BASE_TEMPERATURE (its heating degree-hours). A heat pump's seasonal COP is
+    the heat it delivers over the year divided by the electricity it uses, so hours
+    with more demand count for more.
+
+    Args:
+        temperatures (np.ndarray): °C, shape (n_stations, n_hours)
+        stations (Tuple[str, ...]): the name of each station
+
+    Returns:
+        WeatherTables: the tables
+    """
+    degree_hours = np.maximum(HEATING_BASE_TEMPERATURE - temperatures, 0)
+    heating_degree_hours = degree_hours.sum(axis=1)
+    cop = get_heat_pump_cop(temperatures)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        heating_shape = degree_hours / heating_degree_hours[:, np.newaxis]
+        seasonal_cop = heating_degree_hours / (degree_hours / cop).sum(axis=1)
+    return WeatherTables(
+        stations=tuple(stations),
+        heating_degree_hours=heating_degree_hours,
+        # A station that never needs heating has its heat pump's rated COP
+        seasonal_cop=np.where(heating_degree_hours > 0, seasonal_cop, cop.mean(axis=1)),
+        heating_shape=np.nan_to_num(heating_shape).astype(np.float32),
+        cop=cop.astype(np.float32),
+    )
+
+
+def load_temperatures(
+    path: Path = DEFAULT_TEMPERATURES_PATH, year: int = PROFILE_YEAR
+) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Loads hourly temperatures
+
+    Raises:
+        ValueError: if the file doesn't have a temperature for each hour of the year
+
+    Returns:
+        Tuple[np.ndarray, Tuple[str, ...]]: °C with shape (n_stations, n_hours), and the station names
+    """
+    with open(path) as f:
+        stations = tuple(f.readline().strip().split(",")[1:])
+    temperatures = np.loadtxt(
+        path,
+        delimiter=",",
+        skiprows=1,
+        usecols=range(1, len(stations) + 1),
+        dtype=float,
+        ndmin=2,
+    ).T
+    n_hours = get_days_in_year(year) * 24
+    if temperatures.shape != (len(stations), n_hours):
+        raise ValueError(
+            f"{path} needs a temperature for each of the {n_hours} hours of {year} "
+            f"at each station"
+        )
+    return temperatures, stations
+
+
+@lru_cache(maxsize=4)
+def load_weather_tables(
+    path: Path = DEFAULT_TEMPERATURES_PATH, year: int = PROFILE_YEAR
+) -> WeatherTables:
+    """Loads the weather tables for a temperatures file, once per file
+
+    Building them only takes milliseconds, so they're kept in memory rather than
+    cached on disk.
+
+    Args:
+        path (Path, optional): the temperatures file. Defaults to DEFAULT_TEMPERATURES_PATH.
+        year (int, optional): the year the temperatures are for. Defaults to PROFILE_YEAR.
+
+    Returns:
+        WeatherTables: the tables
+    """
+    return build_weather_tables(*load_temperatures(path, year))
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from constants.utils import PROFILE_YEAR
+from utils.tou_tariff import get_days_in_year
+
+# An illustrative series of hourly wholesale electricity prices over PROFILE_YEAR, in
+# $/kWh. The file is a CSV with a header and one "<local hour>,<price>" row per hour
+# of the year, in order, e.g. "2023-01-01T00:00,0.0492".
+DEFAULT_WHOLESALE_PRICES_PATH = (
+    Path(__file__).parent.parent / "data" / "wholesale_prices_2023.csv"
+)
+
+
+@lru_cache(maxsize=4)
+def load_wholesale_prices(
+    path: Path = DEFAULT_WHOLESALE_PRICES_PATH, year: int = PROFILE_YEAR
+) -> np.ndarray:
+    """Loads a year of hourly wholesale electricity prices, once per path
+
+    Args:
+        path (Path, optional): the prices file. Defaults to DEFAULT_WHOLESALE_PRICES_PATH.
+        year (int, optional): the year the prices are for. Defaults to PROFILE_YEAR.
+
+    Raises:
+        ValueError: if the file doesn't have a price for each hour of the year
+
+    Returns:
+        np.ndarray: $/kWh, shape (n_days, 24). Read-only, as it's shared between callers.
+    """
+    prices = np.loadtxt(
+        path, delimiter=",", skiprows=1, usecols=1, dtype=float, ndmin=1
+    )
+    n_days = get_days_in_year(year)
+    if prices.shape != (n_days * 24,):
+        raise ValueError(
+            f"{path} has {prices.size} prices, not one for each of the "
+            f"{n_days * 24} hours of {year}"
+        )
+    prices = prices.reshape(n_days, 24)
+    prices.flags.writeable = False
+    return prices